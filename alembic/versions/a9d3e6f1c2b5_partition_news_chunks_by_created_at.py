@@ -0,0 +1,178 @@
+"""Partition news_chunks by created_at year
+
+Revision ID: a9d3e6f1c2b5
+Revises: f2c7d9a4b8e1
+Create Date: 2025-09-01 11:27:53.904126
+
+"""
+
+from typing import Sequence, Union
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d3e6f1c2b5"
+down_revision: Union[str, Sequence[str], None] = "f2c7d9a4b8e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기본으로 만들어 두는 연 단위 파티션 범위 (기존 데이터 범위가 더 넓으면 확장)
+# 범위를 벗어나는 날짜는 news_chunks_default 파티션에 저장된다.
+PARTITION_FIRST_YEAR = 2015
+PARTITION_LAST_YEAR = 2030
+
+# 기존 컬럼 (vector_bit는 생성 컬럼이므로 복사 대상에서 제외)
+COPY_COLUMNS = (
+    "id, company_id, title, contents, vector, vector_half, vector_half_512, "
+    "link, created_at"
+)
+
+HNSW_INDEXES = (
+    ("idx_chunk_hnsw", "vector", "vector_cosine_ops"),
+    ("idx_chunk_half_hnsw", "vector_half", "halfvec_cosine_ops"),
+    ("idx_chunk_half_512_hnsw", "vector_half_512", "halfvec_cosine_ops"),
+    ("idx_chunk_bit_hnsw", "vector_bit", "bit_hamming_ops"),
+)
+
+BTREE_INDEXES = (
+    ("idx_news_chunk_created_at_company_id", ["created_at", "company_id"]),
+    ("ix_news_chunks_company_id", ["company_id"]),
+    ("ix_news_chunks_created_at", ["created_at"]),
+    ("ix_news_chunks_link", ["link"]),
+    ("ix_news_chunks_title", ["title"]),
+)
+
+
+def _news_chunk_columns() -> list:
+    return [
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('news_chunks_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column("company_id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=500), nullable=False),
+        sa.Column("contents", sa.Text(), nullable=False),
+        sa.Column(
+            "vector", pgvector.sqlalchemy.vector.VECTOR(dim=1536), nullable=False
+        ),
+        sa.Column("vector_half", pgvector.sqlalchemy.HALFVEC(dim=1536), nullable=True),
+        sa.Column(
+            "vector_half_512", pgvector.sqlalchemy.HALFVEC(dim=512), nullable=True
+        ),
+        sa.Column(
+            "vector_bit",
+            pgvector.sqlalchemy.BIT(length=1536),
+            sa.Computed("binary_quantize(vector)::bit(1536)", persisted=True),
+            nullable=True,
+        ),
+        sa.Column("link", sa.String(length=500), nullable=False),
+        sa.Column("created_at", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"]),
+    ]
+
+
+def _drop_indexes() -> None:
+    for name, *_ in HNSW_INDEXES + BTREE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes() -> None:
+    # 파티션 테이블에 만든 인덱스는 각 파티션에 개별 인덱스로 생성된다.
+    for name, column, ops in HNSW_INDEXES:
+        op.create_index(
+            name,
+            "news_chunks",
+            [column],
+            unique=False,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={column: ops},
+        )
+    for name, columns in BTREE_INDEXES:
+        op.create_index(name, "news_chunks", columns, unique=False)
+
+
+def _partition_years(conn) -> range:
+    first, last = conn.execute(
+        sa.text(
+            "SELECT extract(year FROM min(created_at))::int, "
+            "extract(year FROM max(created_at))::int "
+            "FROM news_chunks_unpartitioned"
+        )
+    ).one()
+    return range(
+        min(first or PARTITION_FIRST_YEAR, PARTITION_FIRST_YEAR),
+        max(last or PARTITION_LAST_YEAR, PARTITION_LAST_YEAR) + 1,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. 기존 테이블을 옆으로 옮기고, id 시퀀스는 새 테이블이 이어받도록 소유 관계 해제
+    op.rename_table("news_chunks", "news_chunks_unpartitioned")
+    _drop_indexes()
+    op.execute(
+        "ALTER TABLE news_chunks_unpartitioned "
+        "RENAME CONSTRAINT news_chunks_pkey TO news_chunks_unpartitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE news_chunks_id_seq OWNED BY NONE")
+
+    # 2. created_at RANGE 파티션 부모 테이블 (기본키는 파티션 키를 포함해야 함)
+    op.create_table(
+        "news_chunks",
+        *_news_chunk_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("ALTER SEQUENCE news_chunks_id_seq OWNED BY news_chunks.id")
+
+    # 3. 연 단위 파티션 + 범위 밖 날짜를 받는 기본 파티션
+    conn = op.get_bind()
+    for year in _partition_years(conn):
+        op.execute(
+            f"CREATE TABLE news_chunks_y{year} PARTITION OF news_chunks "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    op.execute("CREATE TABLE news_chunks_default PARTITION OF news_chunks DEFAULT")
+
+    # 4. 데이터 이관 (id 유지) 후 인덱스 생성 - 적재 후에 만들어야 HNSW 빌드가 빠름
+    op.execute(
+        f"INSERT INTO news_chunks ({COPY_COLUMNS}) "
+        f"SELECT {COPY_COLUMNS} FROM news_chunks_unpartitioned"
+    )
+    _create_indexes()
+
+    op.drop_table("news_chunks_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table("news_chunks", "news_chunks_partitioned")
+    _drop_indexes()
+    op.execute(
+        "ALTER TABLE news_chunks_partitioned "
+        "RENAME CONSTRAINT news_chunks_pkey TO news_chunks_partitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE news_chunks_id_seq OWNED BY NONE")
+
+    op.create_table(
+        "news_chunks",
+        *_news_chunk_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("ALTER SEQUENCE news_chunks_id_seq OWNED BY news_chunks.id")
+
+    op.execute(
+        f"INSERT INTO news_chunks ({COPY_COLUMNS}) "
+        f"SELECT {COPY_COLUMNS} FROM news_chunks_partitioned"
+    )
+    _create_indexes()
+
+    # 파티션은 부모 테이블과 함께 삭제됨
+    op.drop_table("news_chunks_partitioned")
@@ -0,0 +1,54 @@
+"""Add full-text search column to news_chunks
+
+Revision ID: b4e8a2f6d1c9
+Revises: a9d3e6f1c2b5
+Create Date: 2025-08-29 11:02:47.208613
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e8a2f6d1c9"
+down_revision: Union[str, Sequence[str], None] = "a9d3e6f1c2b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # STORED 생성 컬럼이므로 추가 시 모든 파티션의 기존 행이 함께 계산되고(테이블 재작성),
+    # 이후 삽입/수정 시에도 title, contents로부터 자동 갱신된다.
+    op.add_column(
+        "news_chunks",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple'::regconfig, title || ' ' || contents)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    # 부모 테이블에 만든 인덱스는 파티션마다 생성된다.
+    op.create_index(
+        "idx_chunk_search_tsv",
+        "news_chunks",
+        ["search_tsv"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_chunk_search_tsv", table_name="news_chunks", postgresql_using="gin"
+    )
+    op.drop_column("news_chunks", "search_tsv")
@@ -0,0 +1,139 @@
+"""Add company metrics rollups
+
+Revision ID: c3f1a9d2e4b7
+Revises: b651854be18f
+Create Date: 2025-08-20 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f1a9d2e4b7"
+down_revision: Union[str, Sequence[str], None] = "b651854be18f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기존 company_metrics_snapshots(JSONB)로부터 누적 롤업을 계산하여 채운다.
+# - 투자/특허: 월별 합계의 누적합(SUM OVER)
+# - 직원 수/재무: 값이 있는 마지막 달의 값을 이월(carry-forward)
+BACKFILL_SQL = """
+INSERT INTO company_metrics_rollups (
+    company_id,
+    reference_date,
+    cumulative_investment_amount,
+    cumulative_investment_count,
+    cumulative_patent_count,
+    people_count,
+    profit,
+    net_profit,
+    operating_profit
+)
+WITH monthly AS (
+    SELECT
+        s.company_id,
+        s.reference_date,
+        COALESCE((
+            SELECT SUM((inv->>'amount')::bigint)
+            FROM jsonb_array_elements(
+                COALESCE(s.metrics->'investments', '[]'::jsonb)
+            ) AS inv
+        ), 0) AS investment_amount,
+        jsonb_array_length(COALESCE(s.metrics->'investments', '[]'::jsonb))
+            AS investment_count,
+        jsonb_array_length(COALESCE(s.metrics->'patents', '[]'::jsonb))
+            AS patent_count,
+        (s.metrics->'organizations'->-1->>'people_count')::integer AS people_count,
+        (s.metrics->'finance'->-1->>'profit')::bigint AS profit,
+        (s.metrics->'finance'->-1->>'netProfit')::bigint AS net_profit,
+        (s.metrics->'finance'->-1->>'operatingProfit')::bigint AS operating_profit
+    FROM company_metrics_snapshots s
+),
+grouped AS (
+    SELECT
+        m.*,
+        SUM(investment_amount) OVER w AS cumulative_investment_amount,
+        SUM(investment_count) OVER w AS cumulative_investment_count,
+        SUM(patent_count) OVER w AS cumulative_patent_count,
+        COUNT(people_count) OVER w AS people_grp,
+        COUNT(profit) OVER w AS finance_grp
+    FROM monthly m
+    WINDOW w AS (PARTITION BY company_id ORDER BY reference_date)
+)
+SELECT
+    company_id,
+    reference_date,
+    cumulative_investment_amount,
+    cumulative_investment_count,
+    cumulative_patent_count,
+    COALESCE(MAX(people_count) OVER (PARTITION BY company_id, people_grp), 0),
+    COALESCE(MAX(profit) OVER (PARTITION BY company_id, finance_grp), 0),
+    COALESCE(MAX(net_profit) OVER (PARTITION BY company_id, finance_grp), 0),
+    COALESCE(MAX(operating_profit) OVER (PARTITION BY company_id, finance_grp), 0)
+FROM grouped
+ON CONFLICT (company_id, reference_date) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "company_metrics_rollups",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("company_id", sa.Uuid(), nullable=False),
+        sa.Column("reference_date", sa.Date(), nullable=False),
+        sa.Column(
+            "cumulative_investment_amount",
+            sa.BigInteger(),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "cumulative_investment_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "cumulative_patent_count", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column("people_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("profit", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("net_profit", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "operating_profit", sa.BigInteger(), server_default="0", nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["company_id"],
+            ["companies.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_company_metrics_rollups_company_id"),
+        "company_metrics_rollups",
+        ["company_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_company_rollup_date",
+        "company_metrics_rollups",
+        ["company_id", "reference_date"],
+        unique=True,
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_company_rollup_date", table_name="company_metrics_rollups")
+    op.drop_index(
+        op.f("ix_company_metrics_rollups_company_id"),
+        table_name="company_metrics_rollups",
+    )
+    op.drop_table("company_metrics_rollups")
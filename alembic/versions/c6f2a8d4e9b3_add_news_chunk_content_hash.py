@@ -0,0 +1,88 @@
+"""Add content hash idempotency key to news_chunks
+
+Revision ID: c6f2a8d4e9b3
+Revises: b4e8a2f6d1c9
+Create Date: 2025-08-30 10:14:52.630918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f2a8d4e9b3"
+down_revision: Union[str, Sequence[str], None] = "b4e8a2f6d1c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 5_000
+
+# 기존 청크의 content_hash를 id 순서대로 배치 단위로 채운다.
+# 해시 입력은 NewsChunkRecord.hash_of와 같은 company_id, link, contents를 0x1f로 이은 UTF-8 문자열이다.
+BACKFILL_BATCH_SQL = sa.text("""
+    WITH batch AS (
+        SELECT id FROM news_chunks
+        WHERE id > :last_id
+        ORDER BY id
+        LIMIT :batch_size
+    ),
+    updated AS (
+        UPDATE news_chunks c
+        SET content_hash = encode(
+            sha256(convert_to(
+                c.company_id::text || chr(31) || c.link || chr(31) || c.contents,
+                'UTF8'
+            )),
+            'hex'
+        )
+        FROM batch
+        WHERE c.id = batch.id
+        RETURNING c.id
+    )
+    SELECT max(id) FROM updated
+    """)
+
+# 기존 적재 스크립트는 벡터 동등 비교로만 중복을 걸렀으므로 같은 해시가 있을 수 있다.
+# 유니크 제약을 만들기 전에 (content_hash, created_at)마다 가장 먼저 적재된 행만 남긴다.
+DELETE_DUPLICATES_SQL = sa.text("""
+    DELETE FROM news_chunks c
+    USING news_chunks d
+    WHERE c.content_hash = d.content_hash
+      AND c.created_at = d.created_at
+      AND c.id > d.id
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "news_chunks",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        last_id = conn.execute(
+            BACKFILL_BATCH_SQL,
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).scalar()
+        if last_id is None:
+            break
+    conn.execute(DELETE_DUPLICATES_SQL)
+
+    op.alter_column("news_chunks", "content_hash", nullable=False)
+    # 파티션 테이블의 유니크 제약은 파티션 키(created_at)를 포함해야 한다.
+    op.create_unique_constraint(
+        "uq_news_chunk_content_hash", "news_chunks", ["content_hash", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_news_chunk_content_hash", "news_chunks", type_="unique")
+    op.drop_column("news_chunks", "content_hash")
@@ -0,0 +1,222 @@
+"""Add normalized company metric tables
+
+Revision ID: d7a4c2e9b1f3
+Revises: c3f1a9d2e4b7
+Create Date: 2025-08-21 14:03:17.602511
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a4c2e9b1f3"
+down_revision: Union[str, Sequence[str], None] = "c3f1a9d2e4b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 기존 company_metrics_snapshots(JSONB)의 각 메트릭 배열을 행 단위로 풀어 적재한다.
+# WITH ORDINALITY로 배열 내 순서를 보존하여 id 순서가 원본 순서와 같도록 한다.
+BACKFILL_SQL = [
+    """
+    INSERT INTO company_mau (
+        company_id, reference_date, product_id, product_name, value, date, growth_rate
+    )
+    SELECT
+        s.company_id,
+        s.reference_date,
+        e->>'product_id',
+        e->>'product_name',
+        (e->>'value')::bigint,
+        (e->>'date')::date,
+        (e->>'growthRate')::double precision
+    FROM company_metrics_snapshots s
+    CROSS JOIN LATERAL jsonb_array_elements(
+        COALESCE(s.metrics->'mau', '[]'::jsonb)
+    ) WITH ORDINALITY AS t(e, ord)
+    ORDER BY s.id, t.ord
+    """,
+    """
+    INSERT INTO company_patents (company_id, reference_date, level, title, date)
+    SELECT
+        s.company_id,
+        s.reference_date,
+        e->>'level',
+        e->>'title',
+        (e->>'date')::date
+    FROM company_metrics_snapshots s
+    CROSS JOIN LATERAL jsonb_array_elements(
+        COALESCE(s.metrics->'patents', '[]'::jsonb)
+    ) WITH ORDINALITY AS t(e, ord)
+    ORDER BY s.id, t.ord
+    """,
+    """
+    INSERT INTO company_finance (
+        company_id, reference_date, year, profit, operating_profit, net_profit
+    )
+    SELECT
+        s.company_id,
+        s.reference_date,
+        (e->>'year')::integer,
+        (e->>'profit')::bigint,
+        (e->>'operatingProfit')::bigint,
+        (e->>'netProfit')::bigint
+    FROM company_metrics_snapshots s
+    CROSS JOIN LATERAL jsonb_array_elements(
+        COALESCE(s.metrics->'finance', '[]'::jsonb)
+    ) WITH ORDINALITY AS t(e, ord)
+    ORDER BY s.id, t.ord
+    """,
+    """
+    INSERT INTO company_investments (
+        company_id, reference_date, level, date, amount, investors
+    )
+    SELECT
+        s.company_id,
+        s.reference_date,
+        e->>'level',
+        (e->>'date')::date,
+        (e->>'amount')::bigint,
+        ARRAY(
+            SELECT jsonb_array_elements_text(COALESCE(e->'investors', '[]'::jsonb))
+        )
+    FROM company_metrics_snapshots s
+    CROSS JOIN LATERAL jsonb_array_elements(
+        COALESCE(s.metrics->'investments', '[]'::jsonb)
+    ) WITH ORDINALITY AS t(e, ord)
+    ORDER BY s.id, t.ord
+    """,
+    """
+    INSERT INTO company_headcount (
+        company_id, reference_date, name, date, people_count, growth_rate
+    )
+    SELECT
+        s.company_id,
+        s.reference_date,
+        e->>'name',
+        (e->>'date')::date,
+        (e->>'people_count')::integer,
+        COALESCE((e->>'growth_rate')::double precision, 0)
+    FROM company_metrics_snapshots s
+    CROSS JOIN LATERAL jsonb_array_elements(
+        COALESCE(s.metrics->'organizations', '[]'::jsonb)
+    ) WITH ORDINALITY AS t(e, ord)
+    ORDER BY s.id, t.ord
+    """,
+]
+
+
+def _create_metric_table(name: str, *columns: sa.Column) -> None:
+    op.create_table(
+        name,
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("company_id", sa.Uuid(), nullable=False),
+        sa.Column("reference_date", sa.Date(), nullable=False),
+        *columns,
+        sa.ForeignKeyConstraint(
+            ["company_id"],
+            ["companies.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _create_metric_table(
+        "company_mau",
+        sa.Column("product_id", sa.String(length=32), nullable=False),
+        sa.Column("product_name", sa.String(length=100), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("growth_rate", sa.Float(), nullable=True),
+    )
+    op.create_index(
+        "idx_company_mau_date",
+        "company_mau",
+        ["company_id", "reference_date"],
+        unique=False,
+    )
+
+    _create_metric_table(
+        "company_patents",
+        sa.Column("level", sa.String(length=32), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+    )
+    op.create_index(
+        "idx_company_patent_date",
+        "company_patents",
+        ["company_id", "reference_date"],
+        unique=False,
+    )
+
+    _create_metric_table(
+        "company_finance",
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("profit", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "operating_profit", sa.BigInteger(), server_default="0", nullable=False
+        ),
+        sa.Column("net_profit", sa.BigInteger(), nullable=True),
+    )
+    op.create_index(
+        "idx_company_finance_date",
+        "company_finance",
+        ["company_id", "reference_date"],
+        unique=False,
+    )
+
+    _create_metric_table(
+        "company_investments",
+        sa.Column("level", sa.String(length=32), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("amount", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "investors",
+            postgresql.ARRAY(sa.String()),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_company_investment_date",
+        "company_investments",
+        ["company_id", "reference_date"],
+        unique=False,
+    )
+
+    _create_metric_table(
+        "company_headcount",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("people_count", sa.Integer(), nullable=False),
+        sa.Column("growth_rate", sa.Float(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "idx_company_headcount_date",
+        "company_headcount",
+        ["company_id", "reference_date"],
+        unique=False,
+    )
+
+    for sql in BACKFILL_SQL:
+        op.execute(sql)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, index in (
+        ("company_headcount", "idx_company_headcount_date"),
+        ("company_investments", "idx_company_investment_date"),
+        ("company_finance", "idx_company_finance_date"),
+        ("company_patents", "idx_company_patent_date"),
+        ("company_mau", "idx_company_mau_date"),
+    ):
+        op.drop_index(index, table_name=table)
+        op.drop_table(table)
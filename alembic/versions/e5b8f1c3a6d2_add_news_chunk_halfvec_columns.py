@@ -0,0 +1,109 @@
+"""Add halfvec embedding columns to news_chunks
+
+Revision ID: e5b8f1c3a6d2
+Revises: d7a4c2e9b1f3
+Create Date: 2025-08-25 10:12:44.318907
+
+"""
+
+from typing import Sequence, Union
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b8f1c3a6d2"
+down_revision: Union[str, Sequence[str], None] = "d7a4c2e9b1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 5_000
+
+# 기존 float32 벡터로부터 halfvec 사본을 id 순서대로 배치 단위로 채운다.
+# 한 번에 전체 테이블을 UPDATE하지 않도록 id > :last_id 구간을 LIMIT으로 잘라
+# 처리하고, 마지막으로 처리한 id를 반환받아 다음 배치의 시작점으로 사용한다.
+# 512차원 사본은 앞 512차원을 잘라 저장한다 (코사인 거리는 크기와 무관하므로 재정규화 생략).
+BACKFILL_BATCH_SQL = sa.text("""
+    WITH batch AS (
+        SELECT id FROM news_chunks
+        WHERE id > :last_id
+        ORDER BY id
+        LIMIT :batch_size
+    ),
+    updated AS (
+        UPDATE news_chunks c
+        SET vector_half = c.vector::halfvec(1536),
+            vector_half_512 = subvector(c.vector, 1, 512)::halfvec(512)
+        FROM batch
+        WHERE c.id = batch.id
+        RETURNING c.id
+    )
+    SELECT max(id) FROM updated
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "news_chunks",
+        sa.Column("vector_half", pgvector.sqlalchemy.HALFVEC(dim=1536), nullable=True),
+    )
+    op.add_column(
+        "news_chunks",
+        sa.Column(
+            "vector_half_512", pgvector.sqlalchemy.HALFVEC(dim=512), nullable=True
+        ),
+    )
+
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        last_id = conn.execute(
+            BACKFILL_BATCH_SQL,
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).scalar()
+        if last_id is None:
+            break
+
+    # 백필 후에 인덱스를 만들어야 행 단위 삽입보다 빌드가 빠름
+    op.create_index(
+        "idx_chunk_half_hnsw",
+        "news_chunks",
+        ["vector_half"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector_half": "halfvec_cosine_ops"},
+    )
+    op.create_index(
+        "idx_chunk_half_512_hnsw",
+        "news_chunks",
+        ["vector_half_512"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector_half_512": "halfvec_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_chunk_half_512_hnsw",
+        table_name="news_chunks",
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector_half_512": "halfvec_cosine_ops"},
+    )
+    op.drop_index(
+        "idx_chunk_half_hnsw",
+        table_name="news_chunks",
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector_half": "halfvec_cosine_ops"},
+    )
+    op.drop_column("news_chunks", "vector_half_512")
+    op.drop_column("news_chunks", "vector_half")
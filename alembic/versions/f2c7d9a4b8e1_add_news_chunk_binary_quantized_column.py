@@ -0,0 +1,56 @@
+"""Add binary quantized embedding column to news_chunks
+
+Revision ID: f2c7d9a4b8e1
+Revises: e5b8f1c3a6d2
+Create Date: 2025-08-27 16:40:09.512734
+
+"""
+
+from typing import Sequence, Union
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7d9a4b8e1"
+down_revision: Union[str, Sequence[str], None] = "e5b8f1c3a6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # STORED 생성 컬럼이므로 추가 시 기존 행이 함께 계산되고(테이블 재작성),
+    # 이후 삽입/수정 시에도 vector로부터 자동 갱신된다.
+    op.add_column(
+        "news_chunks",
+        sa.Column(
+            "vector_bit",
+            pgvector.sqlalchemy.BIT(length=1536),
+            sa.Computed("binary_quantize(vector)::bit(1536)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_chunk_bit_hnsw",
+        "news_chunks",
+        ["vector_bit"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector_bit": "bit_hamming_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_chunk_bit_hnsw",
+        table_name="news_chunks",
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"vector_bit": "bit_hamming_ops"},
+    )
+    op.drop_column("news_chunks", "vector_bit")
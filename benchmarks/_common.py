@@ -0,0 +1,119 @@
+"""
+벤치마크 공용 유틸리티
+
+실행 예시 (프로젝트 루트에서):
+    PYTHONPATH=src python -m benchmarks.company_metrics_rollup
+"""
+
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pgvector.asyncpg import register_vector
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from config.config import Config
+from db.db import ReadSessionManager, WriteSessionManager, engine_with_pgvector
+
+__all__ = [
+    "compile_sql",
+    "database",
+    "explain",
+    "measure",
+    "plan_time",
+    "print_table",
+]
+
+
+def _database_url(config: Config) -> str:
+    db = config.DATABASE
+    return (
+        f"{db.WRITE_ENGINE}://{db.WRITE_USER}:{db.WRITE_PASSWORD}"
+        f"@{db.WRITE_URL}:{db.WRITE_PORT}/{db.WRITE_NAME}"
+    )
+
+
+@asynccontextmanager
+async def database():
+    """벤치마크용 엔진과 (write, read) 세션 매니저 팩토리를 생성"""
+    config = Config()
+    async with engine_with_pgvector(
+        url=_database_url(config), pool_size=config.DATABASE.POOL_SIZE
+    ) as engine:
+        session_maker = async_sessionmaker(bind=engine, class_=AsyncSession)
+        yield (
+            engine,
+            lambda: WriteSessionManager(session_maker),
+            lambda **kw: ReadSessionManager(session_maker, **kw),
+        )
+
+
+async def measure(
+    fn: Callable[[], Awaitable[object]], repeat: int = 20, warmup: int = 3
+) -> Dict[str, float]:
+    """비동기 함수를 반복 실행하여 지연 시간(ms) 통계를 반환"""
+    for _ in range(warmup):
+        await fn()
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p95": samples[max(0, int(len(samples) * 0.95) - 1)],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def compile_sql(query) -> str:
+    """asyncpg 방언으로 컴파일한 SQL 문 (prepared statement 텍스트)"""
+    return str(query.compile(dialect=asyncpg.dialect()))
+
+
+async def explain(
+    engine: AsyncEngine,
+    query,
+    params: Optional[Dict[str, Any]] = None,
+    options: str = "ANALYZE, BUFFERS",
+) -> str:
+    """SQLAlchemy 쿼리를 EXPLAIN하여 실행 계획 텍스트를 반환"""
+    compiled = query.compile(dialect=asyncpg.dialect())
+    bound = compiled.construct_params(params or {})
+    args = [bound[name] for name in compiled.positiontup]
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        await register_vector(raw)
+        rows = await raw.fetch(f"EXPLAIN ({options}) {compiled}", *args)
+    return "\n".join(row[0] for row in rows)
+
+
+def plan_time(plan: str, label: str = "Planning Time") -> float:
+    """EXPLAIN ANALYZE 결과에서 Planning/Execution Time(ms) 추출"""
+    for line in plan.splitlines():
+        if line.strip().startswith(label):
+            return float(line.split(":")[1].split()[0])
+    return float("nan")
+
+
+def print_table(title: str, rows: List[Dict[str, object]]) -> None:
+    """측정 결과를 고정 폭 표로 출력"""
+    print(f"\n## {title}")
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    widths = [max(len(str(h)), *(len(_fmt(row[h])) for row in rows)) for h in headers]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(_fmt(row[h]).ljust(w) for h, w in zip(headers, widths)))
+
+
+def _fmt(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
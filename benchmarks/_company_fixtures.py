@@ -0,0 +1,145 @@
+"""
+벤치마크용 합성 회사 데이터 생성/정리
+"""
+
+from datetime import date
+from typing import Callable, Iterable
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete
+
+from db.db import WriteSessionManager
+from enrichment.domain.aggregates.company_aggregate import CompanyAggregate
+from enrichment.domain.entities.company import Company, CompanyCreateParams
+from enrichment.domain.entities.company_alias import (
+    CompanyAlias,
+    CompanyAliasCreateParams,
+)
+from enrichment.domain.entities.company_metrics_snapshot import (
+    CompanyMetricSnapshotCreateParams,
+    CompanyMetricsSnapshot,
+)
+from enrichment.domain.vos.metrics import (
+    Finance,
+    Investment,
+    MonthlyMetrics,
+    Organization,
+    Patent,
+)
+from enrichment.infrastructure.orm import Company as CompanyOrm
+from enrichment.infrastructure.orm import CompanyAlias as CompanyAliasOrm
+from enrichment.infrastructure.orm import (
+    CompanyFinance,
+    CompanyHeadcount,
+    CompanyInvestment,
+    CompanyMau,
+    CompanyMetricsRollup,
+    CompanyPatent,
+    NewsChunk,
+)
+from enrichment.infrastructure.orm import (
+    CompanyMetricsSnapshot as CompanyMetricsSnapshotOrm,
+)
+
+__all__ = ["START_DATE", "build_aggregate", "delete_companies", "month_of"]
+
+START_DATE = date(1940, 1, 1)
+
+# 회사에 종속된 테이블 (삭제 순서)
+_DEPENDENT_ORMS = (
+    NewsChunk,
+    CompanyMau,
+    CompanyHeadcount,
+    CompanyInvestment,
+    CompanyPatent,
+    CompanyFinance,
+    CompanyMetricsRollup,
+    CompanyMetricsSnapshotOrm,
+    CompanyAliasOrm,
+)
+
+
+def month_of(offset: int, start: date = START_DATE) -> date:
+    year, month = divmod(start.month - 1 + offset, 12)
+    return date(start.year + year, month + 1, 1)
+
+
+def build_aggregate(months: int, alias: str | None = None) -> CompanyAggregate:
+    """months개월치 스냅샷과 롤업을 가진 합성 회사 애그리게이트 생성"""
+    company = Company.of(
+        CompanyCreateParams(
+            external_id=f"bench-{uuid4().hex[:10]}",
+            name=alias or f"벤치마크회사{months}",
+            employee_count=0,
+        )
+    )
+    company.id = uuid4()
+
+    aliases = []
+    if alias:
+        aliases.append(
+            CompanyAlias.of(
+                CompanyAliasCreateParams(
+                    company_id=company.id, alias=alias, alias_type="company_name"
+                )
+            )
+        )
+
+    snapshots = []
+    for offset in range(months):
+        ref_date = month_of(offset)
+        metrics = MonthlyMetrics(
+            mau=[],
+            patents=[Patent(level="국내특허", title=f"특허{offset}", date=ref_date)],
+            finance=[
+                Finance(
+                    year=ref_date.year,
+                    profit=offset * 1000,
+                    operatingProfit=offset * 100,
+                    netProfit=offset * 10,
+                )
+            ],
+            investments=[
+                Investment(
+                    level="Series A",
+                    date=ref_date,
+                    amount=1_000_000,
+                    investors=["벤처캐피탈A"],
+                )
+            ],
+            organizations=[
+                Organization(
+                    name="조직",
+                    date=ref_date,
+                    people_count=10 + offset,
+                    growth_rate=0,
+                )
+            ],
+        )
+        snapshots.append(
+            CompanyMetricsSnapshot.of(
+                CompanyMetricSnapshotCreateParams(
+                    company_id=company.id, reference_date=ref_date, metrics=metrics
+                )
+            )
+        )
+
+    aggregate = CompanyAggregate.of(
+        company=company, company_aliases=aliases, company_metrics_snapshots=snapshots
+    )
+    aggregate.company_metrics_rollups = aggregate.build_metrics_rollups()
+    return aggregate
+
+
+async def delete_companies(
+    write_manager: Callable[[], WriteSessionManager], company_ids: Iterable[UUID]
+) -> None:
+    """합성 회사와 종속 데이터 삭제"""
+    company_ids = list(company_ids)
+    if not company_ids:
+        return
+
+    async with write_manager() as session:
+        for orm in _DEPENDENT_ORMS:
+            await session.execute(delete(orm).where(orm.company_id.in_(company_ids)))
+        await session.execute(delete(CompanyOrm).where(CompanyOrm.id.in_(company_ids)))
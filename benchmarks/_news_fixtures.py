@@ -0,0 +1,97 @@
+"""
+벤치마크용 합성 뉴스 청크 생성
+"""
+
+import hashlib
+from datetime import date, timedelta
+from typing import List, Sequence
+from uuid import UUID
+
+import numpy as np
+from pgvector.asyncpg import register_vector
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+__all__ = [
+    "DIMENSION",
+    "HALF_DIMENSION",
+    "NEWS_START_DATE",
+    "insert_news_chunks",
+    "random_vectors",
+]
+
+DIMENSION = 1536
+HALF_DIMENSION = 512
+NEWS_START_DATE = date(2020, 1, 1)
+NEWS_DAYS = 5 * 365
+
+
+def random_vectors(count: int, seed: int = 0) -> np.ndarray:
+    """정규화된 float32 랜덤 벡터 (count, DIMENSION)"""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, DIMENSION), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+async def insert_news_chunks(
+    engine: AsyncEngine,
+    company_ids: Sequence[UUID],
+    per_company: int,
+    seed: int = 0,
+    batch_size: int = 10_000,
+) -> int:
+    """회사마다 per_company개의 청크를 COPY로 적재하고 적재 건수를 반환"""
+    rng = np.random.default_rng(seed)
+    total = 0
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        await register_vector(raw)
+
+        records: List[tuple] = []
+        for company_idx, company_id in enumerate(company_ids):
+            vectors = random_vectors(per_company, seed=seed + company_idx)
+            offsets = rng.integers(0, NEWS_DAYS, size=per_company)
+            for chunk_idx in range(per_company):
+                contents = f"벤치마크 뉴스 본문 {company_idx}-{chunk_idx}"
+                link = f"https://bench.local/{company_id}/{chunk_idx}"
+                records.append(
+                    (
+                        company_id,
+                        f"벤치마크 뉴스 {company_idx}-{chunk_idx}",
+                        contents,
+                        vectors[chunk_idx],
+                        vectors[chunk_idx],
+                        vectors[chunk_idx][:HALF_DIMENSION],
+                        link,
+                        NEWS_START_DATE + timedelta(days=int(offsets[chunk_idx])),
+                        hashlib.sha256(
+                            f"{company_id}\x1f{link}\x1f{contents}".encode("utf-8")
+                        ).hexdigest(),
+                    )
+                )
+                if len(records) >= batch_size:
+                    total += await _copy(raw, records)
+                    records = []
+        if records:
+            total += await _copy(raw, records)
+        await conn.commit()
+    return total
+
+
+async def _copy(raw, records: List[tuple]) -> int:
+    await raw.copy_records_to_table(
+        "news_chunks",
+        records=records,
+        columns=[
+            "company_id",
+            "title",
+            "contents",
+            "vector",
+            "vector_half",
+            "vector_half_512",
+            "link",
+            "created_at",
+            "content_hash",
+        ],
+    )
+    return len(records)
@@ -0,0 +1,59 @@
+"""
+서버 확장성 벤치마크용 앱: 실제 server.app에 외부 의존성(DB/Redis/OpenAI)만 스텁으로 교체
+
+요청 처리 경로(multipart 파싱, 프로필 검증, 컨텍스트 집계, 프롬프트 렌더링, 응답 파싱/직렬화)는
+그대로 실행되므로 워커 수에 따른 CPU 처리량을 외부 서비스 없이 측정할 수 있다.
+
+    PYTHONPATH=src python -m runner --app benchmarks._stub_app:app
+"""
+
+import json
+
+from dependency_injector import providers
+
+from server import app
+
+__all__ = ["app"]
+
+LLM_ANSWER = "```json\n{}\n```".format(
+    json.dumps(
+        {
+            "experience_tags": ["대규모 회사 경험", "리더십"],
+            "competency_tags": ["기술 리더십"],
+            "inferences": [
+                {"tag": "리더십", "inference": "팀 리드로 조직을 이끈 경험이 있습니다."}
+            ],
+        },
+        ensure_ascii=False,
+    )
+)
+
+
+class _NoCompanies:
+    async def search(self, params):
+        return []
+
+
+class _NoNews:
+    async def search(self, request):
+        return []
+
+
+class _FixedAnswer:
+    async def answer(self, question, context, model):
+        return LLM_ANSWER
+
+
+class _AlwaysMiss:
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value, ttl=3600):
+        return True
+
+
+_container = app.state.container
+_container.company_search_adapter.override(providers.Object(_NoCompanies()))
+_container.news_search_adapter.override(providers.Object(_NoNews()))
+_container.openai_client.override(providers.Object(_FixedAnswer()))
+_container.redis_cache_adapter.override(providers.Object(_AlwaysMiss()))
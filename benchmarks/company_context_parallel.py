@@ -0,0 +1,107 @@
+"""
+회사 컨텍스트 조회: 회사/메트릭 쿼리 순차 실행 vs 세션을 나눈 동시 실행
+
+합성 회사 20개(각 60개월 스냅샷)를 적재한 뒤 1/5/20개 경력(position)에 대해
+CompanyRepository.get_companies의 지연 시간을 다음 두 설정으로 측정하고 결과가 동일한지 확인한다.
+
+- 순차: 요청당 세션 상한 1 (회사 행 → 스냅샷 또는 계열별 테이블을 한 번에 하나씩 조회)
+- 동시: 요청당 세션 상한 4 (별칭 조회 후 나머지 쿼리를 각자의 세션에서 동시에 조회)
+
+JSONB 스냅샷 조회와, 정규화 테이블 3개 계열(ORGANIZATIONS/FINANCE/INVESTMENTS) 조회를 각각 측정한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.company_context_parallel
+"""
+
+import asyncio
+from uuid import uuid4
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies, month_of
+from enrichment.domain.specs.company_spec import CompanySearchParam
+from enrichment.domain.vos.metrics import MetricFamily
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+
+POSITIONS = (1, 5, 20)
+MONTHS = 60
+SCENARIOS = {
+    "snapshots": None,
+    "3 metric families": [
+        MetricFamily.ORGANIZATIONS,
+        MetricFamily.FINANCE,
+        MetricFamily.INVESTMENTS,
+    ],
+}
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (_, write_manager, read_manager):
+        writer = CompanyRepository(write_manager(), read_manager())
+        sequential = CompanyRepository(write_manager(), read_manager(max_concurrency=1))
+        concurrent = CompanyRepository(write_manager(), read_manager(max_concurrency=4))
+
+        suffix = uuid4().hex[:8]
+        aggregates = [
+            build_aggregate(MONTHS, alias=f"벤치회사{idx}-{suffix}")
+            for idx in range(max(POSITIONS))
+        ]
+        try:
+            for aggregate in aggregates:
+                await writer.save(aggregate)
+
+            for scenario, families in SCENARIOS.items():
+                for positions in POSITIONS:
+                    params = [
+                        CompanySearchParam(
+                            alias=aggregate.company_aliases[0].alias,
+                            start_date=month_of(12),
+                            end_date=month_of(36),
+                        )
+                        for aggregate in aggregates[:positions]
+                    ]
+
+                    assert _summary(
+                        await sequential.get_companies(params, families)
+                    ) == _summary(await concurrent.get_companies(params, families))
+
+                    one_by_one = await measure(
+                        lambda: sequential.get_companies(params, families)
+                    )
+                    together = await measure(
+                        lambda: concurrent.get_companies(params, families)
+                    )
+                    rows.append(
+                        {
+                            "scenario": scenario,
+                            "positions": positions,
+                            "seq_p50_ms": one_by_one["p50"],
+                            "seq_p95_ms": one_by_one["p95"],
+                            "par_p50_ms": together["p50"],
+                            "par_p95_ms": together["p95"],
+                            "speedup": one_by_one["p50"] / together["p50"],
+                        }
+                    )
+        finally:
+            await delete_companies(
+                write_manager, [aggregate.company.id for aggregate in aggregates]
+            )
+
+    print_table("company context: sequential vs concurrent sessions", rows)
+
+
+def _summary(aggregates):
+    return sorted(
+        (
+            aggregate.company.id,
+            tuple(alias.alias for alias in aggregate.company_aliases),
+            tuple(s.reference_date for s in aggregate.company_metrics_snapshots),
+        )
+        for aggregate in aggregates
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
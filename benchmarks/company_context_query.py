@@ -0,0 +1,89 @@
+"""
+회사 컨텍스트 조회: 3회 왕복(별칭/회사/스냅샷) vs CTE 단일 쿼리 비교
+
+합성 회사 20개(각 60개월 스냅샷)를 적재한 뒤 1/5/20개 경력(position)에 대해
+두 방식의 지연 시간을 측정하고 결과가 동일한지 확인한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.company_context_query
+"""
+
+import asyncio
+from uuid import uuid4
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies, month_of
+from enrichment.domain.specs.company_spec import CompanySearchParam
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+
+POSITIONS = (1, 5, 20)
+MONTHS = 60
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (_, write_manager, read_manager):
+        writer = CompanyRepository(write_manager(), read_manager())
+        multi = CompanyRepository(write_manager(), read_manager())
+        single = CompanyRepository(
+            write_manager(), read_manager(), single_statement=True
+        )
+
+        suffix = uuid4().hex[:8]
+        aggregates = [
+            build_aggregate(MONTHS, alias=f"벤치회사{idx}-{suffix}")
+            for idx in range(max(POSITIONS))
+        ]
+        try:
+            for aggregate in aggregates:
+                await writer.save(aggregate)
+
+            for positions in POSITIONS:
+                params = [
+                    CompanySearchParam(
+                        alias=aggregate.company_aliases[0].alias,
+                        start_date=month_of(12),
+                        end_date=month_of(36),
+                    )
+                    for aggregate in aggregates[:positions]
+                ]
+
+                multi_result = await multi.get_companies(params)
+                single_result = await single.get_companies(params)
+                assert _summary(multi_result) == _summary(single_result)
+
+                three_queries = await measure(lambda: multi.get_companies(params))
+                one_query = await measure(lambda: single.get_companies(params))
+                rows.append(
+                    {
+                        "positions": positions,
+                        "3q_p50_ms": three_queries["p50"],
+                        "3q_p95_ms": three_queries["p95"],
+                        "1q_p50_ms": one_query["p50"],
+                        "1q_p95_ms": one_query["p95"],
+                        "speedup": three_queries["p50"] / one_query["p50"],
+                    }
+                )
+        finally:
+            await delete_companies(
+                write_manager, [aggregate.company.id for aggregate in aggregates]
+            )
+
+    print_table("company context: three round trips vs single statement", rows)
+
+
+def _summary(aggregates):
+    return sorted(
+        (
+            aggregate.company.id,
+            tuple(alias.alias for alias in aggregate.company_aliases),
+            tuple(s.reference_date for s in aggregate.company_metrics_snapshots),
+        )
+        for aggregate in aggregates
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""
+재직 구간 메트릭 요약: 스냅샷 스캔 vs 누적 롤업 조회 비교
+
+합성 회사 하나에 10/100/1000개월의 스냅샷과 롤업을 적재한 뒤,
+전체 기간을 재직 구간으로 하여 두 방식의 지연 시간을 측정한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.company_metrics_rollup
+"""
+
+import asyncio
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from enrichment.domain.aggregates.company_aggregate import CompanyAggregate
+from enrichment.domain.specs.company_spec import MetricsWindowParam
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+    GetCompaniesMetricsSnapshotsPram,
+)
+
+MONTHS = (10, 100, 1000)
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (_, write_manager, read_manager):
+        repository = CompanyRepository(write_manager(), read_manager())
+
+        for months in MONTHS:
+            aggregate = build_aggregate(months)
+            company_id = aggregate.company.id
+            start_date = aggregate.company_metrics_snapshots[0].reference_date
+            end_date = aggregate.company_metrics_snapshots[-1].reference_date
+            await repository.save(aggregate)
+
+            async def snapshot_scan():
+                # 기존 경로: 구간 내 스냅샷 전체를 읽어 애그리게이트에서 계산
+                async with repository.read_session_manager as session:
+                    snapshot_map = await repository._get_companies_metrics_snapshots(
+                        [
+                            GetCompaniesMetricsSnapshotsPram(
+                                company_id=company_id,
+                                start_date=start_date,
+                                end_date=end_date,
+                            )
+                        ],
+                        session,
+                    )
+                scanned = CompanyAggregate.of(
+                    company=aggregate.company,
+                    company_aliases=[],
+                    company_metrics_snapshots=[
+                        repository._create_snapshots_from(s)
+                        for s in snapshot_map.get(company_id, [])
+                    ],
+                )
+                scanned.calculate_people_metrics()
+                scanned.calculate_finance_metrics()
+                scanned.calculate_investment_metrics()
+                scanned.calculate_patent_metrics()
+
+            async def rollup_window():
+                await repository.get_metrics_windows(
+                    [
+                        MetricsWindowParam(
+                            company_id=company_id,
+                            start_date=start_date,
+                            end_date=end_date,
+                        )
+                    ]
+                )
+
+            try:
+                scan = await measure(snapshot_scan)
+                rollup = await measure(rollup_window)
+            finally:
+                await delete_companies(write_manager, [company_id])
+
+            rows.append(
+                {
+                    "months": months,
+                    "scan_p50_ms": scan["p50"],
+                    "scan_p95_ms": scan["p95"],
+                    "rollup_p50_ms": rollup["p50"],
+                    "rollup_p95_ms": rollup["p95"],
+                    "speedup": scan["p50"] / rollup["p50"],
+                }
+            )
+
+    print_table("tenure window metrics: snapshot scan vs rollup", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
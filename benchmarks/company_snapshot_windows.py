@@ -0,0 +1,119 @@
+"""
+재직 구간 스냅샷 조회: OR-of-ANDs 조건 vs unnest 파라미터 테이블 비교
+
+합성 회사 50개(각 120개월 스냅샷)를 적재한 뒤 1~50개 구간에 대해
+두 쿼리의 지연 시간, SQL 문 종류 수(prepared statement 재사용 여부),
+EXPLAIN (ANALYZE, BUFFERS) 계획을 출력한다. 측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.company_snapshot_windows
+"""
+
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import and_, or_, select
+
+from benchmarks._common import compile_sql, database, explain, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies, month_of
+from enrichment.infrastructure.orm.company_snapshot import (
+    CompanyMetricsSnapshot as CompanyMetricsSnapshotOrm,
+)
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+    GetCompaniesMetricsSnapshotsPram,
+)
+
+WINDOWS = (1, 5, 10, 25, 50)
+EXPLAIN_WINDOWS = (1, 50)
+MONTHS = 120
+
+
+def legacy_query(params):
+    """기존 OR-of-ANDs 조건 쿼리 (비교용)"""
+    conditions = [
+        and_(
+            CompanyMetricsSnapshotOrm.company_id == param.company_id,
+            CompanyMetricsSnapshotOrm.reference_date >= param.start_date,
+            CompanyMetricsSnapshotOrm.reference_date <= param.end_date,
+        )
+        for param in params
+    ]
+    return (
+        select(CompanyMetricsSnapshotOrm)
+        .where(or_(*conditions))
+        .order_by(CompanyMetricsSnapshotOrm.reference_date.desc())
+    )
+
+
+def unnest_query(repository, params):
+    return (
+        select(CompanyMetricsSnapshotOrm)
+        .where(repository._window_conditions(CompanyMetricsSnapshotOrm, params))
+        .order_by(CompanyMetricsSnapshotOrm.reference_date.desc())
+    )
+
+
+async def main() -> None:
+    rows = []
+    plans = []
+    async with database() as (engine, write_manager, read_manager):
+        repository = CompanyRepository(write_manager(), read_manager())
+        aggregates = [
+            build_aggregate(MONTHS, alias=f"구간회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(max(WINDOWS))
+        ]
+        try:
+            for aggregate in aggregates:
+                await repository.save(aggregate)
+
+            legacy_sql, unnest_sql = set(), set()
+            for windows in WINDOWS:
+                params = [
+                    GetCompaniesMetricsSnapshotsPram(
+                        company_id=aggregate.company.id,
+                        start_date=month_of(24),
+                        end_date=month_of(48),
+                    )
+                    for aggregate in aggregates[:windows]
+                ]
+                legacy = legacy_query(params)
+                unnest = unnest_query(repository, params)
+                legacy_sql.add(compile_sql(legacy))
+                unnest_sql.add(compile_sql(unnest))
+
+                async def run(query):
+                    async with repository.read_session_manager as session:
+                        return (await session.execute(query)).scalars().all()
+
+                assert len(await run(legacy)) == len(await run(unnest))
+                legacy_stats = await measure(lambda: run(legacy))
+                unnest_stats = await measure(lambda: run(unnest))
+                rows.append(
+                    {
+                        "windows": windows,
+                        "or_p50_ms": legacy_stats["p50"],
+                        "or_p95_ms": legacy_stats["p95"],
+                        "unnest_p50_ms": unnest_stats["p50"],
+                        "unnest_p95_ms": unnest_stats["p95"],
+                        "distinct_or_sql": len(legacy_sql),
+                        "distinct_unnest_sql": len(unnest_sql),
+                    }
+                )
+
+                if windows in EXPLAIN_WINDOWS:
+                    plans.append((f"OR-of-ANDs, {windows} windows", legacy))
+                    plans.append((f"unnest, {windows} windows", unnest))
+
+            plans = [(title, await explain(engine, query)) for title, query in plans]
+        finally:
+            await delete_companies(
+                write_manager, [aggregate.company.id for aggregate in aggregates]
+            )
+
+    print_table("snapshot windows: OR-of-ANDs vs unnest", rows)
+    for title, plan in plans:
+        print(f"\n## EXPLAIN {title}\n{plan}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
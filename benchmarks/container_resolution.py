@@ -0,0 +1,168 @@
+"""
+요청당 서비스 그래프 생성 비용: Factory 그래프(이전) vs Singleton 그래프(현재)
+
+analyze_talent_profile이 요청마다 주입받는 Container.talent_inference_service를
+REQUESTS회 해석하여 다음을 출력한다.
+
+1. 요청당 해석 시간(us)과 초당 해석 가능 횟수
+2. 요청당 할당 메모리 최고점(KB, tracemalloc): 해석 중 생성되는 객체 그래프의 크기
+
+이전 그래프는 현재 컨테이너에서 당시 Factory였던 Singleton 제공자(세션 매니저, 리포지터리,
+리더, 어댑터, OpenAI/캐시 클라이언트, 추론 서비스)를 같은 인자의 Factory로 override해 재현한다.
+엔진 생성은 DB에 연결하지 않으므로 DB/Redis/OpenAI 없이 실행된다.
+
+    PYTHONPATH=src python -m benchmarks.container_resolution
+"""
+
+import asyncio
+import gc
+import statistics
+import time
+import tracemalloc
+
+from dependency_injector import providers
+
+from benchmarks._common import print_table
+from containers import Container
+from db.db import ReadSessionManager, WriteSessionManager
+from enrichment.application.services.company_info_reader import CompanyInfoReader
+from enrichment.application.services.news_reader import NewsReader
+from enrichment.application.services.news_writer import NewsWriter
+from enrichment.infrastructure.repositories.company_repository import CompanyRepository
+from enrichment.infrastructure.repositories.news_chunk_write_repository import (
+    NewsChunkWriteRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import NewsRepository
+from inference.application.services.talent_infer import TalentInference
+from inference.infrastructure.adapters.company_search_adapter import (
+    CompanyContextSearchAdapter,
+)
+from inference.infrastructure.adapters.news_search_adapter import NewsSearchAdapter
+from inference.infrastructure.adapters.openai_adapter import OpenAIClient
+from shared.cache.redis_cache_adapter import RedisCacheAdapter
+
+REQUESTS = 2000
+# 메모리 측정 횟수 (tracemalloc은 느리므로 일부만)
+SAMPLES = 200
+CONFIG = {
+    "OPENAI": {"API_KEY": "sk-container-resolution"},
+    "EMBEDDING": {"PROVIDER": "openai"},
+    "DATABASE": {
+        "WRITE_ENGINE": "postgresql+asyncpg",
+        "WRITE_URL": "localhost",
+        "WRITE_PORT": 5432,
+        "WRITE_NAME": "bench",
+        "WRITE_USER": "bench",
+        "WRITE_PASSWORD": "bench",
+        "READ_ENGINE": "postgresql+asyncpg",
+        "READ_URL": "localhost",
+        "READ_PORT": 5432,
+        "READ_NAME": "bench",
+        "READ_USER": "bench",
+        "READ_PASSWORD": "bench",
+        "READ_REPLICA_URLS": "",
+        "READ_MAX_LAG_SECONDS": 5.0,
+        "READ_LAG_CHECK_INTERVAL": 0,
+        "READ_YOUR_WRITES_SECONDS": 10.0,
+        "POOL_SIZE": 5,
+        "MAX_OVERFLOW": 5,
+        "POOL_TIMEOUT": 30,
+        "POOL_RECYCLE": 1800,
+        "MAX_SESSIONS_PER_REQUEST": 4,
+        "SINGLE_STATEMENT_COMPANY_QUERY": False,
+    },
+    "NEWS_SEARCH": {
+        "BACKEND": "postgres",
+        "ENGINE": "exact",
+        "HNSW_EF_SEARCH": 100,
+        "HNSW_ITERATIVE_SCAN": "relaxed_order",
+        "VECTOR_STORAGE": "vector",
+    },
+    "NEWS_INGEST": {
+        "CHUNK_SIZE": 320,
+        "CHUNK_OVERLAP": 80,
+        "MAX_BATCH_TOKENS": 250000,
+        "MAX_BATCH_SIZE": 2048,
+    },
+    "REDIS": {"HOST": "localhost", "PORT": 6379, "DB": 0},
+}
+# Singleton으로 바꾸기 전 Factory였던 구현
+PREVIOUSLY_FACTORIES = {
+    ReadSessionManager,
+    WriteSessionManager,
+    CompanyRepository,
+    NewsRepository,
+    NewsChunkWriteRepository,
+    CompanyInfoReader,
+    NewsReader,
+    NewsWriter,
+    OpenAIClient,
+    RedisCacheAdapter,
+    CompanyContextSearchAdapter,
+    NewsSearchAdapter,
+    TalentInference,
+}
+
+
+def build_container(per_request: bool) -> Container:
+    container = Container()
+    container.config.from_dict(CONFIG)
+    if per_request:
+        for provider in container.traverse(types=[providers.Singleton]):
+            if provider.provides in PREVIOUSLY_FACTORIES:
+                provider.override(
+                    providers.Factory(
+                        provider.provides, *provider.args, **provider.kwargs
+                    )
+                )
+    return container
+
+
+async def resolve(container: Container) -> None:
+    service = container.talent_inference_service()
+    if asyncio.isfuture(service) or asyncio.iscoroutine(service):
+        await service
+
+
+async def run(name: str, per_request: bool) -> dict:
+    container = build_container(per_request)
+    # 엔진/Redis 클라이언트 등 프로세스당 하나인 자원은 측정 전에 생성
+    await resolve(container)
+
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await resolve(container)
+    elapsed = time.perf_counter() - started
+
+    # 요청 하나를 해석하는 동안 늘어난 메모리의 최고점 (생성 후 해제되는 객체 포함)
+    gc.collect()
+    tracemalloc.start()
+    peaks = []
+    for _ in range(SAMPLES):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        await resolve(container)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+
+    await container.shutdown_resources()
+    return {
+        "graph": name,
+        "us_per_request": elapsed / REQUESTS * 1e6,
+        "resolutions_per_s": REQUESTS / elapsed,
+        "alloc_peak_kb": statistics.fmean(peaks) / 1024,
+    }
+
+
+async def main() -> None:
+    rows = [
+        await run("factory (before)", per_request=True),
+        await run("singleton", per_request=False),
+    ]
+    print_table("talent_inference_service resolution per request", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+임베딩 클라이언트: 배치 분할 + 동시 요청 처리량 (로컬 가짜 임베딩 서버)
+
+OpenAI embeddings API를 흉내 내는 aiohttp 서버(요청당 고정 지연 + 입력당 지연,
+동시 처리 한도를 넘으면 retry-after와 함께 429)를 띄우고,
+OpenAIEmbeddingClient를 base_url로 연결하여 20,000개 청크를 동시성 1/2/4/8로 임베딩할 때의 초당 처리량과 429 횟수를 출력한다.
+DB나 네트워크 없이 실행된다.
+
+    PYTHONPATH=src python -m benchmarks.embedding_client_throughput
+"""
+
+import asyncio
+import base64
+import time
+
+import numpy as np
+from aiohttp import web
+
+from benchmarks._common import print_table
+from enrichment.infrastructure.embeddings.openai import OpenAIEmbeddingClient
+
+TEXTS = 20_000
+DIMENSIONS = 1536
+MAX_BATCH_SIZE = 512
+CONCURRENCY = (1, 2, 4, 8)
+# 가짜 서버: 요청당 지연, 입력당 지연, 동시 처리 한도
+REQUEST_LATENCY_S = 0.05
+PER_INPUT_LATENCY_S = 0.0002
+SERVER_CAPACITY = 6
+
+
+class FakeEmbeddingServer:
+    def __init__(self):
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limited = 0
+        vector = np.random.default_rng(0).random(DIMENSIONS, dtype=np.float32)
+        self.vectors = {
+            "float": vector.tolist(),
+            "base64": base64.b64encode(vector.astype("<f4").tobytes()).decode(),
+        }
+
+    async def embeddings(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests += 1
+        if self.in_flight >= SERVER_CAPACITY:
+            self.rate_limited += 1
+            return web.json_response(
+                {"error": {"message": "Rate limit reached", "type": "requests"}},
+                status=429,
+                headers={"retry-after": "0.05"},
+            )
+
+        self.in_flight += 1
+        try:
+            inputs = payload["input"]
+            vector = self.vectors[payload.get("encoding_format", "float")]
+            await asyncio.sleep(REQUEST_LATENCY_S + PER_INPUT_LATENCY_S * len(inputs))
+            return web.json_response(
+                {
+                    "object": "list",
+                    "model": payload["model"],
+                    "data": [
+                        {"object": "embedding", "index": idx, "embedding": vector}
+                        for idx in range(len(inputs))
+                    ],
+                    "usage": {"prompt_tokens": 0, "total_tokens": 0},
+                }
+            )
+        finally:
+            self.in_flight -= 1
+
+
+async def main() -> None:
+    server = FakeEmbeddingServer()
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/v1/embeddings", server.embeddings)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    texts = [
+        f"{idx}번째 뉴스 청크: 회사가 새로운 결제 시스템을 발표했다."
+        for idx in range(TEXTS)
+    ]
+    rows = []
+    try:
+        for concurrency in CONCURRENCY:
+            client = OpenAIEmbeddingClient(
+                api_key="fake",
+                base_url=f"http://127.0.0.1:{port}/v1",
+                max_batch_size=MAX_BATCH_SIZE,
+                max_concurrency=concurrency,
+                backoff_base=0.05,
+            )
+            server.requests = server.rate_limited = 0
+
+            started = time.perf_counter()
+            embeddings = await client.generate_embeddings(texts)
+            elapsed = time.perf_counter() - started
+            assert len(embeddings) == TEXTS and all(
+                e.size == DIMENSIONS for e in embeddings
+            )
+
+            rows.append(
+                {
+                    "concurrency": concurrency,
+                    "texts_per_s": TEXTS / elapsed,
+                    "elapsed_s": elapsed,
+                    "requests": server.requests,
+                    "rate_limited": server.rate_limited,
+                    "final_limit": client.limiter.limit,
+                }
+            )
+            await client.client.close()
+    finally:
+        await runner.cleanup()
+
+    print_table("embedding client throughput (fake server)", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
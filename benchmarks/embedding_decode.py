@@ -0,0 +1,97 @@
+"""
+임베딩 전송 형식: float JSON 리스트 vs base64 float32 -> NumPy
+
+OpenAI embeddings 응답 본문(512개 x 1536차원)을 받아 pgvector 바인드 값까지 만드는
+경로를 형식별로 측정하여 임베딩 1개당 CPU 시간과 최대 할당량(tracemalloc peak)을 출력한다.
+- float_text: float JSON 리스트 -> List[float] -> pgvector 텍스트('[...]') (기존)
+- sdk_base64_list: base64 -> NumPy -> tolist() (SDK 기본 동작) -> pgvector 텍스트
+- base64_numpy_binary: base64 -> np.frombuffer (복사 없음) -> pgvector 바이너리 (변경 후)
+DB나 네트워크 없이 실행된다.
+
+    PYTHONPATH=src python -m benchmarks.embedding_decode
+"""
+
+import base64
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+from pgvector import Vector
+
+from benchmarks._common import print_table
+from enrichment.infrastructure.embeddings.openai import OpenAIEmbeddingClient
+
+BATCH = 512
+DIMENSIONS = 1536
+REPEATS = 5
+
+
+def response_body(encoding_format: str) -> bytes:
+    vectors = np.random.default_rng(0).standard_normal(
+        (BATCH, DIMENSIONS), dtype=np.float32
+    )
+    if encoding_format == "base64":
+        embeddings = [
+            base64.b64encode(v.astype("<f4").tobytes()).decode() for v in vectors
+        ]
+    else:
+        embeddings = vectors.tolist()
+    return json.dumps(
+        {"data": [{"index": i, "embedding": e} for i, e in enumerate(embeddings)]}
+    ).encode()
+
+
+def float_text(body: bytes):
+    data = json.loads(body)["data"]
+    return [Vector._to_db(item["embedding"]) for item in data]
+
+
+def sdk_base64_list(body: bytes):
+    data = json.loads(body)["data"]
+    vectors = [
+        np.frombuffer(base64.b64decode(item["embedding"]), dtype="float32").tolist()
+        for item in data
+    ]
+    return [Vector._to_db(vector) for vector in vectors]
+
+
+def base64_numpy_binary(body: bytes):
+    data = json.loads(body)["data"]
+    vectors = [OpenAIEmbeddingClient._decode(item["embedding"]) for item in data]
+    return [Vector(vector).to_binary() for vector in vectors]
+
+
+def profile(fn: Callable, body: bytes) -> dict:
+    fn(body)  # warm-up
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        fn(body)
+    elapsed = (time.perf_counter() - started) / REPEATS
+
+    tracemalloc.start()
+    fn(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "us_per_embedding": elapsed / BATCH * 1_000_000,
+        "peak_kb_per_embedding": peak / BATCH / 1024,
+        "body_kb_per_embedding": len(body) / BATCH / 1024,
+    }
+
+
+def main() -> None:
+    bodies = {fmt: response_body(fmt) for fmt in ("float", "base64")}
+    rows = []
+    for name, fn, fmt in (
+        ("float_text", float_text, "float"),
+        ("sdk_base64_list", sdk_base64_list, "base64"),
+        ("base64_numpy_binary", base64_numpy_binary, "base64"),
+    ):
+        rows.append({"path": name, **profile(fn, bodies[fmt])})
+    print_table(f"embedding decode ({BATCH} x {DIMENSIONS})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+로컬 해싱 임베딩(HashingEmbeddingClient): 처리량과 검색 품질
+
+1. 처리량: 약 650자 한국어 합성 청크 100,000개를 2,048개 배치로 임베딩하여
+   초당 청크 수를 출력한다.
+2. 검색 품질: 회사/사건/제품 조합으로 만든 합성 뉴스 문장 12,000개에서, 같은 조합을
+   다른 어순과 표현으로 쓴 질의 500개로 코사인 top-10을 찾아 recall@1/recall@10을 출력한다.
+DB나 네트워크 없이 실행된다.
+
+    PYTHONPATH=src python -m benchmarks.embedding_hashing
+"""
+
+import asyncio
+import itertools
+import time
+
+import numpy as np
+
+from benchmarks._common import print_table
+from enrichment.infrastructure.embeddings.hashing import HashingEmbeddingClient
+
+THROUGHPUT_CHUNKS = 100_000
+BATCH_SIZE = 2_048
+CORPUS = 12_000
+QUERIES = 500
+
+COMPANIES = [f"{name}{idx}" for idx in range(40) for name in ("한빛", "미래", "새봄")]
+EVENTS = [
+    "신규 공장 건설",
+    "결제 서비스 출시",
+    "대규모 투자 유치",
+    "해외 법인 설립",
+    "인공지능 연구소 개소",
+]
+PRODUCTS = ["반도체", "전기차 배터리", "모바일 게임", "클라우드 플랫폼", "바이오 신약"]
+REGIONS = ["서울", "부산", "베트남", "미국", "독일"]
+
+
+def chunk_text(idx: int) -> str:
+    return (f"{idx}번째 뉴스 청크: 회사가 새로운 결제 시스템을 발표했다. " * 20).strip()
+
+
+def corpus_sentence(combo) -> str:
+    company, event, product, region = combo
+    return f"{company}가 {region}에서 {product} 사업을 위한 {event} 계획을 발표했다."
+
+
+def query_sentence(combo) -> str:
+    company, event, product, region = combo
+    return f"{region} {product} {event} 소식 ({company})"
+
+
+async def throughput(client: HashingEmbeddingClient) -> dict:
+    texts = [chunk_text(idx) for idx in range(THROUGHPUT_CHUNKS)]
+    started = time.perf_counter()
+    for start in range(0, len(texts), BATCH_SIZE):
+        await client.generate_embeddings(texts[start : start + BATCH_SIZE])
+    elapsed = time.perf_counter() - started
+    return {
+        "chunks": THROUGHPUT_CHUNKS,
+        "chars_per_chunk": len(texts[0]),
+        "chunks_per_s": THROUGHPUT_CHUNKS / elapsed,
+        "elapsed_s": elapsed,
+    }
+
+
+async def retrieval(client: HashingEmbeddingClient) -> dict:
+    rng = np.random.default_rng(0)
+    combos = list(itertools.product(COMPANIES, EVENTS, PRODUCTS, REGIONS))
+    combos = [combos[i] for i in rng.choice(len(combos), CORPUS, replace=False)]
+    corpus = np.stack(
+        await client.generate_embeddings([corpus_sentence(c) for c in combos])
+    )
+
+    targets = rng.choice(len(combos), QUERIES, replace=False)
+    queries = np.stack(
+        await client.generate_embeddings([query_sentence(combos[t]) for t in targets])
+    )
+    top = np.argsort(-(queries @ corpus.T), axis=1)[:, :10]
+    return {
+        "corpus": len(combos),
+        "queries": QUERIES,
+        "recall@1": float(np.mean(top[:, 0] == targets)),
+        "recall@10": float(np.mean((top == targets[:, None]).any(axis=1))),
+    }
+
+
+async def main() -> None:
+    client = HashingEmbeddingClient()
+    print_table("hashing embedding throughput", [await throughput(client)])
+    print_table("hashing embedding retrieval", [await retrieval(client)])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""
+뉴스 청크 분리: llama-index SentenceSplitter vs KoreanSentenceChunker
+
+example_datas/company_news.csv의 기사 1,328건(제목/회사/날짜)마다 그 값으로 채운 한국어
+문장 8~60개짜리 합성 본문을 만들어(원문은 수집해야 하므로) 다음을 출력한다.
+
+1. 처리량: SentenceSplitter, KoreanSentenceChunker(단일 프로세스),
+   KoreanSentenceChunker.split_many(CPU 수만큼의 프로세스)의 초당 청크 수
+2. 출력 일치: SentenceSplitter와 청크 목록이 완전히 같은 기사 비율, 청크 수, 평균 토큰 수
+
+DB나 네트워크 없이 실행된다.
+
+    PYTHONPATH=src python -m benchmarks.news_chunker
+"""
+
+import csv
+import os
+import random
+import time
+from typing import Callable, List
+
+from benchmarks._common import print_table
+from enrichment.infrastructure.chunkers.korean_sentence import KoreanSentenceChunker
+from enrichment.infrastructure.chunkers.sentence_splitter import (
+    SentenceSplitterChunker,
+)
+
+NEWS_CSV = "example_datas/company_news.csv"
+# 처리량 측정용으로 기사 목록을 반복하는 횟수
+REPEAT = 4
+
+TEMPLATES = [
+    '{name}는 {year}년 {month}월 {day}일 "{title}" 관련 내용을 발표했다.',
+    '업계 관계자는 "{name}의 이번 결정은 시장에 큰 영향을 줄 것"이라고 말했다.',
+    "{name} 측은 올해 매출이 전년 대비 {pct}% 증가할 것으로 내다봤다.",
+    "이번 발표는 서울 본사에서 진행됐으며, 국내외 투자자 {count}명이 참석했다.",
+    "전문가들은 {name}가 신규 서비스, 해외 진출, 인공지능 투자를 통해 성장세를 "
+    "이어갈 것으로 분석했다.",
+    "다만 경쟁 심화와 규제 리스크는 여전히 과제로 꼽힌다.",
+    "한편 {name}의 주가는 이날 {rate}% 상승 마감했다!",
+    "회사는 하반기에도 이용자 경험 개선에 집중할 계획이냐는 질문에 그렇다고 답했다?",
+]
+
+
+def build_articles() -> List[str]:
+    rng = random.Random(0)
+    with open(NEWS_CSV, "r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    articles = []
+    for row in rows:
+        sentences = [
+            rng.choice(TEMPLATES).format(
+                **row,
+                pct=rng.randint(1, 40),
+                count=rng.randint(10, 500),
+                rate=f"{rng.uniform(0, 10):.1f}",
+            )
+            for _ in range(rng.randint(8, 60))
+        ]
+        articles.append(" ".join(sentences))
+    return articles
+
+
+def throughput(name: str, split_all: Callable[[List[str]], List[List[str]]], texts):
+    started = time.perf_counter()
+    results = split_all(texts)
+    elapsed = time.perf_counter() - started
+    chunks = sum(len(chunks) for chunks in results)
+    return {
+        "chunker": name,
+        "articles": len(texts),
+        "chunks": chunks,
+        "chunks_per_s": chunks / elapsed,
+        "elapsed_s": elapsed,
+    }
+
+
+def main() -> None:
+    articles = build_articles()
+    texts = articles * REPEAT
+    reference = SentenceSplitterChunker(chunk_size=320, chunk_overlap=80)
+    chunker = KoreanSentenceChunker(chunk_size=320, chunk_overlap=80)
+    workers = os.cpu_count() or 1
+
+    print_table(
+        "news chunker throughput",
+        [
+            throughput(
+                "SentenceSplitter",
+                lambda items: [reference.split(text) for text in items],
+                texts,
+            ),
+            throughput(
+                "KoreanSentenceChunker",
+                lambda items: [chunker.split(text) for text in items],
+                texts,
+            ),
+            throughput(
+                f"KoreanSentenceChunker x{workers} proc",
+                lambda items: list(chunker.split_many(items, workers=workers)),
+                texts,
+            ),
+        ],
+    )
+
+    expected = [reference.split(text) for text in articles]
+    actual = [chunker.split(text) for text in articles]
+    print_table(
+        "news chunker parity",
+        [
+            {
+                "articles": len(articles),
+                "identical": sum(a == b for a, b in zip(actual, expected))
+                / len(articles),
+                "chunks_reference": sum(len(chunks) for chunks in expected),
+                "chunks": sum(len(chunks) for chunks in actual),
+                "mean_tokens_reference": mean_tokens(chunker, expected),
+                "mean_tokens": mean_tokens(chunker, actual),
+            }
+        ],
+    )
+
+
+def mean_tokens(chunker: KoreanSentenceChunker, results: List[List[str]]) -> float:
+    chunks = [chunk for chunks in results for chunk in chunks]
+    return sum(chunker.count_tokens(chunk) for chunk in chunks) / len(chunks)
+
+
+if __name__ == "__main__":
+    main()
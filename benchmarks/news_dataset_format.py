@@ -0,0 +1,115 @@
+"""
+뉴스 청크 데이터셋 형식: CSV(JSON 벡터 열) vs 메타데이터 CSV + float32 .npy
+
+합성 청크 20,000개(1536차원)를 두 형식으로 저장하여 파일 크기, 적재 시간(전체 벡터를
+float32 행렬로 만들기까지), 바이너리 COPY 스트림 생성 시간을 출력한다.
+- csv_json: tools/init_data의 이전 형식 (csv.DictReader + json.loads, 행마다 텍스트 벡터)
+- npy_mmap: tools/news_dataset 형식 (np.load(mmap_mode="r") + 바이너리 COPY 스트림)
+DB 없이 실행되며 측정 후 파일은 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_dataset_format
+"""
+
+import csv
+import json
+import os
+import tempfile
+import time
+from uuid import uuid4
+
+import numpy as np
+
+from benchmarks._common import print_table
+from benchmarks._news_fixtures import random_vectors
+from tools.news_dataset import _copy_stream, read_dataset, write_dataset
+
+CHUNKS = 20_000
+
+
+def build_rows():
+    return [
+        {
+            "name": f"회사{idx % 20}",
+            "title": f"뉴스 제목 {idx}",
+            "original_link": f"https://news.local/{idx // 5}",
+            "year": "2023",
+            "month": str(idx % 12 + 1),
+            "day": "1",
+            "content": f"{idx}번째 뉴스 청크: 회사가 새로운 결제 시스템을 발표했다. "
+            * 10,
+        }
+        for idx in range(CHUNKS)
+    ]
+
+
+def write_legacy_csv(path, rows, vectors):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=[*rows[0].keys(), "vectors"])
+        writer.writeheader()
+        for row, vector in zip(rows, vectors):
+            writer.writerow({**row, "vectors": json.dumps(vector.tolist())})
+
+
+def load_legacy_csv(path):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    matrix = np.asarray([json.loads(row["vectors"]) for row in rows], dtype=np.float32)
+    return rows, matrix
+
+
+def main() -> None:
+    rows = build_rows()
+    vectors = random_vectors(CHUNKS, seed=42_000)
+    company_map = {f"회사{idx}": str(uuid4()) for idx in range(20)}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, "company_news_with_vector.csv")
+        dataset_path = os.path.join(workdir, "company_news_dataset")
+        write_legacy_csv(csv_path, rows, vectors)
+        write_dataset(dataset_path, rows, vectors)
+
+        started = time.perf_counter()
+        _, legacy_matrix = load_legacy_csv(csv_path)
+        csv_load = time.perf_counter() - started
+
+        started = time.perf_counter()
+        dataset_rows, dataset_matrix = read_dataset(dataset_path)
+        dataset_matrix = np.asarray(dataset_matrix)  # 전체 행 접근
+        npy_load = time.perf_counter() - started
+        started = time.perf_counter()
+        _copy_stream(dataset_rows, dataset_matrix, company_map)
+        npy_copy = time.perf_counter() - started
+
+        assert np.array_equal(legacy_matrix, dataset_matrix)
+        csv_mb = os.path.getsize(csv_path) / 1024 / 1024
+        npy_mb = (
+            sum(
+                os.path.getsize(os.path.join(dataset_path, name))
+                for name in os.listdir(dataset_path)
+            )
+            / 1024
+            / 1024
+        )
+
+    print_table(
+        f"news dataset format ({CHUNKS} chunks x 1536)",
+        [
+            {
+                "format": "csv_json",
+                "size_mb": csv_mb,
+                "load_s": csv_load,
+                # 이전 경로는 청크마다 INSERT 1회 (텍스트 벡터를 서버가 파싱)
+                "copy_stream_s": "-",
+            },
+            {
+                "format": "npy_mmap",
+                "size_mb": npy_mb,
+                "load_s": npy_load,
+                "copy_stream_s": npy_copy,
+            },
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+뉴스 적재: NewsWriter 처리량 (분할 + 임베딩 + COPY 적재)
+
+합성 회사 20개에 기사 2,000건(기사당 약 50청크, 총 약 10만 청크)을 로컬 스텁 임베더로
+적재하여 분당 청크 처리량을 출력한다. 목표는 분당 100,000청크이며,
+같은 기사를 다시 적재하여 content_hash 멱등성(새 적재 0건, 임베딩 호출 없음)도 확인한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_ingest
+"""
+
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import List
+from uuid import uuid4
+
+from benchmarks._common import database, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import random_vectors
+from enrichment.application.dtos.news_write import NewsArticle
+from enrichment.application.ports.text_embedding_client_port import (
+    TextEmbeddingClientPort,
+)
+from enrichment.application.services.news_writer import NewsWriter
+from enrichment.infrastructure.chunkers.korean_sentence import KoreanSentenceChunker
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_chunk_write_repository import (
+    NewsChunkWriteRepository,
+)
+
+COMPANIES = 20
+ARTICLES = 2_000
+SENTENCES_PER_ARTICLE = 300
+TARGET_CHUNKS_PER_MINUTE = 100_000
+
+
+class StubEmbeddingClient(TextEmbeddingClientPort):
+    """네트워크 없이 랜덤 단위 벡터를 반환하는 임베더"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        return list(random_vectors(len(texts), seed=self.calls))
+
+
+def build_articles(company_ids) -> List[NewsArticle]:
+    articles = []
+    for idx in range(ARTICLES):
+        sentences = (
+            f"기사 {idx}의 {n}번째 문장에서 회사가 새로운 결제 시스템을 발표했다."
+            for n in range(SENTENCES_PER_ARTICLE)
+        )
+        articles.append(
+            NewsArticle(
+                company_id=company_ids[idx % len(company_ids)],
+                title=f"적재 벤치마크 기사 {idx}",
+                contents=" ".join(sentences),
+                link=f"https://bench.local/ingest/{idx}",
+                published_at=date(2020, 1, 1) + timedelta(days=idx % 1500),
+            )
+        )
+    return articles
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+
+        aggregates = [
+            build_aggregate(1, alias=f"적재회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(COMPANIES)
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            articles = build_articles(company_ids)
+
+            for run in ("first", "rerun"):
+                embedder = StubEmbeddingClient()
+                writer = NewsWriter(
+                    chunker=KoreanSentenceChunker(),
+                    embedding_client=embedder,
+                    repository=NewsChunkWriteRepository(write_manager()),
+                )
+                started = time.perf_counter()
+                result = await writer.write(articles)
+                elapsed = time.perf_counter() - started
+                if run == "rerun":
+                    assert result.inserted == 0 and embedder.calls == 0, result
+
+                rows.append(
+                    {
+                        "run": run,
+                        "chunks": result.chunks,
+                        "inserted": result.inserted,
+                        "skipped": result.skipped,
+                        "embed_calls": embedder.calls,
+                        "seconds": elapsed,
+                        "chunks_per_min": result.chunks / elapsed * 60,
+                        "target": TARGET_CHUNKS_PER_MINUTE,
+                    }
+                )
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table("news ingest: NewsWriter throughput (stub embedder)", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,134 @@
+"""
+뉴스 검색: created_at 파티션 제외(partition pruning) 확인
+
+합성 회사 20개(회사당 2,000개 청크, 2020~2024년 분포)를 적재한 뒤
+재직 구간이 2021년 한 해인 검색 쿼리와 2020~2024년 전체인 검색 쿼리에 대해
+저장 방식/검색 엔진별 문의 실행 계획에서 실제로 스캔된 연 단위 파티션과
+종단 지연 시간을 출력한다. 2021년 쿼리의 계획에 다른 연도 파티션이 나타나면 실패한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_partition_pruning
+"""
+
+import asyncio
+import re
+from datetime import date
+from uuid import uuid4
+
+from benchmarks._common import database, explain, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import (
+    BINARY_SEARCH_STATEMENT,
+    EXACT_PER_QUERY_SEARCH_STATEMENT,
+    HNSW_SEARCH_STATEMENT,
+    NewsRepository,
+    NewsSearchEngine,
+)
+
+COMPANIES = 20
+CHUNKS_PER_COMPANY = 2_000
+WINDOWS = {
+    "2021": (date(2021, 1, 1), date(2021, 12, 31)),
+    "2020-2024": (date(2020, 1, 1), date(2024, 12, 31)),
+}
+STATEMENTS = {
+    "exact": EXACT_PER_QUERY_SEARCH_STATEMENT,
+    "hnsw": HNSW_SEARCH_STATEMENT,
+    "binary": BINARY_SEARCH_STATEMENT,
+}
+PARTITION = re.compile(r"news_chunks_(y\d{4}|default)")
+
+
+def scanned_partitions(plan: str) -> set:
+    """실행 계획에서 실제로 실행된(never executed가 아닌) 파티션 이름"""
+    return {
+        match.group(0)
+        for line in plan.splitlines()
+        if "never executed" not in line
+        for match in PARTITION.finditer(line)
+    }
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+
+        aggregates = [
+            build_aggregate(1, alias=f"파티션회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(COMPANIES)
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            await insert_news_chunks(engine, company_ids, CHUNKS_PER_COMPANY)
+
+            query_vectors = random_vectors(COMPANIES, seed=50_000)
+            for label, (start_date, end_date) in WINDOWS.items():
+                context = NewsSearchContext(
+                    queries=[
+                        SearchQuery(
+                            company_id=company_id,
+                            query_vector=query_vectors[idx],
+                            start_date=start_date,
+                            end_date=end_date,
+                        )
+                        for idx, company_id in enumerate(company_ids)
+                    ],
+                    limit_per_query=5,
+                    similarity_threshold=-1.0,
+                )
+                repository = NewsRepository(read_manager())
+                params = repository._statement_params(context)
+                params["candidate_limit"] = context.limit_per_query * 10
+
+                for name, statement in STATEMENTS.items():
+                    plan = await explain(engine, statement, params, options="ANALYZE")
+                    partitions = scanned_partitions(plan)
+                    if label == "2021":
+                        assert partitions == {"news_chunks_y2021"}, partitions
+
+                    search_repository = NewsRepository(
+                        read_manager(),
+                        engine=(
+                            NewsSearchEngine.HNSW
+                            if name == "hnsw"
+                            else NewsSearchEngine.EXACT
+                        ),
+                    )
+                    search_context = (
+                        NewsSearchContext(
+                            queries=context.queries,
+                            limit_per_query=context.limit_per_query,
+                            similarity_threshold=context.similarity_threshold,
+                            binary_prefilter=True,
+                        )
+                        if name == "binary"
+                        else context
+                    )
+                    stats = await measure(
+                        lambda: search_repository.search_per_query(search_context)
+                    )
+                    rows.append(
+                        {
+                            "window": label,
+                            "statement": name,
+                            "partitions": ",".join(sorted(partitions)),
+                            "p50_ms": stats["p50"],
+                            "p95_ms": stats["p95"],
+                        }
+                    )
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table("news search: created_at partition pruning", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
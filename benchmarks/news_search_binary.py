@@ -0,0 +1,121 @@
+"""
+뉴스 검색: 이진 양자화(bit) 프리필터 + float32 재정렬 2단계 검색 평가
+
+코퍼스 크기별로 합성 청크를 적재한 뒤 같은 검색 쿼리 묶음에 대해
+정확 검색, HNSW(float32) 검색, 후보 배수별 이진 프리필터 검색의
+종단 지연 시간(p50/p95)과 recall@k(정확 검색 결과 대비)를 측정한다.
+크기마다 합성 데이터를 적재하고 측정 후 삭제한다.
+
+    PYTHONPATH=src python -m benchmarks.news_search_binary
+
+코퍼스 크기(청크 수, 쉼표 구분)와 회사 수는 환경 변수로 조정한다.
+
+    BENCH_NEWS_SIZES=100000,1000000 BENCH_NEWS_COMPANIES=200 \\
+        PYTHONPATH=src python -m benchmarks.news_search_binary
+"""
+
+import asyncio
+import os
+from dataclasses import replace
+from datetime import date
+from uuid import uuid4
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from benchmarks.news_search_hnsw import recall
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import (
+    NewsRepository,
+    NewsSearchEngine,
+)
+
+SIZES = tuple(
+    int(size)
+    for size in os.environ.get("BENCH_NEWS_SIZES", "50000,200000,1000000").split(",")
+)
+COMPANIES = int(os.environ.get("BENCH_NEWS_COMPANIES", 100))
+QUERY_COUNT = 20
+LIMIT_PER_QUERY = 10
+EF_SEARCH = 100
+OVERSAMPLES = (4, 10, 20)
+
+
+async def evaluate(engine, write_manager, read_manager, size: int) -> list:
+    company_repository = CompanyRepository(write_manager(), read_manager())
+    aggregates = [
+        build_aggregate(1, alias=f"이진검색회사{idx}-{uuid4().hex[:8]}")
+        for idx in range(COMPANIES)
+    ]
+    company_ids = [aggregate.company.id for aggregate in aggregates]
+    rows = []
+    try:
+        for aggregate in aggregates:
+            await company_repository.save(aggregate)
+        await insert_news_chunks(engine, company_ids, size // COMPANIES)
+
+        query_vectors = random_vectors(QUERY_COUNT, seed=40_000)
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(
+                    company_id=company_ids[idx * COMPANIES // QUERY_COUNT],
+                    query_vector=query_vectors[idx],
+                    start_date=date(2021, 1, 1),
+                    end_date=date(2023, 12, 31),
+                )
+                for idx in range(QUERY_COUNT)
+            ],
+            limit_per_query=LIMIT_PER_QUERY,
+            similarity_threshold=-1.0,
+        )
+
+        exact_repository = NewsRepository(read_manager())
+        hnsw_repository = NewsRepository(
+            read_manager(), engine=NewsSearchEngine.HNSW, ef_search=EF_SEARCH
+        )
+        exact = await exact_repository.search_per_query(context)
+
+        candidates = [
+            ("exact", exact_repository, context),
+            (f"hnsw ef={EF_SEARCH}", hnsw_repository, context),
+        ] + [
+            (
+                f"binary x{oversample}",
+                exact_repository,
+                replace(context, binary_prefilter=True, binary_oversample=oversample),
+            )
+            for oversample in OVERSAMPLES
+        ]
+        for label, repository, search_context in candidates:
+            result = await repository.search_per_query(search_context)
+            stats = await measure(
+                lambda: repository.search_per_query(search_context), repeat=10
+            )
+            rows.append(
+                {
+                    "chunks": size,
+                    "mode": label,
+                    "p50_ms": stats["p50"],
+                    "p95_ms": stats["p95"],
+                    f"recall@{LIMIT_PER_QUERY}": recall(exact, result),
+                }
+            )
+    finally:
+        await delete_companies(write_manager, company_ids)
+    return rows
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        for size in SIZES:
+            rows.extend(await evaluate(engine, write_manager, read_manager, size))
+
+    print_table(f"news search: binary prefilter + rerank ({QUERY_COUNT} queries)", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
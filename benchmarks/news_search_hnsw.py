@@ -0,0 +1,128 @@
+"""
+뉴스 검색: 정확 검색(ROW_NUMBER 전수 정렬) vs LATERAL HNSW top-k 검색 비교
+
+합성 회사(기본 500개 × 회사당 2,000개 = 100만 청크)를 적재한 뒤
+같은 검색 쿼리 묶음에 대해 정확 검색과 hnsw.ef_search 값별 HNSW 검색의
+종단 지연 시간(p50/p95)과 recall@k(정확 검색 결과 대비)를 측정한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_search_hnsw
+
+규모는 환경 변수로 조정한다.
+
+    BENCH_NEWS_COMPANIES=50 BENCH_NEWS_PER_COMPANY=1000 \\
+        PYTHONPATH=src python -m benchmarks.news_search_hnsw
+"""
+
+import asyncio
+import os
+from datetime import date
+from typing import List
+from uuid import uuid4
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from enrichment.domain.entities.new_chunk import NewsChunk
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import (
+    NewsRepository,
+    NewsSearchEngine,
+)
+
+COMPANIES = int(os.environ.get("BENCH_NEWS_COMPANIES", 500))
+CHUNKS_PER_COMPANY = int(os.environ.get("BENCH_NEWS_PER_COMPANY", 2_000))
+QUERY_COUNT = 20
+LIMIT_PER_QUERY = 10
+EF_SEARCH_VALUES = (40, 100, 200)
+
+
+def recall(exact: List[List[NewsChunk]], approx: List[List[NewsChunk]]) -> float:
+    """쿼리별 정확 검색 top-k 중 근사 검색이 찾아낸 비율의 평균"""
+    ratios = []
+    for exact_chunks, approx_chunks in zip(exact, approx):
+        if not exact_chunks:
+            continue
+        expected = {chunk.id for chunk in exact_chunks}
+        found = {chunk.id for chunk in approx_chunks}
+        ratios.append(len(expected & found) / len(expected))
+    return sum(ratios) / len(ratios) if ratios else 1.0
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+
+        aggregates = [
+            build_aggregate(1, alias=f"HNSW회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(COMPANIES)
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            await insert_news_chunks(engine, company_ids, CHUNKS_PER_COMPANY)
+
+            query_vectors = random_vectors(QUERY_COUNT, seed=20_000)
+            context = NewsSearchContext(
+                queries=[
+                    SearchQuery(
+                        company_id=company_ids[idx * COMPANIES // QUERY_COUNT],
+                        query_vector=query_vectors[idx],
+                        start_date=date(2021, 1, 1),
+                        end_date=date(2023, 12, 31),
+                    )
+                    for idx in range(QUERY_COUNT)
+                ],
+                limit_per_query=LIMIT_PER_QUERY,
+                similarity_threshold=-1.0,
+            )
+
+            exact_repository = NewsRepository(read_manager())
+            exact = await exact_repository.search_per_query(context)
+            exact_stats = await measure(
+                lambda: exact_repository.search_per_query(context), repeat=10
+            )
+            rows.append(
+                {
+                    "engine": "exact",
+                    "ef_search": "-",
+                    "p50_ms": exact_stats["p50"],
+                    "p95_ms": exact_stats["p95"],
+                    f"recall@{LIMIT_PER_QUERY}": 1.0,
+                }
+            )
+
+            for ef_search in EF_SEARCH_VALUES:
+                hnsw_repository = NewsRepository(
+                    read_manager(), engine=NewsSearchEngine.HNSW, ef_search=ef_search
+                )
+                approx = await hnsw_repository.search_per_query(context)
+                hnsw_stats = await measure(
+                    lambda: hnsw_repository.search_per_query(context)
+                )
+                rows.append(
+                    {
+                        "engine": "hnsw",
+                        "ef_search": ef_search,
+                        "p50_ms": hnsw_stats["p50"],
+                        "p95_ms": hnsw_stats["p95"],
+                        f"recall@{LIMIT_PER_QUERY}": recall(exact, approx),
+                    }
+                )
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table(
+        f"news search: exact vs LATERAL HNSW "
+        f"({COMPANIES * CHUNKS_PER_COMPANY:,} chunks, {QUERY_COUNT} queries)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
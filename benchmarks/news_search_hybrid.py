@@ -0,0 +1,92 @@
+"""
+뉴스 검색: 벡터 단독 vs 하이브리드(벡터 + 전문 검색, RRF) 지연 시간
+
+합성 회사 20개(회사당 2,000개 청크)를 적재한 뒤 1/3/7/20개 검색 쿼리에 대해
+벡터 단독 쿼리별 검색과 하이브리드 검색의 종단 지연 시간을 측정한다.
+하이브리드 검색어는 모든 청크에 매칭되는 경우(broad, 최악)와
+어떤 청크에도 매칭되지 않는 경우(miss)로 나누어 측정한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_search_hybrid
+"""
+
+import asyncio
+from dataclasses import replace
+from datetime import date
+from uuid import uuid4
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import NewsRepository
+
+QUERY_COUNTS = (1, 3, 7, 20)
+CHUNKS_PER_COMPANY = 2_000
+QUERY_TEXTS = {
+    "broad": "벤치마크 뉴스 본문",  # 합성 청크 전부에 매칭
+    "miss": "결제 시스템 토스뱅크",  # 매칭 없음
+}
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+
+        aggregates = [
+            build_aggregate(1, alias=f"하이브리드회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(max(QUERY_COUNTS))
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            await insert_news_chunks(engine, company_ids, CHUNKS_PER_COMPANY)
+
+            repository = NewsRepository(read_manager())
+            query_vectors = random_vectors(max(QUERY_COUNTS), seed=70_000)
+            for count in QUERY_COUNTS:
+                context = NewsSearchContext(
+                    queries=[
+                        SearchQuery(
+                            company_id=company_ids[idx],
+                            query_vector=query_vectors[idx],
+                            start_date=date(2021, 1, 1),
+                            end_date=date(2023, 12, 31),
+                        )
+                        for idx in range(count)
+                    ],
+                    limit_per_query=5,
+                    similarity_threshold=0.0,
+                )
+                vector_stats = await measure(
+                    lambda: repository.search_per_query(context)
+                )
+                row = {"queries": count, "vector_p50_ms": vector_stats["p50"]}
+                for label, query_text in QUERY_TEXTS.items():
+                    hybrid_context = replace(
+                        context,
+                        queries=[
+                            replace(query, query_text=query_text)
+                            for query in context.queries
+                        ],
+                        hybrid=True,
+                    )
+                    stats = await measure(
+                        lambda: repository.search_per_query(hybrid_context)
+                    )
+                    row[f"hybrid_{label}_p50_ms"] = stats["p50"]
+                    row[f"hybrid_{label}_overhead"] = stats["p50"] / vector_stats["p50"]
+                rows.append(row)
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table("news search: vector-only vs hybrid (RRF)", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
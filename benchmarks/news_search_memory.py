@@ -0,0 +1,110 @@
+"""
+뉴스 검색: Postgres(NewsRepository) vs 인메모리 NumPy(InMemoryNewsRepository)
+
+합성 회사 20개(회사당 2,000개 청크)를 적재한 뒤 1/3/7/20개 검색 쿼리에 대해
+Postgres 정확 검색, 인메모리 검색(적재 후), mmap 인메모리 검색의
+종단 지연 시간을 측정하고, 최초 지연 적재 시간과 인덱스 메모리 사용량을 출력한다.
+측정 후 합성 데이터와 mmap 파일은 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_search_memory
+"""
+
+import asyncio
+import tempfile
+import time
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.in_memory_news_repository import (
+    InMemoryNewsRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import NewsRepository
+
+QUERY_COUNTS = (1, 3, 7, 20)
+CHUNKS_PER_COMPANY = 2_000
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+        session_maker = async_sessionmaker(bind=engine, class_=AsyncSession)
+
+        aggregates = [
+            build_aggregate(1, alias=f"인메모리회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(max(QUERY_COUNTS))
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            await insert_news_chunks(engine, company_ids, CHUNKS_PER_COMPANY)
+
+            postgres = NewsRepository(read_manager())
+            memory = InMemoryNewsRepository(session_maker)
+            with tempfile.TemporaryDirectory() as mmap_dir:
+                mmap = InMemoryNewsRepository(session_maker, mmap_dir=mmap_dir)
+
+                load_times = {}
+                for name, repository in (("memory", memory), ("mmap", mmap)):
+                    started = time.perf_counter()
+                    await repository.preload(company_ids)
+                    load_times[name] = (time.perf_counter() - started) * 1000
+
+                query_vectors = random_vectors(max(QUERY_COUNTS), seed=60_000)
+                for count in QUERY_COUNTS:
+                    context = NewsSearchContext(
+                        queries=[
+                            SearchQuery(
+                                company_id=company_ids[idx],
+                                query_vector=query_vectors[idx],
+                                start_date=date(2021, 1, 1),
+                                end_date=date(2023, 12, 31),
+                            )
+                            for idx in range(count)
+                        ],
+                        limit_per_query=5,
+                        similarity_threshold=0.0,
+                    )
+                    postgres_stats = await measure(lambda: postgres.search(context))
+                    memory_stats = await measure(lambda: memory.search(context))
+                    mmap_stats = await measure(lambda: mmap.search(context))
+                    rows.append(
+                        {
+                            "queries": count,
+                            "postgres_p50_ms": postgres_stats["p50"],
+                            "memory_p50_ms": memory_stats["p50"],
+                            "mmap_p50_ms": mmap_stats["p50"],
+                            "postgres_p95_ms": postgres_stats["p95"],
+                            "memory_p95_ms": memory_stats["p95"],
+                            "mmap_p95_ms": mmap_stats["p95"],
+                        }
+                    )
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table("news search: postgres vs in-process numpy", rows)
+    print_table(
+        "in-process index load",
+        [
+            {
+                "companies": len(company_ids),
+                "memory_load_ms": load_times["memory"],
+                "mmap_first_load_ms": load_times["mmap"],
+                "index_mb": memory.memory_bytes / 1024 / 1024,
+            }
+        ],
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
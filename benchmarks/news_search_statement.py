@@ -0,0 +1,167 @@
+"""
+뉴스 검색: 쿼리 수만큼 커지는 VALUES 문 vs 고정 형태 unnest 문 비교
+
+합성 회사 20개(회사당 2,000개 청크)를 적재한 뒤 1/3/7/20개 검색 쿼리에 대해
+플래닝 시간, 종단 지연 시간, 생성되는 SQL 문 종류 수를 측정한다.
+측정 후 합성 데이터는 삭제된다.
+
+    PYTHONPATH=src python -m benchmarks.news_search_statement
+"""
+
+import asyncio
+from datetime import date
+from uuid import uuid4
+
+from pgvector.sqlalchemy import Vector as PG_Vector
+from sqlalchemy import and_, case, cast, column, func, literal, select
+from sqlalchemy import values as sa_values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from benchmarks._common import (
+    compile_sql,
+    database,
+    explain,
+    measure,
+    plan_time,
+    print_table,
+)
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.orm.news_chunk import NewsChunk as NewsChunkORM
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import (
+    SEARCH_STATEMENT,
+    NewsRepository,
+)
+
+QUERY_COUNTS = (1, 3, 7, 20)
+CHUNKS_PER_COMPANY = 2_000
+
+
+def values_statement(context: NewsSearchContext):
+    """변경 전 VALUES 기반 검색 문 (비교용)"""
+    v = (
+        sa_values(
+            column("company_id", PG_UUID(as_uuid=True)),
+            column("qvec", PG_Vector(1536)),
+            column("start_date"),
+            column("end_date"),
+        )
+        .data([query.to_tuple() for query in context.queries])
+        .alias("q")
+    )
+    date_pred = and_(
+        NewsChunkORM.company_id == v.c.company_id,
+        NewsChunkORM.created_at >= v.c.start_date,
+        case(
+            (v.c.end_date.isnot(None), NewsChunkORM.created_at <= v.c.end_date),
+            else_=literal(True),
+        ),
+    )
+    dist = NewsChunkORM.vector.cosine_distance(cast(v.c.qvec, PG_Vector(1536)))
+    sim = (literal(1.0) - dist).label("similarity_score")
+    ranked = (
+        select(
+            NewsChunkORM.id,
+            NewsChunkORM.company_id,
+            NewsChunkORM.title,
+            NewsChunkORM.contents,
+            sim,
+            func.row_number()
+            .over(partition_by=NewsChunkORM.company_id, order_by=dist.asc())
+            .label("rn"),
+        )
+        .select_from(v.join(NewsChunkORM, date_pred))
+        .where(sim >= context.similarity_threshold)
+        .subquery("ranked")
+    )
+    return (
+        select(ranked)
+        .where(ranked.c.rn <= context.limit_per_query)
+        .order_by(ranked.c.similarity_score.desc())
+    )
+
+
+def unnest_params(context: NewsSearchContext):
+    company_ids, vectors, starts, ends = map(
+        list, zip(*(query.to_tuple() for query in context.queries))
+    )
+    return {
+        "company_ids": company_ids,
+        "query_vectors": vectors,
+        "start_dates": starts,
+        "end_dates": ends,
+        "similarity_threshold": context.similarity_threshold,
+        "limit_per_query": context.limit_per_query,
+    }
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+        news_repository = NewsRepository(read_manager())
+
+        aggregates = [
+            build_aggregate(1, alias=f"뉴스회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(max(QUERY_COUNTS))
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            await insert_news_chunks(engine, company_ids, CHUNKS_PER_COMPANY)
+
+            query_vectors = random_vectors(max(QUERY_COUNTS), seed=10_000)
+            values_sql = set()
+            for count in QUERY_COUNTS:
+                context = NewsSearchContext(
+                    queries=[
+                        SearchQuery(
+                            company_id=company_ids[idx],
+                            query_vector=query_vectors[idx],
+                            start_date=date(2021, 1, 1),
+                            end_date=date(2023, 12, 31),
+                        )
+                        for idx in range(count)
+                    ],
+                    limit_per_query=5,
+                    similarity_threshold=0.0,
+                )
+                legacy = values_statement(context)
+                values_sql.add(compile_sql(legacy))
+
+                async def run_values():
+                    async with news_repository.session_manager as session:
+                        return (await session.execute(legacy)).fetchall()
+
+                values_stats = await measure(run_values)
+                unnest_stats = await measure(lambda: news_repository.search(context))
+                values_plan = await explain(engine, legacy, options="ANALYZE")
+                unnest_plan = await explain(
+                    engine, SEARCH_STATEMENT, unnest_params(context), options="ANALYZE"
+                )
+                rows.append(
+                    {
+                        "queries": count,
+                        "values_plan_ms": plan_time(values_plan),
+                        "unnest_plan_ms": plan_time(unnest_plan),
+                        "values_p50_ms": values_stats["p50"],
+                        "unnest_p50_ms": unnest_stats["p50"],
+                        "values_p95_ms": values_stats["p95"],
+                        "unnest_p95_ms": unnest_stats["p95"],
+                        "distinct_values_sql": len(values_sql),
+                        "distinct_unnest_sql": 1,
+                    }
+                )
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table("news search: VALUES statement vs fixed-shape unnest", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
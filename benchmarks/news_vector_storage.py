@@ -0,0 +1,146 @@
+"""
+뉴스 임베딩 저장 방식 비교: vector(1536, float32) vs halfvec(1536) vs halfvec(512)
+
+합성 회사(기본 100개 × 회사당 2,000개 청크)를 적재한 뒤 저장 방식별로
+HNSW 인덱스 크기, 인덱스 빌드 시간, HNSW 검색 지연 시간(p50/p95),
+float32 정확 검색 대비 recall@k를 측정한다.
+빌드 시간은 기존 인덱스를 같은 정의로 DROP 후 다시 CREATE하여 측정하므로
+측정이 끝나면 스키마는 원래대로 남고, 합성 데이터는 삭제된다.
+
+합성 벡터는 차원 간 상관이 없는 랜덤 벡터이므로 halfvec_512의 recall은
+실제 text-embedding-3 임베딩(앞쪽 차원에 정보가 몰려 있음)보다 비관적으로 측정된다.
+
+    PYTHONPATH=src python -m benchmarks.news_vector_storage
+
+규모는 환경 변수로 조정한다.
+
+    BENCH_NEWS_COMPANIES=500 BENCH_NEWS_PER_COMPANY=2000 \\
+        PYTHONPATH=src python -m benchmarks.news_vector_storage
+"""
+
+import asyncio
+import os
+import time
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from benchmarks._common import database, measure, print_table
+from benchmarks._company_fixtures import build_aggregate, delete_companies
+from benchmarks._news_fixtures import insert_news_chunks, random_vectors
+from benchmarks.news_search_hnsw import recall
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories.company_repository import (
+    CompanyRepository,
+)
+from enrichment.infrastructure.repositories.news_repository import (
+    NewsRepository,
+    NewsSearchEngine,
+    NewsVectorStorage,
+)
+
+COMPANIES = int(os.environ.get("BENCH_NEWS_COMPANIES", 100))
+CHUNKS_PER_COMPANY = int(os.environ.get("BENCH_NEWS_PER_COMPANY", 2_000))
+QUERY_COUNT = 20
+LIMIT_PER_QUERY = 10
+EF_SEARCH = 100
+
+INDEXES = {
+    NewsVectorStorage.VECTOR: "idx_chunk_hnsw",
+    NewsVectorStorage.HALFVEC: "idx_chunk_half_hnsw",
+    NewsVectorStorage.HALFVEC_512: "idx_chunk_half_512_hnsw",
+}
+
+
+async def rebuild_index(engine, index_name: str) -> float:
+    """인덱스를 같은 정의로 다시 만들고 빌드 시간(초)을 반환"""
+    async with engine.connect() as conn:
+        indexdef = (
+            await conn.execute(
+                text("SELECT indexdef FROM pg_indexes WHERE indexname = :name"),
+                {"name": index_name},
+            )
+        ).scalar_one()
+        await conn.execute(text(f"DROP INDEX {index_name}"))
+        started = time.perf_counter()
+        await conn.execute(text(indexdef))
+        elapsed = time.perf_counter() - started
+        await conn.commit()
+    return elapsed
+
+
+async def index_size_mb(engine, index_name: str) -> float:
+    async with engine.connect() as conn:
+        size = (
+            await conn.execute(
+                text("SELECT pg_relation_size(CAST(:name AS regclass))"),
+                {"name": index_name},
+            )
+        ).scalar_one()
+    return size / 1024 / 1024
+
+
+async def main() -> None:
+    rows = []
+    async with database() as (engine, write_manager, read_manager):
+        company_repository = CompanyRepository(write_manager(), read_manager())
+
+        aggregates = [
+            build_aggregate(1, alias=f"저장방식회사{idx}-{uuid4().hex[:8]}")
+            for idx in range(COMPANIES)
+        ]
+        company_ids = [aggregate.company.id for aggregate in aggregates]
+        try:
+            for aggregate in aggregates:
+                await company_repository.save(aggregate)
+            await insert_news_chunks(engine, company_ids, CHUNKS_PER_COMPANY)
+
+            query_vectors = random_vectors(QUERY_COUNT, seed=30_000)
+            context = NewsSearchContext(
+                queries=[
+                    SearchQuery(
+                        company_id=company_ids[idx * COMPANIES // QUERY_COUNT],
+                        query_vector=query_vectors[idx],
+                        start_date=date(2021, 1, 1),
+                        end_date=date(2023, 12, 31),
+                    )
+                    for idx in range(QUERY_COUNT)
+                ],
+                limit_per_query=LIMIT_PER_QUERY,
+                similarity_threshold=-1.0,
+            )
+            exact = await NewsRepository(read_manager()).search_per_query(context)
+
+            for storage, index_name in INDEXES.items():
+                build_seconds = await rebuild_index(engine, index_name)
+                repository = NewsRepository(
+                    read_manager(),
+                    engine=NewsSearchEngine.HNSW,
+                    ef_search=EF_SEARCH,
+                    vector_storage=storage,
+                )
+                approx = await repository.search_per_query(context)
+                stats = await measure(lambda: repository.search_per_query(context))
+                rows.append(
+                    {
+                        "storage": storage.value,
+                        "index_mb": await index_size_mb(engine, index_name),
+                        "build_s": build_seconds,
+                        "p50_ms": stats["p50"],
+                        "p95_ms": stats["p95"],
+                        f"recall@{LIMIT_PER_QUERY}": recall(exact, approx),
+                    }
+                )
+        finally:
+            await delete_companies(write_manager, company_ids)
+
+    print_table(
+        f"news vector storage ({COMPANIES * CHUNKS_PER_COMPANY:,} chunks, "
+        f"hnsw ef_search={EF_SEARCH})",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+"""
+워커 수에 따른 API 처리량: runner(prefork) 워커 1개 ~ CPU 코어 수
+
+benchmarks._stub_app(외부 의존성만 스텁으로 교체한 server.app)을 `python -m runner`로 띄우고,
+CLIENTS개의 부하 생성 프로세스가 각각 CONCURRENCY개의 연결로 DURATION초 동안
+/api/v1/inferences/talent-profile-analyses에 인재 프로필(example_datas/talent_ex1.json)을 업로드하여
+다음을 출력한다.
+
+1. 워커 수별 초당 요청 수와 워커 1개 대비 배율
+2. 요청 지연 시간 p50/p99(ms)와 실패 수
+
+부하 생성기도 같은 머신의 CPU를 쓰므로 배율은 코어 수보다 낮게 나온다. uvicorn이 설치되어 있어야 한다.
+
+    PYTHONPATH=src python -m benchmarks.server_scaling
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import httpx
+
+from benchmarks._common import print_table
+from benchmarks.startup_profile import probe_env
+
+DURATION = 10.0
+WARMUP = 2.0
+CLIENTS = 2
+CONCURRENCY = 32
+STARTUP_TIMEOUT = 30.0
+PROFILE = "example_datas/talent_ex1.json"
+PATH = "/api/v1/inferences/talent-profile-analyses"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = probe_env()
+    env.update(
+        {
+            "DB_WARMUP": "false",
+            # 측정 중 워커 교체가 일어나지 않도록
+            "SERVER_MAX_REQUESTS": "0",
+        }
+    )
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "runner",
+            "--app",
+            "benchmarks._stub_app:app",
+            "--workers",
+            str(workers),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+    stop_server(process)
+    raise RuntimeError(f"runner with {workers} workers did not start")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def _load(port: int, body: bytes) -> Tuple[List[float], int]:
+    latencies: List[float] = []
+    failures = 0
+    limits = httpx.Limits(max_connections=CONCURRENCY)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30
+    ) as client:
+        started = time.monotonic()
+        measure_from = started + WARMUP
+        deadline = measure_from + DURATION
+
+        async def user() -> None:
+            nonlocal failures
+            while (now := time.monotonic()) < deadline:
+                try:
+                    response = await client.post(
+                        PATH, files={"file": ("talent.json", body, "application/json")}
+                    )
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if now < measure_from:
+                    continue
+                if ok:
+                    latencies.append(time.monotonic() - now)
+                else:
+                    failures += 1
+
+        await asyncio.gather(*(user() for _ in range(CONCURRENCY)))
+    return latencies, failures
+
+
+def load(port: int) -> Tuple[List[float], int]:
+    with open(PROFILE, "rb") as f:
+        body = f.read()
+    return asyncio.run(_load(port, body))
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def main() -> None:
+    rows = []
+    baseline = None
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        port = free_port()
+        process = start_server(workers, port)
+        try:
+            with ProcessPoolExecutor(CLIENTS) as executor:
+                results = list(executor.map(load, [port] * CLIENTS))
+        finally:
+            stop_server(process)
+
+        latencies = [latency for result, _ in results for latency in result]
+        failures = sum(failed for _, failed in results)
+        rps = len(latencies) / DURATION
+        baseline = baseline or rps
+        rows.append(
+            {
+                "workers": workers,
+                "rps": rps,
+                "speedup": rps / baseline if baseline else 0.0,
+                "p50_ms": percentile(latencies, 0.5) * 1000 if latencies else 0.0,
+                "p99_ms": percentile(latencies, 0.99) * 1000 if latencies else 0.0,
+                "failures": failures,
+            }
+        )
+    print_table("talent inference throughput by worker count (stubbed IO)", rows)
+
+
+if __name__ == "__main__":
+    main()
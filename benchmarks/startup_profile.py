@@ -0,0 +1,119 @@
+"""
+API 프로세스 시작 프로파일: import 시간, 최대 RSS, 로딩된 모듈
+
+새 인터프리터에서 `python -X importtime`으로 server 모듈(app 생성 포함)을 import하는 과정을
+REPEAT회 반복하여 다음을 출력한다.
+
+1. 시작 시간/최대 RSS/모듈 수 (중앙값): 현재 server와, 이전처럼 llama_index를 함께
+   import하는 경우(RichPromptTemplate/get_tokenizer를 쓰던 시작 경로)를 비교
+2. 현재 server의 최상위 패키지별 import 자체 시간 상위 TOP개
+
+설정은 환경 변수가 없으면 .env-example 값을 사용하며, DB/Redis/OpenAI에는 연결하지 않는다.
+
+    PYTHONPATH=src python -m benchmarks.startup_profile
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from benchmarks._common import print_table
+
+REPEAT = 5
+TOP = 12
+ENV_EXAMPLE = ".env-example"
+
+PROBE = """
+import resource, sys, time
+started = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - started
+print(__import__("json").dumps({{
+    "elapsed_s": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": len(sys.modules),
+    "llama_index": any(name.startswith("llama_index") for name in sys.modules),
+}}))
+"""
+
+SCENARIOS = {
+    "server": "import server",
+    "server + llama_index (before)": (
+        "import llama_index.core.prompts, llama_index.core.utils\nimport server"
+    ),
+}
+
+
+def probe_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    with open(ENV_EXAMPLE, "r", encoding="utf-8") as f:
+        for line in f:
+            key, sep, value = line.strip().partition("=")
+            if sep and not key.startswith("#"):
+                env.setdefault(key, value)
+    env["OPENAI_API_KEY"] = env.get("OPENAI_API_KEY") or "sk-startup-profile"
+    env["PYTHONPATH"] = "src"
+    env["PYTHONWARNINGS"] = "ignore"
+    return env
+
+
+def run(imports: str, env: Dict[str, str]) -> Tuple[dict, str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(imports=imports)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def package_self_times(importtime: str) -> Counter:
+    """-X importtime 출력의 자체 시간(us)을 최상위 패키지별로 합산"""
+    totals = Counter()
+    for line in importtime.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    return totals
+
+
+def main() -> None:
+    env = probe_env()
+    rows: List[dict] = []
+    server_importtime = ""
+    for name, imports in SCENARIOS.items():
+        samples = []
+        for _ in range(REPEAT):
+            sample, importtime = run(imports, env)
+            samples.append(sample)
+        if name == "server":
+            server_importtime = importtime
+        rows.append(
+            {
+                "scenario": name,
+                "startup_s": statistics.median(s["elapsed_s"] for s in samples),
+                "max_rss_mb": statistics.median(s["max_rss_mb"] for s in samples),
+                "modules": samples[-1]["modules"],
+                "llama_index": samples[-1]["llama_index"],
+            }
+        )
+    print_table("api startup", rows)
+
+    totals = package_self_times(server_importtime)
+    print_table(
+        f"server import self time by package (top {TOP})",
+        [
+            {"package": package, "self_ms": us / 1000}
+            for package, us in totals.most_common(TOP)
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,21 @@ __all__ = ["Config"]
 
 class OpenAIConfig(BaseSettings):
     API_KEY: str = Field(default="")
+    # 임베딩 배치 동시 요청 수 상한 / rate limit 재시도 횟수
+    EMBEDDING_MAX_CONCURRENCY: int = Field(default=4)
+    EMBEDDING_MAX_RETRIES: int = Field(default=5)
 
     model_config = SettingsConfigDict(env_prefix="OPENAI_")
 
 
+class EmbeddingConfig(BaseSettings):
+    # 임베딩 구현: openai(OpenAIEmbeddingClient) / hashing(HashingEmbeddingClient, 오프라인 결정적 임베딩)
+    PROVIDER: str = Field(default="openai")
+    HASHING_SEED: int = Field(default=0)
+
+    model_config = SettingsConfigDict(env_prefix="EMBEDDING_")
+
+
 class DatabaseConfig(BaseSettings):
     WRITE_ENGINE: str = Field(default="postgresql+asyncpg")
     WRITE_URL: str = Field(default="localhost:5432")
@@ -24,15 +35,65 @@ class DatabaseConfig(BaseSettings):
     READ_NAME: str = Field(default="dev")
     READ_USER: str = Field(default="dev")
     READ_PASSWORD: str = Field(default="dev")
+    # 읽기 복제본 host[:port] 목록 (쉼표 구분, 포트 생략 시 READ_PORT). 비어 있으면 READ_URL 하나
+    READ_REPLICA_URLS: str = Field(default="")
+    # 복제 지연이 이 값(초)을 넘거나 응답하지 않는 복제본은 순환에서 제외 (모두 제외되면 primary에서 읽음)
+    READ_MAX_LAG_SECONDS: float = Field(default=5.0)
+    # 복제 지연 확인 주기(초). 0이면 확인하지 않음
+    READ_LAG_CHECK_INTERVAL: float = Field(default=5.0)
+    # 회사를 저장한 뒤 같은 회사(ID/별칭)를 primary에서 읽는 시간(초). 0이면 사용하지 않음
+    READ_YOUR_WRITES_SECONDS: float = Field(default=10.0)
 
     POOL_SIZE: int = Field(default=5)
     MAX_OVERFLOW: int = Field(default=5)
     POOL_TIMEOUT: int = Field(default=30)
     POOL_RECYCLE: int = Field(default=1800)
+    # 요청 하나가 독립 쿼리를 동시에 실행할 때 함께 여는 읽기 세션(연결) 수 상한
+    MAX_SESSIONS_PER_REQUEST: int = Field(default=4)
+    # 엔진(읽기/쓰기)별로 모든 워커 프로세스가 여는 연결 수 합계의 상한 (runner가 워커별 풀 크기로 나눔)
+    # 0이면 워커마다 POOL_SIZE/MAX_OVERFLOW를 그대로 사용
+    CONNECTION_BUDGET: int = Field(default=0)
+
+    # 회사 컨텍스트 조회를 CTE 기반 단일 쿼리로 수행할지 여부
+    SINGLE_STATEMENT_COMPANY_QUERY: bool = Field(default=False)
+
+    # 시작 시 읽기/쓰기 엔진마다 POOL_SIZE개 연결을 열고 뉴스 검색 문을 prepare 할지 여부
+    WARMUP: bool = Field(default=False)
+    # 워밍업 시 뉴스 검색 HNSW 인덱스를 pg_prewarm으로 적재할지 여부 (pg_prewarm 확장 필요)
+    WARMUP_PREWARM_INDEXES: bool = Field(default=False)
 
     model_config = SettingsConfigDict(env_prefix="DB_")
 
 
+class NewsSearchConfig(BaseSettings):
+    # exact: 조건에 맞는 모든 청크 거리 계산, hnsw: 쿼리별 LATERAL top-k + HNSW 인덱스
+    ENGINE: str = Field(default="exact")
+    HNSW_EF_SEARCH: int = Field(default=100)
+    HNSW_ITERATIVE_SCAN: str = Field(default="relaxed_order")
+    # 검색 대상 임베딩 컬럼: vector(float32) / halfvec(float16) / halfvec_512(float16, 512차원)
+    VECTOR_STORAGE: str = Field(default="vector")
+
+    # 뉴스 리포지터리 구현: postgres(NewsRepository) / memory(InMemoryNewsRepository)
+    BACKEND: str = Field(default="postgres")
+    # memory 백엔드: 회사별 인덱스 메모리 예산(MB), 시작 시 전체 적재 여부, mmap 파일 디렉터리
+    MEMORY_BUDGET_MB: int = Field(default=512)
+    MEMORY_PRELOAD: bool = Field(default=False)
+    MEMORY_MMAP_DIR: str = Field(default="")
+
+    model_config = SettingsConfigDict(env_prefix="NEWS_SEARCH_")
+
+
+class NewsIngestConfig(BaseSettings):
+    # 기사 본문 분할 크기/겹침 (토큰)
+    CHUNK_SIZE: int = Field(default=320)
+    CHUNK_OVERLAP: int = Field(default=80)
+    # 임베딩 요청 1회의 최대 토큰 수/입력 개수 (OpenAI 제한: 300,000 토큰, 2,048개)
+    MAX_BATCH_TOKENS: int = Field(default=250_000)
+    MAX_BATCH_SIZE: int = Field(default=2048)
+
+    model_config = SettingsConfigDict(env_prefix="NEWS_INGEST_")
+
+
 class RedisConfig(BaseSettings):
     HOST: str = Field(default="localhost")
     PORT: int = Field(default=6379)
@@ -41,11 +102,30 @@ class RedisConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
 
+class ServerConfig(BaseSettings):
+    HOST: str = Field(default="0.0.0.0")
+    PORT: int = Field(default=8000)
+    # 워커 프로세스 수 (0이면 CPU 수)
+    WORKERS: int = Field(default=0)
+    # 워커가 처리할 최대 요청 수, 넘으면 정상 종료 후 새 워커로 교체 (0이면 교체하지 않음)
+    # 워커들이 동시에 교체되지 않도록 워커마다 0~MAX_REQUESTS_JITTER를 더함
+    MAX_REQUESTS: int = Field(default=10_000)
+    MAX_REQUESTS_JITTER: int = Field(default=1_000)
+    # 종료/교체 시 진행 중인 요청을 기다리는 최대 시간(초)
+    GRACEFUL_TIMEOUT: int = Field(default=30)
+
+    model_config = SettingsConfigDict(env_prefix="SERVER_")
+
+
 class Config(BaseSettings):
     APP_ENV: str = Field(default="dev")
 
     OPENAI: OpenAIConfig = Field(default_factory=OpenAIConfig)
+    EMBEDDING: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
     DATABASE: DatabaseConfig = Field(default_factory=DatabaseConfig)
     REDIS: RedisConfig = Field(default_factory=RedisConfig)
+    NEWS_SEARCH: NewsSearchConfig = Field(default_factory=NewsSearchConfig)
+    NEWS_INGEST: NewsIngestConfig = Field(default_factory=NewsIngestConfig)
+    SERVER: ServerConfig = Field(default_factory=ServerConfig)
 
     model_config = SettingsConfigDict(case_sensitive=True)
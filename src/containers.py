@@ -1,16 +1,28 @@
+import importlib
+import operator
+from typing import Callable, List
+
 import redis.asyncio as redis
 from dependency_injector import containers, providers
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from db.db import ReadSessionManager, WriteSessionManager, engine_with_pgvector
+from db.db import (
+    ReadSessionManager,
+    WriteSessionManager,
+    engine_with_pgvector,
+    read_router,
+    replica_engines,
+)
 from enrichment.application.services.company_info_reader import CompanyInfoReader
 from enrichment.application.services.company_info_writer import CompanyInfoWriter
 from enrichment.application.services.news_reader import NewsReader
+from enrichment.application.services.news_writer import NewsWriter
+from enrichment.infrastructure.chunkers.korean_sentence import KoreanSentenceChunker
 from enrichment.infrastructure.embeddings.openai import OpenAIEmbeddingClient
-from enrichment.infrastructure.readers.forest_of_hyuksin_reader import (
-    ForestOfHyuksinReader,
-)
 from enrichment.infrastructure.repositories.company_repository import CompanyRepository
+from enrichment.infrastructure.repositories.news_chunk_write_repository import (
+    NewsChunkWriteRepository,
+)
 from enrichment.infrastructure.repositories.news_repository import NewsRepository
 from inference.application.services.talent_infer import TalentInference
 from inference.infrastructure.adapters.company_search_adapter import (
@@ -23,9 +35,47 @@ from shared.cache.redis_cache_adapter import RedisCacheAdapter
 __all__ = ["Container"]
 
 
+def _deferred(path: str) -> Callable:
+    """
+    설정으로 선택될 때만 쓰는 구현은 처음 생성할 때 import 합니다 (API 프로세스 시작 시 로딩하지 않음).
+    """
+    module_name, _, name = path.rpartition(".")
+
+    def create(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), name)(*args, **kwargs)
+
+    create.__qualname__ = path
+    return create
+
+
+def _read_urls(
+    engine: str,
+    user: str,
+    password: str,
+    name: str,
+    url: str,
+    port: int,
+    replica_urls: str = "",
+) -> List[str]:
+    """읽기 복제본 URL 목록 (READ_REPLICA_URLS가 비어 있으면 READ_URL 하나)"""
+    hosts = [host.strip() for host in (replica_urls or "").split(",") if host.strip()]
+    return [
+        f"{engine}://{user}:{password}@{host if ':' in host else f'{host}:{port}'}/{name}"
+        for host in hosts or [url]
+    ]
+
+
 class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
 
+    # Redis client (캐시, 쓰기 후 읽기 고정)
+    redis_client = providers.Singleton(
+        redis.Redis,
+        host=config.REDIS.HOST,
+        port=config.REDIS.PORT,
+        db=config.REDIS.DB,
+    )
+
     # SqlAlchemy
     _write_db_engine = providers.Resource(
         engine_with_pgvector,
@@ -47,51 +97,96 @@ class Container(containers.DeclarativeContainer):
         async_sessionmaker, bind=_write_db_engine, class_=AsyncSession
     )
 
-    _read_db_engine = providers.Resource(
-        engine_with_pgvector,
-        url=providers.Callable(
-            "{engine}://{user}:{password}@{url}:{port}/{name}".format,
+    _read_db_engines = providers.Resource(
+        replica_engines,
+        urls=providers.Callable(
+            _read_urls,
             engine=config.DATABASE.READ_ENGINE,
             user=config.DATABASE.READ_USER,
             password=config.DATABASE.READ_PASSWORD,
+            name=config.DATABASE.READ_NAME,
             url=config.DATABASE.READ_URL,
             port=config.DATABASE.READ_PORT,
-            name=config.DATABASE.READ_NAME,
+            replica_urls=config.DATABASE.READ_REPLICA_URLS,
         ),
         pool_size=config.DATABASE.POOL_SIZE,
         max_overflow=config.DATABASE.MAX_OVERFLOW,
         pool_timeout=config.DATABASE.POOL_TIMEOUT,
         pool_recycle=config.DATABASE.POOL_RECYCLE,
     )
+    # 첫 번째 복제본 (세션 매니저를 거치지 않고 직접 읽는 인메모리 뉴스 인덱스 적재 등)
+    _read_db_engine = providers.Callable(operator.itemgetter(0), _read_db_engines)
     _read_db_session_maker = providers.Singleton(
         async_sessionmaker, bind=_read_db_engine, class_=AsyncSession
     )
 
-    read_session_manager = providers.Factory(
+    # 복제본 분배/복제 지연 확인/쓰기 후 primary 고정 (고정은 Redis로 워커 간 공유)
+    _read_router = providers.Resource(
+        read_router,
+        primary=_write_db_session_maker,
+        engines=_read_db_engines,
+        max_lag_seconds=config.DATABASE.READ_MAX_LAG_SECONDS,
+        pin_seconds=config.DATABASE.READ_YOUR_WRITES_SECONDS,
+        check_interval=config.DATABASE.READ_LAG_CHECK_INTERVAL,
+        redis_client=redis_client,
+    )
+
+    # 세션은 작업(ContextVar)별로 보관되므로 매니저는 프로세스당 하나를 공유하고,
+    # 요청 단위 범위(동시 세션 상한)는 server의 SessionScopeMiddleware가 엽니다.
+    read_session_manager = providers.Singleton(
         ReadSessionManager,
-        session_maker=_read_db_session_maker,
+        router=_read_router,
+        max_concurrency=config.DATABASE.MAX_SESSIONS_PER_REQUEST,
     )
 
-    write_session_manager = providers.Factory(
+    write_session_manager = providers.Singleton(
         WriteSessionManager,
         session_maker=_write_db_session_maker,
     )
 
     # Enrichment
+    # 요청별 상태가 없는 리포지터리/서비스/어댑터/클라이언트는 프로세스당 하나를 공유
+    # (요청마다 객체 그래프를 새로 만들지 않음)
     # # Repositories
-    company_repository = providers.Factory(
+    company_repository = providers.Singleton(
         CompanyRepository,
         write_session_manager=write_session_manager,
         read_session_manager=read_session_manager,
+        single_statement=config.DATABASE.SINGLE_STATEMENT_COMPANY_QUERY,
+    )
+    news_respository = providers.Selector(
+        config.NEWS_SEARCH.BACKEND,
+        postgres=providers.Singleton(
+            NewsRepository,
+            session_manager=read_session_manager,
+            engine=config.NEWS_SEARCH.ENGINE,
+            ef_search=config.NEWS_SEARCH.HNSW_EF_SEARCH,
+            iterative_scan=config.NEWS_SEARCH.HNSW_ITERATIVE_SCAN,
+            vector_storage=config.NEWS_SEARCH.VECTOR_STORAGE,
+        ),
+        # 회사별 인덱스를 요청 간에 유지해야 하므로 프로세스당 하나
+        memory=providers.Singleton(
+            _deferred(
+                "enrichment.infrastructure.repositories.in_memory_news_repository"
+                ".InMemoryNewsRepository"
+            ),
+            session_maker=_read_db_session_maker,
+            memory_budget_mb=config.NEWS_SEARCH.MEMORY_BUDGET_MB,
+            mmap_dir=config.NEWS_SEARCH.MEMORY_MMAP_DIR,
+        ),
     )
-    news_respository = providers.Factory(
-        NewsRepository,
-        session_manager=read_session_manager,
+
+    news_chunk_write_repository = providers.Singleton(
+        NewsChunkWriteRepository,
+        session_manager=write_session_manager,
     )
 
     # # Readers
     forest_hyucksin_reader = providers.Factory(
-        ForestOfHyuksinReader,
+        _deferred(
+            "enrichment.infrastructure.readers.forest_of_hyuksin_reader"
+            ".ForestOfHyuksinReader"
+        ),
     )
 
     # # Dynamic config for runtime values
@@ -104,60 +199,90 @@ class Container(containers.DeclarativeContainer):
     )
 
     # # embedding clients
-    openai_embedding_client = providers.Factory(
+    # 동시성 제한/rate limit 상태를 요청 간에 공유하도록 프로세스당 하나
+    openai_embedding_client = providers.Singleton(
         OpenAIEmbeddingClient,
         api_key=config.OPENAI.API_KEY,
+        max_batch_tokens=config.NEWS_INGEST.MAX_BATCH_TOKENS,
+        max_batch_size=config.NEWS_INGEST.MAX_BATCH_SIZE,
+        max_concurrency=config.OPENAI.EMBEDDING_MAX_CONCURRENCY,
+        max_retries=config.OPENAI.EMBEDDING_MAX_RETRIES,
+    )
+    hashing_embedding_client = providers.Singleton(
+        _deferred(
+            "enrichment.infrastructure.embeddings.hashing.HashingEmbeddingClient"
+        ),
+        seed=config.EMBEDDING.HASHING_SEED,
+    )
+    embedding_client = providers.Selector(
+        config.EMBEDDING.PROVIDER,
+        openai=openai_embedding_client,
+        hashing=hashing_embedding_client,
+    )
+
+    # # chunkers
+    # 토크나이저 로딩 비용이 있으므로 프로세스당 하나
+    text_chunker = providers.Singleton(
+        KoreanSentenceChunker,
+        chunk_size=config.NEWS_INGEST.CHUNK_SIZE,
+        chunk_overlap=config.NEWS_INGEST.CHUNK_OVERLAP,
     )
 
     # # services
+    # reader_source_key로 요청마다 reader를 고르므로 writer만 요청마다 생성
     company_info_writer = providers.Factory(
         CompanyInfoWriter,
         reader=reader_selector,
         repository=company_repository,
     )
-    company_info_reader = providers.Factory(
+    company_info_reader = providers.Singleton(
         CompanyInfoReader,
         repository=company_repository,
     )
 
-    news_reader = providers.Factory(
+    news_reader = providers.Singleton(
         NewsReader,
-        embedding_client=openai_embedding_client,
+        embedding_client=embedding_client,
+        news_repository=news_respository,
+        chunker=text_chunker,
+        max_article_tokens=config.NEWS_INGEST.CHUNK_SIZE,
+    )
+
+    news_writer = providers.Singleton(
+        NewsWriter,
+        chunker=text_chunker,
+        embedding_client=embedding_client,
+        repository=news_chunk_write_repository,
+        max_batch_tokens=config.NEWS_INGEST.MAX_BATCH_TOKENS,
+        max_batch_size=config.NEWS_INGEST.MAX_BATCH_SIZE,
         news_repository=news_respository,
     )
 
     # Inference
     # LLM Client
-    openai_client = providers.Factory(
+    # AsyncOpenAI의 HTTP 연결 풀을 요청 간에 재사용
+    openai_client = providers.Singleton(
         OpenAIClient,
         api_key=config.OPENAI.API_KEY,
     )
 
-    # Redis client
-    redis_client = providers.Singleton(
-        redis.Redis,
-        host=config.REDIS.HOST,
-        port=config.REDIS.PORT,
-        db=config.REDIS.DB,
-    )
-
     # Cache adapter
-    redis_cache_adapter = providers.Factory(
+    redis_cache_adapter = providers.Singleton(
         RedisCacheAdapter,
         redis_client=redis_client,
     )
 
     # adapters
-    company_search_adapter = providers.Factory(
+    company_search_adapter = providers.Singleton(
         CompanyContextSearchAdapter,
         company_search_service=company_info_reader,
     )
-    news_search_adapter = providers.Factory(
+    news_search_adapter = providers.Singleton(
         NewsSearchAdapter, news_search_service=news_reader
     )
 
     # services
-    talent_inference_service = providers.Factory(
+    talent_inference_service = providers.Singleton(
         TalentInference,
         company_search_adapter=company_search_adapter,
         news_search_adapter=news_search_adapter,
@@ -1,76 +1,483 @@
-from contextlib import asynccontextmanager
-from typing import Optional
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from pgvector.asyncpg import register_vector
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 __all__ = [
+    "ReadReplica",
+    "ReadRouter",
     "ReadSessionManager",
+    "SessionScope",
     "WriteSessionManager",
     "WriteSessionSyncManager",
     "engine_with_pgvector",
+    "read_router",
+    "replica_engines",
+    "session_scope",
+    "warm_up_engine",
 ]
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 인덱스(파티션 테이블이면 파티션별 하위 인덱스)를 shared_buffers에 적재하고 블록 수를 반환
+PREWARM_STATEMENT = text("""
+    SELECT coalesce(sum(pg_prewarm(c.oid::regclass)), 0) AS blocks
+    FROM pg_class c
+    WHERE c.relkind = 'i'
+      AND (
+        c.oid = to_regclass(:index_name)
+        OR c.oid IN (
+          SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(:index_name)
+        )
+      )
+    """)
+
+# 쓰기 후 읽기를 primary로 고정하는 키 (워커 프로세스 간 공유)
+READ_PIN_KEY_PREFIX = "db:read_pin:"
+
+# 복제본이 따라잡지 못한 시간(초). primary면 0, WAL 수신이 끊겼거나(받은 WAL을 모두 재생해도
+# 더 이상 따라잡지 못함) 재생한 트랜잭션이 없으면 NULL(순환에서 제외),
+# 스트리밍 중이고 받은 WAL을 모두 재생했으면(쓰기가 없어 마지막 재생 시각이 오래된 경우 포함) 0
+# pg_stat_wal_receiver.status는 pg_read_all_stats 권한이 있어야 보이므로 읽기 계정에 권한 부여 필요
+REPLICATION_LAG_STATEMENT = text("""
+    SELECT CASE
+      WHEN NOT pg_is_in_recovery() THEN 0
+      WHEN NOT EXISTS (
+        SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+      ) THEN NULL
+      WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+      ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END AS lag_seconds
+    """)
+
+
+def _register_vector_codec(dbapi_connection, connection_record) -> None:
+    # 풀이 새 연결을 열 때마다 호출되므로 재연결/recycle된 연결에도 코덱이 등록됨
+    dbapi_connection.run_async(register_vector)
+
 
 @asynccontextmanager
 async def engine_with_pgvector(**kw):
     engine = create_async_engine(**kw)
-    # 최초 연결에서 코덱 등록
-    async with engine.connect() as conn:
-        raw = await conn.get_raw_connection()
-        await register_vector(raw.driver_connection)
+    event.listen(engine.sync_engine, "connect", _register_vector_codec)
     try:
         yield engine
     finally:
         await engine.dispose()
 
 
+@asynccontextmanager
+async def replica_engines(
+    urls: Sequence[str], **kw
+) -> AsyncIterator[List[AsyncEngine]]:
+    """읽기 복제본 URL마다 같은 풀 설정의 엔진을 만들고, 종료 시 모두 dispose 합니다."""
+    async with AsyncExitStack() as stack:
+        yield [
+            await stack.enter_async_context(engine_with_pgvector(url=url, **kw))
+            for url in urls
+        ]
+
+
+async def warm_up_engine(
+    engine: AsyncEngine,
+    connections: int,
+    statements: Sequence[Tuple[Any, dict]] = (),
+    prewarm_indexes: Sequence[str] = (),
+) -> int:
+    """
+    요청 전에 풀 연결을 미리 열고 주요 문을 prepare 합니다.
+
+    connections개 연결을 동시에 열어(연결 시 pgvector 코덱 등록) 각 연결에서 statements를
+    한 번씩 실행하므로, 연결별 prepared statement 캐시가 채워진 상태로 풀에 반환됩니다.
+    prewarm_indexes가 있으면 pg_prewarm으로 인덱스를 shared_buffers에 적재하며,
+    pg_prewarm 확장이 없으면 경고만 남깁니다.
+
+    Returns:
+        int: pg_prewarm으로 적재한 블록 수
+    """
+    async with AsyncExitStack() as stack:
+        # 하나씩 열고 닫으면 같은 연결만 재사용되므로 모두 연 채로 유지
+        conns = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+        )
+        await asyncio.gather(*(_prepare(conn, statements) for conn in conns))
+
+        blocks = 0
+        if prewarm_indexes and conns:
+            try:
+                for index_name in prewarm_indexes:
+                    result = await conns[0].execute(
+                        PREWARM_STATEMENT, {"index_name": index_name}
+                    )
+                    blocks += result.scalar_one()
+            except DBAPIError as e:
+                logger.warning(f"pg_prewarm skipped: {e}")
+        # 조회만 했으므로 연결 종료 시 롤백
+        return blocks
+
+
+async def _prepare(conn: AsyncConnection, statements: Sequence[Tuple[Any, dict]]):
+    for statement, params in statements:
+        await conn.execute(statement, params)
+
+
+class SessionScope:
+    """요청 하나의 세션 범위: 요청 안에서 동시에 여는 세션 수를 제한하는 세마포어"""
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+
+_SESSION_SCOPE: ContextVar[Optional[SessionScope]] = ContextVar(
+    "db_session_scope", default=None
+)
+
+
+@asynccontextmanager
+async def session_scope(max_concurrency: int = 4) -> AsyncIterator[SessionScope]:
+    """
+    요청 단위 세션 범위를 엽니다.
+
+    세션 매니저는 프로세스당 하나를 공유하므로, 요청마다 이 범위 안에서 실행해야
+    동시 세션 상한(max_concurrency)이 요청별로 적용됩니다.
+    범위 밖(스크립트 등)에서는 매니저 자체의 상한이 적용됩니다.
+    """
+    scope = SessionScope(max_concurrency)
+    token = _SESSION_SCOPE.set(scope)
+    try:
+        yield scope
+    finally:
+        _SESSION_SCOPE.reset(token)
+
+
+class ReadReplica:
+    """읽기 대상 하나: 세션 팩토리와 진행 중인 세션 수, 마지막으로 측정한 복제 지연"""
+
+    def __init__(self, name: str, session_maker: async_sessionmaker[AsyncSession]):
+        self.name = name
+        self.session_maker = session_maker
+        self.in_flight = 0
+        # 측정 전에는 순환에 포함 (첫 지연 확인 전까지 모든 요청이 primary로 몰리지 않도록)
+        self.lag: Optional[float] = None
+        self.healthy = True
+
+    def open(self) -> AsyncSession:
+        session = self.session_maker()
+        self.in_flight += 1
+        return session
+
+    async def close(self, session: AsyncSession) -> None:
+        try:
+            await session.close()
+        finally:
+            self.in_flight -= 1
+
+
+class ReadRouter:
+    """
+    읽기 세션을 복제본에 분배합니다.
+
+    - 순환 중인 복제본 가운데 진행 중인 세션이 가장 적은 곳을 고릅니다.
+    - check_lag()이 복제 지연이 max_lag_seconds를 넘거나 응답하지 않는 복제본을 순환에서 빼고,
+      따라잡으면 다시 넣습니다. 순환 중인 복제본이 없으면 primary에서 읽습니다.
+    - mark_written(keys) 후 pin_seconds 동안 같은 키(회사 ID/별칭 등)를 읽는 세션은 primary에서
+      읽어, 방금 쓴 데이터가 복제되기 전에 조회되지 않게 합니다. redis_client가 있으면 고정을
+      Redis에 만료 시간과 함께 저장해 다른 워커 프로세스의 읽기에도 적용되며, 없으면 프로세스
+      안에서만 유지됩니다. Redis를 조회할 수 없으면 고정 여부를 알 수 없으므로 primary에서 읽습니다.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: Sequence[ReadReplica] = (),
+        max_lag_seconds: float = 5.0,
+        pin_seconds: float = 0.0,
+        redis_client: Optional[Redis] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = ReadReplica("primary", primary)
+        self.replicas = list(replicas)
+        self.max_lag_seconds = max_lag_seconds
+        self.pin_seconds = pin_seconds
+        self.redis_client = redis_client
+        self._clock = clock
+        # 이 프로세스에서 쓴 키 -> 고정 만료 시각 (Redis 왕복 없이 먼저 확인)
+        self._pins: Dict[Hashable, float] = {}
+        self._next = 0
+
+    async def choose(self, keys: Iterable[Hashable] = ()) -> ReadReplica:
+        candidates = [replica for replica in self.replicas if replica.healthy]
+        if not candidates:
+            return self.primary
+
+        keys = list(keys)
+        if keys and self.pin_seconds > 0 and await self._is_pinned(keys):
+            return self.primary
+
+        # 진행 중인 세션 수가 같으면 시작 위치를 돌려 한 복제본에 몰리지 않게 함
+        self._next = (self._next + 1) % len(candidates)
+        rotated = candidates[self._next :] + candidates[: self._next]
+        return min(rotated, key=lambda replica: replica.in_flight)
+
+    async def mark_written(self, keys: Iterable[Hashable]) -> None:
+        if self.pin_seconds <= 0:
+            return
+
+        keys = list(keys)
+        now = self._clock()
+        self._pins = {key: until for key, until in self._pins.items() if until > now}
+        until = now + self.pin_seconds
+        for key in keys:
+            self._pins[key] = until
+
+        if self.redis_client is None or not keys:
+            return
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(
+                        self._pin_key(key), 1, px=max(1, int(self.pin_seconds * 1000))
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Read pin not shared (pinned in this process only): {e!r}")
+
+    async def _is_pinned(self, keys: List[Hashable]) -> bool:
+        now = self._clock()
+        if any(self._pins.get(key, 0.0) > now for key in keys):
+            return True
+        if self.redis_client is None:
+            return False
+        try:
+            return await self.redis_client.exists(*map(self._pin_key, keys)) > 0
+        except RedisError as e:
+            logger.warning(f"Read pin check failed, reading from primary: {e!r}")
+            return True
+
+    @staticmethod
+    def _pin_key(key: Hashable) -> str:
+        return f"{READ_PIN_KEY_PREFIX}{key}"
+
+    async def check_lag(self, timeout: float = 5.0) -> None:
+        """모든 복제본의 복제 지연을 동시에 측정해 순환 포함 여부를 갱신합니다."""
+        await asyncio.gather(
+            *(self._check_replica(replica, timeout) for replica in self.replicas)
+        )
+
+    async def _check_replica(self, replica: ReadReplica, timeout: float) -> None:
+        error = None
+        session = replica.session_maker()
+        try:
+            lag = await asyncio.wait_for(
+                session.scalar(REPLICATION_LAG_STATEMENT), timeout
+            )
+        except Exception as e:
+            # 연결 실패/시간 초과 등 어떤 오류든 주기 확인을 멈추지 않고 순환에서만 제외
+            lag, error = None, e
+        finally:
+            await session.close()
+
+        replica.lag = None if lag is None else float(lag)
+        healthy = replica.lag is not None and replica.lag <= self.max_lag_seconds
+        # 상태가 바뀔 때만 기록 (장애가 이어지는 동안 주기마다 경고하지 않음)
+        if healthy != replica.healthy:
+            logger.warning(
+                f"Replica {replica.name} {'back in' if healthy else 'removed from'} "
+                f"rotation: lag={replica.lag}" + (f" error={error!r}" if error else "")
+            )
+        replica.healthy = healthy
+
+    async def run_lag_checks(self, interval: float) -> None:
+        while True:
+            await self.check_lag(timeout=interval)
+            await asyncio.sleep(interval)
+
+
+@asynccontextmanager
+async def read_router(
+    primary: async_sessionmaker[AsyncSession],
+    engines: Sequence[AsyncEngine],
+    max_lag_seconds: float = 5.0,
+    pin_seconds: float = 0.0,
+    check_interval: float = 5.0,
+    redis_client: Optional[Redis] = None,
+) -> AsyncIterator[ReadRouter]:
+    """복제본 엔진들로 ReadRouter를 만들고, 종료할 때까지 주기적으로 복제 지연을 확인합니다."""
+    router = ReadRouter(
+        primary,
+        [
+            ReadReplica(
+                f"{engine.url.host}:{engine.url.port}",
+                async_sessionmaker(bind=engine, class_=AsyncSession),
+            )
+            for engine in engines
+        ],
+        max_lag_seconds=max_lag_seconds,
+        pin_seconds=pin_seconds,
+        redis_client=redis_client,
+    )
+    task = None
+    if router.replicas and check_interval > 0:
+        task = asyncio.create_task(router.run_lag_checks(check_interval))
+    try:
+        yield router
+    finally:
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
 class ReadSessionManager:
-    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
-        self._session_maker = session_maker
-        self._session: Optional[AsyncSession] = None
+    """
+    읽기 세션 매니저
+
+    `async with manager as session`은 현재 작업(컨텍스트)의 세션 하나를 공유하므로 한 작업
+    안에서 순서대로만 사용해야 합니다. 세션은 ContextVar에 보관되어 매니저를 여러 요청이
+    공유해도 섞이지 않습니다. 독립적인 쿼리를 동시에 실행할 때는 작업마다 별도 세션(연결)을
+    여는 session()/run_concurrently()를 사용하며, 동시에 여는 세션 수는 현재 session_scope의
+    상한(범위 밖이면 max_concurrency)으로 제한됩니다.
+
+    router를 지정하면 세션마다 ReadRouter가 고른 복제본(또는 primary)에서 읽습니다.
+    session()/run_concurrently()에 keys를 넘기면 mark_written()으로 최근에 쓴 키는 primary에서
+    읽습니다. router가 없으면 모든 세션을 session_maker로 엽니다.
+    """
+
+    def __init__(
+        self,
+        session_maker: Optional[async_sessionmaker[AsyncSession]] = None,
+        max_concurrency: int = 4,
+        router: Optional[ReadRouter] = None,
+    ):
+        if router is None and session_maker is None:
+            raise ValueError("session_maker or router is required")
+        self._router = router or ReadRouter(session_maker)
+        self._session: ContextVar[Optional[Tuple[AsyncSession, ReadReplica]]] = (
+            ContextVar(f"read_session_{id(self)}", default=None)
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def mark_written(self, keys: Iterable[Hashable]) -> None:
+        """keys에 대한 쓰기가 커밋되었음을 알려, 잠시 동안 해당 키의 읽기를 primary로 보냅니다."""
+        await self._router.mark_written(keys)
+
+    @asynccontextmanager
+    async def session(
+        self, keys: Iterable[Hashable] = ()
+    ) -> AsyncIterator[AsyncSession]:
+        """호출한 작업 전용 세션을 열고, 블록이 끝나면 닫아 연결을 풀에 반환합니다."""
+        scope = _SESSION_SCOPE.get()
+        async with scope.semaphore if scope else self._semaphore:
+            replica = await self._router.choose(keys)
+            session = replica.open()
+            try:
+                yield session
+            finally:
+                await replica.close(session)
+
+    async def run_concurrently(
+        self,
+        *calls: Callable[[AsyncSession], Awaitable[T]],
+        keys: Iterable[Hashable] = (),
+    ) -> List[T]:
+        """
+        각 호출을 독립 세션으로 동시에 실행하고 결과를 호출 순서대로 반환합니다.
+
+        세션 수가 상한을 넘으면 앞선 호출이 끝날 때까지 대기합니다.
+        """
+        keys = tuple(keys)
+
+        async def run(call: Callable[[AsyncSession], Awaitable[T]]) -> T:
+            async with self.session(keys) as session:
+                return await call(session)
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
 
     async def __aenter__(self) -> AsyncSession:
-        if self._session is None:
-            self._session = self._session_maker()
-        return self._session
+        current = self._session.get()
+        if current is None:
+            replica = await self._router.choose()
+            current = (replica.open(), replica)
+            self._session.set(current)
+        return current[0]
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        if not self._session:
+        current = self._session.get()
+        if not current:
             return
 
+        session, replica = current
         try:
             if exc_type:
                 return False
         finally:
-            await self._session.close()
-            self._session = None
+            await replica.close(session)
+            self._session.set(None)
 
 
 class WriteSessionManager:
+    """쓰기 세션 매니저 (세션은 ReadSessionManager와 같이 작업별로 보관)"""
+
     def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
         self._session_maker = session_maker
-        self._session: Optional[AsyncSession] = None
+        self._session: ContextVar[Optional[AsyncSession]] = ContextVar(
+            f"write_session_{id(self)}", default=None
+        )
 
     async def __aenter__(self) -> AsyncSession:
-        if self._session is None:
-            self._session = self._session_maker()
-        return self._session
+        session = self._session.get()
+        if session is None:
+            session = self._session_maker()
+            self._session.set(session)
+        return session
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        if not self._session:
+        session = self._session.get()
+        if not session:
             return
 
         try:
             if exc_type:
-                await self._session.rollback()
+                await session.rollback()
                 return False
             else:
-                await self._session.commit()
+                await session.commit()
         finally:
-            await self._session.close()
-            self._session = None
+            await session.close()
+            self._session.set(None)
 
 
 class WriteSessionSyncManager:
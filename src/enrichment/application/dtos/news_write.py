@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class NewsArticle:
+    company_id: UUID
+    title: str
+    contents: str
+    link: str
+    published_at: date
+
+
+@dataclass
+class NewsWriteResult:
+    articles: int = 0
+    chunks: int = 0
+    inserted: int = 0
+    skipped: int = 0
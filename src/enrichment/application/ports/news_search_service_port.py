@@ -21,6 +21,14 @@ class NewsSearchParam(BaseModel):
     queries: List[NewsSearchQuery]
     limit_per_query: int = Field(default=10)
     similarity_threshold: float = Field(default=0.7)
+    binary_prefilter: bool = Field(default=False)
+    binary_oversample: int = Field(default=10, ge=1)
+    hybrid: bool = Field(default=False)
+    # 기사별 청크 병합 + MMR로 회사당 limit_per_query개의 서로 다른 기사를 선택
+    diversify: bool = Field(default=False)
+    mmr_lambda: float = Field(default=0.7, ge=0.0, le=1.0)
+    # MMR 후보 배수: 쿼리당 limit_per_query * mmr_oversample개를 검색한 뒤 선택
+    mmr_oversample: int = Field(default=3, ge=1)
 
     model_config = ConfigDict(frozen=True, extra="ignore")
 
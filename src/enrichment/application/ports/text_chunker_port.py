@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class TextChunkerPort(ABC):
+    """Abstract interface for splitting text into embedding-sized chunks."""
+
+    @abstractmethod
+    def split(self, text: str) -> List[str]:
+        """
+        Split text into overlapping chunks.
+        """
+        ...
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        """
+        Count embedding model tokens in text.
+        """
+        ...
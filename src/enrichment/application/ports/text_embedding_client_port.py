@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+import numpy as np
+
 
 class TextEmbeddingClientPort(ABC):
     """Abstract interface for embedding generation clients."""
 
     @abstractmethod
-    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
         """
         Generate embedding vectors for multiple texts.
+
+        Each embedding is a 1-D float32 array; empty texts map to a zero-length array.
         """
         ...
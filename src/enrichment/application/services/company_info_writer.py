@@ -19,6 +19,8 @@ class CompanyInfoWriter:
 
         try:
             aggregate = self.reader.read(file_path)
+            # 구간 요약 조회를 위해 적재 시점에 누적 롤업을 함께 계산한다.
+            aggregate.company_metrics_rollups = aggregate.build_metrics_rollups()
             await self.repository.save(aggregate)
 
             return FileProcessResult(success=True, company_id=aggregate.company.id)
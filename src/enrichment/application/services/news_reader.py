@@ -1,4 +1,5 @@
-from typing import List
+from dataclasses import replace
+from typing import List, Optional
 
 from enrichment.application.ports.news_search_service_port import (
     NewsByCompany,
@@ -6,10 +7,12 @@ from enrichment.application.ports.news_search_service_port import (
     NewsSearchQuery,
     NewsSearchServicePort,
 )
+from enrichment.application.ports.text_chunker_port import TextChunkerPort
 from enrichment.application.ports.text_embedding_client_port import (
     TextEmbeddingClientPort,
 )
 from enrichment.domain.repositories.news_repository_port import NewsRepositoryPort
+from enrichment.domain.services.news_chunk_selector import NewsChunkSelector
 from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
 
 
@@ -18,26 +21,48 @@ class NewsReader(NewsSearchServicePort):
         self,
         embedding_client: TextEmbeddingClientPort,
         news_repository: NewsRepositoryPort,
+        chunker: Optional[TextChunkerPort] = None,
+        max_article_tokens: Optional[int] = None,
     ):
         self.embedding_client = embedding_client
         self.news_repository = news_repository
+        # diversify에서 같은 기사 청크를 병합할 때 본문 토큰 상한 (청크 하나의 크기)
+        self.chunker = chunker
+        self.max_article_tokens = max_article_tokens
 
     async def search(self, param: NewsSearchParam) -> List[NewsByCompany]:
         search_queries = await self._get_vectorized_search_query(quries=param.queries)
 
         context = NewsSearchContext(
             queries=search_queries,
-            limit_per_query=param.limit_per_query,
+            limit_per_query=(
+                param.limit_per_query * param.mmr_oversample
+                if param.diversify
+                else param.limit_per_query
+            ),
             similarity_threshold=param.similarity_threshold,
+            binary_prefilter=param.binary_prefilter,
+            binary_oversample=param.binary_oversample,
+            hybrid=param.hybrid,
+            with_vectors=param.diversify,
         )
 
         news_chunks_map = await self.news_repository.search(context)
         news = []
         for company_id, chunks in news_chunks_map.items():
+            if param.diversify:
+                chunks = NewsChunkSelector.select(
+                    chunks,
+                    k=param.limit_per_query,
+                    mmr_lambda=param.mmr_lambda,
+                    max_tokens=self.max_article_tokens,
+                    count_tokens=self.chunker.count_tokens if self.chunker else None,
+                )
             news.append(
                 NewsByCompany(
                     company_id=company_id,
-                    news_chunks=chunks,
+                    # 임베딩은 선택 단계에서만 쓰므로 응답에서 제외
+                    news_chunks=[replace(chunk, vector=None) for chunk in chunks],
                 )
             )
 
@@ -58,6 +83,7 @@ class NewsReader(NewsSearchServicePort):
                     query_vector=vector,
                     start_date=q.start_date,
                     end_date=q.end_date,
+                    query_text=q.query_text,
                 )
             )
 
@@ -0,0 +1,124 @@
+import asyncio
+from dataclasses import replace
+from typing import Iterator, List, Optional
+
+from enrichment.application.dtos.news_write import NewsArticle, NewsWriteResult
+from enrichment.application.ports.text_chunker_port import TextChunkerPort
+from enrichment.application.ports.text_embedding_client_port import (
+    TextEmbeddingClientPort,
+)
+from enrichment.domain.entities.news_chunk_record import NewsChunkRecord
+from enrichment.domain.repositories.news_chunk_write_repository_port import (
+    NewsChunkWriteRepositoryPort,
+)
+from enrichment.domain.repositories.news_repository_port import NewsRepositoryPort
+
+
+class NewsWriter:
+    """
+    뉴스 기사를 청크로 분할하고 임베딩하여 news_chunks에 적재하는 서비스
+
+    1. 기사 본문을 청크로 분할하고 (회사, 링크, 내용) 해시로 요청 내 중복 제거
+    2. 이미 적재된 해시는 임베딩 전에 제외 (재실행 시 임베딩 비용 없음)
+    3. 토큰 수/입력 개수 상한에 맞춘 배치로 임베딩하며, 다음 배치 임베딩과
+       현재 배치 적재(COPY)를 겹쳐 실행
+    4. 새 청크가 적재된 회사를 news_repository에 알려 캐시된 검색 인덱스를 버림
+    """
+
+    def __init__(
+        self,
+        chunker: TextChunkerPort,
+        embedding_client: TextEmbeddingClientPort,
+        repository: NewsChunkWriteRepositoryPort,
+        max_batch_tokens: int = 250_000,
+        max_batch_size: int = 2048,
+        news_repository: Optional[NewsRepositoryPort] = None,
+    ):
+        self.chunker = chunker
+        self.embedding_client = embedding_client
+        self.repository = repository
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.news_repository = news_repository
+
+    async def write(self, articles: List[NewsArticle]) -> NewsWriteResult:
+        if not articles:
+            return NewsWriteResult()
+
+        # 문장 분할/토큰 계산은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        records = await asyncio.to_thread(self._chunk_articles, articles)
+        existing = await self.repository.find_existing_hashes(
+            [record.content_hash for record in records]
+        )
+        pending = [record for record in records if record.content_hash not in existing]
+
+        inserted = 0
+        written = set()
+        batches = await asyncio.to_thread(lambda: list(self._token_batches(pending)))
+        embedding = None
+        try:
+            for idx, batch in enumerate(batches):
+                if embedding is None:
+                    embedding = asyncio.create_task(self._embed(batch))
+                embedded = await embedding
+                embedding = (
+                    asyncio.create_task(self._embed(batches[idx + 1]))
+                    if idx + 1 < len(batches)
+                    else None
+                )
+                batch_inserted = await self.repository.bulk_insert(embedded)
+                if batch_inserted:
+                    written.update(record.company_id for record in embedded)
+                inserted += batch_inserted
+        finally:
+            if embedding is not None:
+                embedding.cancel()
+            if written and self.news_repository is not None:
+                await self.news_repository.invalidate(written)
+
+        return NewsWriteResult(
+            articles=len(articles),
+            chunks=len(records),
+            inserted=inserted,
+            skipped=len(records) - inserted,
+        )
+
+    def _chunk_articles(self, articles: List[NewsArticle]) -> List[NewsChunkRecord]:
+        records = {}
+        for article in articles:
+            for chunk in self.chunker.split(article.contents.replace("\n", " ")):
+                record = NewsChunkRecord(
+                    company_id=article.company_id,
+                    title=article.title,
+                    contents=chunk,
+                    link=article.link,
+                    created_at=article.published_at,
+                )
+                records.setdefault(record.content_hash, record)
+        return list(records.values())
+
+    def _token_batches(
+        self, records: List[NewsChunkRecord]
+    ) -> Iterator[List[NewsChunkRecord]]:
+        batch: List[NewsChunkRecord] = []
+        batch_tokens = 0
+        for record in records:
+            tokens = self.chunker.count_tokens(record.contents)
+            if batch and (
+                batch_tokens + tokens > self.max_batch_tokens
+                or len(batch) >= self.max_batch_size
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(record)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    async def _embed(self, batch: List[NewsChunkRecord]) -> List[NewsChunkRecord]:
+        vectors = await self.embedding_client.generate_embeddings(
+            [record.contents for record in batch]
+        )
+        return [
+            replace(record, vector=vector) for record, vector in zip(batch, vectors)
+        ]
@@ -0,0 +1,30 @@
+from datetime import date
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+__all__ = ["NewsArticleItem", "NewsIngestRequest", "NewsIngestResponse"]
+
+
+class NewsArticleItem(BaseModel):
+    company_id: UUID = Field(description="뉴스가 속한 회사 ID")
+    title: str = Field(max_length=500, description="기사 제목")
+    contents: str = Field(min_length=1, description="기사 본문")
+    link: str = Field(max_length=500, description="원본 기사 링크")
+    published_at: date = Field(description="기사 작성일")
+
+
+class NewsIngestRequest(BaseModel):
+    articles: List[NewsArticleItem] = Field(
+        min_length=1, description="적재할 뉴스 기사 목록"
+    )
+
+
+class NewsIngestResponse(BaseModel):
+    message: str = Field(..., description="처리 결과 메시지")
+    articles: int = Field(..., description="요청 기사 수")
+    chunks: int = Field(..., description="분할된 청크 수 (요청 내 중복 제외)")
+    inserted: int = Field(..., description="새로 적재된 청크 수")
+    skipped: int = Field(..., description="이미 적재되어 건너뛴 청크 수")
+    status: str = Field(..., description="처리 상태")
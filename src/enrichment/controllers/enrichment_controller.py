@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject
 from fastapi import APIRouter, Request, status
 
 from containers import Container
+from enrichment.application.dtos.news_write import NewsArticle
 from shared.exceptions import (
     BusinessLogicError,
     InternalServerError,
@@ -13,6 +14,7 @@ from shared.exceptions import (
 from shared.swagger_responses import get_common_responses
 
 from .dtos.file_process import FileProcessRequest, FileProcessResponse
+from .dtos.news_ingest import NewsIngestRequest, NewsIngestResponse
 
 router = APIRouter(
     prefix="/api/v1/enrichments",
@@ -90,6 +92,66 @@ async def process_data_source_file(
         )
 
 
+@router.post(
+    "/news",
+    response_model=NewsIngestResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="뉴스 기사 청크 분할/임베딩 및 적재",
+    description="""
+    뉴스 기사를 청크(320/80 토큰)로 분할하고 임베딩하여 news_chunks에 적재합니다.
+
+    - 임베딩은 토큰 수 상한에 맞춘 배치로 요청합니다.
+    - (회사, 링크, 청크 내용) 해시가 이미 있는 청크는 임베딩/적재하지 않으므로
+      같은 요청을 다시 보내도 중복 적재되지 않습니다.
+    """,
+    response_description="분할/적재/건너뛴 청크 수",
+)
+@inject
+async def ingest_news(
+    body: NewsIngestRequest,
+    request: Request,
+) -> NewsIngestResponse:
+    """
+    뉴스 기사를 청크 단위로 임베딩하여 데이터베이스에 저장
+    """
+    try:
+        container: Container = request.app.state.container
+        news_writer = await container.news_writer()  # type: ignore
+
+        result = await news_writer.write(
+            [
+                NewsArticle(
+                    company_id=article.company_id,
+                    title=article.title,
+                    contents=article.contents,
+                    link=article.link,
+                    published_at=article.published_at,
+                )
+                for article in body.articles
+            ]
+        )
+
+        return NewsIngestResponse(
+            message="뉴스 기사가 성공적으로 적재되었습니다.",
+            articles=result.articles,
+            chunks=result.chunks,
+            inserted=result.inserted,
+            skipped=result.skipped,
+            status="success",
+        )
+
+    except (ValidationError, ResourceNotFoundError, BusinessLogicError):
+        raise
+    except Exception as e:
+        raise InternalServerError(
+            detail="뉴스 적재 중 예상치 못한 오류가 발생했습니다.",
+            details={
+                "articles": len(body.articles),
+                "original_error": str(e),
+            },
+        )
+
+
 async def _validate_file_path(file_path: str) -> None:
     """
     파일 경로의 유효성을 검증합니다.
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
 from enrichment.domain.entities.company import Company
 from enrichment.domain.entities.company_alias import CompanyAlias
+from enrichment.domain.entities.company_metrics_rollup import (
+    CompanyMetricsRollup,
+    CompanyMetricsRollupCreateParams,
+)
 from enrichment.domain.entities.company_metrics_snapshot import CompanyMetricsSnapshot
 from enrichment.domain.vos.metrics import MAU
 
@@ -18,11 +22,15 @@ class CompanyAggregate:
     - Company: 회사 기본 정보
     - CompanyAlias: 회사 별칭들 (회사명, 제품명 등)
     - CompanyMetricsSnapshot: 시계열 메트릭 데이터 (MAU, 투자, 특허 등)
+    - CompanyMetricsRollup: 스냅샷의 월별 누적 롤업 (구간 요약 조회용)
     """
 
     company: Company  # 회사 기본 정보
     company_aliases: List[CompanyAlias]  # 회사 별칭 목록
     company_metrics_snapshots: List[CompanyMetricsSnapshot]  # 메트릭 스냅샷 목록
+    company_metrics_rollups: List[CompanyMetricsRollup] = field(
+        default_factory=list
+    )  # 메트릭 누적 롤업 목록
 
     @staticmethod
     def of(
@@ -37,6 +45,58 @@ class CompanyAggregate:
             company_metrics_snapshots=company_metrics_snapshots,
         )
 
+    def build_metrics_rollups(self) -> List[CompanyMetricsRollup]:
+        """스냅샷을 기준 월 오름차순으로 순회하며 월별 누적 롤업 생성
+
+        투자 금액/건수와 특허 수는 누적합으로, 직원 수와 재무 값은
+        해당 월까지 확인된 최신 값으로 이월(carry-forward)한다.
+        """
+        rollups: List[CompanyMetricsRollup] = []
+
+        investment_amount = 0
+        investment_count = 0
+        patent_count = 0
+        people_count = 0
+        profit = 0
+        net_profit = 0
+        operating_profit = 0
+
+        for snapshot in sorted(
+            self.company_metrics_snapshots, key=lambda s: s.reference_date
+        ):
+            metrics = snapshot.metrics
+
+            investment_amount += sum(row.amount for row in metrics.investments)
+            investment_count += len(metrics.investments)
+            patent_count += len(metrics.patents)
+
+            if metrics.organizations:
+                people_count = metrics.organizations[-1].people_count
+
+            if metrics.finance:
+                latest_finance = metrics.finance[-1]
+                profit = latest_finance.profit
+                net_profit = latest_finance.netProfit or 0
+                operating_profit = latest_finance.operatingProfit
+
+            rollups.append(
+                CompanyMetricsRollup.of(
+                    CompanyMetricsRollupCreateParams(
+                        company_id=snapshot.company_id,
+                        reference_date=snapshot.reference_date,
+                        cumulative_investment_amount=investment_amount,
+                        cumulative_investment_count=investment_count,
+                        cumulative_patent_count=patent_count,
+                        people_count=people_count,
+                        profit=profit,
+                        net_profit=net_profit,
+                        operating_profit=operating_profit,
+                    )
+                )
+            )
+
+        return rollups
+
     def calculate_people_metrics(self) -> Tuple[int, float]:
         """조직 메트릭 계산: 직원 수와 성장률"""
 
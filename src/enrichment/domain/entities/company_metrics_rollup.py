@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+__all__ = ["CompanyMetricsRollup", "CompanyMetricsRollupCreateParams"]
+
+
+class CompanyMetricsRollupCreateParams(BaseModel):
+    company_id: UUID
+    reference_date: date
+    cumulative_investment_amount: int = 0
+    cumulative_investment_count: int = 0
+    cumulative_patent_count: int = 0
+    people_count: int = 0
+    profit: int = 0
+    net_profit: int = 0
+    operating_profit: int = 0
+
+    model_config = ConfigDict(frozen=True)
+
+
+class CompanyMetricsRollup(BaseModel):
+    """
+    회사 메트릭 누적 롤업 도메인 엔티티 - 월별 스냅샷의 누적합(prefix sum)을 관리
+    투자/특허는 해당 월까지의 누적값, 직원 수/재무는 해당 월 기준 최신값을 보관하여
+    임의의 (시작, 종료) 구간 요약을 두 번의 조회와 뺄셈으로 계산할 수 있게 한다.
+    """
+
+    company_id: UUID  # 소속 회사 ID
+    reference_date: date  # 롤업 기준 날짜 (매월 1일)
+    cumulative_investment_amount: int  # 기준 월까지의 누적 투자 금액
+    cumulative_investment_count: int  # 기준 월까지의 누적 투자 건수
+    cumulative_patent_count: int  # 기준 월까지의 누적 특허 수
+    people_count: int  # 기준 월 기준 최신 직원 수
+    profit: int  # 기준 월 기준 최신 매출
+    net_profit: int  # 기준 월 기준 최신 순이익
+    operating_profit: int  # 기준 월 기준 최신 영업이익
+    id: Optional[int] = None  # 데이터베이스 기본키 (생성 후 할당)
+
+    @staticmethod
+    def of(params: CompanyMetricsRollupCreateParams) -> CompanyMetricsRollup:
+        return CompanyMetricsRollup(
+            company_id=params.company_id,
+            reference_date=params.reference_date,
+            cumulative_investment_amount=params.cumulative_investment_amount,
+            cumulative_investment_count=params.cumulative_investment_count,
+            cumulative_patent_count=params.cumulative_patent_count,
+            people_count=params.people_count,
+            profit=params.profit,
+            net_profit=params.net_profit,
+            operating_profit=params.operating_profit,
+            id=None,
+        )
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Optional
 from uuid import UUID
 
 
@@ -9,3 +10,7 @@ class NewsChunk:
     title: str
     contents: str
     similarity: float
+    # 원본 기사 링크 - 같은 기사의 청크를 묶는 데 사용
+    link: Optional[str] = None
+    # 검색 대상 임베딩 (MMR 재정렬용, 응답으로 내보내기 전에 제거)
+    vector: Optional[Any] = field(default=None, repr=False, compare=False)
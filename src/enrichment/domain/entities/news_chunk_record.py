@@ -0,0 +1,35 @@
+import hashlib
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+
+__all__ = ["NewsChunkRecord"]
+
+
+@dataclass(frozen=True)
+class NewsChunkRecord:
+    """적재할 뉴스 청크 (기사 1건을 분할한 조각)"""
+
+    company_id: UUID
+    title: str
+    contents: str
+    link: str
+    created_at: date
+    # 청크 임베딩 - 임베딩 생성 후 replace(record, vector=...)로 채움
+    vector: Optional[Any] = field(default=None, repr=False, compare=False)
+    # 멱등 적재 키: (회사, 기사 링크, 청크 내용)의 SHA-256 hex
+    content_hash: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "content_hash",
+            self.hash_of(self.company_id, self.link, self.contents),
+        )
+
+    @staticmethod
+    def hash_of(company_id: UUID, link: str, contents: str) -> str:
+        # DB 백필(migration)의 sha256(company_id::text || E'\x1f' || link || E'\x1f' || contents)와 같은 값
+        payload = f"{company_id}\x1f{link}\x1f{contents}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
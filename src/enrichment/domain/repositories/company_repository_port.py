@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Sequence
 
 from enrichment.domain.aggregates.company_aggregate import CompanyAggregate
-from enrichment.domain.specs.company_spec import CompanySearchParam
+from enrichment.domain.specs.company_spec import CompanySearchParam, MetricsWindowParam
+from enrichment.domain.vos.metrics import MetricFamily
+from enrichment.domain.vos.metrics_window import CompanyMetricsWindow
 
 
 class CompanyRepositoryPort(ABC):
@@ -13,5 +15,12 @@ class CompanyRepositoryPort(ABC):
 
     @abstractmethod
     async def get_companies(
-        self, params: List[CompanySearchParam]
+        self,
+        params: List[CompanySearchParam],
+        metric_families: Optional[Sequence[MetricFamily]] = None,
     ) -> List[CompanyAggregate]: ...
+
+    @abstractmethod
+    async def get_metrics_windows(
+        self, params: List[MetricsWindowParam]
+    ) -> List[CompanyMetricsWindow]: ...
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import List, Set
+
+from enrichment.domain.entities.news_chunk_record import NewsChunkRecord
+
+
+class NewsChunkWriteRepositoryPort(ABC):
+    @abstractmethod
+    async def find_existing_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """이미 적재된 청크의 content_hash 집합"""
+        ...
+
+    @abstractmethod
+    async def bulk_insert(self, records: List[NewsChunkRecord]) -> int:
+        """청크를 일괄 적재하고 새로 삽입된 건수를 반환 (이미 있는 content_hash는 무시)"""
+        ...
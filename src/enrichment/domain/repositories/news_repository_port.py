@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable, List
 from uuid import UUID
 
 from enrichment.domain.entities.new_chunk import NewsChunk
@@ -11,3 +11,11 @@ class NewsRepositoryPort(ABC):
     async def search(
         self, context: NewsSearchContext
     ) -> Dict[UUID, List[NewsChunk]]: ...
+
+    @abstractmethod
+    async def search_per_query(
+        self, context: NewsSearchContext
+    ) -> List[List[NewsChunk]]: ...
+
+    async def invalidate(self, company_ids: Iterable[UUID]) -> None:
+        """회사 뉴스가 새로 적재되었음을 알립니다. (조회 결과를 캐시하는 구현만 재정의)"""
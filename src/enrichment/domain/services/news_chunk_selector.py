@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from enrichment.domain.entities.new_chunk import NewsChunk
+
+__all__ = ["NewsChunkSelector"]
+
+# 이 길이 미만의 접미사/접두사 일치는 청크 겹침이 아닌 우연의 일치로 보고 병합하지 않음
+_MIN_OVERLAP = 8
+
+
+class NewsChunkSelector:
+    """
+    검색된 뉴스 청크 후보에서 프롬프트에 넣을 k개를 고르는 Domain Service
+
+    기사는 겹치는 청크(320/80)로 분할되어 저장되므로 한 회사의 상위 결과가
+    같은 기사의 연속 청크로 채워지기 쉽습니다. 다음 두 단계로 중복을 줄입니다.
+    1. 기사(link)별로 묶고 가장 유사한 청크와 id가 연속인 청크만 겹친 부분을 제거하여
+       하나의 본문으로 병합 (청크 하나의 토큰 예산 이내)
+    2. 기사 임베딩에 MMR(maximal marginal relevance)을 적용하여 관련성이 높으면서
+       이미 고른 기사와 덜 비슷한 k개를 선택
+    """
+
+    @staticmethod
+    def select(
+        chunks: List[NewsChunk],
+        k: int,
+        mmr_lambda: float = 0.7,
+        max_tokens: Optional[int] = None,
+        count_tokens: Optional[Callable[[str], int]] = None,
+    ) -> List[NewsChunk]:
+        """
+        Args:
+            chunks: 한 회사의 검색 결과 청크 (유사도 내림차순, vector 포함)
+            k: 선택할 기사 수
+            mmr_lambda: 관련성 가중치 (1이면 유사도 순, 0에 가까울수록 다양성 우선)
+            max_tokens, count_tokens: 병합된 기사 본문의 토큰 상한과 토큰 수 계산 함수
+                (merge_by_article 참고)
+
+        Returns:
+            List[NewsChunk]: 선택 순서대로 정렬된 최대 k개의 (병합된) 청크
+        """
+        articles = NewsChunkSelector.merge_by_article(chunks, max_tokens, count_tokens)
+        if len(articles) <= 1 or k <= 0:
+            return articles[: max(k, 0)]
+        return NewsChunkSelector._mmr(articles, k, mmr_lambda)
+
+    @staticmethod
+    def merge_by_article(
+        chunks: List[NewsChunk],
+        max_tokens: Optional[int] = None,
+        count_tokens: Optional[Callable[[str], int]] = None,
+    ) -> List[NewsChunk]:
+        """
+        같은 link의 청크를 가장 유사도가 높은 청크 중심의 연속 구간 하나로 병합합니다.
+
+        가장 유사한 청크에서 시작하여 id가 연속인 앞/뒤 청크 중 유사도가 높은 쪽부터 붙이며,
+        max_tokens와 count_tokens가 주어지면 병합 본문이 max_tokens 토큰을 넘지 않는 동안만
+        붙입니다. 떨어진 구간의 청크는 버리므로 후보를 많이 가져와도 기사 하나의 본문은
+        청크 하나의 토큰 예산을 넘지 않습니다.
+
+        병합된 청크의 id/vector는 가장 유사도가 높은 청크의 값을, similarity는 최댓값을 가지며
+        결과는 similarity 내림차순입니다. link가 없는 청크는 그대로 둡니다.
+        """
+        by_link: Dict[str, List[NewsChunk]] = {}
+        merged: List[NewsChunk] = []
+        for chunk in chunks:
+            if chunk.link:
+                by_link.setdefault(chunk.link, []).append(chunk)
+            else:
+                merged.append(chunk)
+
+        for article_chunks in by_link.values():
+            # 여러 쿼리에서 같은 청크가 반환된 경우 중복 제거
+            unique: Dict[int, NewsChunk] = {}
+            for chunk in article_chunks:
+                if (
+                    chunk.id not in unique
+                    or unique[chunk.id].similarity < chunk.similarity
+                ):
+                    unique[chunk.id] = chunk
+            best = max(unique.values(), key=lambda chunk: chunk.similarity)
+            contents = NewsChunkSelector._grow_span(
+                unique, best, max_tokens, count_tokens
+            )
+            merged.append(replace(best, contents=contents))
+
+        merged.sort(key=lambda chunk: chunk.similarity, reverse=True)
+        return merged
+
+    @staticmethod
+    def _grow_span(
+        by_id: Dict[int, NewsChunk],
+        best: NewsChunk,
+        max_tokens: Optional[int],
+        count_tokens: Optional[Callable[[str], int]],
+    ) -> str:
+        contents = best.contents
+        first = last = best.id
+        # 예산을 넘어 더 붙일 수 없는 방향은 닫음
+        open_before = open_after = True
+        while True:
+            before = by_id.get(first - 1) if open_before else None
+            after = by_id.get(last + 1) if open_after else None
+            if before is None and after is None:
+                return contents
+            if after is None or (
+                before is not None and before.similarity >= after.similarity
+            ):
+                candidate = NewsChunkSelector._join_overlapping(
+                    before.contents, contents
+                )
+                extend_before = True
+            else:
+                candidate = NewsChunkSelector._join_overlapping(
+                    contents, after.contents
+                )
+                extend_before = False
+
+            if (
+                max_tokens is not None
+                and count_tokens is not None
+                and count_tokens(candidate) > max_tokens
+            ):
+                if extend_before:
+                    open_before = False
+                else:
+                    open_after = False
+                continue
+
+            contents = candidate
+            if extend_before:
+                first -= 1
+            else:
+                last += 1
+
+    @staticmethod
+    def _join_overlapping(head: str, tail: str) -> str:
+        # head의 접미사와 tail의 접두사가 겹치는 최대 길이를 접두사 함수(KMP)로 선형 시간에 계산
+        probe = tail + "\0" + head[-len(tail) :]
+        prefix = [0] * len(probe)
+        for i in range(1, len(probe)):
+            j = prefix[i - 1]
+            while j and probe[i] != probe[j]:
+                j = prefix[j - 1]
+            if probe[i] == probe[j]:
+                j += 1
+            prefix[i] = j
+        overlap = prefix[-1]
+
+        if overlap >= _MIN_OVERLAP:
+            return head + tail[overlap:]
+        return head + " " + tail
+
+    @staticmethod
+    def _mmr(articles: List[NewsChunk], k: int, mmr_lambda: float) -> List[NewsChunk]:
+        if any(article.vector is None for article in articles):
+            # 임베딩이 없으면 다양성을 계산할 수 없으므로 유사도 순
+            return articles[:k]
+
+        matrix = np.asarray([article.vector for article in articles], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+        pairwise = matrix @ matrix.T
+        relevance = np.asarray(
+            [article.similarity for article in articles], dtype=np.float32
+        )
+
+        selected = [int(np.argmax(relevance))]
+        # 후보별로 이미 선택된 기사와의 최대 코사인 유사도
+        redundancy = pairwise[selected[0]].copy()
+        available = np.ones(len(articles), dtype=bool)
+        available[selected[0]] = False
+        while len(selected) < min(k, len(articles)):
+            scores = mmr_lambda * relevance - (1 - mmr_lambda) * redundancy
+            scores[~available] = -np.inf
+            pick = int(np.argmax(scores))
+            selected.append(pick)
+            available[pick] = False
+            np.maximum(redundancy, pairwise[pick], out=redundancy)
+
+        return [articles[idx] for idx in selected]
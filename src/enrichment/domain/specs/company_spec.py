@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import date
 from typing import Optional
+from uuid import UUID
 
 
 @dataclass(frozen=True)
@@ -8,3 +9,10 @@ class CompanySearchParam:
     alias: str
     start_date: date
     end_date: Optional[date] = None
+
+
+@dataclass(frozen=True)
+class MetricsWindowParam:
+    company_id: UUID
+    start_date: date
+    end_date: Optional[date] = None
@@ -3,15 +3,20 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class SearchQuery:
     """기업별 뉴스 검색 쿼리"""
 
     company_id: UUID
-    query_vector: List[float]
+    # float32 1-D 배열 (임베딩 클라이언트 결과를 그대로 전달, list도 허용)
+    query_vector: np.ndarray
     start_date: date
     end_date: Optional[date] = None
+    # 원문 검색어 - 하이브리드(어휘 + 벡터) 검색의 어휘 매칭에 사용
+    query_text: Optional[str] = None
 
     def to_tuple(self):
         """필드 이름과 값을 튜플로 반환"""
@@ -23,3 +28,11 @@ class NewsSearchContext:
     queries: List[SearchQuery]
     limit_per_query: int = 10
     similarity_threshold: float = 0.7
+    # 이진 양자화(bit) 프리필터 후 원본 벡터로 재정렬하는 2단계 검색 사용 여부
+    binary_prefilter: bool = False
+    # 프리필터 후보 배수: limit_per_query * binary_oversample개 후보를 재정렬
+    binary_oversample: int = 10
+    # 벡터 검색과 전문(tsvector) 검색 결과를 RRF(reciprocal rank fusion)로 합치는 하이브리드 검색 사용 여부
+    hybrid: bool = False
+    # 결과 청크에 임베딩을 함께 조회할지 여부 (MMR 재정렬에서만 필요)
+    with_vectors: bool = False
@@ -1,4 +1,5 @@
 from datetime import date
+from enum import StrEnum
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -57,3 +58,13 @@ class MonthlyMetrics(BaseModel):
     organizations: List[Organization]
 
     model_config = ConfigDict(frozen=True)
+
+
+class MetricFamily(StrEnum):
+    """MonthlyMetrics의 메트릭 계열 (필드명과 동일)"""
+
+    MAU = "mau"
+    PATENTS = "patents"
+    FINANCE = "finance"
+    INVESTMENTS = "investments"
+    ORGANIZATIONS = "organizations"
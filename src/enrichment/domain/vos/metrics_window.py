@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from enrichment.domain.entities.company_metrics_rollup import CompanyMetricsRollup
+
+__all__ = ["CompanyMetricsWindow"]
+
+
+class CompanyMetricsWindow(BaseModel):
+    """
+    재직 기간(시작~종료) 동안의 회사 메트릭 요약 값 객체
+
+    구간 직전 롤업(before)과 구간 마지막 롤업(last)의 차이로 계산되므로
+    재직 기간의 길이와 무관하게 일정한 비용으로 생성된다.
+    """
+
+    company_id: UUID
+    start_date: date
+    end_date: date
+
+    investment_amount: int  # 구간 내 투자 유치 금액
+    investment_count: int  # 구간 내 투자 건수
+    patent_count: int  # 구간 내 등록 특허 수
+
+    people_count: int  # 구간 종료 시점 직원 수
+    people_count_at_start: int  # 구간 시작 직전 직원 수
+
+    profit: int  # 구간 종료 시점 매출
+    net_profit: int  # 구간 종료 시점 순이익
+    profit_at_start: int  # 구간 시작 직전 매출
+    net_profit_at_start: int  # 구간 시작 직전 순이익
+
+    model_config = ConfigDict(frozen=True)
+
+    @staticmethod
+    def of(
+        company_id: UUID,
+        start_date: date,
+        end_date: date,
+        before: Optional[CompanyMetricsRollup],
+        last: Optional[CompanyMetricsRollup],
+    ) -> CompanyMetricsWindow:
+        """
+        구간 직전 롤업과 구간 마지막 롤업으로 구간 요약 생성
+
+        Args:
+            company_id: 회사 ID
+            start_date: 구간 시작일
+            end_date: 구간 종료일
+            before: start_date 이전의 마지막 롤업 (없으면 None)
+            last: end_date 이하의 마지막 롤업 (없으면 None)
+        """
+        # 구간 안에 롤업이 없으면 직전 값이 그대로 마지막 값이 된다.
+        if last is None or last.reference_date < start_date:
+            last = before
+
+        return CompanyMetricsWindow(
+            company_id=company_id,
+            start_date=start_date,
+            end_date=end_date,
+            investment_amount=_value(last, "cumulative_investment_amount")
+            - _value(before, "cumulative_investment_amount"),
+            investment_count=_value(last, "cumulative_investment_count")
+            - _value(before, "cumulative_investment_count"),
+            patent_count=_value(last, "cumulative_patent_count")
+            - _value(before, "cumulative_patent_count"),
+            people_count=_value(last, "people_count"),
+            people_count_at_start=_value(before, "people_count"),
+            profit=_value(last, "profit"),
+            net_profit=_value(last, "net_profit"),
+            profit_at_start=_value(before, "profit"),
+            net_profit_at_start=_value(before, "net_profit"),
+        )
+
+    @property
+    def people_growth_rate(self) -> float:
+        return _growth_rate(self.people_count_at_start, self.people_count)
+
+    @property
+    def profit_growth_rate(self) -> float:
+        return _growth_rate(self.profit_at_start, self.profit)
+
+    @property
+    def net_profit_growth_rate(self) -> float:
+        return _growth_rate(self.net_profit_at_start, self.net_profit)
+
+
+def _value(rollup: Optional[CompanyMetricsRollup], field: str) -> int:
+    if rollup is None:
+        return 0
+    return getattr(rollup, field)
+
+
+def _growth_rate(initial_value: int, final_value: int) -> float:
+    if initial_value == 0:
+        return 0.0
+    return ((final_value - initial_value) / initial_value) * 100.0
@@ -0,0 +1,221 @@
+import os
+import re
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from enrichment.application.ports.text_chunker_port import TextChunkerPort
+from enrichment.infrastructure.chunkers.tokenizer import (
+    DEFAULT_ENCODING,
+    load_encoding,
+)
+
+__all__ = ["KoreanSentenceChunker"]
+
+_PARAGRAPH_SEPARATOR = "\n\n\n"
+# 문장 끝: 종결 부호(와 닫는 따옴표/괄호) 뒤의 공백, 전각 부호는 공백이 없어도 문장 끝
+_SENTENCE_END = re.compile(r"([.?!]+)[\"'”’」』)\]]*\s+|[。？！]+[\"'”’」』)\]]*\s*")
+# 마침표 뒤에 공백이 있어도 문장 끝이 아닌 약어/영문 이니셜 (U.S. / Co. / Dr. 등)
+_ABBREVIATION = re.compile(
+    r"(?:\b[A-Za-z]|\b(?:Mr|Mrs|Ms|Dr|Prof|Inc|Co|Corp|Ltd|Jr|Sr|St|No|vs))\.$"
+)
+# 문장보다 작은 구 단위 (SentenceSplitter의 secondary_chunking_regex와 같음)
+_PHRASE = re.compile(r"[^,.;。？！]+[,.;。？！]?")
+
+Split = Tuple[str, int]
+
+
+class KoreanSentenceChunker(TextChunkerPort):
+    """
+    한국어 문장 단위 청커
+
+    llama-index SentenceSplitter와 같은 크기/겹침 규칙을 따릅니다. 문단("\\n\\n\\n") -> 문장 ->
+    구(쉼표 등) -> 공백 -> 글자 순으로 chunk_size 토큰 이하가 될 때까지 나눈 조각을 앞에서부터
+    chunk_size까지 채우고, 다음 청크는 직전 청크 끝의 chunk_overlap 토큰 이내 조각으로 시작합니다.
+
+    문장 분리는 nltk punkt(영어 학습 모델) 대신 종결 부호 정규식을 사용하여 "다." 뒤 따옴표와
+    전각 부호(。？！)를 문장 끝으로 보고, 말줄임표와 영문 약어/이니셜에서는 나누지 않습니다.
+    토큰 수는 오프라인 tiktoken BPE(cl100k_base)로 계산하며, 한 글자가 chunk_size보다 많은
+    토큰인 경우(매우 작은 chunk_size)에는 예외 대신 그 글자만으로 된 청크를 만듭니다.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 320,
+        chunk_overlap: int = 80,
+        encoding_name: str = DEFAULT_ENCODING,
+    ):
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"chunk_overlap ({chunk_overlap}) must not exceed chunk_size ({chunk_size})"
+            )
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
+        self._encode = load_encoding(encoding_name).encode_ordinary
+
+    def split(self, text: str) -> List[str]:
+        if not text:
+            return []
+        return self._merge(self._split(text, self.count_tokens(text)))
+
+    def count_tokens(self, text: str) -> int:
+        return len(self._encode(text))
+
+    def split_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        batch_size: int = 64,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[List[str]]:
+        """
+        기사 스트림을 기사별 청크 목록 스트림으로 나눕니다 (입력 순서 유지).
+
+        기사를 batch_size개씩 프로세스 풀에서 나누고, 처리 중인 배치를 워커 수의 2배로 제한하여
+        입력을 끝까지 읽지 않고도 결과를 순서대로 내보냅니다.
+
+        Args:
+            workers: 프로세스 수 (None이면 CPU 수)
+            executor: 사용할 실행기 (지정하면 workers 무시, 종료는 호출자 책임)
+        """
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(workers)
+        window = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        texts = iter(texts)
+        try:
+            while True:
+                batch = list(islice(texts, batch_size))
+                if batch:
+                    pending.append(
+                        executor.submit(
+                            _split_batch,
+                            self.chunk_size,
+                            self.chunk_overlap,
+                            self.encoding_name,
+                            batch,
+                        )
+                    )
+                if not pending:
+                    return
+                if not batch or len(pending) >= window:
+                    yield from pending.popleft().result()
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    def _split(self, text: str, tokens: int) -> List[Split]:
+        if tokens <= self.chunk_size:
+            return [(text, tokens)]
+
+        pieces = _split_pieces(text)
+        splits: List[Split] = []
+        for piece in pieces:
+            piece_tokens = self.count_tokens(piece)
+            if piece_tokens <= self.chunk_size or len(pieces) == 1:
+                splits.append((piece, piece_tokens))
+            else:
+                splits.extend(self._split(piece, piece_tokens))
+        return splits
+
+    def _merge(self, splits: List[Split]) -> List[str]:
+        chunks: List[str] = []
+        current: List[Split] = []
+        current_tokens = 0
+        new_chunk = True
+        idx = 0
+        while idx < len(splits):
+            text, tokens = splits[idx]
+            if current_tokens + tokens > self.chunk_size and not new_chunk:
+                chunks.append("".join(piece for piece, _ in current))
+                # 직전 청크 끝에서 chunk_overlap 토큰 이내의 조각으로 다음 청크 시작
+                overlap: List[Split] = []
+                current_tokens = 0
+                for piece, piece_tokens in reversed(current):
+                    if current_tokens + piece_tokens > self.chunk_overlap:
+                        break
+                    overlap.append((piece, piece_tokens))
+                    current_tokens += piece_tokens
+                current = overlap[::-1]
+                new_chunk = True
+                continue
+
+            if new_chunk:
+                # 겹친 조각 때문에 첫 조각이 들어가지 않으면 앞에서부터 겹침을 줄임
+                while current and current_tokens + tokens > self.chunk_size:
+                    current_tokens -= current.pop(0)[1]
+            current.append((text, tokens))
+            current_tokens += tokens
+            new_chunk = False
+            idx += 1
+
+        if not new_chunk:
+            chunks.append("".join(piece for piece, _ in current))
+        return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    종결 부호 기준으로 문장을 나눕니다. 각 문장은 뒤따르는 공백을 포함하고 첫 문장 앞 공백은 버립니다.
+    """
+    sentences = []
+    start = len(text) - len(text.lstrip())
+    for match in _SENTENCE_END.finditer(text, start):
+        end = match.end()
+        if end >= len(text):
+            break
+        marks = match.group(1) or ""
+        # 말줄임표("...")는 잘린 제목 인용 등 문장 중간에 자주 쓰이므로 문장 끝으로 보지 않음
+        if ".." in marks:
+            continue
+        period = match.start()
+        if marks == "." and _ABBREVIATION.search(text, max(0, period - 5), period + 1):
+            continue
+        sentences.append(text[start:end])
+        start = end
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+def _split_pieces(text: str) -> List[str]:
+    parts = text.split(_PARAGRAPH_SEPARATOR)
+    if len(parts) > 1:
+        pieces = [parts[0]] + [_PARAGRAPH_SEPARATOR + part for part in parts[1:]]
+        pieces = [piece for piece in pieces if piece]
+        if len(pieces) > 1:
+            return pieces
+
+    sentences = _split_sentences(text)
+    if len(sentences) > 1:
+        return sentences
+
+    phrases = _PHRASE.findall(text)
+    if len(phrases) > 1:
+        return phrases
+
+    words = text.split(" ")
+    if len(words) > 1:
+        pieces = [words[0]] + [" " + word for word in words[1:]]
+        pieces = [piece for piece in pieces if piece]
+        if len(pieces) > 1:
+            return pieces
+
+    return list(text)
+
+
+# 프로세스 풀 워커마다 설정별 청커 하나 (토크나이저 로딩은 워커당 한 번)
+_WORKER_CHUNKERS: Dict[Tuple[int, int, str], KoreanSentenceChunker] = {}
+
+
+def _split_batch(
+    chunk_size: int, chunk_overlap: int, encoding_name: str, texts: List[str]
+) -> List[List[str]]:
+    key = (chunk_size, chunk_overlap, encoding_name)
+    chunker = _WORKER_CHUNKERS.get(key)
+    if chunker is None:
+        chunker = _WORKER_CHUNKERS[key] = KoreanSentenceChunker(*key)
+    return [chunker.split(text) for text in texts]
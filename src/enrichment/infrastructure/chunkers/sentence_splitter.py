@@ -0,0 +1,25 @@
+from typing import List
+
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.utils import get_tokenizer
+
+from enrichment.application.ports.text_chunker_port import TextChunkerPort
+
+
+class SentenceSplitterChunker(TextChunkerPort):
+    """llama-index SentenceSplitter implementation of the TextChunkerPort interface."""
+
+    def __init__(self, chunk_size: int = 320, chunk_overlap: int = 80):
+        # 기본 토크나이저는 text-embedding-3 계열과 같은 cl100k_base
+        self.tokenizer = get_tokenizer()
+        self.splitter = SentenceSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            tokenizer=self.tokenizer,
+        )
+
+    def split(self, text: str) -> List[str]:
+        return self.splitter.split_text(text)
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.tokenizer(text))
@@ -0,0 +1,53 @@
+import os
+from functools import lru_cache
+
+__all__ = ["load_encoding"]
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# 패키지에 포함된 BPE 파일 디렉터리
+# (cl100k_base.tiktoken: https://openaipublic.blob.core.windows.net/encodings/cl100k_base.tiktoken)
+_BPE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 인코딩별 (BPE 파일 sha256, 사전 토큰화 정규식, 특수 토큰) - tiktoken_ext.openai_public과 같음
+_ENCODINGS = {
+    "cl100k_base": (
+        "223921b76ee99bde995b7ff738513eef100fb51d18c93597a113bcffe865b2a7",
+        r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s""",
+        {
+            "<|endoftext|>": 100257,
+            "<|fim_prefix|>": 100258,
+            "<|fim_middle|>": 100259,
+            "<|fim_suffix|>": 100260,
+            "<|endofprompt|>": 100276,
+        },
+    ),
+}
+
+
+def load_encoding(name: str = DEFAULT_ENCODING):
+    """
+    tiktoken BPE 인코딩을 네트워크 없이 불러옵니다.
+
+    패키지에 포함된 BPE 파일로 인코딩을 만들므로 다운로드나 TIKTOKEN_CACHE_DIR 설정이 필요 없으며,
+    BPE 병합 테이블 구성 비용이 크므로 프로세스 안에서 인코딩별로 한 번만 만듭니다.
+    """
+    return _load_encoding(name)
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(name: str):
+    import tiktoken
+    from tiktoken.load import load_tiktoken_bpe
+
+    if name not in _ENCODINGS:
+        raise ValueError(f"Unsupported offline tiktoken encoding: {name}")
+    expected_hash, pat_str, special_tokens = _ENCODINGS[name]
+    return tiktoken.Encoding(
+        name=name,
+        pat_str=pat_str,
+        mergeable_ranks=load_tiktoken_bpe(
+            os.path.join(_BPE_DIR, f"{name}.tiktoken"), expected_hash=expected_hash
+        ),
+        special_tokens=special_tokens,
+    )
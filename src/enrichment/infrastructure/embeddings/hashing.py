@@ -0,0 +1,133 @@
+import asyncio
+import re
+import unicodedata
+from typing import List, Tuple
+
+import numpy as np
+
+from enrichment.application.exceptions.embedding_exception import (
+    EmbeddingGenerationError,
+)
+from enrichment.application.ports.text_embedding_client_port import (
+    TextEmbeddingClientPort,
+)
+
+__all__ = ["HashingEmbeddingClient"]
+
+_WHITESPACE = re.compile(r"\s+")
+# 텍스트 경계 표시 (정규화 후 본문에 나타나지 않는 코드포인트)
+_SEPARATOR = "\x00"
+# 이 글자 수를 넘는 배치는 이벤트 루프를 막지 않도록 스레드에서 계산
+_THREAD_THRESHOLD_CHARS = 200_000
+# 64비트 다항식 해시 기저 / murmur3 fmix64 상수
+_BASE = np.uint64(0x100000001B3)
+_MIX1 = np.uint64(0xFF51AFD7ED558CCD)
+_MIX2 = np.uint64(0xC4CEB9FE1A85EC53)
+
+# 빈 텍스트 위치에 넣는 길이 0 임베딩 (읽기 전용으로 공유)
+_EMPTY_EMBEDDING = np.empty(0, dtype=np.float32)
+_EMPTY_EMBEDDING.flags.writeable = False
+
+
+class HashingEmbeddingClient(TextEmbeddingClientPort):
+    """
+    네트워크 없이 결정적인 임베딩을 만드는 로컬 임베딩 클라이언트
+
+    텍스트를 정규화(NFKC, 소문자, 공백 압축)한 뒤 단어 경계를 포함한 문자 n-gram을
+    부호 있는 feature hashing으로 dimensions차원에 투영하고 L2 정규화합니다.
+    문자(한글은 음절) 단위이므로 형태소 분석 없이 한국어에도 동작하며, 코사인 유사도는
+    n-gram 중복(어휘 유사도)을 반영합니다. 같은 입력/seed에는 프로세스와 무관하게
+    항상 같은 벡터를 반환하므로 오프라인 테스트, 부하 테스트, 검색 벤치마크용
+    합성 코퍼스에서 OpenAI 임베딩을 대신합니다.
+
+    배치의 모든 n-gram 해시를 NumPy로 한 번에 계산하므로 수백만 청크도 임베딩할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 1536,
+        ngram_range: Tuple[int, int] = (2, 4),
+        seed: int = 0,
+    ):
+        self.dimensions = dimensions
+        self.ngram_range = ngram_range
+        self.seed = seed
+
+    async def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        if not texts:
+            return []
+
+        normalized = [self._normalize(text) if text else "" for text in texts]
+        indices = [i for i, text in enumerate(normalized) if text]
+        if not indices:
+            raise EmbeddingGenerationError(
+                str(texts), "All input texts are empty or None"
+            )
+
+        batch = [normalized[i] for i in indices]
+        if sum(len(text) for text in batch) > _THREAD_THRESHOLD_CHARS:
+            matrix = await asyncio.to_thread(self.embed, batch)
+        else:
+            matrix = self.embed(batch)
+
+        embeddings = [_EMPTY_EMBEDDING] * len(texts)
+        for row, i in enumerate(indices):
+            embeddings[i] = matrix[row]
+        return embeddings
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        정규화된 텍스트 목록을 (len(texts), dimensions) float32 행렬로 임베딩합니다.
+        """
+        # 텍스트마다 앞뒤 공백을 붙여 단어 시작/끝 n-gram이 생기도록 하고 경계 문자로 연결
+        joined = _SEPARATOR.join(f" {text} " for text in texts)
+        codepoints = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        codepoints = codepoints.astype(np.uint64)
+        # 위치별 텍스트 번호
+        boundary = codepoints == 0
+        segment = np.cumsum(boundary, dtype=np.uint64)
+
+        dims = np.uint64(self.dimensions)
+        keys, signs = [], []
+        # n-gram 다항식 해시를 n-1-gram 해시에서 이어 계산 (uint64 곱셈은 2^64로 감김)
+        hashes = np.full(len(codepoints), self.seed * 1_000_003, dtype=np.uint64)
+        crosses = np.zeros(len(codepoints), dtype=bool)
+        for n in range(1, self.ngram_range[1] + 1):
+            count = len(codepoints) - n + 1
+            if count <= 0:
+                break
+            hashes = hashes[:count] * _BASE + codepoints[n - 1 :]
+            crosses = crosses[:count] | boundary[n - 1 :]
+            if n < self.ngram_range[0]:
+                continue
+
+            # n마다 다른 해시가 되도록 n을 섞은 뒤 murmur3 fmix64로 비트 확산
+            mixed = hashes[~crosses] ^ np.uint64(n)
+            mixed ^= mixed >> np.uint64(33)
+            mixed *= _MIX1
+            mixed ^= mixed >> np.uint64(33)
+            mixed *= _MIX2
+            mixed ^= mixed >> np.uint64(33)
+
+            # 상위 32비트를 [0, dimensions)로 사상 (나눗셈 없는 곱셈-시프트)
+            buckets = ((mixed >> np.uint64(32)) * dims) >> np.uint64(32)
+            keys.append(segment[:count][~crosses] * dims + buckets)
+            # 최하위 비트로 부호를 정해 해시 충돌의 편향을 상쇄
+            signs.append(1.0 - 2.0 * (mixed & np.uint64(1)).astype(np.float64))
+
+        matrix = np.bincount(
+            np.concatenate(keys),
+            weights=np.concatenate(signs),
+            minlength=len(texts) * self.dimensions,
+        ).reshape(len(texts), self.dimensions)
+        matrix = matrix.astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+        return matrix
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        if not unicodedata.is_normalized("NFKC", text):
+            text = unicodedata.normalize("NFKC", text)
+        text = text.lower().replace(_SEPARATOR, " ")
+        return _WHITESPACE.sub(" ", text).strip()
@@ -1,25 +1,96 @@
-from typing import List
+import asyncio
+import base64
+import random
+from typing import Callable, List, Optional
 
+import numpy as np
 import openai
 from openai import AsyncOpenAI
 
 from enrichment.application.exceptions.embedding_exception import (
     EmbeddingConnectionError,
+    EmbeddingError,
     EmbeddingGenerationError,
 )
 from enrichment.application.ports.text_embedding_client_port import (
     TextEmbeddingClientPort,
 )
+from enrichment.infrastructure.chunkers.tokenizer import load_encoding
 
+# 빈 텍스트 위치에 넣는 길이 0 임베딩 (읽기 전용으로 공유)
+_EMPTY_EMBEDDING = np.empty(0, dtype=np.float32)
+_EMPTY_EMBEDDING.flags.writeable = False
 
-class OpenAIEmbeddingClient(TextEmbeddingClientPort):
-    """OpenAI implementation of the EmbeddingClient interface."""
 
-    def __init__(self, api_key: str, model: str = "text-embedding-3-small"):
-        self.model = model
-        self.client = AsyncOpenAI(api_key=api_key)
+class AdaptiveConcurrencyLimiter:
+    """
+    동시 요청 수 제한기 (AIMD)
+
+    rate limit 응답을 받으면 허용 동시 요청 수를 절반으로 줄이고,
+    성공할 때마다 1씩 늘려 max_concurrency까지 회복합니다.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify_all()
+
+    async def on_success(self) -> None:
+        async with self._condition:
+            if self.limit < self.max_concurrency:
+                self.limit += 1
+                self._condition.notify_all()
+
+    async def on_rate_limited(self) -> None:
+        async with self._condition:
+            self.limit = max(1, self.limit // 2)
+
 
-    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+class OpenAIEmbeddingClient(TextEmbeddingClientPort):
+    """OpenAI implementation of the EmbeddingClient interface.
+
+    Inputs are split into batches by token count and item cap, sent concurrently
+    under an adaptive concurrency limit, and retried with exponential backoff
+    on rate limits. Embeddings are requested base64-encoded and decoded straight
+    into float32 arrays without building Python float objects.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        max_batch_tokens: int = 250_000,
+        max_batch_size: int = 2048,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        base_url: Optional[str] = None,
+    ):
+        self.model = model
+        # 재시도는 이 클라이언트의 backoff/동시성 조절로 처리
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self._tokenizer: Optional[Callable[[str], List[int]]] = None
+
+    async def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
         """
         Generate embedding vectors for multiple texts using OpenAI's API.
 
@@ -27,7 +98,8 @@ class OpenAIEmbeddingClient(TextEmbeddingClientPort):
             texts: List of input texts to generate embeddings for
 
         Returns:
-            List of embedding vectors, each as a list of float values
+            List of embedding vectors, each as a 1-D float32 array
+            (zero-length for empty texts)
 
         Raises:
             EmbeddingGenerationError: If embedding generation fails
@@ -50,22 +122,29 @@ class OpenAIEmbeddingClient(TextEmbeddingClientPort):
             )
 
         try:
-            response = await self.client.embeddings.create(
-                input=filtered_texts, model=self.model
-            )
-
-            if not response.data or len(response.data) != len(filtered_texts):
-                raise EmbeddingGenerationError(
-                    str(texts), "OpenAI returned unexpected number of embeddings"
-                )
-
-            embeddings = [[] for _ in texts]
-            for i, embedding_data in enumerate(response.data):
-                original_index = text_indices[i]
-                embeddings[original_index] = embedding_data.embedding
+            batches = self._split_batches(filtered_texts)
+            tasks = [
+                asyncio.create_task(self._embed_batch(filtered_texts[start:end]))
+                for start, end in batches
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # 한 배치가 실패하면 나머지 요청은 취소
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            embeddings = [_EMPTY_EMBEDDING] * len(texts)
+            for (start, _), batch_embeddings in zip(batches, results):
+                for offset, embedding in enumerate(batch_embeddings):
+                    embeddings[text_indices[start + offset]] = embedding
 
             return embeddings
 
+        except EmbeddingError:
+            raise
+
         except openai.AuthenticationError as e:
             raise EmbeddingConnectionError("OpenAI", f"Authentication failed: {str(e)}")
 
@@ -80,3 +159,81 @@ class OpenAIEmbeddingClient(TextEmbeddingClientPort):
 
         except Exception as e:
             raise EmbeddingGenerationError(str(texts), f"Unexpected error: {str(e)}")
+
+    def _split_batches(self, texts: List[str]) -> List[tuple]:
+        """토큰 수/입력 개수 상한을 넘지 않는 연속 구간 [start, end) 목록"""
+        # 토큰은 최소 1바이트이므로 UTF-8 길이 합이 상한 이하이면 토큰화 없이 한 배치
+        if len(texts) <= self.max_batch_size and (
+            sum(len(text.encode("utf-8")) for text in texts) <= self.max_batch_tokens
+        ):
+            return [(0, len(texts))]
+
+        batches = []
+        start, batch_tokens = 0, 0
+        for idx, text in enumerate(texts):
+            tokens = self._count_tokens(text)
+            if idx > start and (
+                batch_tokens + tokens > self.max_batch_tokens
+                or idx - start >= self.max_batch_size
+            ):
+                batches.append((start, idx))
+                start, batch_tokens = idx, 0
+            batch_tokens += tokens
+        batches.append((start, len(texts)))
+        return batches
+
+    def _count_tokens(self, text: str) -> int:
+        if self._tokenizer is None:
+            # text-embedding-3 계열과 같은 cl100k_base (오프라인 BPE 캐시 사용)
+            self._tokenizer = load_encoding().encode_ordinary
+        return len(self._tokenizer(text))
+
+    async def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        for attempt in range(self.max_retries + 1):
+            async with self.limiter:
+                try:
+                    # base64를 명시하면 SDK가 float 리스트로 변환하지 않고 문자열 그대로 반환
+                    response = await self.client.embeddings.create(
+                        input=texts, model=self.model, encoding_format="base64"
+                    )
+                except openai.RateLimitError as e:
+                    await self.limiter.on_rate_limited()
+                    if attempt == self.max_retries:
+                        raise
+                    delay = self._backoff_delay(attempt, e)
+                else:
+                    await self.limiter.on_success()
+                    break
+            # 제한기 밖에서 대기하여 다른 배치가 자리를 쓸 수 있게 함
+            await asyncio.sleep(delay)
+
+        if not response.data or len(response.data) != len(texts):
+            raise EmbeddingGenerationError(
+                str(texts), "OpenAI returned unexpected number of embeddings"
+            )
+        return [
+            self._decode(embedding_data.embedding) for embedding_data in response.data
+        ]
+
+    @staticmethod
+    def _decode(embedding) -> np.ndarray:
+        if isinstance(embedding, str):
+            # little-endian float32 바이트 위의 읽기 전용 뷰 (복사 없음)
+            return np.frombuffer(base64.b64decode(embedding), dtype="<f4")
+        # base64를 지원하지 않는 호환 서버가 float 리스트를 반환한 경우
+        return np.asarray(embedding, dtype=np.float32)
+
+    def _backoff_delay(self, attempt: int, error: openai.RateLimitError) -> float:
+        # 서버가 retry-after를 주면 그 값을, 아니면 지수 backoff + full jitter
+        retry_after = None
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers is not None:
+            try:
+                retry_after = float(headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * (2**attempt))
+        )
@@ -1,4 +1,10 @@
 from .company import Company
 from .company_alias import CompanyAlias
+from .company_finance import CompanyFinance
+from .company_headcount import CompanyHeadcount
+from .company_investment import CompanyInvestment
+from .company_mau import CompanyMau
+from .company_metrics_rollup import CompanyMetricsRollup
+from .company_patent import CompanyPatent
 from .company_snapshot import CompanyMetricsSnapshot
 from .news_chunk import NewsChunk
@@ -11,6 +11,7 @@ from db.model import Base
 
 if TYPE_CHECKING:
     from .company_alias import CompanyAlias
+    from .company_metrics_rollup import CompanyMetricsRollup
     from .company_snapshot import CompanyMetricsSnapshot
     from .news_chunk import NewsChunk
 
@@ -90,6 +91,11 @@ class Company(Base):
         "CompanyMetricsSnapshot", back_populates="company"
     )
 
+    # 관계: 회사 메트릭 누적 롤업 목록 (구간 요약 조회용)
+    rollups: Mapped[List["CompanyMetricsRollup"]] = relationship(
+        "CompanyMetricsRollup", back_populates="company"
+    )
+
     # 관계: 뉴스 청크 목록
     news_chunks: Mapped[List["NewsChunk"]] = relationship(
         "NewsChunk", back_populates="company"
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.model import Base
+
+__all__ = ["CompanyFinance"]
+
+
+class CompanyFinance(Base):
+    """
+    회사 재무 테이블 - MonthlyMetrics.finance를 행 단위로 정규화하여 저장
+    """
+
+    __tablename__ = "company_finance"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id"))
+
+    # 기준 날짜: 스냅샷과 동일하게 매월 1일로 통일
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    profit: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    operating_profit: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0"
+    )
+    net_profit: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
+    # 복합 인덱스: 회사별 날짜 구간 조회용
+    __table_args__ = (
+        Index("idx_company_finance_date", "company_id", "reference_date"),
+    )
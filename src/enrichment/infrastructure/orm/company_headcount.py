@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.model import Base
+
+__all__ = ["CompanyHeadcount"]
+
+
+class CompanyHeadcount(Base):
+    """
+    회사 조직(직원 수) 테이블 - MonthlyMetrics.organizations를 행 단위로 정규화하여 저장
+    """
+
+    __tablename__ = "company_headcount"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id"))
+
+    # 기준 날짜: 스냅샷과 동일하게 매월 1일로 통일
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    people_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    growth_rate: Mapped[float] = mapped_column(Float, default=0, server_default="0")
+
+    # 복합 인덱스: 회사별 날짜 구간 조회용
+    __table_args__ = (
+        Index("idx_company_headcount_date", "company_id", "reference_date"),
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import ARRAY, BigInteger, Date, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.model import Base
+
+__all__ = ["CompanyInvestment"]
+
+
+class CompanyInvestment(Base):
+    """
+    회사 투자 유치 테이블 - MonthlyMetrics.investments를 행 단위로 정규화하여 저장
+    """
+
+    __tablename__ = "company_investments"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id"))
+
+    # 기준 날짜: 스냅샷과 동일하게 매월 1일로 통일
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    level: Mapped[str] = mapped_column(String(32), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    investors: Mapped[List[str]] = mapped_column(
+        ARRAY(String), default=list, server_default=text("'{}'")
+    )
+
+    # 복합 인덱스: 회사별 날짜 구간 조회용
+    __table_args__ = (
+        Index("idx_company_investment_date", "company_id", "reference_date"),
+    )
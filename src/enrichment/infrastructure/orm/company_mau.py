@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, Float, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.model import Base
+
+__all__ = ["CompanyMau"]
+
+
+class CompanyMau(Base):
+    """
+    회사 제품별 MAU 테이블 - MonthlyMetrics.mau를 행 단위로 정규화하여 저장
+    """
+
+    __tablename__ = "company_mau"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id"))
+
+    # 기준 날짜: 스냅샷과 동일하게 매월 1일로 통일
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    product_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    product_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    growth_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    # 복합 인덱스: 회사별 날짜 구간 조회용
+    __table_args__ = (Index("idx_company_mau_date", "company_id", "reference_date"),)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from db.model import Base
+
+if TYPE_CHECKING:
+    from .company import Company
+
+__all__ = ["CompanyMetricsRollup"]
+
+
+class CompanyMetricsRollup(Base):
+    """
+    회사 메트릭 누적 롤업 테이블 - 월별 스냅샷의 누적합(prefix sum)을 저장
+    CompanyInfoWriter가 적재 시점에 CompanyMetricsSnapshot과 함께 저장하며,
+    임의의 재직 구간 요약은 (구간 직전 롤업, 구간 마지막 롤업) 두 번의 인덱스 조회로 계산됨
+    """
+
+    __tablename__ = "company_metrics_rollups"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id"), index=True)
+
+    # 기준 날짜: 스냅샷과 동일하게 매월 1일로 통일
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    # 누적 값: 기준 월까지의 합계
+    cumulative_investment_amount: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0"
+    )
+    cumulative_investment_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
+    cumulative_patent_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
+
+    # 이월 값: 기준 월까지 확인된 최신 값
+    people_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    profit: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    net_profit: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+    operating_profit: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0"
+    )
+
+    # 관계: 소속 회사 정보
+    company: Mapped["Company"] = relationship("Company", back_populates="rollups")
+
+    # 유니크 복합 인덱스: (회사, 기준 월) 포인트 조회 및 역순 LIMIT 1 조회용
+    __table_args__ = (
+        Index(
+            "idx_company_rollup_date",
+            "company_id",
+            "reference_date",
+            unique=True,
+        ),
+    )
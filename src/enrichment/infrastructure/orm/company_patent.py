@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.model import Base
+
+__all__ = ["CompanyPatent"]
+
+
+class CompanyPatent(Base):
+    """
+    회사 특허 테이블 - MonthlyMetrics.patents를 행 단위로 정규화하여 저장
+    """
+
+    __tablename__ = "company_patents"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    company_id: Mapped[UUID] = mapped_column(ForeignKey("companies.id"))
+
+    # 기준 날짜: 스냅샷과 동일하게 매월 1일로 통일
+    reference_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    level: Mapped[str] = mapped_column(String(32), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    # 복합 인덱스: 회사별 날짜 구간 조회용
+    __table_args__ = (Index("idx_company_patent_date", "company_id", "reference_date"),)
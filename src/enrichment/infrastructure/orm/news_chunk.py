@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import BigInteger, Date, ForeignKey, Index, String, Text
+from pgvector import HalfVector
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import (
+    BigInteger,
+    Computed,
+    Date,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.model import Base
@@ -20,11 +31,13 @@ __all__ = ["NewsChunk"]
 class NewsChunk(Base):
     """
     뉴스 기사의 청크를 저장하는 테이블
+    created_at 기준 연 단위 RANGE 파티션 테이블이며(news_chunks_yYYYY, news_chunks_default),
+    부모 테이블에 정의한 인덱스는 파티션마다 따로 생성됨
     """
 
     __tablename__ = "news_chunks"
 
-    # 기본키: 청크 ID
+    # 기본키: (청크 ID, 생성 날짜) - 파티션 테이블의 기본키는 파티션 키를 포함해야 함
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     # 외래키: 회사 ID (뉴스가 속한 회사)
@@ -39,11 +52,42 @@ class NewsChunk(Base):
     # 청크 내용을 1536차원 벡터로 저장(text-embedding-3-small dim)
     vector: Mapped[Vector] = mapped_column(Vector(1536), nullable=False)
 
+    # 같은 임베딩의 float16(halfvec) 사본 - 선택적 저장 방식(NEWS_SEARCH_VECTOR_STORAGE)
+    vector_half: Mapped[Optional[HalfVector]] = mapped_column(
+        HALFVEC(1536), nullable=True
+    )
+
+    # 임베딩 앞 512차원의 float16 사본 (text-embedding-3의 축소 차원)
+    vector_half_512: Mapped[Optional[HalfVector]] = mapped_column(
+        HALFVEC(512), nullable=True
+    )
+
+    # 임베딩의 이진 양자화(부호 비트) - 해밍 거리 프리필터용, vector에서 자동 계산
+    vector_bit: Mapped[Optional[str]] = mapped_column(
+        BIT(1536), Computed("binary_quantize(vector)::bit(1536)", persisted=True)
+    )
+
+    # 제목 + 내용의 전문 검색 벡터 - 하이브리드 검색의 어휘 매칭용, 자동 계산
+    # 형태소 분석 사전이 없는 한국어는 'simple' 설정으로 공백 단위 토큰을 그대로 저장하고,
+    # 조사가 붙은 어절은 검색 시 접두사 매칭(term:*)으로 찾음
+    search_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple'::regconfig, title || ' ' || contents)",
+            persisted=True,
+        ),
+    )
+
+    # 멱등 적재 키: sha256(company_id || link || contents) hex
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
     # 원본 뉴스 링크
     link: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
 
-    # 뉴스 기사 생성 날짜 (부모 뉴스와 동일)
-    created_at: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    # 뉴스 기사 생성 날짜 (부모 뉴스와 동일), 파티션 키
+    created_at: Mapped[date] = mapped_column(
+        Date, primary_key=True, nullable=False, index=True
+    )
 
     # 관계: 회사 정보
     company: Mapped["Company"] = relationship("Company", back_populates="news_chunks")
@@ -56,6 +100,32 @@ class NewsChunk(Base):
             postgresql_with={"m": 16, "ef_construction": 64},
             postgresql_ops={"vector": "vector_cosine_ops"},
         ),
+        Index(
+            "idx_chunk_half_hnsw",
+            "vector_half",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"vector_half": "halfvec_cosine_ops"},
+        ),
+        Index(
+            "idx_chunk_half_512_hnsw",
+            "vector_half_512",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"vector_half_512": "halfvec_cosine_ops"},
+        ),
+        Index(
+            "idx_chunk_bit_hnsw",
+            "vector_bit",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"vector_bit": "bit_hamming_ops"},
+        ),
+        # 파티션 테이블의 유니크 제약은 파티션 키를 포함해야 함
+        UniqueConstraint(
+            "content_hash", "created_at", name="uq_news_chunk_content_hash"
+        ),
+        Index("idx_chunk_search_tsv", "search_tsv", postgresql_using="gin"),
         # 인덱스: created_at과 company_id를 조합한 인덱스
         Index(
             "idx_news_chunk_created_at_company_id",
@@ -63,4 +133,5 @@ class NewsChunk(Base):
             "company_id",
             unique=False,
         ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
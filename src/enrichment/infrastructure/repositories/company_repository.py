@@ -1,29 +1,82 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional, Sequence
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import (
+    Date,
+    Integer,
+    String,
+    bindparam,
+    column,
+    exists,
+    func,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy import values as sa_values
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from db.db import ReadSessionManager, WriteSessionManager
+from db.model import Base
 from enrichment.domain.aggregates.company_aggregate import CompanyAggregate
 from enrichment.domain.entities.company import Company
 from enrichment.domain.entities.company_alias import CompanyAlias
+from enrichment.domain.entities.company_metrics_rollup import CompanyMetricsRollup
 from enrichment.domain.entities.company_metrics_snapshot import CompanyMetricsSnapshot
 from enrichment.domain.repositories.company_repository_port import CompanyRepositoryPort
-from enrichment.domain.specs.company_spec import CompanySearchParam
-from enrichment.domain.vos.metrics import MonthlyMetrics
+from enrichment.domain.specs.company_spec import CompanySearchParam, MetricsWindowParam
+from enrichment.domain.vos.metrics import (
+    MAU,
+    Finance,
+    Investment,
+    MetricFamily,
+    MonthlyMetrics,
+    Organization,
+    Patent,
+)
+from enrichment.domain.vos.metrics_window import CompanyMetricsWindow
 from enrichment.infrastructure.exceptions.repository_exception import (
     DuplicatedCompanyError,
 )
 from enrichment.infrastructure.orm.company import Company as CompanyOrm
 from enrichment.infrastructure.orm.company_alias import CompanyAlias as CompanyAliasOrm
+from enrichment.infrastructure.orm.company_finance import (
+    CompanyFinance as CompanyFinanceOrm,
+)
+from enrichment.infrastructure.orm.company_headcount import (
+    CompanyHeadcount as CompanyHeadcountOrm,
+)
+from enrichment.infrastructure.orm.company_investment import (
+    CompanyInvestment as CompanyInvestmentOrm,
+)
+from enrichment.infrastructure.orm.company_mau import CompanyMau as CompanyMauOrm
+from enrichment.infrastructure.orm.company_metrics_rollup import (
+    CompanyMetricsRollup as CompanyMetricsRollupOrm,
+)
+from enrichment.infrastructure.orm.company_patent import (
+    CompanyPatent as CompanyPatentOrm,
+)
 from enrichment.infrastructure.orm.company_snapshot import (
     CompanyMetricsSnapshot as CompanyMetricsSnapshotOrm,
 )
 
+# 메트릭 계열별 정규화 테이블
+METRIC_ORMS: Dict[MetricFamily, type[Base]] = {
+    MetricFamily.MAU: CompanyMauOrm,
+    MetricFamily.PATENTS: CompanyPatentOrm,
+    MetricFamily.FINANCE: CompanyFinanceOrm,
+    MetricFamily.INVESTMENTS: CompanyInvestmentOrm,
+    MetricFamily.ORGANIZATIONS: CompanyHeadcountOrm,
+}
+
 
 @dataclass
 class GetCompaniesMetricsSnapshotsPram:
@@ -37,9 +90,12 @@ class CompanyRepository(CompanyRepositoryPort):
         self,
         write_session_manager: WriteSessionManager,
         read_session_manager: ReadSessionManager,
+        single_statement: bool = False,
     ):
         self.write_session_manager = write_session_manager
         self.read_session_manager = read_session_manager
+        # True이면 별칭/회사/스냅샷을 CTE 기반 단일 쿼리(1회 왕복)로 조회
+        self.single_statement = single_statement
 
     async def save(self, aggregate: CompanyAggregate) -> None:
         async with self.write_session_manager as session:
@@ -83,41 +139,102 @@ class CompanyRepository(CompanyRepositoryPort):
                 )
                 session.add(snapshot_orm)
 
+                # 정규화 메트릭 테이블 이중 기록 (JSONB 스냅샷과 동일한 내용)
+                for metric_orm in self._create_metric_orms_from(snapshot):
+                    session.add(metric_orm)
+
+            for rollup in aggregate.company_metrics_rollups:
+                rollup_orm = CompanyMetricsRollupOrm(
+                    company_id=rollup.company_id,
+                    reference_date=rollup.reference_date,
+                    cumulative_investment_amount=rollup.cumulative_investment_amount,
+                    cumulative_investment_count=rollup.cumulative_investment_count,
+                    cumulative_patent_count=rollup.cumulative_patent_count,
+                    people_count=rollup.people_count,
+                    profit=rollup.profit,
+                    net_profit=rollup.net_profit,
+                    operating_profit=rollup.operating_profit,
+                )
+                session.add(rollup_orm)
+
+        # 커밋된 뒤 잠시 동안 이 회사(ID/별칭) 조회는 복제 지연과 무관하게 primary에서 읽음
+        await self.read_session_manager.mark_written(
+            [
+                aggregate.company.id,
+                *(alias.alias for alias in aggregate.company_aliases),
+            ]
+        )
+
     async def get_companies(
-        self, params: List[CompanySearchParam]
+        self,
+        params: List[CompanySearchParam],
+        metric_families: Optional[Sequence[MetricFamily]] = None,
     ) -> List[CompanyAggregate]:
+        """
+        별칭과 재직 구간으로 회사 애그리게이트를 조회합니다.
+
+        Args:
+            params: 회사 별칭과 재직 구간 목록
+            metric_families: 조회할 메트릭 계열. 지정하면 JSONB 스냅샷 대신
+                해당 계열의 정규화 테이블만 조회하고, 나머지 계열은 빈 목록으로 채운다.
+                None이면 기존 JSONB 스냅샷 전체를 조회한다.
+        """
         if not params:
             return []
 
-        company_orms = []
-        snapshot_orm_map = {}
+        if self.single_statement and metric_families is None:
+            return await self._get_companies_in_single_statement(params)
+
+        aliases = [param.alias for param in params]
         alias_orm_map = defaultdict(list)
-        async with self.read_session_manager as session:
-            aliases_map = await self._get_aliases_map_by(
-                [param.alias for param in params], session
-            )
+        async with self.read_session_manager.session(aliases) as session:
+            aliases_map = await self._get_aliases_map_by(aliases, session)
 
-            company_ids = []
-            metrics_params = []
-            for param in params:
-                alias_orm = aliases_map.get(param.alias)
-                if not alias_orm:
-                    continue
+        company_ids = []
+        metrics_params = []
+        for param in params:
+            alias_orm = aliases_map.get(param.alias)
+            if not alias_orm:
+                continue
 
-                alias_orm_map[alias_orm.company_id].append(alias_orm)
+            alias_orm_map[alias_orm.company_id].append(alias_orm)
 
-                company_ids.append(alias_orm.company_id)
-                metrics_params.append(
-                    GetCompaniesMetricsSnapshotsPram(
-                        company_id=alias_orm.company_id,
-                        start_date=param.start_date,
-                        end_date=param.end_date,
-                    )
+            company_ids.append(alias_orm.company_id)
+            metrics_params.append(
+                GetCompaniesMetricsSnapshotsPram(
+                    company_id=alias_orm.company_id,
+                    start_date=param.start_date,
+                    end_date=param.end_date,
                 )
+            )
+        if not company_ids:
+            return []
 
-            company_orms = await self._get_companies(company_ids, session=session)
-            snapshot_orm_map = await self._get_companies_metrics_snapshots(
-                metrics_params, session=session
+        # 회사 행과 메트릭(스냅샷 또는 계열별 테이블)은 서로 독립이므로 세션을 나눠 동시에 조회
+        snapshot_orm_map = {}
+        metric_snapshot_map = None
+        if metric_families is None:
+            company_orms, snapshot_orm_map = (
+                await self.read_session_manager.run_concurrently(
+                    partial(self._get_companies, company_ids),
+                    partial(self._get_companies_metrics_snapshots, metrics_params),
+                    keys=company_ids,
+                )
+            )
+        else:
+            families = list(dict.fromkeys(metric_families))
+            company_orms, *family_orms = (
+                await self.read_session_manager.run_concurrently(
+                    partial(self._get_companies, company_ids),
+                    *(
+                        partial(self._get_metric_family_orms, family, metrics_params)
+                        for family in families
+                    ),
+                    keys=company_ids,
+                )
+            )
+            metric_snapshot_map = self._create_metric_snapshots_from(
+                dict(zip(families, family_orms))
             )
 
         aggregates = []
@@ -127,10 +244,259 @@ class CompanyRepository(CompanyRepositoryPort):
                     company_orm=company_orm,
                     alias_orms=alias_orm_map.get(company_orm.id, []),
                     snapshot_orm=snapshot_orm_map.get(company_orm.id, []),
+                    metric_snapshots=(
+                        metric_snapshot_map.get(company_orm.id, [])
+                        if metric_snapshot_map is not None
+                        else None
+                    ),
                 )
             )
         return aggregates
 
+    async def _get_companies_in_single_statement(
+        self, params: List[CompanySearchParam]
+    ) -> List[CompanyAggregate]:
+        """별칭 해석, 회사 조회, 스냅샷 집계를 하나의 쿼리로 수행합니다."""
+        query = self._build_company_context_query(
+            [
+                (idx, param.alias, param.start_date, param.end_date or date.today())
+                for idx, param in enumerate(params)
+            ]
+        )
+
+        async with self.read_session_manager.session(
+            [param.alias for param in params]
+        ) as session:
+            result = (await session.execute(query)).all()
+
+        aggregates = []
+        for row in result:
+            company_id = row.Company.id
+            aggregates.append(
+                CompanyAggregate(
+                    company=self._create_company_from(row.Company),
+                    company_aliases=[
+                        CompanyAlias(
+                            company_id=company_id,
+                            alias=alias["alias"],
+                            alias_type=alias["alias_type"],
+                            id=alias["id"],
+                        )
+                        for alias in row.aliases or []
+                    ],
+                    company_metrics_snapshots=[
+                        CompanyMetricsSnapshot(
+                            company_id=company_id,
+                            reference_date=date.fromisoformat(
+                                snapshot["reference_date"]
+                            ),
+                            metrics=MonthlyMetrics.model_validate(snapshot["metrics"]),
+                            id=snapshot["id"],
+                        )
+                        for snapshot in row.snapshots or []
+                    ],
+                )
+            )
+        return aggregates
+
+    def _build_company_context_query(self, rows: List[tuple]):
+        # VALUES 절로 (idx, alias, start_date, end_date) 파라미터 테이블을 생성
+        v = (
+            sa_values(
+                column("idx", Integer),
+                column("alias", String),
+                column("start_date", Date),
+                column("end_date", Date),
+            )
+            .data(rows)
+            .alias("p")
+        )
+
+        # 파라미터별 별칭 해석 (같은 별칭이 여러 건이면 id가 가장 작은 행)
+        ranked = (
+            select(
+                v.c.start_date,
+                v.c.end_date,
+                CompanyAliasOrm.id.label("alias_id"),
+                CompanyAliasOrm.company_id,
+                CompanyAliasOrm.alias,
+                CompanyAliasOrm.alias_type,
+                func.row_number()
+                .over(partition_by=v.c.idx, order_by=CompanyAliasOrm.id)
+                .label("rn"),
+            )
+            .select_from(v)
+            .join(CompanyAliasOrm, CompanyAliasOrm.alias == v.c.alias)
+            .subquery("ranked")
+        )
+        matched = (
+            select(
+                ranked.c.start_date,
+                ranked.c.end_date,
+                ranked.c.alias_id,
+                ranked.c.company_id,
+                ranked.c.alias,
+                ranked.c.alias_type,
+            )
+            .where(ranked.c.rn == 1)
+            .cte("matched")
+        )
+
+        # 회사별로 매칭된 별칭 목록
+        matched_aliases = (
+            select(matched.c.alias_id, matched.c.alias, matched.c.alias_type)
+            .where(matched.c.company_id == CompanyOrm.id)
+            .distinct()
+            .correlate(CompanyOrm)
+            .subquery("matched_aliases")
+        )
+        aliases = (
+            select(
+                func.jsonb_agg(
+                    aggregate_order_by(
+                        func.jsonb_build_object(
+                            "id",
+                            matched_aliases.c.alias_id,
+                            "alias",
+                            matched_aliases.c.alias,
+                            "alias_type",
+                            matched_aliases.c.alias_type,
+                        ),
+                        matched_aliases.c.alias_id,
+                    ),
+                    type_=JSONB,
+                )
+            )
+            .scalar_subquery()
+            .label("aliases")
+        )
+
+        # 회사별 재직 구간에 포함되는 스냅샷 (기준 날짜 내림차순)
+        in_window = exists(
+            select(literal_column("1")).where(
+                matched.c.company_id == CompanyMetricsSnapshotOrm.company_id,
+                CompanyMetricsSnapshotOrm.reference_date >= matched.c.start_date,
+                CompanyMetricsSnapshotOrm.reference_date <= matched.c.end_date,
+            )
+        )
+        snapshots = (
+            select(
+                func.jsonb_agg(
+                    aggregate_order_by(
+                        func.jsonb_build_object(
+                            "id",
+                            CompanyMetricsSnapshotOrm.id,
+                            "reference_date",
+                            CompanyMetricsSnapshotOrm.reference_date,
+                            "metrics",
+                            CompanyMetricsSnapshotOrm.metrics,
+                        ),
+                        CompanyMetricsSnapshotOrm.reference_date.desc(),
+                    ),
+                    type_=JSONB,
+                )
+            )
+            .where(CompanyMetricsSnapshotOrm.company_id == CompanyOrm.id, in_window)
+            .scalar_subquery()
+            .label("snapshots")
+        )
+
+        return select(CompanyOrm, aliases, snapshots).where(
+            CompanyOrm.id.in_(select(matched.c.company_id))
+        )
+
+    async def get_metrics_windows(
+        self, params: List[MetricsWindowParam]
+    ) -> List[CompanyMetricsWindow]:
+        """
+        재직 구간별 메트릭 요약을 누적 롤업으로 조회합니다.
+
+        구간마다 (시작일 이전 마지막 롤업, 종료일 이하 마지막 롤업) 두 건만
+        (company_id, reference_date) 인덱스로 조회하므로 구간 길이와 무관합니다.
+
+        Args:
+            params: 회사 ID와 재직 구간 목록
+
+        Returns:
+            List[CompanyMetricsWindow]: params와 같은 순서의 구간 요약 목록
+        """
+        if not params:
+            return []
+
+        rows = [
+            (idx, param.company_id, param.start_date, param.end_date or date.today())
+            for idx, param in enumerate(params)
+        ]
+        query = self._build_metrics_windows_query(rows)
+
+        async with self.read_session_manager.session(
+            [param.company_id for param in params]
+        ) as session:
+            result = (await session.execute(query)).all()
+
+        windows: List[Optional[CompanyMetricsWindow]] = [None] * len(params)
+        for row in result:
+            windows[row.idx] = CompanyMetricsWindow.of(
+                company_id=row.company_id,
+                start_date=row.start_date,
+                end_date=row.end_date,
+                before=self._create_rollup_from(row.before) if row.before else None,
+                last=self._create_rollup_from(row.last) if row.last else None,
+            )
+        return [window for window in windows if window is not None]
+
+    def _build_metrics_windows_query(self, rows: List[tuple]):
+        # VALUES 절로 (idx, company_id, start_date, end_date) 파라미터 테이블을 생성
+        v = (
+            sa_values(
+                column("idx", Integer),
+                column("company_id", PG_UUID(as_uuid=True)),
+                column("start_date", Date),
+                column("end_date", Date),
+            )
+            .data(rows)
+            .alias("w")
+        )
+
+        # 구간 시작 직전의 마지막 롤업 (역순 LIMIT 1 → 인덱스 한 번 탐색)
+        before_subq = (
+            select(CompanyMetricsRollupOrm)
+            .where(
+                CompanyMetricsRollupOrm.company_id == v.c.company_id,
+                CompanyMetricsRollupOrm.reference_date < v.c.start_date,
+            )
+            .order_by(CompanyMetricsRollupOrm.reference_date.desc())
+            .limit(1)
+            .lateral("before_rollup")
+        )
+        # 구간 종료일 이하의 마지막 롤업
+        last_subq = (
+            select(CompanyMetricsRollupOrm)
+            .where(
+                CompanyMetricsRollupOrm.company_id == v.c.company_id,
+                CompanyMetricsRollupOrm.reference_date <= v.c.end_date,
+            )
+            .order_by(CompanyMetricsRollupOrm.reference_date.desc())
+            .limit(1)
+            .lateral("last_rollup")
+        )
+        before = aliased(CompanyMetricsRollupOrm, before_subq, name="before")
+        last = aliased(CompanyMetricsRollupOrm, last_subq, name="last")
+
+        return (
+            select(
+                v.c.idx,
+                v.c.company_id,
+                v.c.start_date,
+                v.c.end_date,
+                before,
+                last,
+            )
+            .select_from(v)
+            .outerjoin(before_subq, true())
+            .outerjoin(last_subq, true())
+        )
+
     async def _get_aliases_map_by(
         self, aliases: List[str], session: AsyncSession
     ) -> Dict[str, CompanyAliasOrm]:
@@ -160,20 +526,9 @@ class CompanyRepository(CompanyRepositoryPort):
         if not params:
             return {}
 
-        conditions = []
-        for param in params:
-            end_date = param.end_date or date.today()
-            conditions.append(
-                and_(
-                    CompanyMetricsSnapshotOrm.company_id == param.company_id,
-                    CompanyMetricsSnapshotOrm.reference_date >= param.start_date,
-                    CompanyMetricsSnapshotOrm.reference_date <= end_date,
-                )
-            )
-
         query = (
             select(CompanyMetricsSnapshotOrm)
-            .where(or_(*conditions))
+            .where(self._window_conditions(CompanyMetricsSnapshotOrm, params))
             .order_by(CompanyMetricsSnapshotOrm.reference_date.desc())
         )
 
@@ -185,18 +540,114 @@ class CompanyRepository(CompanyRepositoryPort):
 
         return result
 
+    async def _get_metric_family_orms(
+        self,
+        family: MetricFamily,
+        params: List[GetCompaniesMetricsSnapshotsPram],
+        session: AsyncSession,
+    ) -> Sequence[Base]:
+        """메트릭 계열 하나의 정규화 테이블에서 재직 구간 안의 행을 조회"""
+        if not params:
+            return []
+
+        orm_cls = METRIC_ORMS[family]
+        query = (
+            select(orm_cls)
+            .where(self._window_conditions(orm_cls, params))
+            .order_by(orm_cls.reference_date.desc(), orm_cls.id)
+        )
+        ext = await session.execute(query)
+        return ext.scalars().all()
+
+    def _create_metric_snapshots_from(
+        self, family_orms: Dict[MetricFamily, Sequence[Base]]
+    ) -> Dict[UUID, List[CompanyMetricsSnapshot]]:
+        """계열별 정규화 테이블 행을 월별 스냅샷으로 재구성"""
+        # (company_id, reference_date) -> {계열: 메트릭 목록}
+        monthly: Dict[Tuple[UUID, date], Dict[str, list]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for family, orms in family_orms.items():
+            for orm in orms:
+                monthly[(orm.company_id, orm.reference_date)][family.value].append(
+                    self._create_metric_from(family, orm)
+                )
+
+        result = defaultdict(list)
+        for (company_id, reference_date), families in sorted(
+            monthly.items(), key=lambda item: item[0][1], reverse=True
+        ):
+            result[company_id].append(
+                CompanyMetricsSnapshot(
+                    company_id=company_id,
+                    reference_date=reference_date,
+                    metrics=MonthlyMetrics(
+                        **{
+                            family.value: families[family.value]
+                            for family in MetricFamily
+                        }
+                    ),
+                )
+            )
+        return result
+
+    def _window_conditions(
+        self, orm_cls: type[Base], params: Iterable[GetCompaniesMetricsSnapshotsPram]
+    ):
+        """
+        재직 구간 목록에 포함되는 행을 고르는 EXISTS 조건
+
+        구간 목록을 unnest(uuid[], date[], date[]) 파라미터 테이블로 전달하므로
+        구간 개수와 무관하게 SQL 문이 동일하여 prepared statement가 재사용된다.
+        """
+        company_ids, start_dates, end_dates = [], [], []
+        for param in params:
+            company_ids.append(param.company_id)
+            start_dates.append(param.start_date)
+            end_dates.append(param.end_date or date.today())
+
+        windows = (
+            func.unnest(
+                bindparam(
+                    "window_company_ids",
+                    company_ids,
+                    type_=ARRAY(PG_UUID(as_uuid=True)),
+                ),
+                bindparam("window_start_dates", start_dates, type_=ARRAY(Date)),
+                bindparam("window_end_dates", end_dates, type_=ARRAY(Date)),
+            )
+            .table_valued(
+                column("company_id", PG_UUID(as_uuid=True)),
+                column("start_date", Date),
+                column("end_date", Date),
+            )
+            .render_derived("w")
+        )
+        return exists(
+            select(literal_column("1"))
+            .select_from(windows)
+            .where(
+                windows.c.company_id == orm_cls.company_id,
+                orm_cls.reference_date >= windows.c.start_date,
+                orm_cls.reference_date <= windows.c.end_date,
+            )
+        )
+
     def _create_company_aggregate(
         self,
         company_orm: CompanyOrm,
         alias_orms: List[CompanyAliasOrm],
         snapshot_orm: List[CompanyMetricsSnapshotOrm],
+        metric_snapshots: Optional[List[CompanyMetricsSnapshot]] = None,
     ) -> CompanyAggregate:
+        if metric_snapshots is None:
+            metric_snapshots = [
+                self._create_snapshots_from(snapshot) for snapshot in snapshot_orm
+            ]
         return CompanyAggregate(
             company=self._create_company_from(company_orm),
             company_aliases=[self._create_alias_from(alias) for alias in alias_orms],
-            company_metrics_snapshots=[
-                self._create_snapshots_from(snapshot) for snapshot in snapshot_orm
-            ],
+            company_metrics_snapshots=metric_snapshots,
         )
 
     def _create_company_from(self, orm: CompanyOrm) -> Company:
@@ -224,6 +675,22 @@ class CompanyRepository(CompanyRepositoryPort):
             id=alias_orm.id,
         )
 
+    def _create_rollup_from(
+        self, rollup_orm: CompanyMetricsRollupOrm
+    ) -> CompanyMetricsRollup:
+        return CompanyMetricsRollup(
+            company_id=rollup_orm.company_id,
+            reference_date=rollup_orm.reference_date,
+            cumulative_investment_amount=rollup_orm.cumulative_investment_amount,
+            cumulative_investment_count=rollup_orm.cumulative_investment_count,
+            cumulative_patent_count=rollup_orm.cumulative_patent_count,
+            people_count=rollup_orm.people_count,
+            profit=rollup_orm.profit,
+            net_profit=rollup_orm.net_profit,
+            operating_profit=rollup_orm.operating_profit,
+            id=rollup_orm.id,
+        )
+
     def _create_snapshots_from(
         self, snapshot_orm: CompanyMetricsSnapshotOrm
     ) -> CompanyMetricsSnapshot:
@@ -234,3 +701,100 @@ class CompanyRepository(CompanyRepositoryPort):
             metrics=monthly_metrics,
             id=snapshot_orm.id,
         )
+
+    def _create_metric_orms_from(self, snapshot: CompanyMetricsSnapshot) -> List[Base]:
+        company_id = snapshot.company_id
+        reference_date = snapshot.reference_date
+        metrics = snapshot.metrics
+
+        orms: List[Base] = []
+        orms.extend(
+            CompanyMauOrm(
+                company_id=company_id,
+                reference_date=reference_date,
+                product_id=row.product_id,
+                product_name=row.product_name,
+                value=row.value,
+                date=row.date,
+                growth_rate=row.growthRate,
+            )
+            for row in metrics.mau
+        )
+        orms.extend(
+            CompanyPatentOrm(
+                company_id=company_id,
+                reference_date=reference_date,
+                level=row.level,
+                title=row.title,
+                date=row.date,
+            )
+            for row in metrics.patents
+        )
+        orms.extend(
+            CompanyFinanceOrm(
+                company_id=company_id,
+                reference_date=reference_date,
+                year=row.year,
+                profit=row.profit,
+                operating_profit=row.operatingProfit,
+                net_profit=row.netProfit,
+            )
+            for row in metrics.finance
+        )
+        orms.extend(
+            CompanyInvestmentOrm(
+                company_id=company_id,
+                reference_date=reference_date,
+                level=row.level,
+                date=row.date,
+                amount=row.amount,
+                investors=list(row.investors),
+            )
+            for row in metrics.investments
+        )
+        orms.extend(
+            CompanyHeadcountOrm(
+                company_id=company_id,
+                reference_date=reference_date,
+                name=row.name,
+                date=row.date,
+                people_count=row.people_count,
+                growth_rate=row.growth_rate,
+            )
+            for row in metrics.organizations
+        )
+        return orms
+
+    def _create_metric_from(self, family: MetricFamily, orm: Base):
+        match family:
+            case MetricFamily.MAU:
+                return MAU(
+                    product_id=orm.product_id,
+                    product_name=orm.product_name,
+                    value=orm.value,
+                    date=orm.date,
+                    growthRate=orm.growth_rate,
+                )
+            case MetricFamily.PATENTS:
+                return Patent(level=orm.level, title=orm.title, date=orm.date)
+            case MetricFamily.FINANCE:
+                return Finance(
+                    year=orm.year,
+                    profit=orm.profit,
+                    operatingProfit=orm.operating_profit,
+                    netProfit=orm.net_profit,
+                )
+            case MetricFamily.INVESTMENTS:
+                return Investment(
+                    level=orm.level,
+                    date=orm.date,
+                    amount=orm.amount,
+                    investors=orm.investors or [],
+                )
+            case MetricFamily.ORGANIZATIONS:
+                return Organization(
+                    name=orm.name,
+                    date=orm.date,
+                    people_count=orm.people_count,
+                    growth_rate=orm.growth_rate,
+                )
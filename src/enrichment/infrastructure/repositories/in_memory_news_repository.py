@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import glob
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from db.db import ReadSessionManager
+from enrichment.domain.entities.new_chunk import NewsChunk
+from enrichment.domain.repositories.news_repository_port import NewsRepositoryPort
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.orm.news_chunk import NewsChunk as NewsChunkORM
+
+__all__ = ["CompanyNewsIndex", "InMemoryNewsRepository"]
+
+DIMENSION = 1536
+
+_COMPANY_FILTER = NewsChunkORM.company_id == any_(
+    bindparam("company_ids", type_=ARRAY(PG_UUID(as_uuid=True)))
+)
+
+# 회사별 청크 메타데이터 (행 순서 = 회사, id 오름차순)
+METADATA_STATEMENT = (
+    select(
+        NewsChunkORM.id,
+        NewsChunkORM.company_id,
+        NewsChunkORM.title,
+        NewsChunkORM.contents,
+        NewsChunkORM.link,
+        NewsChunkORM.created_at,
+    )
+    .where(_COMPANY_FILTER)
+    .order_by(NewsChunkORM.company_id, NewsChunkORM.id)
+)
+
+# 회사별 청크 임베딩 (메타데이터와 같은 행 순서)
+VECTOR_STATEMENT = (
+    select(NewsChunkORM.id, NewsChunkORM.company_id, NewsChunkORM.vector)
+    .where(_COMPANY_FILTER)
+    .order_by(NewsChunkORM.company_id, NewsChunkORM.id)
+)
+
+COMPANY_IDS_STATEMENT = select(NewsChunkORM.company_id).distinct()
+
+# preload()가 한 번에 적재하는 회사 수
+PRELOAD_BATCH_SIZE = 64
+
+
+@dataclass
+class CompanyNewsIndex:
+    """한 회사의 뉴스 청크 검색 인덱스 (모든 배열의 행 순서 = 청크 id 오름차순)"""
+
+    ids: np.ndarray  # int64 (n,)
+    dates: np.ndarray  # datetime64[D] (n,)
+    titles: List[str]
+    contents: List[str]
+    links: List[str]
+    matrix: np.ndarray  # float32 (n, 1536), 행 단위 L2 정규화
+    nbytes: int = 0
+
+    def __post_init__(self):
+        if not self.nbytes:
+            # mmap 행렬도 접근하면 페이지 캐시에 올라오므로 동일하게 계산
+            self.nbytes = (
+                self.matrix.nbytes
+                + self.ids.nbytes
+                + self.dates.nbytes
+                + sum(len(text) for text in self.titles)
+                + sum(len(text) for text in self.contents)
+                + sum(len(text) for text in self.links)
+            )
+
+    @classmethod
+    def empty(cls) -> "CompanyNewsIndex":
+        return cls(
+            ids=np.empty(0, dtype=np.int64),
+            dates=np.empty(0, dtype="datetime64[D]"),
+            titles=[],
+            contents=[],
+            links=[],
+            matrix=np.empty((0, DIMENSION), dtype=np.float32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class InMemoryNewsRepository(NewsRepositoryPort):
+    """인메모리 뉴스 청크 리포지터리
+
+    회사별 임베딩 행렬/날짜 배열/메타데이터를 프로세스 메모리에 두고
+    회사마다 한 번의 행렬 곱으로 모든 검색 쿼리의 코사인 유사도를 계산합니다.
+    회사 데이터는 preload()로 시작 시 적재하거나 검색 시 회사 단위로 지연 적재하며,
+    memory_budget_mb를 넘으면 가장 오래 사용하지 않은 회사부터 제거(LRU)합니다.
+
+    mmap_dir을 지정하면 임베딩 행렬을 <company_id>-<청크 id 해시>.npy 파일로 저장하고 mmap으로 읽어
+    같은 호스트의 여러 워커 프로세스가 페이지 캐시를 공유합니다.
+
+    적재된 인덱스는 자동으로 갱신되지 않습니다. NewsWriter는 적재 후 invalidate()로 같은
+    프로세스의 인덱스를 버려 다음 검색에서 다시 읽게 하지만, 다른 워커 프로세스의 인덱스는
+    LRU로 제거되거나 프로세스가 재시작(runner의 최대 요청 수 교체 포함)될 때까지 이전 데이터로 검색합니다.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        memory_budget_mb: int = 512,
+        mmap_dir: Optional[str] = None,
+    ):
+        self.session_maker = session_maker
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.mmap_dir = mmap_dir or None
+        self._indexes: OrderedDict[UUID, CompanyNewsIndex] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = asyncio.Lock()
+        # 적재 중인 회사 -> 적재 태스크 (같은 회사를 동시에 여러 번 적재하지 않도록 공유)
+        self._loading: Dict[UUID, asyncio.Task] = {}
+
+        if self.mmap_dir:
+            os.makedirs(self.mmap_dir, exist_ok=True)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    def __contains__(self, company_id: UUID) -> bool:
+        return company_id in self._indexes
+
+    async def preload(self, company_ids: Optional[Sequence[UUID]] = None) -> None:
+        """
+        회사 인덱스를 미리 적재합니다. company_ids가 없으면 뉴스가 있는 모든 회사를
+        메모리 예산 한도까지 적재합니다.
+        """
+        if company_ids is None:
+            async with ReadSessionManager(self.session_maker) as session:
+                result = await session.execute(COMPANY_IDS_STATEMENT)
+                company_ids = [row.company_id for row in result.fetchall()]
+
+        company_ids = list(dict.fromkeys(company_ids))
+        for start in range(0, len(company_ids), PRELOAD_BATCH_SIZE):
+            batch = company_ids[start : start + PRELOAD_BATCH_SIZE]
+            # 검색 중인 회사가 없으므로 보호 없이 예산을 적용
+            await self._get_indexes(batch, protected=set())
+            # 예산에 도달하면 중단 (더 적재하면 방금 적재한 회사를 다시 제거하게 됨)
+            if self._memory_bytes >= self.memory_budget_bytes or not all(
+                company_id in self._indexes for company_id in batch
+            ):
+                return
+
+    async def invalidate(self, company_ids: Iterable[UUID]) -> None:
+        """회사 인덱스를 버려 다음 검색에서 새로 적재하게 합니다."""
+        async with self._lock:
+            for company_id in company_ids:
+                # 적재 중인 결과는 무효화 이전 데이터일 수 있으므로 저장하지 않음
+                self._loading.pop(company_id, None)
+                index = self._indexes.pop(company_id, None)
+                if index is not None:
+                    self._memory_bytes -= index.nbytes
+
+    async def search(
+        self,
+        context: NewsSearchContext,
+    ) -> Dict[UUID, List[NewsChunk]]:
+        """
+        회사별로 모든 검색 쿼리 중 가장 높은 유사도를 청크 점수로 하여
+        회사당 limit_per_query개의 뉴스 청크를 반환합니다.
+        """
+        if not context.queries:
+            return dict()
+
+        positions_by_company = self._positions_by_company(context.queries)
+        indexes = await self._get_indexes(positions_by_company)
+
+        chunks: Dict[UUID, List[NewsChunk]] = {}
+        for company_id, positions in positions_by_company.items():
+            index = indexes[company_id]
+            if not len(index):
+                continue
+            scores = self._scores(index, [context.queries[p] for p in positions])
+            top_k = self._top_k(company_id, index, scores.max(axis=1), context)
+            if top_k:
+                chunks[company_id] = top_k
+        return chunks
+
+    async def search_per_query(
+        self,
+        context: NewsSearchContext,
+    ) -> List[List[NewsChunk]]:
+        if not context.queries:
+            return []
+
+        positions_by_company = self._positions_by_company(context.queries)
+        indexes = await self._get_indexes(positions_by_company)
+
+        chunks: List[List[NewsChunk]] = [[] for _ in context.queries]
+        for company_id, positions in positions_by_company.items():
+            index = indexes[company_id]
+            if not len(index):
+                continue
+            scores = self._scores(index, [context.queries[p] for p in positions])
+            for column, position in enumerate(positions):
+                chunks[position] = self._top_k(
+                    company_id, index, scores[:, column], context
+                )
+        return chunks
+
+    def _positions_by_company(
+        self, queries: Sequence[SearchQuery]
+    ) -> Dict[UUID, List[int]]:
+        positions: Dict[UUID, List[int]] = {}
+        for position, query in enumerate(queries):
+            positions.setdefault(query.company_id, []).append(position)
+        return positions
+
+    def _scores(
+        self, index: CompanyNewsIndex, queries: Sequence[SearchQuery]
+    ) -> np.ndarray:
+        """(청크 수, 쿼리 수) 코사인 유사도 행렬, 재직 구간 밖의 청크는 -inf"""
+        query_matrix = np.asarray([q.query_vector for q in queries], dtype=np.float32)
+        norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+        query_matrix /= np.where(norms == 0, 1, norms)
+
+        scores = index.matrix @ query_matrix.T
+
+        starts = np.array([q.start_date for q in queries], dtype="datetime64[D]")
+        ends = np.array(
+            [q.end_date or date.max for q in queries], dtype="datetime64[D]"
+        )
+        dates = index.dates[:, None]
+        return np.where((dates >= starts) & (dates <= ends), scores, -np.inf)
+
+    def _top_k(
+        self,
+        company_id: UUID,
+        index: CompanyNewsIndex,
+        scores: np.ndarray,
+        context: NewsSearchContext,
+    ) -> List[NewsChunk]:
+        candidates = np.flatnonzero(scores >= context.similarity_threshold)
+        k = context.limit_per_query
+        if len(candidates) > k:
+            # 전체 정렬 없이 상위 k개만 골라낸 뒤 그 안에서만 정렬
+            candidates = candidates[np.argpartition(scores[candidates], -k)[-k:]]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [
+            NewsChunk(
+                id=int(index.ids[row]),
+                company_id=company_id,
+                title=index.titles[row],
+                contents=index.contents[row],
+                similarity=float(scores[row]),
+                link=index.links[row],
+                vector=index.matrix[row],
+            )
+            for row in ordered
+        ]
+
+    async def _get_indexes(
+        self, company_ids: Iterable[UUID], protected: Optional[set] = None
+    ) -> Dict[UUID, CompanyNewsIndex]:
+        """
+        회사 인덱스를 반환합니다. 없는 회사는 적재하고, 예산을 넘으면 protected(기본값은
+        요청한 회사들)를 제외한 가장 오래된 회사부터 제거합니다.
+
+        잠금은 캐시 조회/갱신에만 사용하고 적재(DB 조회, 파일 I/O)는 잠금 밖에서 실행하므로,
+        한 회사를 적재하는 동안에도 이미 적재된 회사의 검색은 기다리지 않습니다.
+        적재 중인 회사를 요청하면 새로 적재하지 않고 진행 중인 적재 태스크를 기다립니다.
+        """
+        company_ids = list(dict.fromkeys(company_ids))
+        indexes: Dict[UUID, CompanyNewsIndex] = {}
+        pending: Dict[UUID, asyncio.Task] = {}
+        async with self._lock:
+            missing = []
+            for company_id in company_ids:
+                if company_id in self._indexes:
+                    indexes[company_id] = self._indexes[company_id]
+                elif company_id in self._loading:
+                    pending[company_id] = self._loading[company_id]
+                else:
+                    missing.append(company_id)
+            if missing:
+                task = asyncio.ensure_future(self._load(missing))
+                task.add_done_callback(functools.partial(self._store_loaded, missing))
+                for company_id in missing:
+                    self._loading[company_id] = task
+                    pending[company_id] = task
+
+        for company_id, task in pending.items():
+            # 한 요청이 취소되어도 같은 적재를 기다리는 다른 요청에는 영향이 없도록 shield
+            indexes[company_id] = (await asyncio.shield(task))[company_id]
+
+        async with self._lock:
+            for company_id in company_ids:
+                if company_id in self._indexes:
+                    self._indexes.move_to_end(company_id)
+            self._evict(set(company_ids) if protected is None else protected)
+        return indexes
+
+    def _store_loaded(self, company_ids: List[UUID], task: asyncio.Task) -> None:
+        """적재 태스크 완료 콜백: 무효화되지 않은 회사의 인덱스를 캐시에 저장"""
+        current = [c for c in company_ids if self._loading.get(c) is task]
+        for company_id in current:
+            del self._loading[company_id]
+        if task.cancelled() or task.exception() is not None:
+            return
+        loaded = task.result()
+        for company_id in current:
+            previous = self._indexes.pop(company_id, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+            self._indexes[company_id] = loaded[company_id]
+            self._memory_bytes += loaded[company_id].nbytes
+
+    def _evict(self, protected: set) -> None:
+        """메모리 예산을 넘으면 현재 요청에 쓰이지 않는 가장 오래된 회사부터 제거"""
+        for company_id in list(self._indexes):
+            if self._memory_bytes <= self.memory_budget_bytes:
+                return
+            if company_id in protected:
+                continue
+            self._memory_bytes -= self._indexes.pop(company_id).nbytes
+
+    async def _load(self, company_ids: List[UUID]) -> Dict[UUID, CompanyNewsIndex]:
+        params = {"company_ids": company_ids}
+        if not self.mmap_dir:
+            async with ReadSessionManager(self.session_maker) as session:
+                # 메타데이터와 임베딩을 한 번에 조회
+                rows = (
+                    await session.execute(
+                        METADATA_STATEMENT.add_columns(NewsChunkORM.vector), params
+                    )
+                ).fetchall()
+            # 행렬 구성(정규화)은 CPU 작업이므로 이벤트 루프 밖에서 실행
+            return await asyncio.to_thread(self._build_indexes, company_ids, rows)
+
+        async with ReadSessionManager(self.session_maker) as session:
+            rows = (await session.execute(METADATA_STATEMENT, params)).fetchall()
+            grouped = self._group_rows(company_ids, rows)
+            # .npy 파일 읽기/쓰기는 블로킹 I/O이므로 이벤트 루프 밖에서 실행
+            matrices = await asyncio.to_thread(self._read_matrix_files, grouped)
+
+            stale = [c for c in company_ids if c not in matrices]
+            vector_rows: Dict[UUID, list] = {}
+            if stale:
+                vector_rows = self._group_rows(
+                    stale,
+                    (
+                        await session.execute(VECTOR_STATEMENT, {"company_ids": stale})
+                    ).fetchall(),
+                )
+
+        return await asyncio.to_thread(
+            self._build_mmap_indexes, grouped, matrices, vector_rows
+        )
+
+    def _build_indexes(
+        self, company_ids: List[UUID], rows: list
+    ) -> Dict[UUID, CompanyNewsIndex]:
+        grouped = self._group_rows(company_ids, rows)
+        return {
+            company_id: self._create_index_from(
+                company_rows, self._normalized([r.vector for r in company_rows])
+            )
+            for company_id, company_rows in grouped.items()
+        }
+
+    def _read_matrix_files(self, grouped: Dict[UUID, list]) -> Dict[UUID, np.ndarray]:
+        matrices: Dict[UUID, np.ndarray] = {}
+        for company_id, company_rows in grouped.items():
+            matrix = self._read_matrix_file(company_id, self._ids_of(company_rows))
+            if matrix is not None:
+                matrices[company_id] = matrix
+        return matrices
+
+    def _build_mmap_indexes(
+        self,
+        grouped: Dict[UUID, list],
+        matrices: Dict[UUID, np.ndarray],
+        vector_rows: Dict[UUID, list],
+    ) -> Dict[UUID, CompanyNewsIndex]:
+        """행렬 파일이 없거나 청크가 바뀐 회사의 행렬을 파일로 저장하고 인덱스를 구성"""
+        for company_id, company_vector_rows in vector_rows.items():
+            # 두 조회 사이에 추가/삭제된 청크가 있으면 양쪽에 모두 있는 청크만 사용
+            # (행렬의 i번째 행과 메타데이터의 i번째 행이 같은 청크여야 함)
+            metadata_ids = {r.id for r in grouped[company_id]}
+            company_vector_rows = [
+                r for r in company_vector_rows if r.id in metadata_ids
+            ]
+            vector_ids = {r.id for r in company_vector_rows}
+            grouped[company_id] = [r for r in grouped[company_id] if r.id in vector_ids]
+
+            ids = self._ids_of(company_vector_rows)
+            self._write_matrix_file(
+                company_id,
+                ids,
+                self._normalized([r.vector for r in company_vector_rows]),
+            )
+            matrices[company_id] = self._read_matrix_file(company_id, ids)
+
+        return {
+            company_id: self._create_index_from(company_rows, matrices[company_id])
+            for company_id, company_rows in grouped.items()
+        }
+
+    def _group_rows(self, company_ids: List[UUID], rows: Iterable) -> Dict[UUID, list]:
+        grouped: Dict[UUID, list] = {company_id: [] for company_id in company_ids}
+        for row in rows:
+            grouped[row.company_id].append(row)
+        return grouped
+
+    def _ids_of(self, rows: list) -> np.ndarray:
+        return np.fromiter((r.id for r in rows), dtype=np.int64, count=len(rows))
+
+    def _matrix_path(self, company_id: UUID, ids: np.ndarray) -> str:
+        # 파일명에 청크 id 목록의 해시를 넣어, 행렬과 행 순서가 항상 함께 교체되도록 함
+        digest = hashlib.blake2b(ids.tobytes(), digest_size=8).hexdigest()
+        return os.path.join(self.mmap_dir, f"{company_id}-{digest}.npy")
+
+    def _read_matrix_file(
+        self, company_id: UUID, ids: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """청크 id 목록에 해당하는 행렬 파일이 있으면 mmap으로 열고, 없으면 None"""
+        try:
+            matrix = np.load(self._matrix_path(company_id, ids), mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            return None
+        return matrix if matrix.shape == (len(ids), DIMENSION) else None
+
+    def _write_matrix_file(
+        self, company_id: UUID, ids: np.ndarray, matrix: np.ndarray
+    ) -> None:
+        path = self._matrix_path(company_id, ids)
+        # 다른 워커가 같은 파일을 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+        fd, tmp_path = tempfile.mkstemp(dir=self.mmap_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, matrix)
+        os.replace(tmp_path, path)
+
+        # 이전 버전 파일 정리 (이미 mmap으로 연 프로세스는 계속 읽을 수 있음)
+        for old_path in glob.glob(os.path.join(self.mmap_dir, f"{company_id}-*.npy")):
+            if old_path != path:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(old_path)
+
+    def _normalized(self, vectors: list) -> np.ndarray:
+        if not vectors:
+            return np.empty((0, DIMENSION), dtype=np.float32)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+        return matrix
+
+    def _create_index_from(self, rows: list, matrix: np.ndarray) -> CompanyNewsIndex:
+        if not rows:
+            return CompanyNewsIndex.empty()
+        return CompanyNewsIndex(
+            ids=self._ids_of(rows),
+            dates=np.array([r.created_at for r in rows], dtype="datetime64[D]"),
+            titles=[r.title for r in rows],
+            contents=[r.contents for r in rows],
+            links=[r.link for r in rows],
+            matrix=matrix,
+        )
@@ -0,0 +1,137 @@
+from typing import List, Set
+
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import (
+    Date,
+    String,
+    Text,
+    bindparam,
+    cast,
+    column,
+    func,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+
+from db.db import WriteSessionManager
+from enrichment.domain.entities.news_chunk_record import NewsChunkRecord
+from enrichment.domain.repositories.news_chunk_write_repository_port import (
+    NewsChunkWriteRepositoryPort,
+)
+from enrichment.infrastructure.orm.news_chunk import NewsChunk as NewsChunkORM
+
+STAGING_TABLE = "news_chunks_staging"
+staging = table(
+    STAGING_TABLE,
+    column("company_id", PG_UUID(as_uuid=True)),
+    column("title", String),
+    column("contents", Text),
+    column("vector", Vector(1536)),
+    column("link", String),
+    column("created_at", Date),
+    column("content_hash", String),
+)
+
+EXISTING_HASHES_STATEMENT = select(NewsChunkORM.content_hash).where(
+    NewsChunkORM.content_hash
+    == func.any(bindparam("content_hashes", type_=ARRAY(String)))
+)
+
+# 트랜잭션이 끝나면 사라지는 적재용 임시 테이블 (COPY는 ON CONFLICT를 지원하지 않음)
+CREATE_STAGING_STATEMENT = text(f"""
+    CREATE TEMP TABLE {STAGING_TABLE} (
+        company_id uuid NOT NULL,
+        title varchar(500) NOT NULL,
+        contents text NOT NULL,
+        vector vector(1536) NOT NULL,
+        link varchar(500) NOT NULL,
+        created_at date NOT NULL,
+        content_hash varchar(64) NOT NULL
+    ) ON COMMIT DROP
+    """)
+
+# halfvec 사본은 DB에서 계산하고, 이미 있는 (content_hash, created_at)은 건너뜀
+INSERT_FROM_STAGING_STATEMENT = (
+    insert(NewsChunkORM)
+    .from_select(
+        [
+            "company_id",
+            "title",
+            "contents",
+            "vector",
+            "vector_half",
+            "vector_half_512",
+            "link",
+            "created_at",
+            "content_hash",
+        ],
+        select(
+            staging.c.company_id,
+            staging.c.title,
+            staging.c.contents,
+            staging.c.vector,
+            cast(staging.c.vector, HALFVEC(1536)),
+            cast(func.subvector(staging.c.vector, 1, 512), HALFVEC(512)),
+            staging.c.link,
+            staging.c.created_at,
+            staging.c.content_hash,
+        ),
+    )
+    .on_conflict_do_nothing(index_elements=["content_hash", "created_at"])
+)
+
+
+class NewsChunkWriteRepository(NewsChunkWriteRepositoryPort):
+    """뉴스 청크 적재 리포지터리
+
+    asyncpg copy_records_to_table(바이너리 COPY)로 임시 테이블에 적재한 뒤
+    한 번의 INSERT ... SELECT ... ON CONFLICT DO NOTHING으로 news_chunks에 반영합니다.
+    """
+
+    def __init__(self, session_manager: WriteSessionManager):
+        self.session_manager = session_manager
+
+    async def find_existing_hashes(self, content_hashes: List[str]) -> Set[str]:
+        if not content_hashes:
+            return set()
+
+        async with self.session_manager as session:
+            result = await session.execute(
+                EXISTING_HASHES_STATEMENT, {"content_hashes": content_hashes}
+            )
+            return set(result.scalars().all())
+
+    async def bulk_insert(self, records: List[NewsChunkRecord]) -> int:
+        if not records:
+            return 0
+
+        async with self.session_manager as session:
+            await session.execute(CREATE_STAGING_STATEMENT)
+
+            # 세션 트랜잭션과 같은 asyncpg 연결에서 COPY 실행
+            # (바이너리 COPY에 필요한 vector 코덱은 engine_with_pgvector가 연결마다 등록)
+            connection = await session.connection()
+            raw = (await connection.get_raw_connection()).driver_connection
+            await raw.copy_records_to_table(
+                STAGING_TABLE,
+                records=[
+                    (
+                        record.company_id,
+                        record.title,
+                        record.contents,
+                        record.vector,
+                        record.link,
+                        record.created_at,
+                        record.content_hash,
+                    )
+                    for record in records
+                ],
+                columns=[c.name for c in staging.columns],
+            )
+
+            result = await session.execute(INSERT_FROM_STAGING_STATEMENT)
+            return result.rowcount
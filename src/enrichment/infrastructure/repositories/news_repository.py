@@ -1,28 +1,543 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import re
+from datetime import date
+from enum import StrEnum
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from pgvector import HalfVector, Vector
+from pgvector.sqlalchemy import BIT, HALFVEC
 from pgvector.sqlalchemy import Vector as PG_Vector
-from sqlalchemy import and_, case, cast, column, func, literal, select
-from sqlalchemy import values as sa_values
+from sqlalchemy import (
+    Date,
+    Float,
+    Integer,
+    String,
+    Text,
+    and_,
+    bindparam,
+    case,
+    column,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from db.db import ReadSessionManager
 from enrichment.domain.entities.new_chunk import NewsChunk
 from enrichment.domain.repositories.news_repository_port import NewsRepositoryPort
-from enrichment.domain.specs.news_serch_spec import NewsSearchContext
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
 from enrichment.infrastructure.orm.news_chunk import NewsChunk as NewsChunkORM
 
 
+class NewsVectorStorage(StrEnum):
+    """뉴스 청크 임베딩 저장(검색 대상) 컬럼"""
+
+    VECTOR = "vector"  # float32 1536차원 (기본)
+    HALFVEC = "halfvec"  # float16 1536차원, 인덱스 크기 약 1/2
+    # float16 512차원, 인덱스 크기 약 1/6
+    # text-embedding-3 임베딩은 앞쪽 차원만 잘라 써도 되도록 학습되어 있음
+    HALFVEC_512 = "halfvec_512"
+
+
+class _BinaryVector(PG_Vector):
+    """
+    쿼리 벡터 바인드 타입
+
+    pgvector 기본 타입은 값을 '[0.1,0.2,...]' 텍스트로 직렬화하므로, ndarray/list를
+    pgvector.Vector로만 감싸 asyncpg 바이너리 코덱(register_vector)에 그대로 넘깁니다.
+    ndarray를 그대로 배열 원소로 넘기면 asyncpg가 하위 배열로 해석하므로 감싸야 합니다.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None or isinstance(value, Vector):
+                return value
+            return Vector(value)
+
+        return process
+
+
+class _BinaryHalfVector(HALFVEC):
+    """halfvec 쿼리 벡터 바인드 타입 (_BinaryVector 참고)"""
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None or isinstance(value, HalfVector):
+                return value
+            return HalfVector(value)
+
+        return process
+
+
+# 저장 방식별 (검색 대상 컬럼, 쿼리 벡터 타입)
+_VECTOR_COLUMNS = {
+    NewsVectorStorage.VECTOR: (NewsChunkORM.vector, _BinaryVector(1536)),
+    NewsVectorStorage.HALFVEC: (NewsChunkORM.vector_half, _BinaryHalfVector(1536)),
+    NewsVectorStorage.HALFVEC_512: (
+        NewsChunkORM.vector_half_512,
+        _BinaryHalfVector(512),
+    ),
+}
+
+# 저장 방식별 검색 대상 HNSW 인덱스 (파티션 테이블의 상위 인덱스 이름)
+HNSW_INDEXES = {
+    NewsVectorStorage.VECTOR: "idx_chunk_hnsw",
+    NewsVectorStorage.HALFVEC: "idx_chunk_half_hnsw",
+    NewsVectorStorage.HALFVEC_512: "idx_chunk_half_512_hnsw",
+}
+
+
+def _search_queries_table(
+    storage: NewsVectorStorage = NewsVectorStorage.VECTOR,
+    with_ordinality: bool = False,
+    with_terms: bool = False,
+):
+    """
+    검색 쿼리 목록을 unnest($1::uuid[], $2::vector[], $3::date[], $4::date[])
+    병렬 배열 테이블로 펼칩니다. 쿼리 개수와 무관하게 SQL 문이 고정되므로
+    asyncpg의 prepared statement 캐시가 재사용됩니다.
+
+    쿼리 벡터는 저장 방식의 컬럼 타입(vector/halfvec, 차원)으로 전달됩니다.
+    with_ordinality가 True이면 쿼리 순번(1부터 시작)을 idx 컬럼으로 함께 반환합니다.
+    with_terms가 True이면 쿼리별 tsquery 문자열($5::text[])을 terms 컬럼으로 함께 반환합니다.
+    """
+    _, vector_type = _VECTOR_COLUMNS[storage]
+    arrays = [
+        bindparam("company_ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+        bindparam("query_vectors", type_=ARRAY(vector_type)),
+        bindparam("start_dates", type_=ARRAY(Date)),
+        bindparam("end_dates", type_=ARRAY(Date)),
+    ]
+    columns = [
+        column("company_id", PG_UUID(as_uuid=True)),  # 회사 UUID
+        column("qvec", vector_type),  # 임베딩 벡터 (OpenAI text-embedding-3-small 모델)
+        column("start_date", Date),  # 검색 시작 날짜
+        column("end_date", Date),  # 검색 종료 날짜 (optional)
+    ]
+    if with_terms:
+        arrays.append(bindparam("query_terms", type_=ARRAY(Text)))
+        columns.append(column("terms", Text))  # 전문 검색어 (to_tsquery 입력)
+    return (
+        func.unnest(*arrays)
+        .table_valued(
+            *columns,
+            with_ordinality="idx" if with_ordinality else None,
+        )
+        .render_derived("q")
+    )
+
+
+def _date_predicate(q):
+    # 날짜 필터링 조건 생성
+    # 1. 회사 ID가 일치해야 함
+    # 2. 뉴스 생성일이 재직 시작 날짜 이후여야 함
+    # 3. 퇴사 날짜가 있는 경우, 뉴스 생성일이 퇴사 날짜 이전이어야 함
+    # 4. 뉴스 생성일이 전체 쿼리의 재직 구간을 덮는 [window_start, window_end] 안이어야 함
+    #    - unnest 컬럼과의 비교는 플래너가 파티션 제외에 쓸 수 없으므로, 파라미터와 직접
+    #      비교하는 조건을 추가하여 구간과 겹치는 created_at 파티션만 스캔하도록 함
+    return and_(
+        NewsChunkORM.created_at >= bindparam("window_start", type_=Date),
+        NewsChunkORM.created_at <= bindparam("window_end", type_=Date),
+        NewsChunkORM.company_id == q.c.company_id,
+        NewsChunkORM.created_at >= q.c.start_date,
+        case(
+            (q.c.end_date.isnot(None), NewsChunkORM.created_at <= q.c.end_date),
+            else_=literal(True),  # 종료 날짜가 없으면 조건 무시
+        ),
+    )
+
+
+def _build_search_statement(
+    storage: NewsVectorStorage = NewsVectorStorage.VECTOR,
+    per_query: bool = False,
+    with_vector: bool = False,
+):
+    """
+    정확(exact) 배치 벡터 검색 쿼리를 생성합니다.
+
+    조건에 맞는 모든 청크의 거리를 계산하여 ROW_NUMBER로 순위를 매깁니다.
+    per_query가 False이면 회사별로, True이면 검색 쿼리별로 순위를 매깁니다.
+    with_vector가 True이면 MMR 재정렬용 임베딩을 vector 컬럼으로 함께 반환합니다.
+    """
+    q = _search_queries_table(storage, with_ordinality=per_query)
+    vector_column, _ = _VECTOR_COLUMNS[storage]
+
+    # 코사인 거리 계산 및 유사도 점수 변환
+    # pgvector의 cosine_distance는 0~2 범위의 값을 반환 (0: 동일, 2: 완전 반대)
+    # 1 - cosine_distance로 변환하여 0~1 범위의 유사도 점수로 만듦 (1: 동일, 0: 완전 반대)
+    dist = vector_column.cosine_distance(q.c.qvec)
+    sim = (literal(1.0) - dist).label("similarity_score")
+
+    # 회사(또는 쿼리)별로 유사도 순위를 매기는 서브쿼리
+    # ROW_NUMBER() 윈도우 함수를 사용하여 유사도가 높은 순서대로 순위를 매김
+    partition_key = q.c.idx if per_query else NewsChunkORM.company_id
+    ranked = (
+        select(
+            *([q.c.idx] if per_query else []),
+            NewsChunkORM.id,
+            NewsChunkORM.company_id,
+            NewsChunkORM.title,
+            NewsChunkORM.contents,
+            NewsChunkORM.link,
+            *([vector_column.label("vector")] if with_vector else []),
+            sim,  # 유사도 점수
+            func.row_number()
+            .over(
+                partition_by=partition_key,
+                order_by=dist.asc(),  # 거리가 가까운 순서대로 (유사도가 높은 순서)
+            )
+            .label("rn"),  # 순위 번호
+        )
+        .select_from(
+            q.join(NewsChunkORM, _date_predicate(q))
+        )  # 검색 쿼리 테이블과 뉴스 테이블을 날짜 조건으로 조인
+        .where(
+            sim >= bindparam("similarity_threshold", type_=Float)
+        )  # 최소 유사도 임계값 이상만 선택
+        .subquery("ranked")
+    )
+
+    # 최종 결과 쿼리: 제한된 개수만큼 선택하고 유사도 내림차순으로 정렬
+    return (
+        select(
+            *([ranked.c.idx] if per_query else []),
+            ranked.c.id,
+            ranked.c.company_id,
+            ranked.c.title,
+            ranked.c.contents,
+            ranked.c.link,
+            *([ranked.c.vector] if with_vector else []),
+            ranked.c.similarity_score,
+        )
+        .where(
+            ranked.c.rn <= bindparam("limit_per_query", type_=Integer)
+        )  # 회사(쿼리)당 최대 개수 제한
+        .order_by(
+            *([ranked.c.idx] if per_query else []),
+            ranked.c.similarity_score.desc(),  # 유사도 높은 순서대로 정렬
+        )
+    )
+
+
+def _build_hnsw_search_statement(
+    storage: NewsVectorStorage = NewsVectorStorage.VECTOR,
+    with_vector: bool = False,
+):
+    """
+    HNSW 인덱스를 사용하는 쿼리별 top-k 벡터 검색 쿼리를 생성합니다.
+
+    검색 쿼리마다 LATERAL (... ORDER BY vector <=> q LIMIT k) 서브쿼리를 실행하므로
+    저장 방식별 HNSW 인덱스 스캔이 가능하며, 회사/날짜 필터는 pgvector의
+    iterative index scan(hnsw.iterative_scan)으로 k개가 채워질 때까지 탐색합니다.
+    with_vector는 _build_search_statement와 같습니다.
+    """
+    q = _search_queries_table(storage, with_ordinality=True)
+    vector_column, _ = _VECTOR_COLUMNS[storage]
+
+    dist = vector_column.cosine_distance(q.c.qvec)
+    top_k = (
+        select(
+            NewsChunkORM.id,
+            NewsChunkORM.company_id,
+            NewsChunkORM.title,
+            NewsChunkORM.contents,
+            NewsChunkORM.link,
+            *([vector_column.label("vector")] if with_vector else []),
+            (literal(1.0) - dist).label("similarity_score"),
+        )
+        .where(_date_predicate(q))
+        .order_by(dist)  # 인덱스 순서 그대로 읽도록 거리 자체로 정렬
+        .limit(bindparam("limit_per_query", type_=Integer))
+        .lateral("top_k")
+    )
+
+    return (
+        select(
+            q.c.idx,
+            top_k.c.id,
+            top_k.c.company_id,
+            top_k.c.title,
+            top_k.c.contents,
+            top_k.c.link,
+            *([top_k.c.vector] if with_vector else []),
+            top_k.c.similarity_score,
+        )
+        .select_from(q.join(top_k, true()))
+        .where(
+            top_k.c.similarity_score >= bindparam("similarity_threshold", type_=Float)
+        )
+        # relaxed_order 스캔은 순서가 약간 어긋날 수 있으므로 바깥에서 다시 정렬
+        .order_by(q.c.idx, top_k.c.similarity_score.desc())
+    )
+
+
+def _build_binary_search_statement(with_vector: bool = False):
+    """
+    이진 양자화 프리필터 + 원본 벡터 재정렬 2단계 검색 쿼리를 생성합니다.
+
+    1단계: 검색 쿼리마다 vector_bit의 해밍 거리 HNSW 인덱스(idx_chunk_bit_hnsw)로
+           candidate_limit(= limit_per_query * 배수)개의 후보를 가져옵니다.
+    2단계: 후보의 float32 vector와 쿼리 벡터의 정확한 코사인 거리로 재정렬하여
+           limit_per_query개를 선택합니다.
+    재정렬에는 항상 vector를 읽지만, 결과 행에는 with_vector일 때만 포함합니다.
+    """
+    q = _search_queries_table(with_ordinality=True)
+
+    qbit = func.binary_quantize(q.c.qvec, type_=BIT(1536))
+    candidates = (
+        select(
+            NewsChunkORM.id,
+            NewsChunkORM.company_id,
+            NewsChunkORM.title,
+            NewsChunkORM.contents,
+            NewsChunkORM.link,
+            NewsChunkORM.vector,
+        )
+        .where(_date_predicate(q))
+        .order_by(NewsChunkORM.vector_bit.hamming_distance(qbit))
+        .limit(bindparam("candidate_limit", type_=Integer))
+        .correlate(q)
+        .subquery("candidates")
+    )
+
+    dist = candidates.c.vector.cosine_distance(q.c.qvec)
+    top_k = (
+        select(
+            candidates.c.id,
+            candidates.c.company_id,
+            candidates.c.title,
+            candidates.c.contents,
+            candidates.c.link,
+            *([candidates.c.vector] if with_vector else []),
+            (literal(1.0) - dist).label("similarity_score"),
+        )
+        .order_by(dist)
+        .limit(bindparam("limit_per_query", type_=Integer))
+        .lateral("top_k")
+    )
+
+    return (
+        select(
+            q.c.idx,
+            top_k.c.id,
+            top_k.c.company_id,
+            top_k.c.title,
+            top_k.c.contents,
+            top_k.c.link,
+            *([top_k.c.vector] if with_vector else []),
+            top_k.c.similarity_score,
+        )
+        .select_from(q.join(top_k, true()))
+        .where(
+            top_k.c.similarity_score >= bindparam("similarity_threshold", type_=Float)
+        )
+        .order_by(q.c.idx, top_k.c.similarity_score.desc())
+    )
+
+
+def _build_hybrid_search_statement(
+    storage: NewsVectorStorage = NewsVectorStorage.VECTOR,
+    with_vector: bool = False,
+):
+    """
+    벡터 검색과 전문(tsvector) 검색을 한 문장에서 실행하고 RRF로 합치는 쿼리를 생성합니다.
+
+    검색 쿼리마다 LATERAL 서브쿼리 안에서
+    1. vector_hits: 유사도 임계값 이상인 청크를 거리 순으로 candidate_limit개
+    2. lexical_hits: search_tsv @@ to_tsquery(terms)인 청크를 ts_rank_cd 순으로 candidate_limit개
+    를 구해 FULL OUTER JOIN하고, 각 순위 r에 대해 1 / (rrf_k + r)을 더한 점수 순으로
+    limit_per_query개를 선택합니다. 어휘 매칭 결과는 유사도 임계값과 무관하게 후보가 되며,
+    반환하는 similarity_score는 두 경우 모두 코사인 유사도입니다.
+    with_vector는 _build_search_statement와 같습니다.
+    """
+    q = _search_queries_table(storage, with_ordinality=True, with_terms=True)
+    vector_column, _ = _VECTOR_COLUMNS[storage]
+    candidate_limit = bindparam("candidate_limit", type_=Integer)
+
+    dist = vector_column.cosine_distance(q.c.qvec)
+    vector_hits = (
+        select(
+            NewsChunkORM.id,
+            NewsChunkORM.created_at,
+            func.row_number().over(order_by=dist).label("rank"),
+        )
+        .where(
+            _date_predicate(q),
+            literal(1.0) - dist >= bindparam("similarity_threshold", type_=Float),
+        )
+        .order_by(dist)
+        .limit(candidate_limit)
+        .correlate(q)
+        .subquery("vector_hits")
+    )
+
+    # 'simple' 설정은 형태소 분석 없이 소문자화만 하므로 생성 컬럼과 같은 설정을 사용
+    tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), q.c.terms)
+    lexical_rank = func.ts_rank_cd(NewsChunkORM.search_tsv, tsquery)
+    lexical_hits = (
+        select(
+            NewsChunkORM.id,
+            NewsChunkORM.created_at,
+            func.row_number().over(order_by=lexical_rank.desc()).label("rank"),
+        )
+        .where(_date_predicate(q), NewsChunkORM.search_tsv.op("@@")(tsquery))
+        .order_by(lexical_rank.desc())
+        .limit(candidate_limit)
+        .correlate(q)
+        .subquery("lexical_hits")
+    )
+
+    rrf_k = bindparam("rrf_k", type_=Integer)
+    fusion_score = func.coalesce(
+        literal(1.0) / (rrf_k + vector_hits.c.rank), literal(0.0)
+    ) + func.coalesce(literal(1.0) / (rrf_k + lexical_hits.c.rank), literal(0.0))
+    hits = vector_hits.join(
+        lexical_hits, vector_hits.c.id == lexical_hits.c.id, full=True
+    )
+    fused = (
+        select(
+            NewsChunkORM.id,
+            NewsChunkORM.company_id,
+            NewsChunkORM.title,
+            NewsChunkORM.contents,
+            NewsChunkORM.link,
+            *([vector_column.label("vector")] if with_vector else []),
+            (literal(1.0) - dist).label("similarity_score"),
+            fusion_score.label("fusion_score"),
+        )
+        .select_from(
+            hits.join(
+                NewsChunkORM,
+                and_(
+                    NewsChunkORM.id
+                    == func.coalesce(vector_hits.c.id, lexical_hits.c.id),
+                    NewsChunkORM.created_at
+                    == func.coalesce(
+                        vector_hits.c.created_at, lexical_hits.c.created_at
+                    ),
+                    # 파티션 제외를 위해 파라미터 구간 조건을 함께 둠
+                    NewsChunkORM.created_at >= bindparam("window_start", type_=Date),
+                    NewsChunkORM.created_at <= bindparam("window_end", type_=Date),
+                ),
+            )
+        )
+        .order_by(fusion_score.desc())
+        .limit(bindparam("limit_per_query", type_=Integer))
+        .lateral("fused")
+    )
+
+    return (
+        select(
+            q.c.idx,
+            fused.c.id,
+            fused.c.company_id,
+            fused.c.title,
+            fused.c.contents,
+            fused.c.link,
+            *([fused.c.vector] if with_vector else []),
+            fused.c.similarity_score,
+        )
+        .select_from(q.join(fused, true()))
+        .order_by(q.c.idx, fused.c.fusion_score.desc())
+    )
+
+
+# 쿼리 구조가 고정되어 있으므로 모듈 로드 시 한 번만 생성하여 재사용
+SEARCH_STATEMENTS = {
+    storage: _build_search_statement(storage) for storage in NewsVectorStorage
+}
+EXACT_PER_QUERY_SEARCH_STATEMENTS = {
+    storage: _build_search_statement(storage, per_query=True)
+    for storage in NewsVectorStorage
+}
+HNSW_SEARCH_STATEMENTS = {
+    storage: _build_hnsw_search_statement(storage) for storage in NewsVectorStorage
+}
+SEARCH_STATEMENT = SEARCH_STATEMENTS[NewsVectorStorage.VECTOR]
+EXACT_PER_QUERY_SEARCH_STATEMENT = EXACT_PER_QUERY_SEARCH_STATEMENTS[
+    NewsVectorStorage.VECTOR
+]
+HNSW_SEARCH_STATEMENT = HNSW_SEARCH_STATEMENTS[NewsVectorStorage.VECTOR]
+BINARY_SEARCH_STATEMENT = _build_binary_search_statement()
+HYBRID_SEARCH_STATEMENTS = {
+    storage: _build_hybrid_search_statement(storage) for storage in NewsVectorStorage
+}
+HYBRID_SEARCH_STATEMENT = HYBRID_SEARCH_STATEMENTS[NewsVectorStorage.VECTOR]
+
+# MMR 재정렬(diversify) 검색용: 결과 행에 임베딩(vector 1536차원이면 행당 약 6KB)을
+# 함께 반환하므로 재정렬하지 않는 검색은 위의 문을 사용
+SEARCH_WITH_VECTOR_STATEMENTS = {
+    storage: _build_search_statement(storage, with_vector=True)
+    for storage in NewsVectorStorage
+}
+EXACT_PER_QUERY_SEARCH_WITH_VECTOR_STATEMENTS = {
+    storage: _build_search_statement(storage, per_query=True, with_vector=True)
+    for storage in NewsVectorStorage
+}
+HNSW_SEARCH_WITH_VECTOR_STATEMENTS = {
+    storage: _build_hnsw_search_statement(storage, with_vector=True)
+    for storage in NewsVectorStorage
+}
+BINARY_SEARCH_WITH_VECTOR_STATEMENT = _build_binary_search_statement(with_vector=True)
+HYBRID_SEARCH_WITH_VECTOR_STATEMENTS = {
+    storage: _build_hybrid_search_statement(storage, with_vector=True)
+    for storage in NewsVectorStorage
+}
+
+# 하이브리드 검색어 토큰: 한글/영문/숫자 어절 (tsquery 연산자 문자는 포함되지 않음)
+_QUERY_TERM_PATTERN = re.compile(r"\w+")
+# 쿼리당 OR로 묶는 최대 검색어 수
+_MAX_QUERY_TERMS = 32
+
+# 트랜잭션 범위(is_local=true)로 HNSW 검색 파라미터 설정
+HNSW_SETTINGS_STATEMENT = select(
+    func.set_config("hnsw.ef_search", bindparam("ef_search", type_=String), true()),
+    func.set_config(
+        "hnsw.iterative_scan", bindparam("iterative_scan", type_=String), true()
+    ),
+)
+
+
+class NewsSearchEngine(StrEnum):
+    """뉴스 벡터 검색 방식"""
+
+    EXACT = "exact"  # 조건에 맞는 모든 청크의 거리 계산 (정확, 인덱스 미사용)
+    HNSW = "hnsw"  # 쿼리별 LATERAL top-k + HNSW iterative index scan (근사)
+
+
 class NewsRepository(NewsRepositoryPort):
     """뉴스 청크 리포지터리
 
     벡터 유사도 검색을 통해 회사별 뉴스 청크를 조회하는 리포지터리입니다.
     """
 
-    def __init__(self, session_manager: ReadSessionManager):
+    def __init__(
+        self,
+        session_manager: ReadSessionManager,
+        engine: NewsSearchEngine | str = NewsSearchEngine.EXACT,
+        ef_search: int = 100,
+        iterative_scan: str = "relaxed_order",
+        vector_storage: NewsVectorStorage | str = NewsVectorStorage.VECTOR,
+        hybrid_oversample: int = 4,
+        rrf_k: int = 60,
+    ):
         self.session_manager = session_manager
+        self.engine = NewsSearchEngine(engine)
+        self.ef_search = ef_search
+        self.iterative_scan = iterative_scan
+        self.vector_storage = NewsVectorStorage(vector_storage)
+        self.hybrid_oversample = hybrid_oversample
+        self.rrf_k = rrf_k
 
     async def search(
         self,
@@ -40,95 +555,236 @@ class NewsRepository(NewsRepositoryPort):
         if not context.queries:
             return dict()
 
-        rows = [query.to_tuple() for query in context.queries]
-
-        # VALUES 절을 사용하여 여러 검색 쿼리를 하나의 테이블로 생성
-        # 이를 통해 배치 검색이 가능하며, 여러 회사의 뉴스를 한 번의 쿼리로 검색할 수 있습니다.
-        v = (
-            sa_values(
-                column("company_id", PG_UUID(as_uuid=True)),  # 회사 UUID
-                column(
-                    "qvec", PG_Vector(1536)
-                ),  # 1536차원 임베딩 벡터 (OpenAI text-embedding-3-small 모델)
-                column("start_date"),  # 검색 시작 날짜
-                column("end_date"),  # 검색 종료 날짜 (optional)
-            )
-            .data(rows)
-            .alias("q")
-        )
-
-        # 날짜 필터링 조건 생성
-        # 1. 회사 ID가 일치해야 함
-        # 2. 뉴스 생성일이 재직 시작 날짜 이후여야 함
-        # 3. 퇴사 날짜가 있는 경우, 뉴스 생성일이 퇴사 날짜 이전이어야 함
-        date_pred = and_(
-            NewsChunkORM.company_id == v.c.company_id,
-            NewsChunkORM.created_at >= v.c.start_date,
-            case(
-                (v.c.end_date.isnot(None), NewsChunkORM.created_at <= v.c.end_date),
-                else_=literal(True),  # 종료 날짜가 없으면 조건 무시
-            ),
-        )
-
-        # 코사인 거리 계산 및 유사도 점수 변환
-        # pgvector의 cosine_distance는 0~2 범위의 값을 반환 (0: 동일, 2: 완전 반대)
-        # 1 - cosine_distance로 변환하여 0~1 범위의 유사도 점수로 만듦 (1: 동일, 0: 완전 반대)
-        dist = NewsChunkORM.vector.cosine_distance(cast(v.c.qvec, PG_Vector(1536)))
-        sim = (literal(1.0) - dist).label("similarity_score")
-
-        # 회사별로 유사도 순위를 매기는 서브쿼리
-        # ROW_NUMBER() 윈도우 함수를 사용하여 각 회사별로 유사도가 높은 순서대로 순위를 매김
-        ranked = (
-            select(
-                NewsChunkORM.id,
-                NewsChunkORM.company_id,
-                NewsChunkORM.title,
-                NewsChunkORM.contents,
-                sim,  # 유사도 점수
-                func.row_number()
-                .over(
-                    partition_by=NewsChunkORM.company_id,  # 회사별로 파티션 분할
-                    order_by=dist.asc(),  # 거리가 가까운 순서대로 (유사도가 높은 순서)
-                )
-                .label("rn"),  # 순위 번호
+        if context.hybrid:
+            # 유사도가 아닌 RRF 순위로 정렬된 결과이므로 쿼리 내 순위를 기준으로 합침
+            return self._group_by_company(
+                await self.search_per_query(context), by_rank=True
             )
-            .select_from(
-                v.join(NewsChunkORM, date_pred)
-            )  # VALUES 테이블과 뉴스 테이블을 날짜 조건으로 조인
-            .where(
-                sim >= context.similarity_threshold
-            )  # 최소 유사도 임계값 이상만 선택
-            .subquery("ranked")
-        )
-
-        # 최종 결과 쿼리: 회사별로 제한된 개수만큼 선택하고 유사도 내림차순으로 정렬
-        final_stmt = (
-            select(
-                ranked.c.id,
-                ranked.c.company_id,
-                ranked.c.title,
-                ranked.c.contents,
-                ranked.c.similarity_score,
-            )
-            .where(ranked.c.rn <= context.limit_per_query)  # 회사당 최대 개수 제한
-            .order_by(ranked.c.similarity_score.desc())  # 유사도 높은 순서대로 정렬
-        )
+        if self.engine == NewsSearchEngine.HNSW or context.binary_prefilter:
+            return self._group_by_company(await self.search_per_query(context))
 
+        statements = (
+            SEARCH_WITH_VECTOR_STATEMENTS if context.with_vectors else SEARCH_STATEMENTS
+        )
         # 비동기 세션을 사용하여 쿼리 실행
         async with self.session_manager as session:
-            result = await session.execute(final_stmt)
+            result = await session.execute(
+                statements[self.vector_storage],
+                self._statement_params(context),
+            )
             rows = result.fetchall()
 
         # 결과를 회사별로 그룹화하여 반환
         chunks: Dict[UUID, List[NewsChunk]] = {}
         for r in rows:
             chunks.setdefault(r.company_id, []).append(
-                NewsChunk(
-                    id=r.id,
-                    company_id=r.company_id,
-                    title=r.title,
-                    contents=r.contents,
-                    similarity=r.similarity_score,
-                )
+                self._create_chunk_from(r, context.with_vectors)
             )
         return chunks
+
+    async def search_per_query(
+        self,
+        context: NewsSearchContext,
+    ) -> List[List[NewsChunk]]:
+        """
+        검색 쿼리별 top-k 뉴스 청크를 검색합니다.
+
+        같은 회사에 대한 쿼리가 여러 개여도 쿼리마다 독립적으로 limit_per_query개를 반환합니다.
+
+        Returns:
+            List[List[NewsChunk]]: context.queries와 같은 순서의 쿼리별 청크 목록
+        """
+        if not context.queries:
+            return []
+
+        async with self.session_manager as session:
+            if context.hybrid:
+                params = self._statement_params(context)
+                params["query_terms"] = [
+                    self._query_terms(query.query_text) for query in context.queries
+                ]
+                params["candidate_limit"] = (
+                    context.limit_per_query * self.hybrid_oversample
+                )
+                params["rrf_k"] = self.rrf_k
+                if self.engine == NewsSearchEngine.HNSW:
+                    await self._apply_hnsw_settings(
+                        session, max(self.ef_search, params["candidate_limit"])
+                    )
+                statements = (
+                    HYBRID_SEARCH_WITH_VECTOR_STATEMENTS
+                    if context.with_vectors
+                    else HYBRID_SEARCH_STATEMENTS
+                )
+                statement = statements[self.vector_storage]
+            elif context.binary_prefilter:
+                # 재정렬은 float32 원본 벡터로 하므로 저장 방식과 무관하게 전체 차원 사용
+                params = self._statement_params(context, NewsVectorStorage.VECTOR)
+                params["candidate_limit"] = (
+                    context.limit_per_query * context.binary_oversample
+                )
+                # 후보 수보다 ef_search가 작으면 HNSW가 후보를 다 채우지 못함
+                await self._apply_hnsw_settings(
+                    session, max(self.ef_search, params["candidate_limit"])
+                )
+                statement = (
+                    BINARY_SEARCH_WITH_VECTOR_STATEMENT
+                    if context.with_vectors
+                    else BINARY_SEARCH_STATEMENT
+                )
+            elif self.engine == NewsSearchEngine.HNSW:
+                params = self._statement_params(context)
+                await self._apply_hnsw_settings(session, self.ef_search)
+                statements = (
+                    HNSW_SEARCH_WITH_VECTOR_STATEMENTS
+                    if context.with_vectors
+                    else HNSW_SEARCH_STATEMENTS
+                )
+                statement = statements[self.vector_storage]
+            else:
+                params = self._statement_params(context)
+                statements = (
+                    EXACT_PER_QUERY_SEARCH_WITH_VECTOR_STATEMENTS
+                    if context.with_vectors
+                    else EXACT_PER_QUERY_SEARCH_STATEMENTS
+                )
+                statement = statements[self.vector_storage]
+            result = await session.execute(statement, params)
+            rows = result.fetchall()
+
+        # unnest WITH ORDINALITY의 순번은 1부터 시작
+        chunks: List[List[NewsChunk]] = [[] for _ in context.queries]
+        for r in rows:
+            chunks[r.idx - 1].append(self._create_chunk_from(r, context.with_vectors))
+        return chunks
+
+    def warm_up_statements(self) -> List[Tuple[Any, dict]]:
+        """
+        연결 워밍업에서 prepare 할 (문, 파라미터) 목록을 반환합니다.
+
+        설정된 검색 엔진/저장 방식의 기본 검색 경로에서 쓰는 문을, 결과가 없는
+        더미 쿼리(존재하지 않는 회사, 오늘 하루 구간) 파라미터로 실행하도록 구성합니다.
+        """
+        today = date.today()
+        query_vector = [0.0] * 1536
+        query_vector[0] = 1.0
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(
+                    company_id=UUID(int=0),
+                    query_vector=query_vector,
+                    start_date=today,
+                    end_date=today,
+                )
+            ],
+            limit_per_query=1,
+        )
+        params = self._statement_params(context)
+        if self.engine == NewsSearchEngine.HNSW:
+            return [
+                (
+                    HNSW_SETTINGS_STATEMENT,
+                    {
+                        "ef_search": str(self.ef_search),
+                        "iterative_scan": self.iterative_scan,
+                    },
+                ),
+                (HNSW_SEARCH_STATEMENTS[self.vector_storage], params),
+            ]
+        return [
+            (SEARCH_STATEMENTS[self.vector_storage], params),
+            (EXACT_PER_QUERY_SEARCH_STATEMENTS[self.vector_storage], params),
+        ]
+
+    def warm_up_indexes(self) -> List[str]:
+        """pg_prewarm으로 미리 적재할 검색 대상 HNSW 인덱스 목록"""
+        return [HNSW_INDEXES[self.vector_storage]]
+
+    async def _apply_hnsw_settings(self, session, ef_search: int) -> None:
+        await session.execute(
+            HNSW_SETTINGS_STATEMENT,
+            {"ef_search": str(ef_search), "iterative_scan": self.iterative_scan},
+        )
+
+    def _statement_params(
+        self,
+        context: NewsSearchContext,
+        storage: Optional[NewsVectorStorage] = None,
+    ) -> dict:
+        company_ids, query_vectors, start_dates, end_dates = map(
+            list, zip(*(query.to_tuple() for query in context.queries))
+        )
+        # 축소 차원 저장 방식이면 쿼리 벡터도 앞쪽 차원만 사용
+        # (코사인 거리는 벡터 크기와 무관하므로 재정규화 불필요)
+        _, vector_type = _VECTOR_COLUMNS[storage or self.vector_storage]
+        if vector_type.dim < 1536:
+            query_vectors = [vector[: vector_type.dim] for vector in query_vectors]
+        return {
+            "company_ids": company_ids,
+            "query_vectors": query_vectors,
+            "start_dates": start_dates,
+            "end_dates": end_dates,
+            "window_start": min(start_dates),
+            # 종료 날짜가 없는 쿼리(현재 재직 중)가 있으면 상한 없음
+            "window_end": max(end_date or date.max for end_date in end_dates),
+            "similarity_threshold": context.similarity_threshold,
+            "limit_per_query": context.limit_per_query,
+        }
+
+    @staticmethod
+    def _query_terms(query_text: Optional[str]) -> Optional[str]:
+        """
+        검색어를 OR 접두사 tsquery 문자열로 변환합니다. ("결제 시스템" -> "결제:* | 시스템:*")
+
+        'simple' 설정은 조사를 분리하지 않으므로 접두사 매칭으로 "결제를", "시스템의" 같은
+        어절도 찾습니다. 한 글자 토큰은 매칭 범위가 너무 넓어 제외하며,
+        남는 검색어가 없으면 None(어휘 매칭 없음)을 반환합니다.
+        """
+        if not query_text:
+            return None
+        terms = dict.fromkeys(
+            term
+            for term in _QUERY_TERM_PATTERN.findall(query_text.lower())
+            if len(term) >= 2
+        )
+        if not terms:
+            return None
+        return " | ".join(f"{term}:*" for term in list(terms)[:_MAX_QUERY_TERMS])
+
+    def _group_by_company(
+        self, per_query: List[List[NewsChunk]], by_rank: bool = False
+    ) -> Dict[UUID, List[NewsChunk]]:
+        # 같은 회사의 여러 쿼리 결과를 합치고, 중복 청크는 가장 높은 유사도만 유지
+        # by_rank이면 유사도 대신 쿼리 결과 내 가장 앞선 순위(동순위는 유사도)로 정렬
+        merged: Dict[UUID, Dict[int, NewsChunk]] = {}
+        best_rank: Dict[int, int] = {}
+        for chunks in per_query:
+            for rank, chunk in enumerate(chunks):
+                by_id = merged.setdefault(chunk.company_id, {})
+                existing = by_id.get(chunk.id)
+                if existing is None or existing.similarity < chunk.similarity:
+                    by_id[chunk.id] = chunk
+                best_rank[chunk.id] = min(rank, best_rank.get(chunk.id, rank))
+
+        def sort_key(chunk: NewsChunk):
+            if by_rank:
+                return (best_rank[chunk.id], -chunk.similarity)
+            return -chunk.similarity
+
+        return {
+            company_id: sorted(by_id.values(), key=sort_key)
+            for company_id, by_id in merged.items()
+        }
+
+    def _create_chunk_from(self, row, with_vector: bool = False) -> NewsChunk:
+        vector = row.vector if with_vector else None
+        return NewsChunk(
+            id=row.id,
+            company_id=row.company_id,
+            title=row.title,
+            contents=row.contents,
+            similarity=row.similarity_score,
+            link=row.link,
+            # halfvec 컬럼은 HalfVector로 디코딩되므로 NumPy 배열로 통일
+            vector=(vector.to_numpy() if isinstance(vector, HalfVector) else vector),
+        )
@@ -185,6 +185,8 @@ class TalentInference:
                 queries=queries,
                 limit_per_query=5,
                 similarity_threshold=0.5,
+                # 같은 기사의 겹치는 청크로 프롬프트가 채워지지 않도록 기사 단위로 다양화
+                diversify=True,
             )
         )
 
@@ -1,4 +1,24 @@
-from llama_index.core.prompts import RichPromptTemplate
+from functools import lru_cache
+
+from jinja2 import Environment
+
+# llama-index RichPromptTemplate(banks)과 같은 블록 공백 처리
+_JINJA_ENV = Environment(trim_blocks=True, lstrip_blocks=True, autoescape=False)
+
+
+class PromptTemplate:
+    """
+    Jinja 프롬프트 템플릿
+
+    템플릿 문자열은 생성할 때 한 번 컴파일하고 format(**kwargs)으로 렌더링합니다.
+    """
+
+    def __init__(self, template_str: str):
+        self.template_str = template_str
+        self._template = _JINJA_ENV.from_string(template_str)
+
+    def format(self, **kwargs) -> str:
+        return self._template.render(**kwargs)
 
 
 class TalentInferencePromptTemplates:
@@ -7,12 +27,14 @@ class TalentInferencePromptTemplates:
     """
 
     @staticmethod
-    def get_talent_experience_inference_template() -> RichPromptTemplate:
+    @lru_cache(maxsize=None)
+    def get_talent_experience_inference_template() -> PromptTemplate:
         """
         인재의 경험과 역량을 추론하기 위한 프롬프트 템플릿을 반환합니다.
+        템플릿은 프로세스에서 처음 요청될 때 한 번만 컴파일됩니다.
 
         Returns:
-            RichPromptTemplate: TalentProfile과 CompanySummary를 파라미터로 받는 템플릿
+            PromptTemplate: TalentProfile과 CompanySummary를 파라미터로 받는 템플릿
         """
         template_str = """
             주어진 정보(재직기간내 회사의 투자/매출/MAU/조직규모/뉴스 등)를 바탕으로 이 인재가 보유한 경험을 정확하게 분석하고, 객관적 근거와 함께 경험과 역량을 한국어 태그로 추론해주세요.
@@ -156,4 +178,4 @@ class TalentInferencePromptTemplates:
 
             """
 
-        return RichPromptTemplate(template_str=template_str)
+        return PromptTemplate(template_str)
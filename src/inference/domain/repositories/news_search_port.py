@@ -21,6 +21,9 @@ class NewsSearchRequest(BaseModel):
     queries: List[NewsSearchQuery]
     limit_per_query: int = Field(default=10)
     similarity_threshold: float = Field(default=0.7)
+    hybrid: bool = Field(default=False)
+    diversify: bool = Field(default=False)
+    mmr_lambda: float = Field(default=0.7, ge=0.0, le=1.0)
 
     model_config = ConfigDict(frozen=True, extra="ignore")
 
@@ -0,0 +1,434 @@
+"""
+운영용 멀티 프로세스 실행기
+
+부모 프로세스가 앱과 무거운 모듈을 미리 import하고 `gc.freeze()`를 호출한 뒤 워커를 fork합니다.
+워커는 부모가 연 리슨 소켓을 공유하며 uvicorn으로 요청을 처리하고, 최대 요청 수를 넘으면 정상
+종료되어 새 워커로 교체됩니다. DB 엔진/Redis/OpenAI 클라이언트는 워커의 lifespan/첫 요청에서
+만들어지므로 fork 이전에 연결이 생기지 않습니다.
+
+    PYTHONPATH=src python -m runner [--app server:app] [--workers N] [--port 8000]
+
+SIGTERM/SIGINT: 워커에 SIGTERM을 보내 진행 중인 요청을 마치게 하고 GRACEFUL_TIMEOUT 후 강제 종료
+SIGHUP: 워커를 하나씩 교체 (새 워커가 준비되면 기존 워커 하나를 정상 종료시키는 것을 반복하므로
+        교체 중에도 리슨 소켓에서 accept하는 워커가 항상 있음)
+"""
+
+import argparse
+import gc
+import importlib
+import logging
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from config.config import Config, DatabaseConfig, ServerConfig
+
+__all__ = ["Arbiter", "main", "preload", "worker_pool_env"]
+
+logger = logging.getLogger(__name__)
+
+# 앱 import만으로는 로딩되지 않고 첫 연결/요청에서 import되는 모듈 (부모에서 미리 로딩해 워커가 공유)
+PRELOAD_MODULES = (
+    "asyncpg",
+    "pgvector.asyncpg",
+    "sqlalchemy.dialects.postgresql.asyncpg",
+    "uvicorn.lifespan.on",
+    "uvicorn.loops.auto",
+    "uvicorn.protocols.http.auto",
+)
+# 부모(Arbiter)가 처리하는 시그널
+_HANDLED_SIGNALS = (
+    signal.SIGTERM,
+    signal.SIGINT,
+    signal.SIGHUP,
+    signal.SIGALRM,
+    signal.SIGCHLD,
+)
+# 시작 직후 비정상 종료된 워커는 바로 다시 띄우지 않음 (설정 오류로 fork가 반복되지 않도록)
+MIN_WORKER_LIFETIME = 1.0
+# 감독 루프는 시그널/준비 알림으로 깨어나며, 이 간격(초)마다 한 번은 종료된 워커를 확인
+SUPERVISE_INTERVAL = 1.0
+
+
+def worker_pool_env(database: DatabaseConfig, workers: int) -> Dict[str, str]:
+    """
+    엔진별 연결 예산(CONNECTION_BUDGET)을 워커 수로 나눈 풀 설정을 환경 변수로 반환합니다.
+
+    워커마다 POOL_SIZE = 예산 // 워커 수, MAX_OVERFLOW = 0으로 두어 전체 연결 수가 예산을 넘지 않게
+    합니다. 예산이 0이면 기존 POOL_SIZE/MAX_OVERFLOW를 그대로 사용합니다.
+    """
+    if database.CONNECTION_BUDGET <= 0:
+        return {}
+
+    per_worker = database.CONNECTION_BUDGET // workers
+    if per_worker < 1:
+        logger.warning(
+            f"DB connection budget {database.CONNECTION_BUDGET} is smaller than "
+            f"{workers} workers; each worker keeps one connection per engine"
+        )
+        per_worker = 1
+    return {
+        "DB_POOL_SIZE": str(per_worker),
+        "DB_MAX_OVERFLOW": "0",
+        # 요청 하나가 워커의 풀 전체를 차지하지 않도록 요청당 세션 상한도 풀 크기 이하로
+        "DB_MAX_SESSIONS_PER_REQUEST": str(
+            max(1, min(database.MAX_SESSIONS_PER_REQUEST, per_worker))
+        ),
+    }
+
+
+def preload(app_path: str):
+    """
+    "module:attribute" 경로의 앱과 워커가 쓰게 될 모듈을 import하고 공유 페이지를 고정합니다.
+
+    gc.freeze()는 이때까지 만들어진 객체를 GC 추적 대상에서 빼므로, 워커의 GC가 이 객체들의
+    헤더를 건드려 copy-on-write로 페이지가 복사되는 것을 막습니다.
+    """
+    module_name, _, attribute = app_path.partition(":")
+    app = getattr(importlib.import_module(module_name), attribute or "app")
+
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    # 프롬프트 템플릿(Jinja 컴파일 결과)은 프로세스당 한 번 만들어 캐시되므로 부모에서 생성
+    from inference.application.templates.inference_template import (
+        TalentInferencePromptTemplates,
+    )
+
+    TalentInferencePromptTemplates.get_talent_experience_inference_template()
+
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """워커들이 함께 accept할 리슨 소켓 (fork로 상속)"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve_uvicorn(
+    app, sock: socket.socket, server: ServerConfig
+) -> Callable[[Callable[[], None]], None]:
+    """워커 프로세스에서 실행할 uvicorn 서버 함수를 만듭니다."""
+
+    def serve(ready: Callable[[], None]) -> None:
+        import uvicorn
+
+        class NotifyingServer(uvicorn.Server):
+            async def startup(self, sockets=None) -> None:
+                await super().startup(sockets=sockets)
+                # lifespan 시작이 끝나고 소켓에서 accept를 시작하면 부모에 준비 완료를 알림
+                if self.started and not self.should_exit:
+                    ready()
+
+        max_requests = None
+        if server.MAX_REQUESTS > 0:
+            # fork된 워커는 부모의 난수 상태를 공유하므로 pid로 시드
+            jitter = random.Random(os.getpid()).randint(0, server.MAX_REQUESTS_JITTER)
+            max_requests = server.MAX_REQUESTS + jitter
+
+        NotifyingServer(
+            uvicorn.Config(
+                app,
+                lifespan="on",
+                limit_max_requests=max_requests,
+                timeout_graceful_shutdown=server.GRACEFUL_TIMEOUT,
+            )
+        ).run(sockets=[sock])
+
+    return serve
+
+
+class Arbiter:
+    """
+    워커 프로세스를 fork하고, 종료된 워커를 새 워커로 교체합니다.
+
+    serve는 워커에서 실행되며 요청을 받을 준비가 되면 인자로 받은 ready()를 호출합니다.
+    SIGHUP을 받으면 새 워커 하나를 띄워 ready()를 알릴 때까지 기다린 뒤 기존 워커 하나에
+    SIGTERM을 보내고, 그 워커가 종료되면 다음 워커를 교체합니다(rolling restart).
+    교체 중에는 워커가 workers + 1개까지 늘어납니다.
+    """
+
+    def __init__(
+        self,
+        serve: Callable[[Callable[[], None]], None],
+        workers: int,
+        graceful_timeout: int = 30,
+    ):
+        self.serve = serve
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        # pid -> 시작 시각
+        self.children: Dict[int, float] = {}
+        self.running = False
+        # pid -> 준비 알림 파이프의 읽기 끝 (준비를 알리거나 종료되면 닫음)
+        self._ready_fds: Dict[int, int] = {}
+        # SIGHUP 시점의 교체 대상 워커 (앞에서부터 하나씩 교체)
+        self._reload_queue: List[int] = []
+        # 준비를 기다리는 교체 워커 / 교체되어 종료 중인 기존 워커
+        self._replacement: Optional[int] = None
+        self._retiring: Optional[int] = None
+        # 시그널 처리 시 select를 깨우는 파이프 (signal.set_wakeup_fd)
+        self._wakeup: tuple = ()
+
+    def run(self) -> None:
+        self._wakeup = os.pipe()
+        for fd in self._wakeup:
+            os.set_blocking(fd, False)
+        previous_wakeup = signal.set_wakeup_fd(self._wakeup[1])
+        previous = {
+            signum: signal.signal(signum, handler)
+            for signum, handler in zip(
+                _HANDLED_SIGNALS,
+                (
+                    self._handle_stop,
+                    self._handle_stop,
+                    self._handle_reload,
+                    self._handle_kill,
+                    self._handle_child,
+                ),
+            )
+        }
+        self.running = True
+        try:
+            for _ in range(self.workers):
+                self.spawn()
+            self._supervise()
+        finally:
+            signal.alarm(0)
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            signal.set_wakeup_fd(previous_wakeup)
+            for fd in (*self._wakeup, *self._ready_fds.values()):
+                os.close(fd)
+            self._wakeup = ()
+            self._ready_fds.clear()
+
+    def spawn(self) -> int:
+        read_fd, write_fd = os.pipe()
+        # fork 직후 워커가 처리기를 초기화하기 전에 부모의 처리기가 실행되지 않도록
+        # fork 동안 시그널을 막아 둠
+        signal.pthread_sigmask(signal.SIG_BLOCK, _HANDLED_SIGNALS)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                self._run_worker(write_fd)
+            self.children[pid] = time.monotonic()
+            self._ready_fds[pid] = read_fd
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _HANDLED_SIGNALS)
+            os.close(write_fd)
+        logger.info(f"Worker started: pid={pid}")
+        return pid
+
+    def stop(self) -> None:
+        """모든 워커에 SIGTERM을 보내고, graceful_timeout 후에도 남은 워커는 강제 종료"""
+        if not self.running:
+            return
+        self.running = False
+        self._reload_queue.clear()
+        self._signal_children(signal.SIGTERM)
+        signal.alarm(self.graceful_timeout)
+
+    def _supervise(self) -> None:
+        while self.children:
+            self._reap()
+            if not self.children:
+                break
+            if self.running:
+                self._roll()
+
+            fds = [self._wakeup[0], *self._ready_fds.values()]
+            readable, _, _ = select.select(fds, [], [], SUPERVISE_INTERVAL)
+            for fd in readable:
+                if fd == self._wakeup[0]:
+                    self._drain(fd)
+                else:
+                    self._read_ready(fd)
+
+    def _reap(self) -> None:
+        """종료된 워커를 거두고, 교체 과정에서 빠지는 워커가 아니면 새 워커로 교체"""
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+
+            started = self.children.pop(pid, None)
+            fd = self._ready_fds.pop(pid, None)
+            if fd is not None:
+                os.close(fd)
+            if started is None or not self.running:
+                continue
+
+            code = os.waitstatus_to_exitcode(status)
+            lifetime = time.monotonic() - started
+            logger.info(f"Worker exited: pid={pid} code={code} after {lifetime:.1f}s")
+            if code != 0 and lifetime < MIN_WORKER_LIFETIME:
+                time.sleep(MIN_WORKER_LIFETIME)
+
+            if pid == self._retiring:
+                # 교체 워커가 이미 자리를 채움
+                self._retiring = None
+                continue
+            if pid == self._replacement:
+                # 준비 전에 종료된 교체 워커는 _roll이 다시 띄움
+                self._replacement = None
+                continue
+            if pid in self._reload_queue:
+                self._reload_queue.remove(pid)
+                if self._replacement is not None:
+                    # 교체 대상이 먼저 종료되면 준비 중인 교체 워커가 그 자리를 채움
+                    self._replacement = None
+                    continue
+            if self.running:
+                self.spawn()
+
+    def _roll(self) -> None:
+        """교체할 워커가 남아 있고 진행 중인 교체가 없으면 교체 워커를 하나 띄움"""
+        if self._replacement is not None or self._retiring is not None:
+            return
+        self._reload_queue = [pid for pid in self._reload_queue if pid in self.children]
+        if self._reload_queue:
+            self._replacement = self.spawn()
+
+    def _read_ready(self, fd: int) -> None:
+        pid = next(pid for pid, ready_fd in self._ready_fds.items() if ready_fd == fd)
+        notified = os.read(fd, 1)
+        os.close(self._ready_fds.pop(pid))
+        # 준비를 알리지 않고 종료된 워커는 빈 값(EOF)을 반환하며, 거두는 것은 _reap이 처리
+        if not notified or pid != self._replacement:
+            return
+
+        self._replacement = None
+        while self._reload_queue:
+            old = self._reload_queue.pop(0)
+            if old in self.children:
+                logger.info(f"Worker replaced: pid={old} by pid={pid}")
+                self._retiring = old
+                os.kill(old, signal.SIGTERM)
+                return
+
+    @staticmethod
+    def _drain(fd: int) -> None:
+        try:
+            while os.read(fd, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _run_worker(self, ready_fd: int) -> None:
+        # 부모의 시그널 처리기를 해제해 워커 서버(uvicorn)가 직접 처리하게 함
+        for signum in _HANDLED_SIGNALS:
+            signal.signal(signum, signal.SIG_DFL)
+        signal.set_wakeup_fd(-1)
+        # 부모의 시그널 파이프와 다른 워커의 준비 알림 파이프는 쓰지 않음
+        for fd in (*self._wakeup, *self._ready_fds.values()):
+            os.close(fd)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _HANDLED_SIGNALS)
+
+        def ready() -> None:
+            nonlocal ready_fd
+            if ready_fd < 0:
+                return
+            try:
+                os.write(ready_fd, b"1")
+            except OSError:
+                pass
+            os.close(ready_fd)
+            ready_fd = -1
+
+        code = 0
+        try:
+            self.serve(ready)
+        except BaseException:
+            logger.exception("Worker failed")
+            code = 1
+        finally:
+            # 부모에서 상속한 atexit/정리 코드를 실행하지 않고 종료
+            os._exit(code)
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                self.children.pop(pid, None)
+
+    def _handle_stop(self, signum, frame) -> None:
+        self.stop()
+
+    def _handle_reload(self, signum, frame) -> None:
+        # 현재 워커를 모두 교체 대상으로 (진행 중인 교체 워커와 종료 중인 워커는 제외)
+        if self.running:
+            self._reload_queue = [
+                pid
+                for pid in self.children
+                if pid not in (self._replacement, self._retiring)
+            ]
+
+    def _handle_child(self, signum, frame) -> None:
+        # set_wakeup_fd로 select를 깨우기 위한 처리기 (거두는 것은 _reap이 처리)
+        pass
+
+    def _handle_kill(self, signum, frame) -> None:
+        self._signal_children(signal.SIGKILL)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--app", default="server:app", help="module:attribute")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    server = Config().SERVER
+    overrides = {
+        "WORKERS": args.workers,
+        "HOST": args.host,
+        "PORT": args.port,
+    }
+    server = server.model_copy(
+        update={key: value for key, value in overrides.items() if value is not None}
+    )
+    workers = server.WORKERS or os.cpu_count() or 1
+
+    # 앱 설정(Config)은 preload에서 읽히므로 그 전에 워커별 풀 크기를 반영
+    os.environ.update(worker_pool_env(DatabaseConfig(), workers))
+    app = preload(args.app)
+    sock = bind_socket(server.HOST, server.PORT)
+    logger.info(f"Listening on {server.HOST}:{server.PORT} with {workers} workers")
+
+    Arbiter(
+        serve_uvicorn(app, sock, server),
+        workers=workers,
+        graceful_timeout=server.GRACEFUL_TIMEOUT,
+    ).run()
+    sock.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
-import glob
+import asyncio
 import importlib
+import inspect
 import logging
-import os
 from contextlib import asynccontextmanager
 from typing import List
 
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from config.config import Config
 from containers import Container
+from db.db import session_scope, warm_up_engine
 from shared.exceptions import (
     general_exception_handler,
     http_exception_handler,
@@ -18,20 +19,12 @@ from shared.exceptions import (
 logger = logging.getLogger(__name__)
 
 
-def load_controllers(base_path="src"):
-    controllers = []
-    pattern = os.path.join(base_path, "**", "controllers", "*.py")
-    for controller_file in glob.glob(pattern, recursive=True):
-        if os.path.basename(controller_file) == "__init__.py":
-            continue
-        module_path = (
-            controller_file.replace(base_path + os.path.sep, "")
-            .replace(".py", "")
-            .replace(os.path.sep, ".")
-        )
-        controllers.append(module_path)
-        logger.info(f"Found controller: {controller_file} -> {module_path}")
-    return controllers
+# 라우터를 등록할 컨트롤러 모듈 (새 컨트롤러는 여기에 추가)
+# 시작할 때 파일 시스템을 탐색하지 않도록 정적으로 둡니다.
+CONTROLLER_MODULES = (
+    "enrichment.controllers.enrichment_controller",
+    "inference.controllers.talent_infer_controller",
+)
 
 
 def register_routers(app: FastAPI, controller_modules: List[str]):
@@ -58,19 +51,83 @@ def register_routers(app: FastAPI, controller_modules: List[str]):
     return registered_routers
 
 
+class SessionScopeMiddleware:
+    """
+    HTTP 요청마다 DB 세션 범위(db.db.session_scope)를 엽니다.
+
+    세션 매니저/리포지터리/서비스는 프로세스당 하나를 공유하므로, 요청별 동시 세션 상한은
+    이 범위로 적용됩니다. (BaseHTTPMiddleware를 거치지 않는 순수 ASGI 미들웨어)
+    """
+
+    def __init__(self, app, max_sessions_per_request: int):
+        self.app = app
+        self.max_sessions_per_request = max_sessions_per_request
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        async with session_scope(self.max_sessions_per_request):
+            await self.app(scope, receive, send)
+
+
+async def warm_up_database(container: Container, config: Config) -> None:
+    """읽기(복제본별)/쓰기 엔진의 풀 연결을 미리 열고, 읽기 연결에 뉴스 검색 문을 prepare 합니다."""
+    statements, indexes = [], []
+    if config.NEWS_SEARCH.BACKEND == "postgres":
+        news_repository = await container.news_respository()
+        statements = news_repository.warm_up_statements()
+        if config.DATABASE.WARMUP_PREWARM_INDEXES:
+            indexes = news_repository.warm_up_indexes()
+
+    read_engines, write_engine = await asyncio.gather(
+        container._read_db_engines(), container._write_db_engine()
+    )
+    *read_blocks, _ = await asyncio.gather(
+        *(
+            warm_up_engine(
+                read_engine,
+                config.DATABASE.POOL_SIZE,
+                statements=statements,
+                prewarm_indexes=indexes,
+            )
+            for read_engine in read_engines
+        ),
+        warm_up_engine(write_engine, config.DATABASE.POOL_SIZE),
+    )
+    blocks = sum(read_blocks)
+    logger.info(
+        f"Database warmed up: {config.DATABASE.POOL_SIZE} connections per engine, "
+        f"{len(statements)} statements, {blocks} index blocks prewarmed"
+    )
+
+
 def create_app() -> FastAPI:
     config = Config()
     container = Container()
 
-    controller_modules = load_controllers()
+    controller_modules = list(CONTROLLER_MODULES)
     container.config.from_pydantic(config)
     container.wire(modules=controller_modules)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         logger.info("FastAPI app initialized")
+        if config.DATABASE.WARMUP:
+            await warm_up_database(container, config)
+        if config.NEWS_SEARCH.BACKEND == "memory" and config.NEWS_SEARCH.MEMORY_PRELOAD:
+            # 인메모리 뉴스 검색 인덱스를 요청 전에 적재
+            news_repository = await container.news_respository()
+            await news_repository.preload()
+            logger.info(
+                f"News index preloaded: {news_repository.memory_bytes / 1024 / 1024:.1f}MB"
+            )
         yield
-        container.shutdown_resources()
+        # 비동기 자원(엔진, 읽기 라우터)이 초기화되었으면 코루틴이 반환되므로 기다려야
+        # 지연 확인 작업이 취소되고 엔진이 dispose 됨
+        shutdown = container.shutdown_resources()
+        if inspect.isawaitable(shutdown):
+            await shutdown
         container.unwire()
 
         logger.info("FastAPI app shutdown complete")
@@ -92,6 +149,10 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",
     )
     app.state.container = container
+    app.add_middleware(
+        SessionScopeMiddleware,
+        max_sessions_per_request=config.DATABASE.MAX_SESSIONS_PER_REQUEST,
+    )
 
     # 전역 예외 처리기 등록
     app.add_exception_handler(HTTPException, http_exception_handler)
@@ -1,5 +1,6 @@
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
@@ -8,9 +9,11 @@ import pytest
 from enrichment.application.services.company_info_writer import CompanyInfoWriter
 from enrichment.domain.aggregates.company_aggregate import CompanyAggregate
 from enrichment.domain.entities.company import Company
+from enrichment.domain.entities.company_metrics_snapshot import CompanyMetricsSnapshot
 from enrichment.domain.exceptions.company_reader_exceptions import (
     ReaderInvalidFormatError,
 )
+from enrichment.domain.vos.metrics import MonthlyMetrics
 from enrichment.infrastructure.exceptions.repository_exception import RepositoryError
 
 
@@ -88,6 +91,61 @@ async def test_process_file_success(
     Path(temp_file_path).unlink()
 
 
+@pytest.mark.asyncio
+async def test_process_file_builds_metrics_rollups(
+    company_info_writer, mock_company_reader, mock_company_repository
+):
+    # Arrange
+    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
+        temp_file.write("{}")
+        temp_file_path = temp_file.name
+
+    company_id = UUID("a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a13")
+    mock_company = Company(
+        id=company_id,
+        external_id="EXT1",
+        name="Test Company",
+        name_en="Test Company EN",
+        business_description="Desc",
+        employee_count=100,
+        founded_date=None,
+        ipo_date=None,
+        industry=[],
+        tags=[],
+        stage=None,
+        total_investment=None,
+        origin_file_path=temp_file_path,
+    )
+    snapshots = [
+        CompanyMetricsSnapshot(
+            company_id=company_id,
+            reference_date=date(2023, month, 1),
+            metrics=MonthlyMetrics(
+                mau=[], patents=[], finance=[], investments=[], organizations=[]
+            ),
+        )
+        for month in (2, 1)
+    ]
+    mock_aggregate = CompanyAggregate(
+        company=mock_company, company_aliases=[], company_metrics_snapshots=snapshots
+    )
+    mock_company_reader.read.return_value = mock_aggregate
+
+    # Act
+    result = await company_info_writer.process_file(temp_file_path)
+
+    # Assert
+    assert result.success
+    saved_aggregate = mock_company_repository.save.call_args.args[0]
+    assert [r.reference_date for r in saved_aggregate.company_metrics_rollups] == [
+        date(2023, 1, 1),
+        date(2023, 2, 1),
+    ]
+
+    # Cleanup
+    Path(temp_file_path).unlink()
+
+
 @pytest.mark.asyncio
 async def test_process_file_reader_exception(company_info_writer, mock_company_reader):
     # Arrange
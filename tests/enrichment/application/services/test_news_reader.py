@@ -1,5 +1,5 @@
 from datetime import date
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID
 
 import pytest
@@ -251,3 +251,129 @@ async def test_search_repository_exception(
     mock_embedding_client.generate_embeddings.assert_called_once()
     mock_news_repository.search.assert_called_once()
 
+
+@pytest.mark.asyncio
+async def test_search_passes_binary_prefilter_options(
+    news_reader, mock_embedding_client, mock_news_repository
+):
+    # Arrange
+    param = NewsSearchParam(queries=[], binary_prefilter=True, binary_oversample=4)
+    mock_embedding_client.generate_embeddings.return_value = []
+    mock_news_repository.search.return_value = {}
+
+    # Act
+    await news_reader.search(param)
+
+    # Assert
+    context = mock_news_repository.search.call_args.args[0]
+    assert context.binary_prefilter is True
+    assert context.binary_oversample == 4
+
+
+@pytest.mark.asyncio
+async def test_search_passes_query_text_for_hybrid(
+    news_reader, mock_embedding_client, mock_news_repository
+):
+    # Arrange
+    company_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+    param = NewsSearchParam(
+        queries=[
+            NewsSearchQuery(
+                company_id=company_id,
+                query_text="토스뱅크 결제 시스템",
+                start_date=date(2021, 1, 1),
+            )
+        ],
+        hybrid=True,
+    )
+    mock_embedding_client.generate_embeddings.return_value = [[0.1, 0.2]]
+    mock_news_repository.search.return_value = {}
+
+    # Act
+    await news_reader.search(param)
+
+    # Assert
+    context = mock_news_repository.search.call_args.args[0]
+    assert context.hybrid is True
+    assert context.queries[0].query_text == "토스뱅크 결제 시스템"
+
+
+@pytest.mark.asyncio
+async def test_search_diversify_selects_distinct_articles(
+    news_reader, mock_embedding_client, mock_news_repository
+):
+    # Arrange
+    company_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+    param = NewsSearchParam(
+        queries=[
+            NewsSearchQuery(
+                company_id=company_id,
+                query_text="결제 시스템",
+                start_date=date(2021, 1, 1),
+            )
+        ],
+        limit_per_query=2,
+        diversify=True,
+        mmr_oversample=3,
+    )
+    mock_embedding_client.generate_embeddings.return_value = [[0.1, 0.2]]
+    mock_news_repository.search.return_value = {
+        company_id: [
+            NewsChunk(1, company_id, "기사1", "앞 문단", 0.9, "a", [1.0, 0.0]),
+            NewsChunk(2, company_id, "기사1", "뒷 문단", 0.85, "a", [1.0, 0.0]),
+            NewsChunk(7, company_id, "기사2", "다른 기사", 0.6, "b", [0.0, 1.0]),
+        ]
+    }
+
+    # Act
+    result = await news_reader.search(param)
+
+    # Assert
+    context = mock_news_repository.search.call_args.args[0]
+    assert context.limit_per_query == 6
+    assert context.with_vectors is True
+    chunks = result[0].news_chunks
+    assert [chunk.link for chunk in chunks] == ["a", "b"]
+    assert chunks[0].contents == "앞 문단 뒷 문단"
+    assert all(chunk.vector is None for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_search_diversify_bounds_merged_article_tokens(
+    mock_embedding_client, mock_news_repository
+):
+    # Arrange
+    chunker = Mock()
+    chunker.count_tokens.side_effect = lambda text: len(text.split())
+    news_reader = NewsReader(
+        embedding_client=mock_embedding_client,
+        news_repository=mock_news_repository,
+        chunker=chunker,
+        max_article_tokens=4,
+    )
+    company_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+    param = NewsSearchParam(
+        queries=[
+            NewsSearchQuery(
+                company_id=company_id,
+                query_text="결제 시스템",
+                start_date=date(2021, 1, 1),
+            )
+        ],
+        limit_per_query=1,
+        diversify=True,
+    )
+    mock_embedding_client.generate_embeddings.return_value = [[0.1, 0.2]]
+    mock_news_repository.search.return_value = {
+        company_id: [
+            NewsChunk(2, company_id, "기사1", "둘째 문단", 0.9, "a", [1.0, 0.0]),
+            NewsChunk(3, company_id, "기사1", "셋째 문단", 0.8, "a", [1.0, 0.0]),
+            NewsChunk(1, company_id, "기사1", "첫째 문단", 0.7, "a", [1.0, 0.0]),
+        ]
+    }
+
+    # Act
+    result = await news_reader.search(param)
+
+    # Assert
+    assert result[0].news_chunks[0].contents == "둘째 문단 셋째 문단"
@@ -0,0 +1,191 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from enrichment.application.dtos.news_write import NewsArticle
+from enrichment.application.services.news_writer import NewsWriter
+from enrichment.domain.entities.news_chunk_record import NewsChunkRecord
+
+COMPANY_ID = UUID("a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11")
+
+
+@pytest.fixture
+def mock_chunker():
+    chunker = MagicMock()
+    # 문장 단위로 나누고 글자 수를 토큰 수로 사용
+    chunker.split.side_effect = lambda text: [s for s in text.split(". ") if s]
+    chunker.count_tokens.side_effect = len
+    return chunker
+
+
+@pytest.fixture
+def mock_embedding_client():
+    client = AsyncMock()
+    client.generate_embeddings.side_effect = lambda texts: [
+        [float(len(text))] for text in texts
+    ]
+    return client
+
+
+@pytest.fixture
+def mock_repository():
+    repository = AsyncMock()
+    repository.find_existing_hashes.return_value = set()
+    repository.bulk_insert.side_effect = lambda records: len(records)
+    return repository
+
+
+@pytest.fixture
+def news_writer(mock_chunker, mock_embedding_client, mock_repository):
+    return NewsWriter(
+        chunker=mock_chunker,
+        embedding_client=mock_embedding_client,
+        repository=mock_repository,
+        max_batch_tokens=10,
+        max_batch_size=2,
+    )
+
+
+def article(contents, link="https://news.local/1"):
+    return NewsArticle(
+        company_id=COMPANY_ID,
+        title="제목",
+        contents=contents,
+        link=link,
+        published_at=date(2021, 3, 1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_chunks_embeds_and_inserts(
+    news_writer, mock_embedding_client, mock_repository
+):
+    # Act
+    result = await news_writer.write([article("가나다. 라마바사. 아자")])
+
+    # Assert
+    assert (result.articles, result.chunks, result.inserted, result.skipped) == (
+        1,
+        3,
+        3,
+        0,
+    )
+    inserted = [
+        record
+        for call in mock_repository.bulk_insert.call_args_list
+        for record in call.args[0]
+    ]
+    assert [record.contents for record in inserted] == ["가나다", "라마바사", "아자"]
+    assert [record.vector for record in inserted] == [[3.0], [4.0], [2.0]]
+    assert all(record.created_at == date(2021, 3, 1) for record in inserted)
+
+
+@pytest.mark.asyncio
+async def test_write_batches_by_tokens_and_size(news_writer, mock_embedding_client):
+    # Act: 토큰 상한 10, 입력 개수 상한 2
+    await news_writer.write([article("가나다라마바. 사아자차카. 타파. 하")])
+
+    # Assert
+    batches = [
+        call.args[0]
+        for call in mock_embedding_client.generate_embeddings.call_args_list
+    ]
+    assert batches == [["가나다라마바"], ["사아자차카", "타파"], ["하"]]
+
+
+@pytest.mark.asyncio
+async def test_write_skips_existing_hashes_before_embedding(
+    news_writer, mock_embedding_client, mock_repository
+):
+    # Arrange
+    existing = NewsChunkRecord(
+        company_id=COMPANY_ID,
+        title="제목",
+        contents="가나다",
+        link="https://news.local/1",
+        created_at=date(2021, 3, 1),
+    )
+    mock_repository.find_existing_hashes.return_value = {existing.content_hash}
+
+    # Act
+    result = await news_writer.write(
+        # 같은 기사가 요청 안에서 두 번 와도 한 번만 처리
+        [article("가나다. 라마"), article("가나다. 라마")]
+    )
+
+    # Assert
+    assert (result.chunks, result.inserted, result.skipped) == (2, 1, 1)
+    mock_embedding_client.generate_embeddings.assert_awaited_once_with(["라마"])
+
+
+@pytest.mark.asyncio
+async def test_write_empty_articles(news_writer, mock_repository):
+    # Act
+    result = await news_writer.write([])
+
+    # Assert
+    assert result.inserted == 0
+    mock_repository.find_existing_hashes.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_write_embedding_failure_propagates(
+    news_writer, mock_embedding_client, mock_repository
+):
+    # Arrange
+    mock_embedding_client.generate_embeddings.side_effect = RuntimeError("boom")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        await news_writer.write([article("가나다. 라마")])
+    mock_repository.bulk_insert.assert_not_called()
+
+
+def test_content_hash_depends_on_company_link_and_contents():
+    base = dict(
+        company_id=COMPANY_ID,
+        title="제목",
+        contents="가나다",
+        link="https://news.local/1",
+        created_at=date(2021, 3, 1),
+    )
+
+    record = NewsChunkRecord(**base)
+
+    assert (
+        record.content_hash
+        == NewsChunkRecord(**{**base, "title": "다른 제목"}).content_hash
+    )
+    assert (
+        record.content_hash
+        != NewsChunkRecord(**{**base, "contents": "라마"}).content_hash
+    )
+    assert (
+        record.content_hash
+        != NewsChunkRecord(**{**base, "link": "https://news.local/2"}).content_hash
+    )
+    assert len(record.content_hash) == 64
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_news_index_of_written_companies(
+    mock_chunker, mock_embedding_client, mock_repository
+):
+    # Arrange
+    news_repository = AsyncMock()
+    news_writer = NewsWriter(
+        chunker=mock_chunker,
+        embedding_client=mock_embedding_client,
+        repository=mock_repository,
+        news_repository=news_repository,
+    )
+
+    # Act
+    await news_writer.write([article("가나다. 라마")])
+    mock_repository.find_existing_hashes.side_effect = lambda hashes: set(hashes)
+    await news_writer.write([article("가나다. 라마")])
+
+    # Assert: 새 청크가 적재된 첫 번째 호출에서만 인덱스를 버림
+    news_repository.invalidate.assert_awaited_once_with({COMPANY_ID})
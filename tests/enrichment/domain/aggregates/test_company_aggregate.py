@@ -515,3 +515,114 @@ class TestCompanyAggregate:
         assert len(mau_metrics) == 1
         assert ("앱A", 2000000, 20.0) in mau_metrics
 
+
+    def test_build_metrics_rollups_no_snapshots(self):
+        company = Company.of(
+            CompanyCreateParams(external_id="test_company", name="빈회사", employee_count=0)
+        )
+        aggregate = CompanyAggregate.of(
+            company=company, company_aliases=[], company_metrics_snapshots=[]
+        )
+
+        assert aggregate.build_metrics_rollups() == []
+
+    def test_build_metrics_rollups_accumulates_and_carries_forward(self):
+        company_id = UUID("12345678-1234-5678-9abc-123456789012")
+
+        company = Company.of(
+            CompanyCreateParams(
+                external_id="test_company", name="롤업회사", employee_count=0
+            )
+        )
+        company.id = company_id
+
+        metrics1 = MonthlyMetrics(
+            mau=[],
+            patents=[Patent(level="국내특허", title="특허A", date=date(2023, 1, 10))],
+            finance=[
+                Finance(
+                    year=2022,
+                    profit=1000,
+                    operatingProfit=100,
+                    netProfit=None,
+                )
+            ],
+            investments=[
+                Investment(
+                    level="Seed",
+                    date=date(2023, 1, 20),
+                    amount=1000000000,
+                    investors=["벤처캐피탈A"],
+                )
+            ],
+            organizations=[
+                Organization(
+                    name="조직", date=date(2023, 1, 1), people_count=10, growth_rate=0
+                )
+            ],
+        )
+        metrics2 = MonthlyMetrics(
+            mau=[], patents=[], finance=[], investments=[], organizations=[]
+        )
+        metrics3 = MonthlyMetrics(
+            mau=[],
+            patents=[
+                Patent(level="국내특허", title="특허B", date=date(2023, 3, 2)),
+                Patent(level="국제특허", title="특허C", date=date(2023, 3, 9)),
+            ],
+            finance=[
+                Finance(year=2023, profit=3000, operatingProfit=300, netProfit=200)
+            ],
+            investments=[
+                Investment(
+                    level="Series A",
+                    date=date(2023, 3, 5),
+                    amount=5000000000,
+                    investors=["투자회사C"],
+                )
+            ],
+            organizations=[
+                Organization(
+                    name="조직", date=date(2023, 3, 1), people_count=30, growth_rate=0
+                )
+            ],
+        )
+
+        snapshots = [
+            CompanyMetricsSnapshot.of(
+                CompanyMetricSnapshotCreateParams(
+                    company_id=company_id, reference_date=ref_date, metrics=metrics
+                )
+            )
+            for ref_date, metrics in [
+                (date(2023, 3, 1), metrics3),
+                (date(2023, 1, 1), metrics1),
+                (date(2023, 2, 1), metrics2),
+            ]
+        ]
+        aggregate = CompanyAggregate.of(
+            company=company, company_aliases=[], company_metrics_snapshots=snapshots
+        )
+
+        rollups = aggregate.build_metrics_rollups()
+
+        # 기준 월 오름차순으로 생성
+        assert [r.reference_date for r in rollups] == [
+            date(2023, 1, 1),
+            date(2023, 2, 1),
+            date(2023, 3, 1),
+        ]
+        # 누적 값
+        assert [r.cumulative_investment_amount for r in rollups] == [
+            1000000000,
+            1000000000,
+            6000000000,
+        ]
+        assert [r.cumulative_investment_count for r in rollups] == [1, 1, 2]
+        assert [r.cumulative_patent_count for r in rollups] == [1, 1, 3]
+        # 이월 값: 데이터가 없는 2월은 1월 값을 유지
+        assert [r.people_count for r in rollups] == [10, 10, 30]
+        assert [r.profit for r in rollups] == [1000, 1000, 3000]
+        assert [r.net_profit for r in rollups] == [0, 0, 200]
+        assert [r.operating_profit for r in rollups] == [100, 100, 300]
+        assert all(r.company_id == company_id for r in rollups)
@@ -0,0 +1,110 @@
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from enrichment.domain.entities.new_chunk import NewsChunk
+from enrichment.domain.services.news_chunk_selector import NewsChunkSelector
+
+COMPANY_ID = UUID("12345678-1234-5678-9abc-123456789012")
+
+
+def chunk(id, contents, similarity, link, *weights):
+    vector = np.zeros(8, dtype=np.float32)
+    vector[: len(weights)] = weights
+    return NewsChunk(
+        id=id,
+        company_id=COMPANY_ID,
+        title=f"뉴스{id}",
+        contents=contents,
+        similarity=similarity,
+        link=link,
+        vector=vector,
+    )
+
+
+class TestNewsChunkSelector:
+    def test_merge_adjacent_chunks_removes_overlap(self):
+        chunks = [
+            chunk(11, "토스뱅크가 새로운 결제 시스템을 도입했다.", 0.8, "a", 1),
+            chunk(10, "금융권 소식. 토스뱅크가 새로운 결제", 0.9, "a", 1),
+        ]
+
+        merged = NewsChunkSelector.merge_by_article(chunks)
+
+        assert len(merged) == 1
+        assert merged[0].id == 10
+        assert merged[0].similarity == 0.9
+        assert merged[0].contents == "금융권 소식. 토스뱅크가 새로운 결제 시스템을 도입했다."
+
+    def test_merge_keeps_only_span_around_best_chunk(self):
+        chunks = [
+            chunk(1, "첫 문단", 0.9, "a", 1),
+            chunk(5, "다섯째 문단", 0.7, "a", 1),
+            chunk(1, "첫 문단", 0.85, "a", 1),  # 다른 쿼리에서 중복 반환
+            chunk(2, "다른 기사", 0.8, "b", 0, 1),
+        ]
+
+        merged = NewsChunkSelector.merge_by_article(chunks)
+
+        assert [c.link for c in merged] == ["a", "b"]
+        # 떨어진 구간(5번 청크)은 붙이지 않음
+        assert merged[0].contents == "첫 문단"
+
+    def test_merge_is_bounded_by_token_budget(self):
+        # 한 기사의 연속 청크 10개가 모두 후보로 반환된 경우 (청크당 10단어)
+        words = [f"w{i:02d}" for i in range(100)]
+        chunks = [
+            chunk(i, " ".join(words[i * 10 : i * 10 + 10]), 0.9 - abs(i - 4) / 100, "a", 1)
+            for i in range(10)
+        ]
+        count_tokens = lambda text: len(text.split())
+
+        merged = NewsChunkSelector.merge_by_article(
+            chunks, max_tokens=25, count_tokens=count_tokens
+        )
+
+        assert len(merged) == 1
+        assert merged[0].id == 4
+        assert count_tokens(merged[0].contents) <= 25
+        # 가장 유사한 청크와 그보다 유사한 이웃부터 연속으로 붙음
+        assert merged[0].contents == " ".join(words[30:50])
+
+    def test_merge_without_budget_joins_contiguous_run(self):
+        chunks = [
+            chunk(1, "가 나 다", 0.7, "a", 1),
+            chunk(2, "라 마 바", 0.9, "a", 1),
+            chunk(3, "사 아 자", 0.8, "a", 1),
+        ]
+
+        merged = NewsChunkSelector.merge_by_article(chunks)
+
+        assert merged[0].contents == "가 나 다 라 마 바 사 아 자"
+
+    def test_select_prefers_diverse_articles(self):
+        chunks = [
+            chunk(1, "A", 0.95, "a", 1, 0),
+            chunk(2, "B", 0.94, "b", 1, 0.01),  # A와 거의 같은 내용의 기사
+            chunk(3, "C", 0.80, "c", 0, 1),
+        ]
+
+        selected = NewsChunkSelector.select(chunks, k=2, mmr_lambda=0.5)
+
+        assert [c.id for c in selected] == [1, 3]
+
+    def test_select_with_lambda_one_keeps_relevance_order(self):
+        chunks = [
+            chunk(1, "A", 0.95, "a", 1, 0),
+            chunk(2, "B", 0.94, "b", 1, 0.01),
+            chunk(3, "C", 0.80, "c", 0, 1),
+        ]
+
+        selected = NewsChunkSelector.select(chunks, k=2, mmr_lambda=1.0)
+
+        assert [c.id for c in selected] == [1, 2]
+
+    @pytest.mark.parametrize("k", [0, 1, 5])
+    def test_select_limits_to_k(self, k):
+        chunks = [chunk(i, str(i), 1 - i / 10, f"link{i}", i, 1) for i in range(4)]
+
+        assert len(NewsChunkSelector.select(chunks, k=k)) == min(k, 4)
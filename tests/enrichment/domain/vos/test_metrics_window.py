@@ -0,0 +1,90 @@
+"""Test cases for CompanyMetricsWindow"""
+
+from datetime import date
+from uuid import UUID
+
+from enrichment.domain.entities.company_metrics_rollup import CompanyMetricsRollup
+from enrichment.domain.vos.metrics_window import CompanyMetricsWindow
+
+COMPANY_ID = UUID("12345678-1234-5678-9abc-123456789012")
+
+
+def _rollup(reference_date, amount, count, patents, people, profit, net_profit):
+    return CompanyMetricsRollup(
+        company_id=COMPANY_ID,
+        reference_date=reference_date,
+        cumulative_investment_amount=amount,
+        cumulative_investment_count=count,
+        cumulative_patent_count=patents,
+        people_count=people,
+        profit=profit,
+        net_profit=net_profit,
+        operating_profit=0,
+    )
+
+
+class TestCompanyMetricsWindow:
+    def test_of_subtracts_prefix_sums(self):
+        before = _rollup(date(2022, 12, 1), 1000, 1, 2, 10, 100, 50)
+        last = _rollup(date(2023, 12, 1), 6000, 3, 5, 30, 300, 100)
+
+        window = CompanyMetricsWindow.of(
+            company_id=COMPANY_ID,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            before=before,
+            last=last,
+        )
+
+        assert window.investment_amount == 5000
+        assert window.investment_count == 2
+        assert window.patent_count == 3
+        assert window.people_count == 30
+        assert window.people_count_at_start == 10
+        assert window.people_growth_rate == 200.0
+        assert window.profit_growth_rate == 200.0
+        assert window.net_profit_growth_rate == 100.0
+
+    def test_of_without_before_rollup(self):
+        last = _rollup(date(2023, 6, 1), 6000, 3, 5, 30, 300, 100)
+
+        window = CompanyMetricsWindow.of(
+            company_id=COMPANY_ID,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            before=None,
+            last=last,
+        )
+
+        assert window.investment_amount == 6000
+        assert window.people_count_at_start == 0
+        assert window.people_growth_rate == 0.0
+
+    def test_of_without_rollup_inside_window(self):
+        # 구간 안에 롤업이 없으면 직전 값이 유지되고 누적 차이는 0
+        before = _rollup(date(2022, 12, 1), 1000, 1, 2, 10, 100, 50)
+
+        window = CompanyMetricsWindow.of(
+            company_id=COMPANY_ID,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            before=before,
+            last=before,
+        )
+
+        assert window.investment_amount == 0
+        assert window.patent_count == 0
+        assert window.people_count == 10
+        assert window.people_growth_rate == 0.0
+
+    def test_of_without_any_rollup(self):
+        window = CompanyMetricsWindow.of(
+            company_id=COMPANY_ID,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            before=None,
+            last=None,
+        )
+
+        assert window.investment_amount == 0
+        assert window.people_count == 0
@@ -0,0 +1,100 @@
+"""Test cases for Korean sentence chunker"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from enrichment.infrastructure.chunkers.korean_sentence import (
+    KoreanSentenceChunker,
+    _split_sentences,
+)
+from enrichment.infrastructure.chunkers.sentence_splitter import SentenceSplitterChunker
+
+SENTENCES = [
+    "네이버가 578돌 한글날을 맞아 기념 캠페인을 진행한다고 밝혔다.",
+    '회사 측은 "이용자와의 소통을 강화하겠다"고 말했다.',
+    "이번 행사는 10월 9일까지, 서울 강남구 본사에서 열린다.",
+    "업계에서는 MZ세대 이용자가 빠르게 늘고 있다고 분석했다!",
+    "다만 수익성 개선은 과제로 남았다?",
+    "긴 문장은 쉼표에서 나뉘며, " * 30 + "끝난다.",
+]
+
+
+def article(seed: int, sentences: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(SENTENCES) for _ in range(sentences))
+
+
+class TestKoreanSentenceChunker:
+    @pytest.fixture
+    def chunker(self):
+        return KoreanSentenceChunker(chunk_size=320, chunk_overlap=80)
+
+    def test_short_text_single_chunk(self, chunker):
+        assert chunker.split("  네이버가 캠페인을 진행한다.  ") == [
+            "네이버가 캠페인을 진행한다."
+        ]
+
+    def test_empty_text(self, chunker):
+        assert chunker.split("") == []
+        assert chunker.split("   ") == []
+
+    def test_chunks_within_size_and_overlap(self, chunker):
+        chunks = chunker.split(article(seed=0, sentences=60))
+
+        assert len(chunks) > 2
+        assert all(chunker.count_tokens(chunk) <= 320 for chunk in chunks)
+        # 다음 청크는 직전 청크 끝의 문장으로 시작
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current[:20] in previous[-400:]
+
+    def test_parity_with_sentence_splitter(self, chunker):
+        reference = SentenceSplitterChunker(chunk_size=320, chunk_overlap=80)
+
+        for seed in range(20):
+            text = article(seed=seed, sentences=5 + seed * 4)
+            assert chunker.split(text) == reference.split(text)
+
+    def test_sentence_boundaries(self):
+        text = (
+            '  삼성전자는 "공장을 짓는다." U.S. Steel과 협력했다。'
+            '주가는 3.5% 올랐다... 그리고 "잘린 제목…" 기사를 냈다! 끝 '
+        )
+
+        assert _split_sentences(text) == [
+            '삼성전자는 "공장을 짓는다." ',
+            "U.S. Steel과 협력했다。",
+            '주가는 3.5% 올랐다... 그리고 "잘린 제목…" 기사를 냈다! ',
+            "끝 ",
+        ]
+
+    def test_long_text_without_punctuation(self):
+        chunker = KoreanSentenceChunker(chunk_size=20, chunk_overlap=5)
+        text = " ".join(["반도체"] * 200)
+
+        chunks = chunker.split(text)
+
+        assert all(chunker.count_tokens(chunk) <= 20 for chunk in chunks)
+        assert "".join(chunks).count("반도체") >= 200
+
+    def test_invalid_overlap(self):
+        with pytest.raises(ValueError):
+            KoreanSentenceChunker(chunk_size=10, chunk_overlap=20)
+
+    def test_split_many_keeps_order(self, chunker):
+        texts = [article(seed=seed, sentences=10 + seed) for seed in range(30)]
+
+        with ThreadPoolExecutor(2) as executor:
+            results = list(chunker.split_many(texts, batch_size=4, executor=executor))
+
+        assert results == [chunker.split(text) for text in texts]
+
+    def test_split_many_in_process_pool(self, chunker):
+        texts = (article(seed=seed, sentences=20) for seed in range(10))
+
+        results = list(chunker.split_many(texts, workers=2, batch_size=3))
+
+        assert results == [
+            chunker.split(article(seed=seed, sentences=20)) for seed in range(10)
+        ]
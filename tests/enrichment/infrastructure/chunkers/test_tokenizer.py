@@ -0,0 +1,30 @@
+"""Test cases for offline tiktoken encoding loader"""
+
+import os
+
+import pytest
+
+from enrichment.infrastructure.chunkers.tokenizer import _load_encoding, load_encoding
+
+
+def test_load_encoding_uses_bundled_bpe(monkeypatch):
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    _load_encoding.cache_clear()
+
+    encoding = load_encoding()
+
+    assert encoding.name == "cl100k_base"
+    assert encoding.encode_ordinary("hello world") == [15339, 1917]
+    assert encoding.decode(encoding.encode_ordinary("네이버 한글날")) == "네이버 한글날"
+    assert encoding.eot_token == 100257
+    # 프로세스 전역 환경 변수를 바꾸지 않음
+    assert "TIKTOKEN_CACHE_DIR" not in os.environ
+
+
+def test_load_encoding_is_cached_per_process():
+    assert load_encoding() is load_encoding("cl100k_base")
+
+
+def test_load_encoding_rejects_unbundled_encoding():
+    with pytest.raises(ValueError):
+        load_encoding("o200k_base")
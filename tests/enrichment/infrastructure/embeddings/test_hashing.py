@@ -0,0 +1,79 @@
+"""Test cases for local hashing embedding client"""
+import numpy as np
+import pytest
+
+from enrichment.application.exceptions.embedding_exception import EmbeddingGenerationError
+from enrichment.infrastructure.embeddings.hashing import HashingEmbeddingClient
+
+
+class TestHashingEmbeddingClient:
+    @pytest.fixture
+    def client(self):
+        return HashingEmbeddingClient()
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_normalized_float32(self, client):
+        result = await client.generate_embeddings(["삼성전자 반도체 공장", "Apple releases new iPhone"])
+
+        assert len(result) == 2
+        for embedding in result:
+            assert embedding.dtype == np.float32
+            assert embedding.shape == (1536,)
+            assert np.linalg.norm(embedding) == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_deterministic(self, client):
+        texts = ["카카오페이가 결제 서비스를 출시했다"]
+
+        first = await client.generate_embeddings(texts)
+        second = await HashingEmbeddingClient().generate_embeddings(texts)
+        other_seed = await HashingEmbeddingClient(seed=1).generate_embeddings(texts)
+
+        np.testing.assert_array_equal(first[0], second[0])
+        assert not np.array_equal(first[0], other_seed[0])
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_independent_of_batch(self, client):
+        texts = ["삼성전자가 새로운 반도체 공장을 건설한다", "카카오페이 결제", "네이버 검색 광고"]
+
+        batched = await client.generate_embeddings(texts)
+        single = [(await client.generate_embeddings([text]))[0] for text in texts]
+
+        for a, b in zip(batched, single):
+            np.testing.assert_allclose(a, b, rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_similar_korean_texts_closer_than_unrelated(self, client):
+        anchor, similar, unrelated = await client.generate_embeddings(
+            [
+                "삼성전자가 새로운 반도체 공장을 건설한다",
+                "삼성전자 반도체 공장 신설 발표",
+                "카카오페이가 결제 서비스를 출시했다",
+            ]
+        )
+
+        assert anchor @ similar > 0.3
+        assert anchor @ similar > anchor @ unrelated + 0.2
+
+    @pytest.mark.asyncio
+    async def test_normalizes_case_and_whitespace(self, client):
+        a, b = await client.generate_embeddings(["Payment  System", "payment system"])
+
+        np.testing.assert_array_equal(a, b)
+
+    @pytest.mark.asyncio
+    async def test_empty_texts_mapping(self, client):
+        result = await client.generate_embeddings(["회사", "", "   ", None, "뉴스"])
+
+        assert [embedding.size for embedding in result] == [1536, 0, 0, 0, 1536]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_empty_input(self, client):
+        assert await client.generate_embeddings([]) == []
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_all_empty_texts(self, client):
+        with pytest.raises(EmbeddingGenerationError) as exc_info:
+            await client.generate_embeddings(["", "   ", None])
+
+        assert "All input texts are empty or None" in str(exc_info.value)
@@ -1,4 +1,8 @@
 """Test cases for OpenAI embedding service"""
+import asyncio
+import base64
+
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 import openai
@@ -10,6 +14,11 @@ from enrichment.application.exceptions.embedding_exception import (
 )
 
 
+def encode(values):
+    """OpenAI base64 응답 형식 (little-endian float32)"""
+    return base64.b64encode(np.asarray(values, dtype="<f4").tobytes()).decode()
+
+
 class TestOpenAIEmbeddingClient:
     @pytest.fixture
     def client(self):
@@ -20,8 +29,8 @@ class TestOpenAIEmbeddingClient:
         """Mock OpenAI API response"""
         response = Mock()
         response.data = [
-            Mock(embedding=[0.1, 0.2, 0.3]),
-            Mock(embedding=[0.4, 0.5, 0.6])
+            Mock(embedding=encode([0.1, 0.2, 0.3])),
+            Mock(embedding=encode([0.4, 0.5, 0.6]))
         ]
         return response
 
@@ -57,20 +66,21 @@ class TestOpenAIEmbeddingClient:
             
             mock_create.assert_called_once_with(
                 input=["Hello world", "Testing embeddings"],
-                model="text-embedding-3-small"
+                model="text-embedding-3-small",
+                encoding_format="base64"
             )
             
             assert len(result) == 2
-            assert result[0] == [0.1, 0.2, 0.3]
-            assert result[1] == [0.4, 0.5, 0.6]
+            assert result[0].tolist() == pytest.approx([0.1, 0.2, 0.3])
+            assert result[1].tolist() == pytest.approx([0.4, 0.5, 0.6])
     
     @pytest.mark.asyncio
     async def test_generate_embeddings_with_empty_texts_mixed(self, client):
         texts = ["Hello world", "", "Testing embeddings", "   "]
         mock_response = Mock()
         mock_response.data = [
-            Mock(embedding=[0.1, 0.2, 0.3]),
-            Mock(embedding=[0.4, 0.5, 0.6])
+            Mock(embedding=encode([0.1, 0.2, 0.3])),
+            Mock(embedding=encode([0.4, 0.5, 0.6]))
         ]
         
         with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
@@ -81,14 +91,15 @@ class TestOpenAIEmbeddingClient:
             # Only non-empty texts should be sent to API
             mock_create.assert_called_once_with(
                 input=["Hello world", "Testing embeddings"],
-                model="text-embedding-3-small"
+                model="text-embedding-3-small",
+                encoding_format="base64"
             )
             
             assert len(result) == 4
-            assert result[0] == [0.1, 0.2, 0.3]  # First text
-            assert result[1] == []  # Empty text
-            assert result[2] == [0.4, 0.5, 0.6]  # Third text
-            assert result[3] == []  # Empty text
+            assert result[0].tolist() == pytest.approx([0.1, 0.2, 0.3])  # First text
+            assert result[1].size == 0  # Empty text
+            assert result[2].tolist() == pytest.approx([0.4, 0.5, 0.6])  # Third text
+            assert result[3].size == 0  # Empty text
     
     @pytest.mark.asyncio
     async def test_generate_embeddings_unexpected_response_length(self, client):
@@ -96,7 +107,7 @@ class TestOpenAIEmbeddingClient:
         
         # Response with wrong number of embeddings
         mock_response = Mock()
-        mock_response.data = [Mock(embedding=[0.1, 0.2, 0.3])]  # Only 1 embedding for 2 texts
+        mock_response.data = [Mock(embedding=encode([0.1, 0.2, 0.3]))]  # Only 1 embedding for 2 texts
         
         with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -141,14 +152,20 @@ class TestOpenAIEmbeddingClient:
     async def test_generate_embeddings_rate_limit_error(self, client):
         texts = ["Hello world"]
         
-        with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
+        with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create, \
+                patch("enrichment.infrastructure.embeddings.openai.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
             mock_create.side_effect = openai.RateLimitError(
-                message="Rate limit exceeded", response=Mock(), body=None
+                message="Rate limit exceeded", response=Mock(headers={}), body=None
             )
             
             with pytest.raises(EmbeddingConnectionError) as exc_info:
                 await client.generate_embeddings(texts)
             
+            # max_retries만큼 backoff 후 재시도한 뒤 실패
+            assert mock_create.call_count == client.max_retries + 1
+            assert mock_sleep.await_count == client.max_retries
+            assert client.limiter.limit == 1
+            
             assert "Rate limit exceeded" in str(exc_info.value)
             assert exc_info.value.service_name == "OpenAI"
     
@@ -198,9 +215,9 @@ class TestOpenAIEmbeddingClient:
         # Create response with correct number of embeddings (3)
         mock_response = Mock()
         mock_response.data = [
-            Mock(embedding=[0.1, 0.2, 0.3]),
-            Mock(embedding=[0.4, 0.5, 0.6]),
-            Mock(embedding=[0.7, 0.8, 0.9])
+            Mock(embedding=encode([0.1, 0.2, 0.3])),
+            Mock(embedding=encode([0.4, 0.5, 0.6])),
+            Mock(embedding=encode([0.7, 0.8, 0.9]))
         ]
         
         with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
@@ -211,7 +228,8 @@ class TestOpenAIEmbeddingClient:
             # Check that texts are stripped before sending to API
             mock_create.assert_called_once_with(
                 input=["Hello world", "Testing", "Normal text"],
-                model="text-embedding-3-small"
+                model="text-embedding-3-small",
+                encoding_format="base64"
             )
     
     @pytest.mark.asyncio
@@ -221,7 +239,7 @@ class TestOpenAIEmbeddingClient:
         
         # Create mock response with 100 embeddings
         mock_response = Mock()
-        mock_response.data = [Mock(embedding=[0.1, 0.2, 0.3]) for _ in range(100)]
+        mock_response.data = [Mock(embedding=encode([0.1, 0.2, 0.3])) for _ in range(100)]
         
         with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -229,7 +247,7 @@ class TestOpenAIEmbeddingClient:
             result = await client.generate_embeddings(texts)
             
             assert len(result) == 100
-            assert all(embedding == [0.1, 0.2, 0.3] for embedding in result)
+            assert all(embedding.tolist() == pytest.approx([0.1, 0.2, 0.3]) for embedding in result)
     
     @pytest.mark.asyncio
     async def test_generate_embeddings_single_text(self, client):
@@ -237,7 +255,7 @@ class TestOpenAIEmbeddingClient:
         texts = ["Single text"]
         
         mock_response = Mock()
-        mock_response.data = [Mock(embedding=[0.1, 0.2, 0.3])]
+        mock_response.data = [Mock(embedding=encode([0.1, 0.2, 0.3]))]
         
         with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -245,7 +263,7 @@ class TestOpenAIEmbeddingClient:
             result = await client.generate_embeddings(texts)
             
             assert len(result) == 1
-            assert result[0] == [0.1, 0.2, 0.3]
+            assert result[0].tolist() == pytest.approx([0.1, 0.2, 0.3])
     
     @pytest.mark.asyncio
     async def test_generate_embeddings_unicode_text(self, client):
@@ -255,9 +273,9 @@ class TestOpenAIEmbeddingClient:
         # Create response with correct number of embeddings (3)
         mock_response = Mock()
         mock_response.data = [
-            Mock(embedding=[0.1, 0.2, 0.3]),
-            Mock(embedding=[0.4, 0.5, 0.6]),
-            Mock(embedding=[0.7, 0.8, 0.9])
+            Mock(embedding=encode([0.1, 0.2, 0.3])),
+            Mock(embedding=encode([0.4, 0.5, 0.6])),
+            Mock(embedding=encode([0.7, 0.8, 0.9]))
         ]
         
         with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
@@ -267,7 +285,95 @@ class TestOpenAIEmbeddingClient:
             
             mock_create.assert_called_once_with(
                 input=texts,
-                model="text-embedding-3-small"
+                model="text-embedding-3-small",
+                encoding_format="base64"
             )
             
-            assert len(result) == 3
\ No newline at end of file
+            assert len(result) == 3
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_retries_after_rate_limit(self, client):
+        response = Mock(data=[Mock(embedding=encode([0.1, 0.2, 0.3]))])
+        rate_limit = openai.RateLimitError(
+            message="Rate limit exceeded", response=Mock(headers={"retry-after": "2"}), body=None
+        )
+
+        with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create, \
+                patch("enrichment.infrastructure.embeddings.openai.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_create.side_effect = [rate_limit, response]
+
+            result = await client.generate_embeddings(["Hello world"])
+
+            assert [r.tolist() for r in result] == [pytest.approx([0.1, 0.2, 0.3])]
+            # retry-after 헤더를 우선
+            mock_sleep.assert_awaited_once_with(2.0)
+            # 성공하면 줄어든 동시성 한도를 회복
+            assert client.limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_splits_batches_in_order(self):
+        client = OpenAIEmbeddingClient(api_key="test-key", max_batch_tokens=6, max_batch_size=2)
+        texts = ["a b", "", "c d e", "f", "g h i j k", "  ", "l"]
+
+        async def embed(input, model, encoding_format):
+            # 먼저 보낸 배치가 늦게 끝나도 입력 순서대로 재조립
+            await asyncio.sleep(0.01 if "a b" in input else 0)
+            return Mock(data=[Mock(embedding=encode([float(len(text))])) for text in input])
+
+        with patch.object(client.client.embeddings, 'create', side_effect=embed) as mock_create:
+            result = await client.generate_embeddings(texts)
+
+        batches = [call.kwargs["input"] for call in mock_create.call_args_list]
+        assert sorted(batches) == sorted([["a b", "c d e"], ["f", "g h i j k"], ["l"]])
+        assert [r.tolist() for r in result] == [[3.0], [], [5.0], [1.0], [9.0], [], [1.0]]
+
+    def test_split_batches_single_batch_without_tokenizing(self, client):
+        with patch.object(client, "_count_tokens") as mock_count:
+            assert client._split_batches(["Hello world"] * 10) == [(0, 10)]
+        mock_count.assert_not_called()
+
+    def test_split_batches_oversized_text_gets_own_batch(self):
+        client = OpenAIEmbeddingClient(api_key="test-key", max_batch_tokens=3)
+        assert client._split_batches(["a", "b c d e f", "g"]) == [(0, 1), (1, 2), (2, 3)]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_bounded_concurrency(self):
+        client = OpenAIEmbeddingClient(api_key="test-key", max_batch_size=1, max_concurrency=2)
+        in_flight, peak = 0, 0
+
+        async def embed(input, model, encoding_format):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(data=[Mock(embedding=encode([0.1]))])
+
+        with patch.object(client.client.embeddings, 'create', side_effect=embed) as mock_create:
+            result = await client.generate_embeddings([f"text {i}" for i in range(6)])
+
+        assert mock_create.call_count == 6
+        assert peak == 2
+        assert [r.tolist() for r in result] == [pytest.approx([0.1])] * 6
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_decodes_base64_to_float32(self, client):
+        vector = np.random.default_rng(0).random(1536, dtype=np.float32)
+
+        with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = Mock(data=[Mock(embedding=encode(vector))])
+
+            result = await client.generate_embeddings(["Hello world"])
+
+        assert result[0].dtype == np.float32
+        np.testing.assert_array_equal(result[0], vector)
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_accepts_float_list_response(self, client):
+        with patch.object(client.client.embeddings, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = Mock(data=[Mock(embedding=[0.5, 0.25])])
+
+            result = await client.generate_embeddings(["Hello world"])
+
+        assert result[0].dtype == np.float32
+        assert result[0].tolist() == [0.5, 0.25]
@@ -1,20 +1,33 @@
 """Test cases for Company repository"""
+import asyncio
 import pytest
 from datetime import date
 from unittest.mock import AsyncMock, Mock, MagicMock
 from uuid import UUID, uuid4
 from collections import defaultdict
 
+from db.db import ReadReplica, ReadRouter, ReadSessionManager
 from enrichment.infrastructure.repositories.company_repository import CompanyRepository, GetCompaniesMetricsSnapshotsPram
 from enrichment.domain.aggregates.company_aggregate import CompanyAggregate
 from enrichment.domain.entities.company import Company
 from enrichment.domain.entities.company_alias import CompanyAlias
+from enrichment.domain.entities.company_metrics_rollup import CompanyMetricsRollup
 from enrichment.domain.entities.company_metrics_snapshot import CompanyMetricsSnapshot
-from enrichment.domain.specs.company_spec import CompanySearchParam
-from enrichment.domain.vos.metrics import MonthlyMetrics
+from enrichment.domain.specs.company_spec import CompanySearchParam, MetricsWindowParam
+from enrichment.domain.vos.metrics import (
+    Finance,
+    Investment,
+    MetricFamily,
+    MonthlyMetrics,
+    Organization,
+)
 from enrichment.infrastructure.exceptions.repository_exception import DuplicatedCompanyError
 from enrichment.infrastructure.orm.company import Company as CompanyOrm
 from enrichment.infrastructure.orm.company_alias import CompanyAlias as CompanyAliasOrm
+from enrichment.infrastructure.orm.company_finance import CompanyFinance as CompanyFinanceOrm
+from enrichment.infrastructure.orm.company_headcount import CompanyHeadcount as CompanyHeadcountOrm
+from enrichment.infrastructure.orm.company_investment import CompanyInvestment as CompanyInvestmentOrm
+from enrichment.infrastructure.orm.company_metrics_rollup import CompanyMetricsRollup as CompanyMetricsRollupOrm
 from enrichment.infrastructure.orm.company_snapshot import CompanyMetricsSnapshot as CompanyMetricsSnapshotOrm
 
 
@@ -24,8 +37,13 @@ class TestCompanyRepository:
         return AsyncMock()
     
     @pytest.fixture
-    def mock_read_session_manager(self):
-        return AsyncMock()
+    def mock_read_session_maker(self):
+        return Mock()
+
+    @pytest.fixture
+    def mock_read_session_manager(self, mock_read_session_maker):
+        # 동시 조회용 세션도 모두 mock_read_session_maker가 만든 세션을 사용
+        return ReadSessionManager(session_maker=mock_read_session_maker)
     
     @pytest.fixture
     def repository(self, mock_write_session_manager, mock_read_session_manager):
@@ -103,7 +121,49 @@ class TestCompanyRepository:
         
         # Verify session.add was called for company, aliases, and snapshots
         assert mock_session.add.call_count == 4  # 1 company + 2 aliases + 1 snapshot
+
+    @pytest.mark.asyncio
+    async def test_save_with_rollups(self, repository, sample_company_aggregate, mock_write_session_manager):
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+        mock_write_session_manager.__aenter__.return_value = mock_session
+
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        sample_company_aggregate.company_metrics_rollups = sample_company_aggregate.build_metrics_rollups()
+
+        await repository.save(sample_company_aggregate)
+
+        # 1 company + 2 aliases + 1 snapshot + 1 rollup
+        assert mock_session.add.call_count == 5
+        rollup_orm = mock_session.add.call_args_list[-1].args[0]
+        assert isinstance(rollup_orm, CompanyMetricsRollupOrm)
+        assert rollup_orm.reference_date == date(2023, 12, 31)
     
+    @pytest.mark.asyncio
+    async def test_save_pins_company_reads_to_primary(self, sample_company_aggregate, mock_write_session_manager):
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+        mock_write_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        router = ReadRouter(Mock(), [ReadReplica("replica", Mock())], pin_seconds=10)
+        repository = CompanyRepository(
+            write_session_manager=mock_write_session_manager,
+            read_session_manager=ReadSessionManager(router=router),
+        )
+
+        await repository.save(sample_company_aggregate)
+
+        # 저장 직후 같은 회사의 ID/별칭 조회는 복제 지연과 무관하게 primary에서 읽음
+        assert await router.choose([sample_company_aggregate.company.id]) is router.primary
+        assert await router.choose(["Test Company"]) is router.primary
+        assert (await router.choose(["다른회사"])).name == "replica"
+
     @pytest.mark.asyncio
     async def test_save_duplicate_company_error(self, repository, sample_company_aggregate, mock_write_session_manager):
         # Mock session and execute method
@@ -125,10 +185,10 @@ class TestCompanyRepository:
         assert result == []
     
     @pytest.mark.asyncio
-    async def test_get_companies_success(self, repository, mock_read_session_manager):
+    async def test_get_companies_success(self, repository, mock_read_session_maker):
         # Mock session
         mock_session = AsyncMock()
-        mock_read_session_manager.__aenter__.return_value = mock_session
+        mock_read_session_maker.return_value = mock_session
         
         company_id = UUID("12345678-1234-5678-9abc-123456789012")
         
@@ -197,10 +257,10 @@ class TestCompanyRepository:
         assert len(aggregate.company_metrics_snapshots) == 1
     
     @pytest.mark.asyncio
-    async def test_get_companies_no_matching_aliases(self, repository, mock_read_session_manager):
+    async def test_get_companies_no_matching_aliases(self, repository, mock_read_session_maker):
         # Mock session
         mock_session = AsyncMock()
-        mock_read_session_manager.__aenter__.return_value = mock_session
+        mock_read_session_maker.return_value = mock_session
         
         # Mock alias lookup with no results
         mock_aliases_result = Mock()
@@ -328,6 +388,303 @@ class TestCompanyRepository:
         assert len(result) == 1
         assert company_id in result
     
+    @pytest.mark.asyncio
+    async def test_save_dual_writes_metric_tables(self, repository, sample_company_aggregate, mock_write_session_manager):
+        mock_session = AsyncMock()
+        mock_session.add = MagicMock()
+        mock_write_session_manager.__aenter__.return_value = mock_session
+
+        mock_result = Mock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        company_id = sample_company_aggregate.company.id
+        sample_company_aggregate.company_metrics_snapshots = [
+            CompanyMetricsSnapshot(
+                company_id=company_id,
+                reference_date=date(2023, 12, 1),
+                metrics=MonthlyMetrics(
+                    mau=[],
+                    patents=[],
+                    finance=[Finance(year=2023, profit=100, operatingProfit=10)],
+                    investments=[
+                        Investment(level="Seed", date=date(2023, 12, 5), amount=1000, investors=["VC"])
+                    ],
+                    organizations=[
+                        Organization(name="조직", date=date(2023, 12, 1), people_count=30, growth_rate=1.5)
+                    ],
+                ),
+            )
+        ]
+
+        await repository.save(sample_company_aggregate)
+
+        added = [call.args[0] for call in mock_session.add.call_args_list]
+        # 1 company + 2 aliases + 1 snapshot + 3 metric rows
+        assert len(added) == 7
+        finance_orm = next(o for o in added if isinstance(o, CompanyFinanceOrm))
+        assert finance_orm.operating_profit == 10
+        assert finance_orm.net_profit is None
+        investment_orm = next(o for o in added if isinstance(o, CompanyInvestmentOrm))
+        assert investment_orm.investors == ["VC"]
+        headcount_orm = next(o for o in added if isinstance(o, CompanyHeadcountOrm))
+        assert headcount_orm.reference_date == date(2023, 12, 1)
+        assert headcount_orm.people_count == 30
+
+    @pytest.mark.asyncio
+    async def test_get_companies_with_metric_families(self, repository, mock_read_session_maker):
+        mock_session = AsyncMock()
+        mock_read_session_maker.return_value = mock_session
+        company_id = uuid4()
+
+        alias_orm = CompanyAliasOrm(company_id=company_id, alias="테스트회사", alias_type="company_name", id=1)
+        company_orm = CompanyOrm(id=company_id, external_id="test-ext", name="테스트회사", employee_count=10)
+        headcount_orms = [
+            CompanyHeadcountOrm(
+                id=2, company_id=company_id, reference_date=date(2023, 2, 1),
+                name="조직", date=date(2023, 2, 1), people_count=20, growth_rate=0.0,
+            ),
+            CompanyHeadcountOrm(
+                id=1, company_id=company_id, reference_date=date(2023, 1, 1),
+                name="조직", date=date(2023, 1, 1), people_count=10, growth_rate=0.0,
+            ),
+        ]
+
+        alias_result = Mock()
+        alias_result.scalars().all.return_value = [alias_orm]
+        company_result = Mock()
+        company_result.scalars().all.return_value = [company_orm]
+        headcount_result = Mock()
+        headcount_result.scalars().all.return_value = headcount_orms
+        mock_session.execute.side_effect = [alias_result, company_result, headcount_result]
+
+        result = await repository.get_companies(
+            [CompanySearchParam(alias="테스트회사", start_date=date(2023, 1, 1), end_date=date(2023, 12, 31))],
+            metric_families=[MetricFamily.ORGANIZATIONS],
+        )
+
+        # 별칭, 회사, 요청한 계열 1개 테이블만 조회 (JSONB 스냅샷 미조회)
+        assert mock_session.execute.call_count == 3
+        snapshots = result[0].company_metrics_snapshots
+        assert [s.reference_date for s in snapshots] == [date(2023, 2, 1), date(2023, 1, 1)]
+        assert snapshots[0].metrics.organizations[0].people_count == 20
+        assert snapshots[0].metrics.finance == []
+        assert result[0].calculate_people_metrics() == (20, 100.0)
+
+    @pytest.mark.asyncio
+    async def test_get_companies_runs_company_and_snapshot_queries_concurrently(self, repository, mock_read_session_maker):
+        company_id = uuid4()
+        alias_result = Mock()
+        alias_result.scalars().all.return_value = [
+            CompanyAliasOrm(company_id=company_id, alias="테스트회사", alias_type="company_name", id=1)
+        ]
+        company_result = Mock()
+        company_result.scalars().all.return_value = [
+            CompanyOrm(id=company_id, external_id="test-ext", name="테스트회사")
+        ]
+        snapshot_result = Mock()
+        snapshot_result.scalars().all.return_value = []
+
+        in_flight = 0
+        max_in_flight = 0
+        results = iter([alias_result, company_result, snapshot_result])
+
+        async def execute(query):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return next(results)
+
+        sessions = []
+
+        def make_session():
+            session = AsyncMock()
+            session.execute.side_effect = execute
+            sessions.append(session)
+            return session
+
+        mock_read_session_maker.side_effect = make_session
+
+        result = await repository.get_companies(
+            [CompanySearchParam(alias="테스트회사", start_date=date(2023, 1, 1))]
+        )
+
+        assert [aggregate.company.id for aggregate in result] == [company_id]
+        # 별칭 조회 1개 + 회사/스냅샷 조회를 각자의 세션에서 동시에 실행
+        assert len(sessions) == 3
+        assert max_in_flight == 2
+        for session in sessions:
+            session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_companies_single_statement(self, mock_write_session_manager, mock_read_session_manager, mock_read_session_maker):
+        repository = CompanyRepository(
+            write_session_manager=mock_write_session_manager,
+            read_session_manager=mock_read_session_manager,
+            single_statement=True,
+        )
+        mock_session = AsyncMock()
+        mock_read_session_maker.return_value = mock_session
+        company_id = uuid4()
+
+        company_orm = CompanyOrm(id=company_id, external_id="test-ext", name="테스트회사", employee_count=10)
+        metrics = {"mau": [], "patents": [], "finance": [], "investments": [], "organizations": []}
+        row = Mock(
+            Company=company_orm,
+            aliases=[{"id": 1, "alias": "테스트회사", "alias_type": "company_name"}],
+            snapshots=[
+                {"id": 2, "reference_date": "2023-02-01", "metrics": metrics},
+                {"id": 1, "reference_date": "2023-01-01", "metrics": metrics},
+            ],
+        )
+        mock_result = Mock()
+        mock_result.all.return_value = [row]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_companies(
+            [CompanySearchParam(alias="테스트회사", start_date=date(2023, 1, 1), end_date=None)]
+        )
+
+        # 별칭/회사/스냅샷을 한 번의 왕복으로 조회
+        mock_session.execute.assert_called_once()
+        assert len(result) == 1
+        assert result[0].company.id == company_id
+        assert result[0].company_aliases[0].alias == "테스트회사"
+        assert [s.reference_date for s in result[0].company_metrics_snapshots] == [
+            date(2023, 2, 1),
+            date(2023, 1, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_companies_single_statement_no_match(self, mock_write_session_manager, mock_read_session_manager, mock_read_session_maker):
+        repository = CompanyRepository(
+            write_session_manager=mock_write_session_manager,
+            read_session_manager=mock_read_session_manager,
+            single_statement=True,
+        )
+        mock_session = AsyncMock()
+        mock_read_session_maker.return_value = mock_session
+        mock_result = Mock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_companies(
+            [CompanySearchParam(alias="없는회사", start_date=date(2023, 1, 1))]
+        )
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_windows_empty_params(self, repository):
+        result = await repository.get_metrics_windows([])
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_windows_success(self, repository, mock_read_session_maker):
+        mock_session = AsyncMock()
+        mock_read_session_maker.return_value = mock_session
+        company_id = uuid4()
+
+        before_orm = CompanyMetricsRollupOrm(
+            id=1,
+            company_id=company_id,
+            reference_date=date(2022, 12, 1),
+            cumulative_investment_amount=1000,
+            cumulative_investment_count=1,
+            cumulative_patent_count=1,
+            people_count=10,
+            profit=100,
+            net_profit=10,
+            operating_profit=5,
+        )
+        last_orm = CompanyMetricsRollupOrm(
+            id=2,
+            company_id=company_id,
+            reference_date=date(2023, 12, 1),
+            cumulative_investment_amount=4000,
+            cumulative_investment_count=3,
+            cumulative_patent_count=4,
+            people_count=20,
+            profit=300,
+            net_profit=30,
+            operating_profit=15,
+        )
+        # 결과 순서가 달라도 idx 기준으로 params 순서를 유지해야 한다
+        rows = [
+            Mock(idx=1, company_id=company_id, start_date=date(2024, 1, 1),
+                 end_date=date(2024, 6, 30), before=last_orm, last=None),
+            Mock(idx=0, company_id=company_id, start_date=date(2023, 1, 1),
+                 end_date=date(2023, 12, 31), before=before_orm, last=last_orm),
+        ]
+        mock_result = Mock()
+        mock_result.all.return_value = rows
+        mock_session.execute.return_value = mock_result
+
+        params = [
+            MetricsWindowParam(company_id=company_id, start_date=date(2023, 1, 1), end_date=date(2023, 12, 31)),
+            MetricsWindowParam(company_id=company_id, start_date=date(2024, 1, 1), end_date=date(2024, 6, 30)),
+        ]
+
+        windows = await repository.get_metrics_windows(params)
+
+        mock_session.execute.assert_called_once()
+        assert len(windows) == 2
+        assert windows[0].start_date == date(2023, 1, 1)
+        assert windows[0].investment_amount == 3000
+        assert windows[0].patent_count == 3
+        assert windows[0].people_growth_rate == 100.0
+        assert windows[1].investment_amount == 0
+        assert windows[1].people_count == 20
+
+    def test_create_rollup_from_orm(self, repository):
+        company_id = uuid4()
+        rollup_orm = CompanyMetricsRollupOrm(
+            id=7,
+            company_id=company_id,
+            reference_date=date(2023, 12, 1),
+            cumulative_investment_amount=100,
+            cumulative_investment_count=1,
+            cumulative_patent_count=2,
+            people_count=3,
+            profit=4,
+            net_profit=5,
+            operating_profit=6,
+        )
+
+        rollup = repository._create_rollup_from(rollup_orm)
+
+        assert isinstance(rollup, CompanyMetricsRollup)
+        assert rollup.id == 7
+        assert rollup.cumulative_patent_count == 2
+        assert rollup.operating_profit == 6
+
+    def test_window_conditions_sql_is_constant(self, repository):
+        from sqlalchemy import select
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        def compile_for(window_count):
+            params = [
+                GetCompaniesMetricsSnapshotsPram(
+                    company_id=uuid4(), start_date=date(2023, 1, 1), end_date=None
+                )
+                for _ in range(window_count)
+            ]
+            query = select(CompanyMetricsSnapshotOrm).where(
+                repository._window_conditions(CompanyMetricsSnapshotOrm, params)
+            )
+            return query.compile(dialect=asyncpg.dialect())
+
+        single, many = compile_for(1), compile_for(50)
+
+        # 구간 수와 무관하게 SQL 문과 파라미터 개수가 동일해야 prepared statement가 재사용된다
+        assert str(single) == str(many)
+        assert " OR " not in str(many)
+        assert "unnest" in str(many)
+        assert len(many.params["window_company_ids"]) == 50
+        assert many.params["window_end_dates"][0] == date.today()
+
     def test_create_company_aggregate(self, repository):
         company_id = uuid4()
         
@@ -480,10 +837,10 @@ class TestCompanyRepository:
         assert snapshot.id == 1
     
     @pytest.mark.asyncio
-    async def test_get_companies_multiple_params_and_results(self, repository, mock_read_session_manager):
+    async def test_get_companies_multiple_params_and_results(self, repository, mock_read_session_maker):
         """Test with multiple search parameters and results"""
         mock_session = AsyncMock()
-        mock_read_session_manager.__aenter__.return_value = mock_session
+        mock_read_session_maker.return_value = mock_session
         
         company_id1 = UUID("12345678-1234-5678-9abc-123456789012")
         company_id2 = UUID("87654321-4321-8765-cba9-876543210987")
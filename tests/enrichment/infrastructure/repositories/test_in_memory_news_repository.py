@@ -0,0 +1,301 @@
+"""Test cases for in-memory News repository"""
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from enrichment.domain.specs.news_serch_spec import NewsSearchContext, SearchQuery
+from enrichment.infrastructure.repositories import in_memory_news_repository
+from enrichment.infrastructure.repositories.in_memory_news_repository import (
+    METADATA_STATEMENT,
+    VECTOR_STATEMENT,
+    InMemoryNewsRepository,
+)
+
+
+def unit(*weights):
+    """앞쪽 차원에 weights를 넣은 1536차원 벡터"""
+    vector = np.zeros(1536, dtype=np.float32)
+    vector[: len(weights)] = weights
+    return vector
+
+
+def chunk_row(id, company_id, created_at, vector):
+    return Mock(
+        id=id,
+        company_id=company_id,
+        title=f"뉴스{id}",
+        contents=f"내용{id}",
+        link=f"https://news.local/{id}",
+        created_at=created_at,
+        vector=vector,
+    )
+
+
+def result_of(rows):
+    result = Mock()
+    result.fetchall.return_value = rows
+    return result
+
+
+class TestInMemoryNewsRepository:
+    @pytest.fixture
+    def mock_session(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def session_maker(self, mock_session):
+        return Mock(return_value=mock_session)
+
+    @pytest.fixture
+    def repository(self, session_maker):
+        return InMemoryNewsRepository(session_maker=session_maker)
+
+    @pytest.fixture
+    def company_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def rows(self, company_id):
+        return [
+            chunk_row(1, company_id, date(2021, 3, 1), unit(1, 0)),
+            chunk_row(2, company_id, date(2021, 6, 1), unit(1, 1)),
+            chunk_row(3, company_id, date(2021, 9, 1), unit(0, 1)),
+            chunk_row(4, company_id, date(2019, 1, 1), unit(1, 0)),  # 재직 전
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_by_cosine_within_tenure(self, repository, mock_session, company_id, rows):
+        mock_session.execute.return_value = result_of(rows)
+        context = NewsSearchContext(
+            queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1), date(2021, 12, 31))],
+            limit_per_query=2,
+            similarity_threshold=0.5,
+        )
+
+        result = await repository.search(context)
+
+        assert [chunk.id for chunk in result[company_id]] == [1, 2]
+        assert result[company_id][0].similarity == pytest.approx(1.0)
+        assert result[company_id][1].similarity == pytest.approx(np.sqrt(0.5))
+        mock_session.execute.assert_called_once()
+        mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_search_uses_cached_index(self, repository, mock_session, company_id, rows):
+        mock_session.execute.return_value = result_of(rows)
+        context = NewsSearchContext(
+            queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1))],
+            similarity_threshold=0.0,
+        )
+
+        await repository.search(context)
+        await repository.search(context)
+
+        assert mock_session.execute.call_count == 1
+        assert company_id in repository
+
+    @pytest.mark.asyncio
+    async def test_search_merges_queries_of_same_company(self, repository, mock_session, company_id, rows):
+        mock_session.execute.return_value = result_of(rows)
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1), date(2021, 4, 1)),
+                SearchQuery(company_id, list(unit(0, 1)), date(2021, 5, 1)),
+            ],
+            limit_per_query=10,
+            similarity_threshold=0.5,
+        )
+
+        result = await repository.search(context)
+
+        # 청크마다 여러 쿼리 중 최고 유사도 하나로 중복 없이 반환
+        assert [chunk.id for chunk in result[company_id]] == [1, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_search_per_query(self, repository, mock_session, company_id, rows):
+        mock_session.execute.return_value = result_of(rows)
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1)),
+                SearchQuery(company_id, list(unit(0, 1)), date(2021, 1, 1)),
+            ],
+            limit_per_query=1,
+            similarity_threshold=0.0,
+        )
+
+        result = await repository.search_per_query(context)
+
+        assert [[chunk.id for chunk in chunks] for chunks in result] == [[1], [3]]
+
+    @pytest.mark.asyncio
+    async def test_search_company_without_news(self, repository, mock_session):
+        mock_session.execute.return_value = result_of([])
+        company_id = uuid4()
+        context = NewsSearchContext(queries=[SearchQuery(company_id, list(unit(1)), date(2021, 1, 1))])
+
+        assert await repository.search(context) == {}
+        assert await repository.search_per_query(context) == [[]]
+        assert mock_session.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_empty_queries(self, repository, mock_session):
+        assert await repository.search(NewsSearchContext(queries=[])) == {}
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_company(self, repository, mock_session):
+        company_a, company_b = uuid4(), uuid4()
+        mock_session.execute.side_effect = [
+            result_of([chunk_row(1, company_a, date(2021, 1, 1), unit(1))]),
+            result_of([chunk_row(2, company_b, date(2021, 1, 1), unit(1))]),
+        ]
+        repository.memory_budget_bytes = 1
+
+        await repository.preload([company_a])
+        await repository.search(
+            NewsSearchContext(queries=[SearchQuery(company_b, list(unit(1)), date(2021, 1, 1))])
+        )
+
+        # 예산을 넘어도 현재 요청에 쓰이는 회사는 유지
+        assert company_a not in repository
+        assert company_b in repository
+
+    @pytest.mark.asyncio
+    async def test_preload_stops_at_memory_budget(self, repository, mock_session, monkeypatch):
+        monkeypatch.setattr(in_memory_news_repository, "PRELOAD_BATCH_SIZE", 2)
+        company_ids = [uuid4() for _ in range(6)]
+        mock_session.execute.side_effect = [
+            result_of([chunk_row(i, company_id, date(2021, 1, 1), unit(1)) for i, company_id in enumerate(batch)])
+            for batch in (company_ids[0:2], company_ids[2:4], company_ids[4:6])
+        ]
+        index_bytes = 1536 * 4 + 8 + 8 + len("뉴스0") + len("내용0") + len("https://news.local/0")
+        repository.memory_budget_bytes = index_bytes * 3
+
+        await repository.preload(company_ids)
+
+        # 두 번째 배치에서 예산에 도달하면 이후 회사는 적재하지 않음
+        assert repository.memory_bytes <= repository.memory_budget_bytes
+        assert mock_session.execute.call_count == 2
+        assert [company_id in repository for company_id in company_ids] == [False, True, True, True, False, False]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads_company_on_next_search(self, repository, mock_session, company_id, rows):
+        mock_session.execute.return_value = result_of(rows)
+        context = NewsSearchContext(queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1))])
+
+        await repository.search(context)
+        await repository.invalidate([company_id, uuid4()])
+
+        assert company_id not in repository
+        assert repository.memory_bytes == 0
+        await repository.search(context)
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cold_load_does_not_block_cached_company(self, repository, mock_session, company_id, rows):
+        other_id = uuid4()
+        release = asyncio.Event()
+
+        async def execute(statement, params):
+            if params["company_ids"] == [other_id]:
+                await release.wait()
+                return result_of([chunk_row(9, other_id, date(2021, 3, 1), unit(1, 0))])
+            return result_of(rows)
+
+        mock_session.execute.side_effect = execute
+        cached = NewsSearchContext(queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1))])
+        cold = NewsSearchContext(queries=[SearchQuery(other_id, list(unit(1, 0)), date(2021, 1, 1))])
+        await repository.search(cached)
+
+        cold_search = asyncio.create_task(repository.search(cold))
+        await asyncio.sleep(0)
+        # 다른 회사 적재가 끝나지 않아도 적재된 회사 검색은 바로 끝남
+        result = await asyncio.wait_for(repository.search(cached), timeout=1)
+        assert [c.id for c in result[company_id]] == [1, 2]
+        assert not cold_search.done()
+
+        release.set()
+        assert [c.id for c in (await cold_search)[other_id]] == [9]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_one_load(self, repository, mock_session, company_id, rows):
+        release = asyncio.Event()
+
+        async def execute(statement, params):
+            await release.wait()
+            return result_of(rows)
+
+        mock_session.execute.side_effect = execute
+        context = NewsSearchContext(queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1))])
+
+        searches = [asyncio.create_task(repository.search(context)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*searches)
+
+        assert mock_session.execute.call_count == 1
+        assert all([c.id for c in result[company_id]] == [1, 2] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_discards_loaded_index(self, repository, mock_session, company_id, rows):
+        release = asyncio.Event()
+
+        async def execute(statement, params):
+            await release.wait()
+            return result_of(rows)
+
+        mock_session.execute.side_effect = execute
+        context = NewsSearchContext(queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1))])
+
+        search = asyncio.create_task(repository.search(context))
+        await asyncio.sleep(0)
+        await repository.invalidate([company_id])
+        release.set()
+        await search
+
+        # 무효화 이전에 시작한 적재 결과는 캐시하지 않음
+        assert company_id not in repository
+        assert repository.memory_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_mmap_keeps_rows_aligned_when_chunks_change_between_reads(self, session_maker, mock_session, company_id, rows, tmp_path):
+        metadata_rows = [Mock(**{k: getattr(r, k) for k in ("id", "company_id", "title", "contents", "link", "created_at")}) for r in rows[:3]]
+        # 메타데이터 조회 뒤 청크 5가 추가되고 청크 3이 삭제됨
+        inserted = chunk_row(5, company_id, date(2021, 2, 1), unit(1, 0))
+        mock_session.execute.side_effect = [result_of(metadata_rows), result_of([rows[0], inserted, rows[1]])]
+        context = NewsSearchContext(
+            queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1), date(2021, 12, 31))],
+            limit_per_query=10,
+            similarity_threshold=0.0,
+        )
+
+        repository = InMemoryNewsRepository(session_maker=session_maker, mmap_dir=str(tmp_path))
+        result = await repository.search(context)
+
+        assert [(c.id, c.title) for c in result[company_id]] == [(1, "뉴스1"), (2, "뉴스2")]
+        assert repository._indexes[company_id].matrix.shape == (2, 1536)
+
+    @pytest.mark.asyncio
+    async def test_mmap_matrix_shared_between_instances(self, session_maker, mock_session, company_id, rows, tmp_path):
+        metadata_rows = [Mock(**{k: getattr(r, k) for k in ("id", "company_id", "title", "contents", "link", "created_at")}) for r in rows]
+        mock_session.execute.side_effect = [result_of(metadata_rows), result_of(rows), result_of(metadata_rows)]
+        context = NewsSearchContext(
+            queries=[SearchQuery(company_id, list(unit(1, 0)), date(2021, 1, 1), date(2021, 12, 31))],
+            limit_per_query=1,
+        )
+
+        first = InMemoryNewsRepository(session_maker=session_maker, mmap_dir=str(tmp_path))
+        first_result = await first.search(context)
+        second = InMemoryNewsRepository(session_maker=session_maker, mmap_dir=str(tmp_path))
+        second_result = await second.search(context)
+
+        statements = [call.args[0] for call in mock_session.execute.call_args_list]
+        # 두 번째 인스턴스는 임베딩을 다시 조회하지 않고 파일을 mmap으로 엶
+        assert statements == [METADATA_STATEMENT, VECTOR_STATEMENT, METADATA_STATEMENT]
+        assert isinstance(second._indexes[company_id].matrix, np.memmap)
+        assert [c.id for c in first_result[company_id]] == [c.id for c in second_result[company_id]] == [1]
+        assert len(list(tmp_path.glob("*.npy"))) == 1
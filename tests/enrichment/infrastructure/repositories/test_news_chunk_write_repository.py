@@ -0,0 +1,92 @@
+"""Test cases for News chunk write repository"""
+from datetime import date
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from enrichment.domain.entities.news_chunk_record import NewsChunkRecord
+from enrichment.infrastructure.repositories.news_chunk_write_repository import (
+    CREATE_STAGING_STATEMENT,
+    EXISTING_HASHES_STATEMENT,
+    INSERT_FROM_STAGING_STATEMENT,
+    STAGING_TABLE,
+    NewsChunkWriteRepository,
+)
+
+
+class TestNewsChunkWriteRepository:
+    @pytest.fixture
+    def mock_session(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_raw_connection(self, mock_session):
+        raw = AsyncMock()
+        connection = AsyncMock()
+        connection.get_raw_connection.return_value = Mock(driver_connection=raw)
+        mock_session.connection.return_value = connection
+        return raw
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        session_manager = AsyncMock()
+        session_manager.__aenter__.return_value = mock_session
+        return NewsChunkWriteRepository(session_manager=session_manager)
+
+    @pytest.fixture
+    def records(self):
+        company_id = uuid4()
+        return [
+            NewsChunkRecord(
+                company_id=company_id,
+                title="뉴스",
+                contents=f"내용{idx}",
+                link="https://news.local/1",
+                created_at=date(2021, 3, 1),
+                vector=np.full(1536, idx, dtype=np.float32),
+            )
+            for idx in range(3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_copies_into_staging_then_upserts(
+        self, repository, mock_session, mock_raw_connection, records
+    ):
+        mock_session.execute.side_effect = [Mock(), Mock(rowcount=2)]
+
+        inserted = await repository.bulk_insert(records)
+
+        assert inserted == 2
+        statements = [call.args[0] for call in mock_session.execute.call_args_list]
+        assert statements == [CREATE_STAGING_STATEMENT, INSERT_FROM_STAGING_STATEMENT]
+        mock_raw_connection.copy_records_to_table.assert_awaited_once()
+        args, kwargs = mock_raw_connection.copy_records_to_table.call_args
+        assert args == (STAGING_TABLE,)
+        assert kwargs["columns"][-1] == "content_hash"
+        assert [row[-1] for row in kwargs["records"]] == [r.content_hash for r in records]
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_empty(self, repository, mock_session):
+        assert await repository.bulk_insert([]) == 0
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_existing_hashes(self, repository, mock_session):
+        result = Mock()
+        result.scalars.return_value.all.return_value = ["a"]
+        mock_session.execute.return_value = result
+
+        assert await repository.find_existing_hashes(["a", "b"]) == {"a"}
+        mock_session.execute.assert_awaited_once_with(
+            EXISTING_HASHES_STATEMENT, {"content_hashes": ["a", "b"]}
+        )
+
+    def test_insert_statement_ignores_existing_content_hash(self):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        sql = str(INSERT_FROM_STAGING_STATEMENT.compile(dialect=asyncpg.dialect()))
+
+        assert "FROM news_chunks_staging" in sql
+        assert "ON CONFLICT (content_hash, created_at) DO NOTHING" in sql
@@ -428,4 +428,475 @@ class TestNewsRepository:
         
         assert len(result) == 1  # Only company1 has results
         assert company_id1 in result
-        assert company_id2 not in result
\ No newline at end of file
+        assert company_id2 not in result
+    @pytest.mark.asyncio
+    async def test_search_passes_queries_as_parallel_arrays(self, repository, sample_search_context, mock_session_manager):
+        """Queries are bound as parallel arrays to the module-level statement"""
+        from enrichment.infrastructure.repositories.news_repository import SEARCH_STATEMENT
+
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.search(sample_search_context)
+
+        statement, params = mock_session.execute.call_args.args
+        assert statement is SEARCH_STATEMENT
+        assert params["company_ids"] == [q.company_id for q in sample_search_context.queries]
+        assert params["query_vectors"] == [q.query_vector for q in sample_search_context.queries]
+        assert params["start_dates"] == [date(2023, 1, 1), date(2023, 6, 1)]
+        assert params["end_dates"] == [date(2023, 12, 31), None]
+        assert params["window_start"] == date(2023, 1, 1)
+        assert params["window_end"] == date.max
+        assert params["limit_per_query"] == 5
+        assert params["similarity_threshold"] == 0.7
+
+    def test_search_statement_is_fixed_shape(self):
+        """The SQL text does not depend on the number of queries"""
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import SEARCH_STATEMENT
+
+        sql = str(SEARCH_STATEMENT.compile(dialect=asyncpg.dialect()))
+
+        assert "unnest(" in sql
+        assert "VECTOR(1536)[]" in sql
+        assert "VALUES" not in sql
+
+    @pytest.mark.asyncio
+    async def test_search_per_query_exact(self, repository, sample_search_context, mock_session_manager):
+        """Exact engine ranks per query and returns results aligned with the queries"""
+        from enrichment.infrastructure.repositories.news_repository import (
+            EXACT_PER_QUERY_SEARCH_STATEMENT,
+        )
+
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        company_id2 = sample_search_context.queries[1].company_id
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            Mock(idx=2, id=3, company_id=company_id2, title="뉴스", contents="내용", similarity_score=0.9),
+        ]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.search_per_query(sample_search_context)
+
+        assert mock_session.execute.call_args.args[0] is EXACT_PER_QUERY_SEARCH_STATEMENT
+        assert len(result) == 2
+        assert result[0] == []
+        assert result[1][0].id == 3
+
+    @pytest.mark.asyncio
+    async def test_search_per_query_empty(self, repository):
+        context = NewsSearchContext(queries=[])
+        assert await repository.search_per_query(context) == []
+
+    @pytest.mark.asyncio
+    async def test_search_per_query_hnsw_sets_transaction_parameters(self, mock_session_manager, sample_search_context):
+        from enrichment.infrastructure.repositories.news_repository import (
+            HNSW_SEARCH_STATEMENT,
+            HNSW_SETTINGS_STATEMENT,
+        )
+
+        repository = NewsRepository(
+            session_manager=mock_session_manager, engine="hnsw", ef_search=200, iterative_scan="strict_order"
+        )
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        company_id1 = sample_search_context.queries[0].company_id
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            Mock(idx=1, id=1, company_id=company_id1, title="뉴스1", contents="내용1", similarity_score=0.9),
+            Mock(idx=1, id=2, company_id=company_id1, title="뉴스2", contents="내용2", similarity_score=0.8),
+        ]
+        mock_session.execute.side_effect = [Mock(), mock_result]
+
+        result = await repository.search_per_query(sample_search_context)
+
+        settings_call, search_call = mock_session.execute.call_args_list
+        assert settings_call.args[0] is HNSW_SETTINGS_STATEMENT
+        assert settings_call.args[1] == {"ef_search": "200", "iterative_scan": "strict_order"}
+        assert search_call.args[0] is HNSW_SEARCH_STATEMENT
+        assert [chunk.id for chunk in result[0]] == [1, 2]
+        assert result[1] == []
+
+    @pytest.mark.asyncio
+    async def test_search_hnsw_groups_queries_by_company(self, mock_session_manager):
+        """Two positions at the same company are searched independently, then merged"""
+        repository = NewsRepository(session_manager=mock_session_manager, engine="hnsw")
+        company_id = uuid4()
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(company_id=company_id, query_vector=[0.1] * 1536, start_date=date(2020, 1, 1)),
+                SearchQuery(company_id=company_id, query_vector=[0.2] * 1536, start_date=date(2022, 1, 1)),
+            ]
+        )
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            Mock(idx=1, id=1, company_id=company_id, title="뉴스1", contents="내용", similarity_score=0.8),
+            Mock(idx=1, id=2, company_id=company_id, title="뉴스2", contents="내용", similarity_score=0.7),
+            Mock(idx=2, id=2, company_id=company_id, title="뉴스2", contents="내용", similarity_score=0.95),
+        ]
+        mock_session.execute.side_effect = [Mock(), mock_result]
+
+        result = await repository.search(context)
+
+        assert list(result) == [company_id]
+        assert [(c.id, c.similarity) for c in result[company_id]] == [(2, 0.95), (1, 0.8)]
+
+    def test_hnsw_statement_uses_lateral_top_k(self):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import HNSW_SEARCH_STATEMENT
+
+        sql = str(HNSW_SEARCH_STATEMENT.compile(dialect=asyncpg.dialect()))
+
+        assert "JOIN LATERAL" in sql
+        assert "WITH ORDINALITY" in sql
+        assert "ORDER BY news_chunks.vector <=> q.qvec" in sql
+        assert "row_number" not in sql
+
+    @pytest.mark.asyncio
+    async def test_search_halfvec_512_truncates_query_vectors(self, mock_session_manager, sample_search_context):
+        from enrichment.infrastructure.repositories.news_repository import (
+            SEARCH_STATEMENTS,
+            NewsVectorStorage,
+        )
+
+        repository = NewsRepository(session_manager=mock_session_manager, vector_storage="halfvec_512")
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.search(sample_search_context)
+
+        statement, params = mock_session.execute.call_args.args
+        assert statement is SEARCH_STATEMENTS[NewsVectorStorage.HALFVEC_512]
+        assert [len(vector) for vector in params["query_vectors"]] == [512, 512]
+
+    @pytest.mark.parametrize("storage", ["vector", "halfvec", "halfvec_512"])
+    def test_query_vectors_bound_for_binary_codec(self, storage):
+        import numpy as np
+        from pgvector import HalfVector, Vector
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import (
+            SEARCH_STATEMENTS,
+            NewsVectorStorage,
+        )
+
+        dialect = asyncpg.dialect()
+        compiled = SEARCH_STATEMENTS[NewsVectorStorage(storage)].compile(dialect=dialect)
+        processor = compiled._bind_processors["query_vectors"]
+
+        # 텍스트('[0,1,2,3]')로 직렬화하지 않고 pgvector 객체로 감싸 바이너리 코덱에 전달
+        (value,) = processor([np.arange(4, dtype=np.float32)])
+        assert isinstance(value, Vector if storage == "vector" else HalfVector)
+        assert value.to_list() == [0.0, 1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_search_halfvec_keeps_full_dimension(self, mock_session_manager, sample_search_context):
+        from enrichment.infrastructure.repositories.news_repository import (
+            HNSW_SEARCH_STATEMENTS,
+            NewsVectorStorage,
+        )
+
+        repository = NewsRepository(session_manager=mock_session_manager, engine="hnsw", vector_storage="halfvec")
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.side_effect = [Mock(), mock_result]
+
+        await repository.search_per_query(sample_search_context)
+
+        statement, params = mock_session.execute.call_args.args
+        assert statement is HNSW_SEARCH_STATEMENTS[NewsVectorStorage.HALFVEC]
+        assert [len(vector) for vector in params["query_vectors"]] == [1536, 1536]
+
+    def test_statements_search_storage_column(self):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import (
+            HNSW_SEARCH_STATEMENTS,
+            SEARCH_STATEMENTS,
+            NewsVectorStorage,
+        )
+
+        for statements in (SEARCH_STATEMENTS, HNSW_SEARCH_STATEMENTS):
+            vector_sql = str(statements[NewsVectorStorage.VECTOR].compile(dialect=asyncpg.dialect()))
+            half_sql = str(statements[NewsVectorStorage.HALFVEC].compile(dialect=asyncpg.dialect()))
+            half_512_sql = str(statements[NewsVectorStorage.HALFVEC_512].compile(dialect=asyncpg.dialect()))
+
+            assert "news_chunks.vector <=>" in vector_sql
+            assert "news_chunks.vector_half <=>" in half_sql
+            assert "HALFVEC(1536)[]" in half_sql
+            assert "news_chunks.vector_half_512 <=>" in half_512_sql
+            assert "HALFVEC(512)[]" in half_512_sql
+
+    @pytest.mark.asyncio
+    async def test_search_binary_prefilter_reranks_full_vectors(self, mock_session_manager, sample_search_context):
+        """Binary prefilter is chosen per call and reranks with full-dimension vectors"""
+        from dataclasses import replace
+
+        from enrichment.infrastructure.repositories.news_repository import (
+            BINARY_SEARCH_STATEMENT,
+            HNSW_SETTINGS_STATEMENT,
+        )
+
+        repository = NewsRepository(
+            session_manager=mock_session_manager, ef_search=40, vector_storage="halfvec_512"
+        )
+        context = replace(sample_search_context, binary_prefilter=True, binary_oversample=10)
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        company_id1 = sample_search_context.queries[0].company_id
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            Mock(idx=1, id=1, company_id=company_id1, title="뉴스1", contents="내용1", similarity_score=0.9),
+        ]
+        mock_session.execute.side_effect = [Mock(), mock_result]
+
+        result = await repository.search(context)
+
+        settings_call, search_call = mock_session.execute.call_args_list
+        assert settings_call.args[0] is HNSW_SETTINGS_STATEMENT
+        # ef_search는 후보 수(limit_per_query * oversample) 이상으로 올라감
+        assert settings_call.args[1]["ef_search"] == str(context.limit_per_query * 10)
+        statement, params = search_call.args
+        assert statement is BINARY_SEARCH_STATEMENT
+        assert params["candidate_limit"] == context.limit_per_query * 10
+        assert [len(vector) for vector in params["query_vectors"]] == [1536, 1536]
+        assert [chunk.id for chunk in result[company_id1]] == [1]
+
+    def test_binary_statement_prefilters_by_hamming_distance(self):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import BINARY_SEARCH_STATEMENT
+
+        sql = str(BINARY_SEARCH_STATEMENT.compile(dialect=asyncpg.dialect()))
+
+        assert "ORDER BY news_chunks.vector_bit <~> binary_quantize(q.qvec)" in sql
+        assert "ORDER BY candidates.vector <=> q.qvec" in sql
+        assert "JOIN LATERAL" in sql
+
+    @pytest.mark.asyncio
+    async def test_search_window_covers_all_tenures(self, repository, mock_session_manager):
+        """window_start/window_end span every query so partitions outside the tenures are pruned"""
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(uuid4(), [0.1] * 1536, date(2019, 3, 1), date(2020, 2, 1)),
+                SearchQuery(uuid4(), [0.1] * 1536, date(2017, 5, 1), date(2018, 1, 1)),
+            ]
+        )
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await repository.search(context)
+
+        _, params = mock_session.execute.call_args.args
+        assert params["window_start"] == date(2017, 5, 1)
+        assert params["window_end"] == date(2020, 2, 1)
+
+    def test_statements_bound_partition_key_by_parameters(self):
+        """Every statement compares created_at with plain parameters so the planner can prune partitions"""
+        import re
+
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import (
+            BINARY_SEARCH_STATEMENT,
+            EXACT_PER_QUERY_SEARCH_STATEMENTS,
+            HNSW_SEARCH_STATEMENTS,
+            HYBRID_SEARCH_STATEMENTS,
+            SEARCH_STATEMENTS,
+        )
+
+        statements = [
+            BINARY_SEARCH_STATEMENT,
+            *HYBRID_SEARCH_STATEMENTS.values(),
+            *SEARCH_STATEMENTS.values(),
+            *EXACT_PER_QUERY_SEARCH_STATEMENTS.values(),
+            *HNSW_SEARCH_STATEMENTS.values(),
+        ]
+        for statement in statements:
+            compiled = statement.compile(dialect=asyncpg.dialect())
+            sql = str(compiled)
+
+            assert re.search(r"news_chunks\.created_at >= \$\d+::DATE", sql)
+            assert re.search(r"news_chunks\.created_at <= \$\d+::DATE", sql)
+            assert {"window_start", "window_end"} <= set(compiled.params)
+
+    @pytest.mark.asyncio
+    async def test_search_hybrid_passes_query_terms(self, repository, mock_session_manager):
+        """Hybrid search sends prefix tsquery terms and orders merged chunks by fused rank"""
+        from enrichment.infrastructure.repositories.news_repository import HYBRID_SEARCH_STATEMENT
+
+        company_id = uuid4()
+        context = NewsSearchContext(
+            queries=[
+                SearchQuery(company_id, [0.1] * 1536, date(2021, 1, 1), query_text="토스뱅크 결제 시스템"),
+                SearchQuery(company_id, [0.2] * 1536, date(2021, 1, 1), query_text="A"),
+            ],
+            limit_per_query=2,
+            hybrid=True,
+        )
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        # 어휘 매칭으로 올라온 청크(2)는 유사도가 낮아도 RRF 순위대로 앞에 옴
+        mock_result.fetchall.return_value = [
+            Mock(idx=1, id=2, company_id=company_id, title="토스뱅크", contents="결제", similarity_score=0.4),
+            Mock(idx=1, id=1, company_id=company_id, title="뉴스1", contents="내용1", similarity_score=0.8),
+            Mock(idx=2, id=3, company_id=company_id, title="뉴스3", contents="내용3", similarity_score=0.9),
+        ]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.search(context)
+
+        statement, params = mock_session.execute.call_args.args
+        assert statement is HYBRID_SEARCH_STATEMENT
+        assert params["query_terms"] == ["토스뱅크:* | 결제:* | 시스템:*", None]
+        assert params["candidate_limit"] == 2 * repository.hybrid_oversample
+        assert params["rrf_k"] == 60
+        assert [chunk.id for chunk in result[company_id]] == [3, 2, 1]
+
+    def test_hybrid_statement_fuses_vector_and_lexical_hits(self):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        from enrichment.infrastructure.repositories.news_repository import HYBRID_SEARCH_STATEMENT
+
+        sql = str(HYBRID_SEARCH_STATEMENT.compile(dialect=asyncpg.dialect()))
+
+        assert "news_chunks.search_tsv @@ to_tsquery('simple'::regconfig, q.terms)" in sql
+        assert "ORDER BY news_chunks.vector <=> q.qvec" in sql
+        assert "FULL OUTER JOIN" in sql
+        assert "JOIN LATERAL" in sql
+
+    def test_statements_return_vector_only_for_diversify(self):
+        """Embeddings are fetched only by the MMR statements; plain search rows skip them"""
+        from enrichment.infrastructure.repositories.news_repository import (
+            BINARY_SEARCH_STATEMENT,
+            BINARY_SEARCH_WITH_VECTOR_STATEMENT,
+            EXACT_PER_QUERY_SEARCH_STATEMENTS,
+            EXACT_PER_QUERY_SEARCH_WITH_VECTOR_STATEMENTS,
+            HNSW_SEARCH_STATEMENTS,
+            HNSW_SEARCH_WITH_VECTOR_STATEMENTS,
+            HYBRID_SEARCH_STATEMENTS,
+            HYBRID_SEARCH_WITH_VECTOR_STATEMENTS,
+            SEARCH_STATEMENTS,
+            SEARCH_WITH_VECTOR_STATEMENTS,
+        )
+
+        plain = [
+            BINARY_SEARCH_STATEMENT,
+            *SEARCH_STATEMENTS.values(),
+            *EXACT_PER_QUERY_SEARCH_STATEMENTS.values(),
+            *HNSW_SEARCH_STATEMENTS.values(),
+            *HYBRID_SEARCH_STATEMENTS.values(),
+        ]
+        with_vector = [
+            BINARY_SEARCH_WITH_VECTOR_STATEMENT,
+            *SEARCH_WITH_VECTOR_STATEMENTS.values(),
+            *EXACT_PER_QUERY_SEARCH_WITH_VECTOR_STATEMENTS.values(),
+            *HNSW_SEARCH_WITH_VECTOR_STATEMENTS.values(),
+            *HYBRID_SEARCH_WITH_VECTOR_STATEMENTS.values(),
+        ]
+        for statement in plain:
+            columns = set(statement.selected_columns.keys())
+            assert "link" in columns
+            assert "vector" not in columns
+        for statement in with_vector:
+            assert {"link", "vector"} <= set(statement.selected_columns.keys())
+
+    @pytest.mark.asyncio
+    async def test_search_with_vectors_uses_vector_statement(self, repository, sample_search_context, mock_session_manager):
+        from dataclasses import replace
+
+        from enrichment.infrastructure.repositories.news_repository import (
+            SEARCH_WITH_VECTOR_STATEMENTS,
+            NewsVectorStorage,
+        )
+
+        company_id1 = sample_search_context.queries[0].company_id
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            Mock(id=1, company_id=company_id1, title="뉴스1", contents="내용1", link="a", vector=[1.0, 0.0], similarity_score=0.9),
+        ]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.search(replace(sample_search_context, with_vectors=True))
+
+        assert mock_session.execute.call_args.args[0] is SEARCH_WITH_VECTOR_STATEMENTS[NewsVectorStorage.VECTOR]
+        assert result[company_id1][0].vector == [1.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_search_without_vectors_leaves_chunk_vector_empty(self, repository, sample_search_context, mock_session_manager):
+        company_id1 = sample_search_context.queries[0].company_id
+        mock_session = AsyncMock()
+        mock_session_manager.__aenter__.return_value = mock_session
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            Mock(id=1, company_id=company_id1, title="뉴스1", contents="내용1", link="a", similarity_score=0.9),
+        ]
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.search(sample_search_context)
+
+        assert result[company_id1][0].vector is None
+
+
+class TestNewsRepositoryWarmUp:
+    def test_exact_warm_up_statements(self):
+        from enrichment.infrastructure.repositories.news_repository import (
+            EXACT_PER_QUERY_SEARCH_STATEMENTS,
+            SEARCH_STATEMENTS,
+            NewsVectorStorage,
+        )
+
+        repository = NewsRepository(
+            session_manager=AsyncMock(), vector_storage="halfvec_512"
+        )
+
+        statements = repository.warm_up_statements()
+
+        assert [statement for statement, _ in statements] == [
+            SEARCH_STATEMENTS[NewsVectorStorage.HALFVEC_512],
+            EXACT_PER_QUERY_SEARCH_STATEMENTS[NewsVectorStorage.HALFVEC_512],
+        ]
+        params = statements[0][1]
+        assert params["company_ids"] == [UUID(int=0)]
+        assert len(params["query_vectors"][0]) == 512
+        assert params["window_start"] == params["window_end"] == date.today()
+        assert repository.warm_up_indexes() == ["idx_chunk_half_512_hnsw"]
+
+    def test_hnsw_warm_up_statements(self):
+        from enrichment.infrastructure.repositories.news_repository import (
+            HNSW_SEARCH_STATEMENTS,
+            HNSW_SETTINGS_STATEMENT,
+            NewsVectorStorage,
+        )
+
+        repository = NewsRepository(
+            session_manager=AsyncMock(), engine="hnsw", ef_search=40
+        )
+
+        statements = repository.warm_up_statements()
+
+        assert statements[0] == (
+            HNSW_SETTINGS_STATEMENT,
+            {"ef_search": "40", "iterative_scan": "relaxed_order"},
+        )
+        assert statements[1][0] is HNSW_SEARCH_STATEMENTS[NewsVectorStorage.VECTOR]
+        assert repository.warm_up_indexes() == ["idx_chunk_hnsw"]
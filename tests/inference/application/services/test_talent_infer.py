@@ -5,6 +5,9 @@ from uuid import UUID
 import pytest
 
 from inference.application.services.talent_infer import TalentInference
+from inference.application.templates.inference_template import (
+    TalentInferencePromptTemplates,
+)
 from inference.controllers.dtos.talent_infer import (
     DateModel,
     Position,
@@ -497,6 +500,42 @@ class TestTalentInference:
         )
         assert prompt == "Formatted Prompt"
 
+    def test_create_structured_prompt_matches_rich_prompt_template(
+        self,
+        talent_inference_service,
+        sample_talent_profile,
+        sample_company_context_a,
+        sample_news_chunk_a,
+    ):
+        # Arrange
+        from llama_index.core.prompts import RichPromptTemplate
+
+        career_journey = TalentCareerJourney(
+            talent_profile=sample_talent_profile,
+            position_contexts=[
+                PositionWithContext(
+                    position=sample_talent_profile.positions[0],
+                    company_context=sample_company_context_a,
+                    related_news=[sample_news_chunk_a],
+                )
+            ],
+        )
+        template = (
+            TalentInferencePromptTemplates.get_talent_experience_inference_template()
+        )
+
+        # Act
+        prompt = talent_inference_service._create_structured_prompt(career_journey)
+
+        # Assert
+        expected = RichPromptTemplate(template_str=template.template_str).format(
+            talent_profile=sample_talent_profile,
+            career_journey=career_journey,
+            chronological_contexts=career_journey.get_chronological_journey(),
+        )
+        assert prompt == expected
+        assert "Company A" in prompt
+
     @pytest.mark.asyncio
     async def test_execute_llm_inference_success(
         self, talent_inference_service, mock_llm_client
@@ -0,0 +1,79 @@
+"""Test cases for DI container scopes"""
+import pytest
+
+from containers import Container
+from db.db import ReadSessionManager
+
+CONFIG = {
+    "OPENAI": {"API_KEY": "sk-test"},
+    "EMBEDDING": {"PROVIDER": "openai"},
+    "DATABASE": {
+        "WRITE_ENGINE": "postgresql+asyncpg",
+        "WRITE_URL": "localhost",
+        "WRITE_PORT": 5432,
+        "WRITE_NAME": "test",
+        "WRITE_USER": "test",
+        "WRITE_PASSWORD": "test",
+        "READ_ENGINE": "postgresql+asyncpg",
+        "READ_URL": "localhost",
+        "READ_PORT": 5432,
+        "READ_NAME": "test",
+        "READ_USER": "test",
+        "READ_PASSWORD": "test",
+        "READ_REPLICA_URLS": "",
+        "READ_MAX_LAG_SECONDS": 5.0,
+        "READ_LAG_CHECK_INTERVAL": 0,
+        "READ_YOUR_WRITES_SECONDS": 10.0,
+        "POOL_SIZE": 1,
+        "MAX_OVERFLOW": 0,
+        "POOL_TIMEOUT": 1,
+        "POOL_RECYCLE": 60,
+        "MAX_SESSIONS_PER_REQUEST": 2,
+        "SINGLE_STATEMENT_COMPANY_QUERY": False,
+    },
+    "NEWS_SEARCH": {
+        "BACKEND": "postgres",
+        "ENGINE": "exact",
+        "HNSW_EF_SEARCH": 100,
+        "HNSW_ITERATIVE_SCAN": "relaxed_order",
+        "VECTOR_STORAGE": "vector",
+    },
+    "NEWS_INGEST": {
+        "CHUNK_SIZE": 320,
+        "CHUNK_OVERLAP": 80,
+        "MAX_BATCH_TOKENS": 250000,
+        "MAX_BATCH_SIZE": 2048,
+    },
+    "REDIS": {"HOST": "localhost", "PORT": 6379, "DB": 0},
+}
+
+
+@pytest.fixture
+async def container():
+    # 엔진 생성은 DB에 연결하지 않으므로 DB 없이 객체 그래프를 만들 수 있음
+    container = Container()
+    container.config.from_dict(CONFIG)
+    yield container
+    await container.shutdown_resources()
+
+
+async def test_talent_inference_graph_is_shared_across_requests(container):
+    first = await container.talent_inference_service()
+    second = await container.talent_inference_service()
+
+    assert first is second
+    assert first.llm_client is container.openai_client()
+    company_repository = first.company_search_adapter.company_search_service.repository
+    news_repository = first.news_search_adapter.news_search_service.news_repository
+    assert isinstance(company_repository.read_session_manager, ReadSessionManager)
+    assert company_repository.read_session_manager is news_repository.session_manager
+
+
+async def test_company_info_writer_is_created_per_request(container):
+    container.reader_source_key.override("forestofhyucksin")
+
+    first = await container.company_info_writer()
+    second = await container.company_info_writer()
+
+    assert first is not second
+    assert first.repository is second.repository
@@ -0,0 +1,134 @@
+"""Test cases for multi-process runner"""
+
+import gc
+import os
+import signal
+import time
+
+from config.config import DatabaseConfig
+from runner import Arbiter, preload, worker_pool_env
+
+
+def test_worker_pool_env_without_budget():
+    assert worker_pool_env(DatabaseConfig(CONNECTION_BUDGET=0), workers=4) == {}
+
+
+def test_worker_pool_env_splits_budget():
+    env = worker_pool_env(
+        DatabaseConfig(CONNECTION_BUDGET=20, MAX_SESSIONS_PER_REQUEST=4), workers=4
+    )
+
+    assert env == {
+        "DB_POOL_SIZE": "5",
+        "DB_MAX_OVERFLOW": "0",
+        "DB_MAX_SESSIONS_PER_REQUEST": "4",
+    }
+
+
+def test_worker_pool_env_keeps_one_connection_per_worker():
+    env = worker_pool_env(DatabaseConfig(CONNECTION_BUDGET=3), workers=8)
+
+    assert env["DB_POOL_SIZE"] == "1"
+    assert env["DB_MAX_SESSIONS_PER_REQUEST"] == "1"
+
+
+def test_preload_freezes_imported_objects():
+    try:
+        app = preload("server:app")
+
+        assert app.title == "SearcHRight API"
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_arbiter_recycles_exited_workers_and_stops_on_sigterm(tmp_path):
+    workers = 2
+
+    def serve(ready):
+        (tmp_path / str(os.getpid())).touch()
+        if len(list(tmp_path.iterdir())) > workers:
+            # 교체된 워커: 부모에 종료 요청 후 SIGTERM을 받을 때까지 대기
+            os.kill(os.getppid(), signal.SIGTERM)
+            time.sleep(10)
+        # 최대 요청 수를 채운 워커처럼 정상 종료
+        time.sleep(0.05)
+
+    previous = signal.getsignal(signal.SIGTERM)
+    arbiter = Arbiter(serve, workers=workers, graceful_timeout=5)
+
+    started = time.monotonic()
+    arbiter.run()
+
+    assert time.monotonic() - started < 5
+    assert len(list(tmp_path.iterdir())) > workers
+    assert arbiter.children == {}
+    assert signal.getsignal(signal.SIGTERM) is previous
+
+
+def test_arbiter_reload_replaces_workers_one_at_a_time(tmp_path):
+    workers = 2
+    log = tmp_path / "events"
+
+    def record(event):
+        fd = os.open(log, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        os.write(fd, f"{event} {os.getpid()}\n".encode())
+        os.close(fd)
+
+    def events():
+        return [line.split() for line in log.read_text().splitlines()]
+
+    def serve(ready):
+        def on_term(signum, frame):
+            record("stop")
+            os._exit(0)
+
+        signal.signal(signal.SIGTERM, on_term)
+        record("start")
+        generation = [pid for event, pid in events() if event == "start"].index(
+            str(os.getpid())
+        )
+        if generation >= workers:
+            time.sleep(0.2)  # 교체 워커의 시작(lifespan) 시간
+        record("ready")
+        ready()
+
+        if generation == 0:
+            while sum(event == "start" for event, _ in events()) < workers:
+                time.sleep(0.01)
+            os.kill(os.getppid(), signal.SIGHUP)
+        elif generation == 2 * workers - 1:
+            # 마지막 교체 워커가 준비되면 종료
+            os.kill(os.getppid(), signal.SIGTERM)
+        time.sleep(10)
+
+    arbiter = Arbiter(serve, workers=workers, graceful_timeout=5)
+
+    started = time.monotonic()
+    arbiter.run()
+
+    assert time.monotonic() - started < 5
+    history = events()
+    pids = [pid for event, pid in history if event == "start"]
+    assert len(pids) == 2 * workers
+    old, new = pids[:workers], pids[workers:]
+    position = {(event, pid): idx for idx, (event, pid) in enumerate(history)}
+    stops = sorted(position[("stop", pid)] for pid in old)
+    readies = sorted(position[("ready", pid)] for pid in new)
+    starts = sorted(position[("start", pid)] for pid in new)
+    # k번째 교체 워커가 준비된 뒤에야 k번째 기존 워커를 종료
+    assert all(ready < stop for ready, stop in zip(readies, stops))
+    # 기존 워커가 종료된 다음에 다음 교체 워커를 띄움
+    assert stops[0] < starts[1]
+
+    # 종료(SIGTERM) 전까지 준비된 워커 수가 workers 밑으로 내려가지 않음
+    serving = set()
+    for event, pid in history:
+        if event == "ready":
+            serving.add(pid)
+        elif event == "stop":
+            if pid in new:
+                break
+            serving.discard(pid)
+            assert len(serving) >= workers
+    assert arbiter.children == {}
@@ -0,0 +1,89 @@
+"""Test cases for API app startup"""
+import glob
+import os
+import subprocess
+import sys
+
+import server
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def test_controller_registry_matches_controller_modules():
+    pattern = os.path.join(SRC_DIR, "*", "controllers", "*.py")
+    modules = {
+        os.path.relpath(path, SRC_DIR)[: -len(".py")].replace(os.path.sep, ".")
+        for path in glob.glob(pattern)
+        if os.path.basename(path) != "__init__.py"
+    }
+
+    assert set(server.CONTROLLER_MODULES) == modules
+
+
+def test_controller_routers_registered():
+    paths = set(server.app.openapi()["paths"])
+
+    assert "/health" in paths
+    assert len(paths - {"/health"}) >= 3
+
+
+def test_startup_does_not_import_optional_modules():
+    probe = (
+        "import sys, server\n"
+        "print(sorted({name.split('.')[0] for name in sys.modules} & "
+        "{'llama_index', 'banks', 'tiktoken'}))\n"
+        "print('enrichment.infrastructure.embeddings.hashing' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", probe],
+        env={**os.environ, "PYTHONPATH": SRC_DIR},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split() == ["[]", "False"]
+
+
+async def test_session_scope_middleware_opens_scope_per_request():
+    import httpx
+    from fastapi import FastAPI
+
+    from db.db import _SESSION_SCOPE
+
+    app = FastAPI()
+    app.add_middleware(server.SessionScopeMiddleware, max_sessions_per_request=3)
+
+    @app.get("/scope")
+    async def scope():
+        current = _SESSION_SCOPE.get()
+        return {"limit": current.semaphore._value}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = (await client.get("/scope")).json()
+        second = (await client.get("/scope")).json()
+
+    assert first["limit"] == second["limit"] == 3
+    assert _SESSION_SCOPE.get() is None
+
+
+async def test_lifespan_shuts_down_async_resources():
+    from dependency_injector import providers
+
+    closed = []
+
+    async def resource():
+        try:
+            yield "engine"
+        finally:
+            closed.append(True)
+
+    app = server.create_app()
+    container = app.state.container
+    container._write_db_engine.override(providers.Resource(resource))
+
+    async with app.router.lifespan_context(app):
+        assert await container._write_db_engine() == "engine"
+
+    assert closed == [True]
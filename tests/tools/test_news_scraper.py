@@ -0,0 +1,302 @@
+"""Test cases for concurrent cached news scraper"""
+import asyncio
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+
+from tools.news_scraper import BrowserPool, HtmlCache, NewsScraper
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "pages")
+_ARTICLE = re.compile(r"<article>(.*?)</article>", re.S)
+
+
+def extract_article(html: str, url: str) -> str:
+    """trafilatura 대신 <article> 본문만 꺼내는 테스트용 추출기 (프로세스 풀에서 실행 가능)"""
+    match = _ARTICLE.search(html)
+    return match.group(1).strip() if match else ""
+
+
+def read_page(name: str) -> str:
+    with open(os.path.join(PAGES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class PageServer:
+    """저장된 기사 페이지를 제공하는 로컬 HTTP 서버"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+        self.base_url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.requests.append(name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            path = os.path.join(PAGES_DIR, name)
+            if not os.path.exists(path):
+                raise web.HTTPNotFound()
+            return web.Response(text=read_page(name), content_type="text/html")
+        finally:
+            self.in_flight -= 1
+
+    def url(self, name: str) -> str:
+        return f"{self.base_url}/{name}"
+
+
+@pytest.fixture
+async def page_server():
+    server = PageServer()
+    app = web.Application()
+    app.router.add_get("/{name}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    server.base_url = f"http://127.0.0.1:{port}"
+    yield server
+    await runner.cleanup()
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(4) as executor:
+        yield executor
+
+
+class FakeDriver:
+    def __init__(self, pages):
+        self.pages = pages
+        self.page_source = ""
+        self.quit_called = False
+
+    def get(self, url):
+        self.page_source = self.pages[url]
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestNewsScraper:
+    @pytest.mark.asyncio
+    async def test_scrape_extracts_content_in_input_order(
+        self, page_server, executor, tmp_path
+    ):
+        scraper = NewsScraper(extract_article, str(tmp_path), executor=executor)
+        rows = [
+            {"title": "a", "original_link": page_server.url("naver_article.html")},
+            {"title": "b", "original_link": page_server.url("missing.html")},
+            {"title": "c", "original_link": page_server.url("ajunews_article.html")},
+        ]
+
+        parsed, failed = await scraper.scrape(rows)
+
+        assert [row["title"] for row in parsed] == ["a", "c"]
+        assert parsed[0]["content"].startswith("네이버가 578돌 한글날")
+        assert parsed[1]["content"].startswith("네이버의 소통 서비스")
+        assert failed == [rows[1]]
+
+    @pytest.mark.asyncio
+    async def test_rerun_served_from_cache(self, page_server, executor, tmp_path):
+        rows = [
+            {"original_link": page_server.url("naver_article.html")},
+            {"original_link": page_server.url("ajunews_article.html")},
+        ]
+        first, _ = await NewsScraper(
+            extract_article, str(tmp_path), executor=executor
+        ).scrape(rows)
+        requests_after_first_run = len(page_server.requests)
+
+        second, _ = await NewsScraper(
+            extract_article, str(tmp_path), executor=executor
+        ).scrape(rows)
+
+        assert requests_after_first_run == 2
+        assert len(page_server.requests) == 2
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_not_cached(self, page_server, executor, tmp_path):
+        rows = [{"original_link": page_server.url("missing.html")}]
+        scraper = NewsScraper(extract_article, str(tmp_path), executor=executor)
+
+        await scraper.scrape(rows)
+        await scraper.scrape(rows)
+
+        assert page_server.requests == ["missing.html", "missing.html"]
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, page_server, executor, tmp_path):
+        page_server.delay = 0.05
+        scraper = NewsScraper(
+            extract_article, str(tmp_path), per_host_limit=2, executor=executor
+        )
+        rows = [
+            {"original_link": page_server.url(f"naver_article.html?page={idx}")}
+            for idx in range(8)
+        ]
+
+        parsed, _ = await scraper.scrape(rows)
+
+        assert len(parsed) == 8
+        assert page_server.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_busy_host_does_not_hold_total_slots(
+        self, page_server, executor, tmp_path
+    ):
+        page_server.delay = 0.05
+        scraper = NewsScraper(
+            extract_article,
+            str(tmp_path),
+            per_host_limit=1,
+            total_limit=2,
+            executor=executor,
+        )
+        other_host = page_server.base_url.replace("127.0.0.1", "localhost")
+        rows = [
+            {"original_link": page_server.url(f"naver_article.html?page={idx}")}
+            for idx in range(4)
+        ] + [{"original_link": f"{other_host}/ajunews_article.html"}]
+
+        parsed, _ = await scraper.scrape(rows)
+
+        assert len(parsed) == 5
+        # 대기 중인 같은 호스트 요청이 전체 슬롯을 잡고 있지 않으므로 다른 호스트는 바로 요청됨
+        assert page_server.requests[:2] == ["naver_article.html", "ajunews_article.html"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_marks_row_failed(self, page_server, executor, tmp_path):
+        page_server.delay = 0.5
+        scraper = NewsScraper(
+            extract_article, str(tmp_path), timeout=0.05, executor=executor
+        )
+        rows = [{"original_link": page_server.url("naver_article.html")}]
+
+        parsed, failed = await scraper.scrape(rows)
+
+        assert parsed == []
+        assert failed == rows
+
+    @pytest.mark.asyncio
+    async def test_browser_fallback_when_static_html_has_no_content(
+        self, page_server, executor, tmp_path
+    ):
+        url = page_server.url("script_rendered.html")
+        drivers = []
+
+        def driver_factory():
+            driver = FakeDriver(
+                {url: "<html><article>렌더링된 기사 본문</article></html>"}
+            )
+            drivers.append(driver)
+            return driver
+
+        scraper = NewsScraper(
+            extract_article,
+            str(tmp_path),
+            browser_pool=BrowserPool(driver_factory, size=1),
+            executor=executor,
+        )
+
+        parsed, failed = await scraper.scrape([{"original_link": url}])
+
+        assert parsed[0]["content"] == "렌더링된 기사 본문"
+        assert failed == []
+        assert len(drivers) == 1
+        assert drivers[0].quit_called
+        assert HtmlCache(str(tmp_path)).get(f"render:{url}") is not None
+
+    @pytest.mark.asyncio
+    async def test_extraction_in_process_pool(self, page_server, tmp_path):
+        rows = [{"original_link": page_server.url("naver_article.html")}]
+        with ProcessPoolExecutor(1) as executor:
+            scraper = NewsScraper(extract_article, str(tmp_path), executor=executor)
+            parsed, _ = await scraper.scrape(rows)
+
+        assert parsed[0]["content"].startswith("네이버가 578돌 한글날")
+
+
+class TestBrowserPool:
+    @pytest.mark.asyncio
+    async def test_failed_driver_creation_releases_slot(self):
+        url = "https://news.local/1"
+        attempts = []
+
+        def driver_factory():
+            attempts.append(1)
+            if len(attempts) <= 2:
+                raise RuntimeError("chromedriver not found")
+            return FakeDriver({url: "<html>본문</html>"})
+
+        pool = BrowserPool(driver_factory, size=1)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(pool.render(url), timeout=1)
+        assert await asyncio.wait_for(pool.render(url), timeout=1) == "<html>본문</html>"
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_render_discards_driver(self):
+        url = "https://news.local/1"
+        drivers = []
+
+        def driver_factory():
+            # 첫 드라이버는 세션이 죽은 상태 (페이지가 없어 get에서 예외)
+            drivers.append(FakeDriver({} if not drivers else {url: "<html>본문</html>"}))
+            return drivers[-1]
+
+        pool = BrowserPool(driver_factory, size=1)
+
+        with pytest.raises(KeyError):
+            await pool.render(url)
+        assert await pool.render(url) == "<html>본문</html>"
+
+        assert len(drivers) == 2
+        assert drivers[0].quit_called
+        await pool.close()
+        assert drivers[1].quit_called
+
+    @pytest.mark.asyncio
+    async def test_waiters_do_not_hang_when_creation_fails(self):
+        def driver_factory():
+            raise RuntimeError("chromedriver not found")
+
+        pool = BrowserPool(driver_factory, size=1)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(pool.render("https://news.local/1") for _ in range(3)),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestHtmlCache:
+    def test_same_content_stored_once(self, tmp_path):
+        cache = HtmlCache(str(tmp_path))
+
+        first = cache.put("https://a.example/1", "<html>같은 기사</html>")
+        second = cache.put("https://a.example/1?utm=x", "<html>같은 기사</html>")
+
+        assert first == second
+        assert cache.get("https://a.example/1?utm=x") == "<html>같은 기사</html>"
+        assert cache.get("https://a.example/2") is None
+        objects = [f for _, _, files in os.walk(tmp_path / "objects") for f in files]
+        assert len(objects) == 1
@@ -1,19 +1,24 @@
 import asyncio
-import csv
-import json
 import logging
 import os
-from datetime import datetime
 from glob import glob
-from typing import List
+from typing import List, Tuple
 
 import psycopg2
 from dotenv import find_dotenv, load_dotenv
-from llama_index.core.node_parser import SentenceSplitter
+import numpy as np
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
+from enrichment.infrastructure.chunkers.korean_sentence import KoreanSentenceChunker
 from tools.embedding import create_embeddings
 from tools.insert_company_data import save_companies
+from tools.news_dataset import (
+    convert_csv,
+    copy_news_chunks,
+    dataset_exists,
+    read_dataset,
+    write_dataset,
+)
 from tools.scrap_news import scrap_news
 
 load_dotenv(find_dotenv(), override=True)
@@ -24,6 +29,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 뉴스 청크 데이터셋 (metadata.csv + vectors.npy, tools/news_dataset.py 참고)
+NEWS_DATASET_PATH = "example_datas/company_news_dataset"
+# 이전 형식: 벡터를 JSON 문자열 열로 둔 CSV (있으면 데이터셋으로 변환)
+LEGACY_NEWS_CSV = "example_datas/company_news_with_vector.csv"
+LEGACY_NEWS_SHARDS = "./example_datas/vectors/news_vector_*.csv"
+
 
 # 데이터베이스 연결 정보
 DB_CONFIG = {
@@ -53,49 +64,33 @@ def connect_to_db():
         raise
 
 
-def chunk_text(text: str, chunk_size=320, chunk_overlap=80) -> List[str]:
-    splitter = SentenceSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-    )
-    return splitter.split_text(text)
-
-
-def get_news_with_vector() -> List[dict]:
-    news: List[dict] = []
-    if os.path.exists("example_datas/company_news_with_vector.csv"):
-        with open(
-            "example_datas/company_news_with_vector.csv", "r", encoding="utf-8-sig"
-        ) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                news.append(row)
-    else:
-        parsed_news = scrap_news()
-        for row in parsed_news:
-            chunks = chunk_text(row["content"].replace("\n", " "))
-            embeddings = create_embeddings(chunks)
-
-            for i, chunk in enumerate(chunks):
-                news.append(
-                    {
-                        **row,
-                        "content": chunk,
-                        "vectors": json.dumps(embeddings[i]),
-                    }
-                )
-
-    with open(
-        "example_datas/company_news_with_vector.csv",
-        "w",
-        newline="",
-        encoding="utf-8-sig",
-    ) as f:
-        writer = csv.DictWriter(f, fieldnames=news[0].keys())
-        writer.writeheader()
-        writer.writerows(news)
-
-    return news
+async def get_news_with_vector() -> Tuple[List[dict], np.ndarray]:
+    if not dataset_exists(NEWS_DATASET_PATH):
+        if os.path.exists(LEGACY_NEWS_CSV):
+            count = convert_csv([LEGACY_NEWS_CSV], NEWS_DATASET_PATH)
+            logger.info(
+                f"{LEGACY_NEWS_CSV}의 {count}개 청크를 데이터셋으로 변환했습니다."
+            )
+        else:
+            news: List[dict] = []
+            vectors: List[List[float]] = []
+            parsed_news = await scrap_news()
+            chunker = KoreanSentenceChunker(chunk_size=320, chunk_overlap=80)
+            # 기사별 청크 분리는 프로세스 풀에서 병렬로, 결과는 기사 순서대로
+            article_chunks = chunker.split_many(
+                row["content"].replace("\n", " ") for row in parsed_news
+            )
+            for row, chunks in zip(parsed_news, article_chunks):
+                if not chunks:
+                    continue
+                embeddings = create_embeddings(chunks)
+
+                for i, chunk in enumerate(chunks):
+                    news.append({**row, "content": chunk})
+                    vectors.append(embeddings[i])
+            write_dataset(NEWS_DATASET_PATH, news, vectors)
+
+    return read_dataset(NEWS_DATASET_PATH)
 
 
 def get_company_map(conn):
@@ -114,66 +109,13 @@ def get_company_map(conn):
         return {}
 
 
-def insert_news_data(conn, news_data, company_map):
-    """뉴스 데이터를 데이터베이스에 삽입"""
+def insert_news_data(conn, news_data, vectors, company_map):
+    """뉴스 데이터를 데이터베이스에 COPY로 적재 (이미 적재된 청크는 건너뜀)"""
     try:
-        inserted_count = 0
-        skipped_count = 0
-        missing_company_count = 0
-
-        with conn.cursor() as cursor:
-            for news in news_data:
-                company_name = news["name"]
-
-                # 회사 ID 찾기
-                if company_name not in company_map:
-                    missing_company_count += 1
-                    logger.warning(
-                        f"회사 '{company_name}'가 데이터베이스에 존재하지 않습니다. 해당 뉴스를 건너뜁니다."
-                    )
-                    continue
-
-                year = int(news["year"])
-                month = int(news["month"])
-                day = int(news["day"])
-                news["news_date"] = datetime(year, month, day).strftime("%Y-%m-%d")
-
-                company_id = company_map[company_name]
-
-                # 중복 확인
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) FROM news_chunks 
-                    WHERE company_id = %s AND title = %s AND vector = %s AND created_at = %s
-                    """,
-                    (company_id, news["title"], news["vectors"], news["news_date"]),
-                )
-                count = cursor.fetchone()[0]
-
-                if count > 0:
-                    skipped_count += 1
-                    continue
-
-                # 데이터 삽입
-                cursor.execute(
-                    """
-                    INSERT INTO news_chunks (company_id, title, contents, vector, link, created_at) 
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        company_id,
-                        news["title"],
-                        news["content"],
-                        news["vectors"],
-                        news["original_link"],
-                        news["news_date"],
-                    ),
-                )
-                inserted_count += 1
-
-                # 로깅 (100개마다)
-                if inserted_count % 100 == 0:
-                    logger.info(f"{inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
+        inserted_count, missing_company_count = copy_news_chunks(
+            conn, news_data, vectors, company_map
+        )
+        skipped_count = len(news_data) - missing_company_count - inserted_count
 
         logger.info(f"총 {inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
         logger.info(f"중복으로 {skipped_count}개의 데이터가 건너뛰어졌습니다.")
@@ -184,31 +126,22 @@ def insert_news_data(conn, news_data, company_map):
         return inserted_count
     except psycopg2.Error as e:
         logger.error(f"데이터 삽입 오류: {e}")
-        conn.rollback()
         return 0
 
 
 def merge_news_data():
-    file_list = sorted(glob("./example_datas/vectors/news_vector_*.csv"))
-
-    merged_data = []
-    for file in file_list:
-        with open(file, "r", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                merged_data.append(row)
-    if not merged_data:
+    """분할 저장된 이전 형식(CSV) 벡터 파일들을 하나의 데이터셋으로 병합"""
+    if dataset_exists(NEWS_DATASET_PATH):
+        return
+
+    file_list = sorted(glob(LEGACY_NEWS_SHARDS))
+    if not file_list:
         return
 
-    with open(
-        "./example_datas/company_news_with_vector.csv",
-        "w",
-        newline="",
-        encoding="utf-8",
-    ) as f:
-        writer = csv.DictWriter(f, fieldnames=merged_data[0].keys())
-        writer.writeheader()
-        writer.writerows(merged_data)
+    count = convert_csv(file_list, NEWS_DATASET_PATH)
+    logger.info(
+        f"{len(file_list)}개 파일의 {count}개 청크를 데이터셋으로 병합했습니다."
+    )
 
 
 async def main():
@@ -229,13 +162,13 @@ async def main():
             return
 
         # 뉴스 데이터 로드
-        news_data = get_news_with_vector()
+        news_data, vectors = await get_news_with_vector()
         if not news_data:
             logger.error("뉴스 데이터를 로드하지 못했습니다. 프로세스를 중단합니다.")
             return
 
         # 데이터 삽입
-        insert_news_data(conn, news_data, company_map)
+        insert_news_data(conn, news_data, vectors, company_map)
 
     except Exception as e:
         logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
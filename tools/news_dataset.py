@@ -0,0 +1,244 @@
+"""
+뉴스 청크 데이터셋 (메타데이터 CSV + float32 .npy 행렬)
+
+    <dataset>/metadata.csv  뉴스 청크 메타데이터 (벡터 제외, UTF-8)
+    <dataset>/vectors.npy   (청크 수, 1536) little-endian float32 행렬, i번째 행이 metadata i번째 행의 임베딩
+
+임베딩을 CSV 셀의 JSON 문자열로 두면 적재 때마다 수백만 개의 float를 json.loads로 파싱해야 하고
+파일도 원본의 몇 배가 됩니다. 행렬은 연속된 float32 배열로 두고 np.load(mmap_mode="r")로
+열어 필요한 행만 페이지 단위로 읽습니다.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import struct
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+__all__ = [
+    "DIMENSION",
+    "content_hash",
+    "convert_csv",
+    "copy_news_chunks",
+    "dataset_exists",
+    "read_dataset",
+    "write_dataset",
+]
+
+DIMENSION = 1536
+METADATA_FILE = "metadata.csv"
+VECTORS_FILE = "vectors.npy"
+
+# COPY ... (FORMAT binary) 스트림 머리말/꼬리말
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+_POSTGRES_EPOCH = date(2000, 1, 1).toordinal()
+# pgvector 바이너리 형식: int16 차원 수, int16 예약(0), big-endian float32 값
+_VECTOR_HEADER = struct.pack(">HH", DIMENSION, 0)
+_VECTOR_FIELD = struct.pack(">i", len(_VECTOR_HEADER) + DIMENSION * 4) + _VECTOR_HEADER
+_STAGING_COLUMNS = (
+    "company_id",
+    "title",
+    "contents",
+    "link",
+    "created_at",
+    "content_hash",
+    "vector",
+)
+
+
+def content_hash(company_id, link: str, contents: str) -> str:
+    """멱등 적재 키 (NewsChunkRecord.hash_of와 같은 값)"""
+    payload = f"{company_id}\x1f{link}\x1f{contents}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def dataset_exists(path: str) -> bool:
+    return os.path.exists(os.path.join(path, METADATA_FILE)) and os.path.exists(
+        os.path.join(path, VECTORS_FILE)
+    )
+
+
+def write_dataset(path: str, rows: List[dict], vectors) -> None:
+    """
+    메타데이터 행과 임베딩 행렬(또는 벡터 목록)을 데이터셋으로 저장합니다.
+    """
+    matrix = np.asarray(vectors, dtype="<f4")
+    if matrix.shape != (len(rows), DIMENSION):
+        raise ValueError(
+            f"vectors shape {matrix.shape} does not match ({len(rows)}, {DIMENSION})"
+        )
+
+    os.makedirs(path, exist_ok=True)
+    _write_metadata(path, rows)
+    np.save(os.path.join(path, VECTORS_FILE), matrix)
+
+
+def read_dataset(path: str) -> Tuple[List[dict], np.ndarray]:
+    """
+    데이터셋을 읽습니다. 임베딩 행렬은 읽기 전용 memmap으로 반환되어 접근한 행만 디스크에서 읽힙니다.
+    """
+    with open(os.path.join(path, METADATA_FILE), "r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    vectors = np.load(os.path.join(path, VECTORS_FILE), mmap_mode="r")
+    if vectors.shape != (len(rows), DIMENSION):
+        raise ValueError(
+            f"{path}: vectors shape {vectors.shape} does not match {len(rows)} rows"
+        )
+    return rows, vectors
+
+
+def convert_csv(csv_paths: Iterable[str], path: str, vector_column="vectors") -> int:
+    """
+    JSON 문자열 벡터 열이 있는 CSV 파일들을 하나의 데이터셋으로 변환합니다.
+
+    벡터는 행 단위로 파싱하여 미리 할당한 .npy memmap에 바로 기록하므로
+    전체 float 리스트를 메모리에 올리지 않습니다.
+
+    Returns:
+        int: 변환된 행 수
+    """
+    csv_paths = list(csv_paths)
+    total = 0
+    for csv_path in csv_paths:
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            total += sum(1 for _ in csv.DictReader(f))
+    if total == 0:
+        return 0
+
+    os.makedirs(path, exist_ok=True)
+    matrix = np.lib.format.open_memmap(
+        os.path.join(path, VECTORS_FILE),
+        mode="w+",
+        dtype="<f4",
+        shape=(total, DIMENSION),
+    )
+    rows = []
+    for csv_path in csv_paths:
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                matrix[len(rows)] = json.loads(row.pop(vector_column))
+                rows.append(row)
+    matrix.flush()
+    del matrix
+    _write_metadata(path, rows)
+    return total
+
+
+def copy_news_chunks(
+    conn,
+    rows: List[dict],
+    vectors: np.ndarray,
+    company_map: Dict[str, str],
+    batch_size: int = 20_000,
+) -> Tuple[int, int]:
+    """
+    데이터셋을 바이너리 COPY로 임시 테이블에 적재한 뒤 news_chunks에 INSERT ... ON CONFLICT DO NOTHING 합니다.
+
+    Args:
+        conn: autocommit psycopg2 연결
+        rows: 데이터셋 메타데이터 (name, title, content, original_link, year, month, day)
+        vectors: rows와 같은 순서의 (N, 1536) float32 행렬
+        company_map: 회사 이름 -> 회사 ID
+
+    Returns:
+        (적재된 청크 수, 회사가 없어 건너뛴 청크 수)
+    """
+    inserted = 0
+    missing = 0
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS news_chunks_staging (
+                company_id uuid NOT NULL,
+                title text NOT NULL,
+                contents text NOT NULL,
+                link text NOT NULL,
+                created_at date NOT NULL,
+                content_hash varchar(64) NOT NULL,
+                vector vector(1536) NOT NULL
+            )
+            """)
+        try:
+            for start in range(0, len(rows), batch_size):
+                stream, count, skipped = _copy_stream(
+                    rows[start : start + batch_size],
+                    vectors[start : start + batch_size],
+                    company_map,
+                )
+                missing += skipped
+                if count == 0:
+                    continue
+
+                cursor.execute("TRUNCATE news_chunks_staging")
+                cursor.copy_expert(
+                    f"COPY news_chunks_staging ({', '.join(_STAGING_COLUMNS)}) "
+                    "FROM STDIN WITH (FORMAT binary)",
+                    stream,
+                )
+                cursor.execute("""
+                    INSERT INTO news_chunks (
+                        company_id, title, contents, link, created_at, content_hash,
+                        vector, vector_half, vector_half_512
+                    )
+                    SELECT
+                        company_id, title, contents, link, created_at, content_hash,
+                        vector, vector::halfvec(1536), subvector(vector, 1, 512)::halfvec(512)
+                    FROM news_chunks_staging
+                    ON CONFLICT (content_hash, created_at) DO NOTHING
+                    """)
+                inserted += cursor.rowcount
+        finally:
+            cursor.execute("DROP TABLE IF EXISTS news_chunks_staging")
+    return inserted, missing
+
+
+def _copy_stream(
+    rows: List[dict], vectors: np.ndarray, company_map: Dict[str, str]
+) -> Tuple[io.BytesIO, int, int]:
+    """COPY (FORMAT binary) 스트림 생성 - 벡터는 행렬 전체를 한 번에 big-endian으로 변환"""
+    big_endian = np.ascontiguousarray(vectors, dtype=">f4")
+    buffer = io.BytesIO()
+    buffer.write(_COPY_HEADER)
+    count = 0
+    skipped = 0
+    for idx, row in enumerate(rows):
+        company_id: Optional[str] = company_map.get(row["name"])
+        if company_id is None:
+            skipped += 1
+            continue
+
+        created_at = date(int(row["year"]), int(row["month"]), int(row["day"]))
+        fields = (
+            UUID(str(company_id)).bytes,
+            row["title"].encode("utf-8"),
+            row["content"].encode("utf-8"),
+            row["original_link"].encode("utf-8"),
+            struct.pack(">i", created_at.toordinal() - _POSTGRES_EPOCH),
+            content_hash(company_id, row["original_link"], row["content"]).encode(),
+        )
+        buffer.write(struct.pack(">h", len(_STAGING_COLUMNS)))
+        for field in fields:
+            buffer.write(struct.pack(">i", len(field)))
+            buffer.write(field)
+        buffer.write(_VECTOR_FIELD)
+        buffer.write(big_endian[idx].tobytes())
+        count += 1
+    buffer.write(_COPY_TRAILER)
+    buffer.seek(0)
+    return buffer, count, skipped
+
+
+def _write_metadata(path: str, rows: List[dict]) -> None:
+    fieldnames = list(rows[0].keys()) if rows else []
+    with open(
+        os.path.join(path, METADATA_FILE), "w", newline="", encoding="utf-8"
+    ) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
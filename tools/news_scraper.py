@@ -0,0 +1,256 @@
+"""
+비동기 뉴스 본문 수집 파이프라인
+
+    HTTP 요청(호스트별/전체 동시성 제한, 타임아웃)
+      -> HTML 캐시(content-addressed, 재실행 시 요청 생략)
+      -> 본문 추출(프로세스 풀)
+      -> 추출 실패 시 헤드리스 브라우저 렌더링(별도의 작은 풀) 후 다시 추출
+
+본문 추출(trafilatura)은 CPU 작업이므로 이벤트 루프가 아닌 프로세스 풀에서 실행하고,
+브라우저(selenium)는 블로킹 API이므로 드라이버 수만큼만 스레드에서 동시에 사용합니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+__all__ = ["BrowserPool", "HtmlCache", "NewsScraper"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+
+
+class HtmlCache:
+    """
+    URL별 HTML 디스크 캐시
+
+    HTML은 내용의 SHA-256으로 objects/에 한 번만 저장하고, urls/에는 URL 해시 -> 내용 해시를
+    기록합니다. 같은 기사가 여러 URL(리다이렉트, 쿼리 문자열 차이)로 수집되어도 본문은 한 벌이며,
+    기록은 임시 파일 작성 후 rename하므로 중단되어도 깨진 항목이 남지 않습니다.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(root, "urls"), exist_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._url_path(key), "r", encoding="ascii") as f:
+                digest = f.read().strip()
+            with open(self._object_path(digest), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, html: str) -> str:
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            self._write_atomic(object_path, data)
+        self._write_atomic(self._url_path(key), digest.encode("ascii"))
+        return digest
+
+    def _url_path(self, key: str) -> str:
+        return os.path.join(
+            self.root, "urls", hashlib.sha256(key.encode("utf-8")).hexdigest()
+        )
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], f"{digest[2:]}.html")
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class BrowserPool:
+    """
+    헤드리스 브라우저 드라이버 풀
+
+    드라이버는 필요할 때 size개까지 만들고 재사용합니다. selenium API는 블로킹이므로
+    렌더링은 스레드에서 실행되며, 동시에 열리는 브라우저 수는 size로 제한됩니다.
+    """
+
+    def __init__(self, driver_factory: Callable, size: int = 2, wait_seconds=3):
+        self.driver_factory = driver_factory
+        self.size = size
+        self.wait_seconds = wait_seconds
+        self._idle: List = []
+        # 사용 중이거나 생성 중인 드라이버 수 제한 (생성이 실패하면 바로 반환)
+        self._slots = asyncio.Semaphore(size)
+
+    async def render(self, url: str) -> str:
+        async with self._slots:
+            driver = await self._acquire()
+            try:
+                html = await asyncio.to_thread(self._render, driver, url)
+            except BaseException:
+                # 크래시/응답 없는 세션일 수 있으므로 재사용하지 않고 버림 (다음 요청에서 새로 생성)
+                await asyncio.shield(asyncio.to_thread(self._quit, driver))
+                raise
+            self._idle.append(driver)
+            return html
+
+    async def close(self) -> None:
+        while self._idle:
+            driver = self._idle.pop()
+            await asyncio.to_thread(driver.quit)
+
+    async def _acquire(self):
+        if self._idle:
+            return self._idle.pop()
+        return await asyncio.to_thread(self.driver_factory)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"브라우저 종료 실패: {e!r}")
+
+    def _render(self, driver, url: str) -> str:
+        driver.get(url)
+        driver.implicitly_wait(self.wait_seconds)
+        return driver.page_source
+
+
+class NewsScraper:
+    """
+    기사 URL 목록의 본문을 동시에 수집합니다.
+
+    Args:
+        extract: (html, url) -> 본문 텍스트, 프로세스 풀에서 실행되므로 모듈 최상위 함수여야 함
+        cache_dir: HTML 캐시 디렉터리 (다시 실행하면 캐시된 URL은 요청하지 않음)
+        browser_pool: 추출 실패 시 사용할 헤드리스 브라우저 풀 (없으면 폴백 생략)
+        per_host_limit: 호스트별 동시 요청 수
+        total_limit: 전체 동시 요청 수
+        timeout: 요청 타임아웃(초)
+        extract_workers: 본문 추출 프로세스 수 (None이면 CPU 수)
+        executor: 본문 추출 실행기 (지정하면 extract_workers 무시, 종료는 호출자 책임)
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[str, str], str],
+        cache_dir: str,
+        browser_pool: Optional[BrowserPool] = None,
+        per_host_limit: int = 4,
+        total_limit: int = 32,
+        timeout: float = 15.0,
+        extract_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.extract = extract
+        self.cache = HtmlCache(cache_dir)
+        self.browser_pool = browser_pool
+        self.per_host_limit = per_host_limit
+        self.total_limit = total_limit
+        self.timeout = timeout
+        self.extract_workers = extract_workers
+        self.executor = executor
+        self.user_agent = user_agent
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def scrape(
+        self, rows: List[dict], url_key: str = "original_link"
+    ) -> Tuple[List[dict], List[dict]]:
+        """
+        Returns:
+            (본문을 "content"에 채운 행 목록, 실패한 행 목록) - 각각 입력 순서 유지
+        """
+        executor = self.executor or ProcessPoolExecutor(self.extract_workers)
+        total_limit = asyncio.Semaphore(self.total_limit)
+        try:
+            async with httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(max_connections=self.total_limit),
+            ) as client:
+                contents = await asyncio.gather(
+                    *(
+                        self._scrape_one(client, executor, total_limit, row[url_key])
+                        for row in rows
+                    )
+                )
+        finally:
+            if self.executor is None:
+                executor.shutdown()
+            if self.browser_pool is not None:
+                await self.browser_pool.close()
+
+        parsed, failed = [], []
+        for row, content in zip(rows, contents):
+            if content:
+                parsed.append({**row, "content": content})
+            else:
+                failed.append(row)
+        logger.info(f"본문 수집 완료: 성공 {len(parsed)}건, 실패 {len(failed)}건")
+        return parsed, failed
+
+    async def _scrape_one(self, client, executor, total_limit, url: str) -> str:
+        html = await self._fetch(client, total_limit, url)
+        content = await self._extract(executor, html, url)
+        if content or self.browser_pool is None:
+            return content
+
+        # 정적 HTML에서 본문을 찾지 못하면 브라우저로 렌더링한 HTML로 재시도
+        html = await self._render(url)
+        return await self._extract(executor, html, url)
+
+    async def _fetch(self, client, total_limit, url: str) -> str:
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+
+        # 호스트 슬롯을 먼저 잡아, 한 호스트 대기열에 있는 요청이 전체 슬롯을 차지하지 않도록 함
+        async with self._host_limit(url), total_limit:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning(f"요청 실패: {url} - {e!r}")
+                return ""
+        html = response.text
+        self.cache.put(url, html)
+        return html
+
+    async def _render(self, url: str) -> str:
+        key = f"render:{url}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            html = await self.browser_pool.render(url)
+        except Exception as e:
+            logger.warning(f"브라우저 렌더링 실패: {url} - {e!r}")
+            return ""
+        self.cache.put(key, html)
+        return html
+
+    async def _extract(self, executor, html: str, url: str) -> str:
+        if not html:
+            return ""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.extract, html, url) or ""
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
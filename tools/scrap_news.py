@@ -1,26 +1,21 @@
 import csv
 from typing import List, Tuple
 
-import requests
 import trafilatura
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from tools.news_scraper import BrowserPool, NewsScraper
 
-def scrape_news(url: str) -> str:
-    try:
-        html = requests.get(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
-            allow_redirects=True,
-        ).text
-    except Exception:
-        return ""
+# 수집한 HTML 캐시 (다시 실행하면 캐시된 기사는 요청하지 않음)
+HTML_CACHE_DIR = "example_datas/html_cache"
 
-    text = trafilatura.extract(html, url=url, favor_recall=True) or ""
-    return text
+
+def extract_text(html: str, url: str) -> str:
+    # 프로세스 풀에서 실행되므로 모듈 최상위 함수
+    return trafilatura.extract(html, url=url, favor_recall=True) or ""
 
 
 def get_selenium_driver() -> webdriver.Chrome:
@@ -37,54 +32,18 @@ def get_selenium_driver() -> webdriver.Chrome:
     return driver
 
 
-def scrape_news_fallback(url: str, driver: webdriver.Chrome) -> str:
-    try:
-        driver.get(url)
-        driver.implicitly_wait(3)
-
-        html = driver.page_source
-        text = trafilatura.extract(html, url=url, favor_recall=True) or ""
-        if not text:
-            return ""
-        return text
-
-    except Exception as e:
-        print(f"Error scraping {url}: {e}")
-        return ""
-
-
-def get_data(file_path: str) -> Tuple[list, list]:
-    driver = get_selenium_driver()
-
-    parsed_data = []
-    fail_data = []
-
-    data = []
+async def get_data(file_path: str) -> Tuple[list, list]:
     with open(file_path, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-
-    total = len(data)
-    for idx, row in enumerate(data, 1):
-        print(f"{idx}/{total} - {row['original_link']}")
-
-        content = scrape_news(row["original_link"])
-        if content:
-            row["content"] = content
-            parsed_data.append(row)
-        else:
-            content = scrape_news_fallback(row["original_link"], driver)
-            if content:
-                row["content"] = content
-                parsed_data.append(row)
-            else:
-                fail_data.append(row)
+        data = list(csv.DictReader(f))
 
-    parsed_data.append(row)
-    return parsed_data, fail_data
+    scraper = NewsScraper(
+        extract=extract_text,
+        cache_dir=HTML_CACHE_DIR,
+        browser_pool=BrowserPool(get_selenium_driver, size=2),
+    )
+    return await scraper.scrape(data)
 
 
-def scrap_news() -> List[dict]:
-    parsed_data, _ = get_data("example_datas/company_news.csv")
+async def scrap_news() -> List[dict]:
+    parsed_data, _ = await get_data("example_datas/company_news.csv")
     return parsed_data